@@ -1,28 +1,38 @@
 import factory
 import factory.fuzzy
 
-from accounts.models import Account
+from accounts.models import User, UserStatistics
 
 
 class AccountFactory(factory.django.DjangoModelFactory):
     username = factory.Faker("user_name")
     email = factory.Sequence(lambda n: f"user{n}@example.com")
-    password = factory.PostGenerationMethodCall("set_password", "password")
+    password = None
     first_name = factory.Faker("first_name")
     last_name = factory.Faker("last_name")
-    following = factory.RelatedFactoryList(
-        "accounts.tests.factories.AccountFactory",
-        factory_related_name="followers",
-        size=0,
-    )
-    is_staff = False
     is_active = True
 
     class Meta:
-        model = Account
-        django_get_or_create = (
-            "username",
-            "email",
-            "first_name",
-            "last_name",
-        )
+        model = User
+
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        # 비밀번호 해시는 느리므로 기본은 사용 불가 비밀번호 (테스트 로그인은 force_authenticate 사용)
+        return model_class.objects.create_user(*args, **kwargs)
+
+    @factory.post_generation
+    def following(self, create, extracted, **kwargs):
+        if create and extracted:
+            self.following.add(*extracted)
+
+
+class UserStatisticsFactory(factory.django.DjangoModelFactory):
+    user = factory.SubFactory(AccountFactory)
+    mp = factory.fuzzy.FuzzyInteger(0, 50)
+    wins = factory.fuzzy.FuzzyInteger(0, 20)
+    draws = factory.fuzzy.FuzzyInteger(0, 10)
+    losses = factory.fuzzy.FuzzyInteger(0, 20)
+    points_scored = factory.fuzzy.FuzzyInteger(0, 100)
+
+    class Meta:
+        model = UserStatistics
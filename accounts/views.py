@@ -16,6 +16,7 @@ from rest_framework.permissions import AllowAny
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
 
+from accounts.models import User, UserStatistics
 from accounts.serializers import (
     RegisterSerializer,
     LoginSerializer,
@@ -28,17 +29,15 @@ from accounts.serializers import (
 )
 from newsfeed.serializers import NewsfeedPostSerializer
 
-# User 모델 문자열 참조
-
 class UserProfileView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, user_id, *args, **kwargs):
         try:
-            user = models.get_model('accounts', 'User').objects.get(id=user_id)  # 문자열 참조로 User 접근
+            user = User.objects.get(id=user_id)
             serializer = UserSerializer(user)
             return Response(serializer.data, status=status.HTTP_200_OK)
-        except models.get_model('accounts', 'User').DoesNotExist:
+        except User.DoesNotExist:
             return Response({"error": "User not found"}, status=status.HTTP_404_NOT_FOUND)
 
 class DeleteAccountView(APIView):
@@ -50,7 +49,7 @@ class DeleteAccountView(APIView):
         return Response(status=204)
 
 class RegisterView(generics.CreateAPIView):
-    queryset = "accounts.User"  # User 모델 문자열 참조
+    queryset = User.objects.all()
     permission_classes = [AllowAny]
     serializer_class = RegisterSerializer
 
@@ -109,7 +108,7 @@ class PasswordResetView(APIView):
         if not email:
             raise ValidationError("Email is required.")
         
-        user = "accounts.User".objects.filter(email=email).first()  # User 모델 문자열 참조
+        user = User.objects.filter(email=email).first()
         if not user:
             raise ValidationError("No user with that email.")
 
@@ -141,8 +140,8 @@ class UserProfileNewsfeedView(APIView):
 
     def get(self, request, user_id, *args, **kwargs):
         try:
-            user = "accounts.User".objects.get(id=user_id)  # User 모델 문자열 참조
-        except "accounts.User".DoesNotExist:
+            user = User.objects.get(id=user_id)
+        except User.DoesNotExist:
             return Response({"error": "User not found"}, status=status.HTTP_404_NOT_FOUND)
         
         posts = "newsfeed.NewsfeedPost".objects.filter(  # NewsfeedPost 모델 문자열 참조
@@ -173,8 +172,8 @@ class FollowUserView(APIView):
 
     def post(self, request, user_id, *args, **kwargs):
         try:
-            target_user = "accounts.User".objects.get(id=user_id)  # User 모델 문자열 참조
-        except "accounts.User".DoesNotExist:
+            target_user = User.objects.get(id=user_id)
+        except User.DoesNotExist:
             return Response({"error": "User not found"}, status=status.HTTP_404_NOT_FOUND)
 
         user = request.user
@@ -187,8 +186,8 @@ class FollowUserView(APIView):
 
     def get(self, request, user_id, *args, **kwargs):
         try:
-            target_user = "accounts.User".objects.get(id=user_id)  # User 모델 문자열 참조
-        except "accounts.User".DoesNotExist:
+            target_user = User.objects.get(id=user_id)
+        except User.DoesNotExist:
             return Response({"error": "User not found"}, status=status.HTTP_404_NOT_FOUND)
 
         serializer = FollowUserSerializer(target_user, context={'request': request})
@@ -199,8 +198,8 @@ class UserStatisticsView(APIView):
 
     def get(self, request, user_id, *args, **kwargs):
         try:
-            stats = "accounts.UserStatistics".objects.get(user_id=user_id)  # UserStatistics 모델 문자열 참조
-        except "accounts.UserStatistics".DoesNotExist:
+            stats = UserStatistics.objects.get(user_id=user_id)
+        except UserStatistics.DoesNotExist:
             return Response({"error": "User statistics not found"}, status=status.HTTP_404_NOT_FOUND)
         
         serializer = UserStatisticsSerializer(stats)
@@ -0,0 +1,16 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from clubs.models import ClubStatistics
+
+
+class Command(BaseCommand):
+    help = "Recompute every club's manner/performance scores from its members' statistics"
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        updated = ClubStatistics.recompute_all()
+        self.stdout.write(self.style.SUCCESS(
+            f"Updated {updated} club statistics in {time.perf_counter() - started:.2f}s"
+        ))
@@ -1,6 +1,11 @@
-from django.db import models
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.db import connection, models
+from django.db.models import Avg, F
 from django.apps import apps
 
+SCORE_PRECISION = Decimal('0.01')  # manner/performance 필드의 소수 자릿수 (recompute_all의 ROUND(..., 2)와 같은 반올림)
+
 class ClubStatistics(models.Model):
     club = models.ForeignKey('clubs.Club', on_delete=models.CASCADE)  # Club과 1:1 관계
     mp = models.IntegerField(default=0)
@@ -18,38 +23,56 @@ class ClubStatistics(models.Model):
         return f"{self.club.name} - Statistics"
 
     def update_match_stats(self, match_result, points):
-        self.mp += 1
-        self.points_scored += points
-
-        if match_result == 'win':
-            self.wins += 1
-        elif match_result == 'draw':
-            self.draws += 1
-        elif match_result == 'loss':
-            self.losses += 1
-
-        self.save()
+        """경기 결과 하나를 더한다 (동시에 호출돼도 증가분이 사라지지 않도록 F() UPDATE)"""
+        result = {'win': 'wins', 'draw': 'draws', 'loss': 'losses'}.get(match_result)
+        updates = {'mp': F('mp') + 1, 'points_scored': F('points_scored') + points}
+        if result:
+            updates[result] = F(result) + 1
+        ClubStatistics.objects.filter(pk=self.pk).update(**updates)
+        self.refresh_from_db(fields=list(updates))
 
     def update_manner_score(self):
-        members = self.club.members.all()
-        total_manner = 0
-        member_count = members.count()
-
-        for member in members:
-            user_stats = apps.get_model('accounts', 'UserStatistics').objects.get(user=member)
-            total_manner += user_stats.manner
-
-        self.manner = total_manner / member_count if member_count > 0 else 0.00
-        self.save()
+        """클럽 멤버 매너 점수 평균 (UserStatistics가 있는 멤버 기준, 집계 쿼리 1번)"""
+        self.manner = self.member_average('manner')
+        self.save(update_fields=['manner'])
 
     def update_performance_score(self):
-        members = self.club.members.all()
-        total_performance = 0
-        member_count = members.count()
+        """클럽 멤버 성과 점수 평균 (UserStatistics가 있는 멤버 기준, 집계 쿼리 1번)"""
+        self.performance = self.member_average('performance')
+        self.save(update_fields=['performance'])
 
-        for member in members:
-            user_stats = apps.get_model('accounts', 'UserStatistics').objects.get(user=member)
-            total_performance += user_stats.performance
+    def member_average(self, field):
+        UserStatistics = apps.get_model('accounts', 'UserStatistics')
+        average = UserStatistics.objects.filter(user__clubs_joined=self.club_id).aggregate(average=Avg(field))['average']
+        return Decimal(average).quantize(SCORE_PRECISION, rounding=ROUND_HALF_UP) if average is not None else Decimal('0.00')
 
-        self.performance = total_performance / member_count if member_count > 0 else 0.00
-        self.save()
\ No newline at end of file
+    @classmethod
+    def recompute_all(cls):
+        """
+        모든 클럽의 매너/성과 점수를 멤버 평균으로 다시 계산 (UPDATE ... FROM 한 번).
+        멤버가 없는 클럽은 0이 되고, 값이 바뀐 행만 갱신한다. 갱신한 행 수를 반환.
+        """
+        UserStatistics = apps.get_model('accounts', 'UserStatistics')
+        membership = apps.get_model('clubs', 'Club').members.through
+        quote = connection.ops.quote_name
+        stats_table, user_stats_table = quote(cls._meta.db_table), quote(UserStatistics._meta.db_table)
+        membership_table = quote(membership._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE {stats_table} AS stats
+                SET manner = averaged.manner, performance = averaged.performance
+                FROM (
+                    SELECT club_stats.id,
+                           COALESCE(ROUND(AVG(user_stats.manner), 2), 0) AS manner,
+                           COALESCE(ROUND(AVG(user_stats.performance), 2), 0) AS performance
+                    FROM {stats_table} AS club_stats
+                    LEFT JOIN {membership_table} AS membership ON membership.club_id = club_stats.club_id
+                    LEFT JOIN {user_stats_table} AS user_stats ON user_stats.user_id = membership.user_id
+                    GROUP BY club_stats.id
+                ) AS averaged
+                WHERE stats.id = averaged.id
+                  AND (stats.manner <> averaged.manner OR stats.performance <> averaged.performance)
+                """
+            )
+            return cursor.rowcount
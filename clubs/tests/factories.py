@@ -0,0 +1,12 @@
+import factory
+
+from clubs.models import Club
+
+
+class ClubFactory(factory.django.DjangoModelFactory):
+    name = factory.Faker("company")
+    bio = factory.Faker("text")
+    owner = factory.SubFactory("accounts.tests.factories.AccountFactory")
+
+    class Meta:
+        model = Club
@@ -0,0 +1,51 @@
+from decimal import Decimal
+
+from django.test import TestCase
+
+from accounts.tests.factories import AccountFactory, UserStatisticsFactory
+from clubs.models import ClubStatistics
+from clubs.tests.factories import ClubFactory
+
+
+class ClubStatisticsTestCase(TestCase):
+    def setUp(self):
+        self.club = ClubFactory()
+        for manner, performance in (("4.00", "3.00"), ("3.00", "2.00"), ("2.50", "2.00")):
+            user = UserStatisticsFactory(manner=Decimal(manner), performance=Decimal(performance)).user
+            self.club.members.add(user)
+        self.club.members.add(AccountFactory())  # 통계가 없는 멤버는 평균에서 빠진다
+        self.stats = ClubStatistics.objects.create(club=self.club)
+
+    def test_member_averages_in_one_aggregate(self):
+        with self.assertNumQueries(2):  # 평균 집계 + 저장
+            self.stats.update_manner_score()
+        self.stats.update_performance_score()
+
+        self.stats.refresh_from_db()
+        self.assertEqual(self.stats.manner, Decimal("3.17"))
+        self.assertEqual(self.stats.performance, Decimal("2.33"))
+
+    def test_recompute_all(self):
+        empty = ClubStatistics.objects.create(club=ClubFactory(), manner=Decimal("4.00"), performance=Decimal("4.00"))
+
+        self.assertEqual(ClubStatistics.recompute_all(), 2)
+        self.assertEqual(ClubStatistics.recompute_all(), 0)  # 바뀐 값이 없으면 갱신하지 않는다
+
+        self.stats.refresh_from_db()
+        empty.refresh_from_db()
+        self.assertEqual((self.stats.manner, self.stats.performance), (Decimal("3.17"), Decimal("2.33")))
+        self.assertEqual((empty.manner, empty.performance), (Decimal("0.00"), Decimal("0.00")))
+
+    def test_incremental_and_recomputed_averages_round_alike(self):
+        club = ClubFactory()
+        for manner in ("2.00", "2.25"):  # 평균 2.125
+            club.members.add(UserStatisticsFactory(manner=Decimal(manner)).user)
+        stats = ClubStatistics.objects.create(club=club)
+
+        stats.update_manner_score()
+        ClubStatistics.objects.filter(pk=stats.pk).update(manner=0)
+        ClubStatistics.recompute_all()
+
+        self.assertEqual(stats.manner, Decimal("2.13"))
+        stats.refresh_from_db()
+        self.assertEqual(stats.manner, Decimal("2.13"))
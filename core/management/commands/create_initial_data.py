@@ -1,31 +1,28 @@
+from datetime import date, datetime, time, timezone
+
 from django.core.management.base import BaseCommand
 
-from accounts.tests.factories import AccountFactory
-from clubs.tests.factories import ClubFactory
-from leagues.tests.factories import LeagueFactory
-from sportsgrounds.tests.factories import SportGroundFactory
-from tournaments.tests.factories import TournamentFactory
+from core.seeding import USERS_PER_SCALE, Seeder
 
 
 class Command(BaseCommand):
-    help = "Create factory data for the clubs app"
-
-    def handle(self, *args, **options):
-        # Create 500 accounts
-        AccountFactory.create_batch(5000)
-
-        # Create 100 clubs
-        ClubFactory.create_batch(100)
+    help = "Generate deterministic load-testing data (users, follows, clubs, grounds, matches, events, reviews, feed posts)"
 
-        # Create 100 sportsgrounds
-        SportGroundFactory.create_batch(100)
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", type=float, default=1.0, help=f"Data size multiplier (1.0 = {USERS_PER_SCALE:,} users)")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed (same seed and start on an empty database give the same data)")
+        parser.add_argument("--start", type=date.fromisoformat, default=None, help="Day the match schedule is centered on (YYYY-MM-DD, default: today)")
+        parser.add_argument("--chunk", type=int, default=5000, help="Rows written per batch")
 
-        # Create 1 League
-        LeagueFactory.create_batch(1)
-
-        # Create 1 Tournament
-        TournamentFactory.create_batch(1)
-
-        self.stdout.write(
-            self.style.SUCCESS("Successfully created factory data for the clubs app")
+    def handle(self, *args, **options):
+        start = datetime.combine(options["start"], time.min, tzinfo=timezone.utc) if options["start"] else None
+        seeder = Seeder(
+            scale=options["scale"],
+            seed=options["seed"],
+            start=start,
+            chunk_size=options["chunk"],
+            log=self.stdout.write,
         )
+        counts = seeder.run()
+
+        self.stdout.write(self.style.SUCCESS("Created " + ", ".join(f"{count:,} {name}" for name, count in counts.items())))
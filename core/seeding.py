@@ -0,0 +1,381 @@
+"""
+부하 테스트용 대량 데이터 생성.
+
+- 유저/팔로우/클럽/구장(좌표 포함)/매치/이벤트/리뷰/뉴스피드 포스트/유저 통계를 만든다.
+- 값은 모두 seed로 초기화한 random.Random과 factory_boy(Faker) 난수에서 나오므로
+  같은 seed, start, scale이면 빈 DB에 항상 같은 데이터가 만들어진다.
+- 행은 factories로 만든 (저장하지 않은) 인스턴스를 chunk_size개씩 모아 쓴다.
+  id가 다시 필요한 테이블은 bulk_create, 나머지는 PostgreSQL COPY로 쓴다.
+- 비밀번호 해시는 한 번만 계산해 모든 유저가 공유한다 (로그인 비밀번호는 DEFAULT_PASSWORD).
+- 매치는 MATCH_SPACING 간격의 라운드로 나누고 라운드 안에서는 참가자를 중복 없이 뽑으므로
+  한 유저의 매치 일정이 겹치지 않는다 (MatchScheduleSlot 배제 제약).
+"""
+import io
+import json
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import factory.random
+from django.contrib.auth.hashers import make_password
+from django.contrib.gis.geos import Point
+from django.db import connection, transaction
+from django.utils import timezone
+
+from accounts.models import User, UserStatistics
+from accounts.tests.factories import AccountFactory
+from clubs.models import Club
+from clubs.tests.factories import ClubFactory
+from matchmaking.models import (
+    GroundReview, Match, MatchEvent, MatchScheduleSlot, MatchSetScore, PlayerReview, ProcessedMatchStats, Team, TeamPlayer,
+)
+from matchmaking.scoreboard import ScoreState
+from matchmaking.tests.factories import MatchFactory, TeamFactory
+from newsfeed.models import Newsfeed, NewsfeedPost
+from sportsgrounds.models import Facilities, SportsGround
+from sportsgrounds.tests.factories import FacilitiesFactory, SportsGroundFactory
+
+DEFAULT_PASSWORD = "password"
+
+# scale 1.0 기준 개수 (scale 100이면 유저 100만 명)
+USERS_PER_SCALE = 10_000
+CLUBS_PER_SCALE = 100
+GROUNDS_PER_SCALE = 100
+MATCHES_PER_SCALE = 2_000
+
+FACILITIES_PER_GROUND = 3
+CLUB_MEMBERS = 20
+FOLLOWS_PER_USER = 20  # 평균. 인기 유저에게 팔로우가 몰리도록 치우쳐 뽑는다
+PLAYERS_PER_MATCH = 10
+EVENTS_PER_MATCH = 12
+PLAYER_REVIEWS_PER_MATCH = 5
+NAME_POOL_SIZE = 1_000  # Faker 호출을 줄이기 위해 이름은 미리 만든 풀에서 고른다
+
+MATCH_DURATION = timedelta(hours=2)
+MATCH_SPACING = timedelta(hours=3)  # 라운드 간격 (MATCH_DURATION보다 길어야 일정이 겹치지 않는다)
+LOCATION_SPREAD = 0.1  # 도시 중심에서 흩어지는 정도 (도)
+CITIES = [
+    (126.9780, 37.5665),  # 서울
+    (129.0756, 35.1796),  # 부산
+    (126.7052, 37.4563),  # 인천
+    (127.3845, 36.3504),  # 대전
+    (126.8526, 35.1595),  # 광주
+]
+
+
+@dataclass(frozen=True)
+class SeedSize:
+    users: int
+    clubs: int
+    grounds: int
+    matches: int
+
+    @classmethod
+    def for_scale(cls, scale):
+        return cls(
+            users=max(int(USERS_PER_SCALE * scale), PLAYERS_PER_MATCH),
+            clubs=max(int(CLUBS_PER_SCALE * scale), 1),
+            grounds=max(int(GROUNDS_PER_SCALE * scale), 1),
+            matches=int(MATCHES_PER_SCALE * scale),
+        )
+
+
+def _copy_value(value):
+    """COPY text 형식의 값 하나"""
+    from django.db.backends.postgresql.psycopg_any import RANGE_TYPES, Jsonb
+
+    if value is None:
+        return r"\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, Jsonb):
+        value = json.dumps(getattr(value, "adapted", getattr(value, "obj", None)))
+    elif isinstance(value, RANGE_TYPES):
+        value = "{}{},{}{}".format(
+            "[" if value.lower_inc else "(", value.lower.isoformat(), value.upper.isoformat(), "]" if value.upper_inc else ")"
+        )
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def write_rows(model, objs, chunk_size):
+    """
+    id가 필요 없는 행을 저장. PostgreSQL이면 COPY, 아니면 bulk_create.
+    auto_now_add 등은 save()와 같은 pre_save 규칙으로 채운다.
+    """
+    if connection.vendor != "postgresql":
+        model.objects.bulk_create(objs, batch_size=chunk_size)
+        return
+    if not objs:
+        return
+
+    from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+    fields = [field for field in model._meta.concrete_fields if not field.primary_key]
+    buffer = io.StringIO()
+    for obj in objs:
+        buffer.write("\t".join(_copy_value(field.get_db_prep_save(field.pre_save(obj, True), connection)) for field in fields))
+        buffer.write("\n")
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    sql = f"COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) FROM STDIN"
+    with connection.cursor() as cursor:
+        if is_psycopg3:
+            with cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+        else:
+            buffer.seek(0)
+            cursor.copy_expert(sql, buffer)
+
+
+class Seeder:
+    def __init__(self, scale=1.0, seed=0, start=None, chunk_size=5000, log=None):
+        self.size = SeedSize.for_scale(scale)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # 매치 일정의 기준 시각. 이보다 먼저 끝나는 매치는 completed, 나머지는 scheduled
+        self.start = start or timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.chunk_size = chunk_size
+        self.log = log or (lambda message: None)
+        self.counts = {}
+        factory.random.reseed_random(seed)
+
+        self.user_ids = []
+        self.newsfeed_ids = []
+        self.user_clubs = {}  # 유저 인덱스 -> 현재 클럽 id
+        self.facilities = []  # (facility id, sports ground id)
+        self.stats = {}  # 유저 인덱스 -> [mp, wins, draws, losses, points_scored]
+
+    def run(self):
+        self.create_users()
+        self.create_follows()
+        self.create_clubs()
+        self.create_grounds()
+        self.create_matches()
+        self.create_statistics()
+        return self.counts
+
+    def add_count(self, name, count):
+        self.counts[name] = self.counts.get(name, 0) + count
+
+    def chunks(self, total):
+        for start in range(0, total, self.chunk_size):
+            yield range(start, min(start + self.chunk_size, total))
+
+    def random_point(self):
+        lng, lat = self.rng.choice(CITIES)
+        return Point(
+            lng + self.rng.gauss(0, LOCATION_SPREAD), lat + self.rng.gauss(0, LOCATION_SPREAD), srid=4326
+        )
+
+    def rating(self):
+        return Decimal(self.rng.randint(100, 500)) / 100
+
+    def create_users(self):
+        password = make_password(DEFAULT_PASSWORD)
+        names = AccountFactory.build_batch(NAME_POOL_SIZE)
+        for indexes in self.chunks(self.size.users):
+            users = []
+            for i in indexes:
+                name = self.rng.choice(names)
+                users.append(AccountFactory.build(
+                    email=f"seed{self.seed}-{i}@example.com",
+                    username=f"{name.username}{i}",
+                    first_name=name.first_name,
+                    last_name=name.last_name,
+                    password=password,
+                    location=self.random_point(),
+                ))
+            with transaction.atomic():
+                User.objects.bulk_create(users, batch_size=self.chunk_size)
+                newsfeeds = Newsfeed.objects.bulk_create([Newsfeed(user=user) for user in users], batch_size=self.chunk_size)
+            self.user_ids.extend(user.pk for user in users)
+            self.newsfeed_ids.extend(newsfeed.pk for newsfeed in newsfeeds)
+            self.log(f"users: {len(self.user_ids)}/{self.size.users}")
+        self.add_count("users", len(self.user_ids))
+
+    def create_follows(self):
+        Follow = User.following.through
+        total = len(self.user_ids)
+        for indexes in self.chunks(total):
+            rows = []
+            for i in indexes:
+                # 앞쪽 유저일수록 많이 팔로우되는 (random()**2) 분포
+                targets = {int(total * self.rng.random() ** 2) for _ in range(self.rng.randint(1, 2 * FOLLOWS_PER_USER - 1))}
+                targets.discard(i)
+                rows.extend(Follow(from_user_id=self.user_ids[i], to_user_id=self.user_ids[t]) for t in sorted(targets))
+            with transaction.atomic():
+                write_rows(Follow, rows, self.chunk_size)
+            self.add_count("follows", len(rows))
+
+    def create_clubs(self):
+        Membership = Club.members.through
+        members_per_club = min(CLUB_MEMBERS, len(self.user_ids))
+        for indexes in self.chunks(self.size.clubs):
+            clubs = []
+            members = []
+            for _ in indexes:
+                member_indexes = self.rng.sample(range(len(self.user_ids)), members_per_club)
+                club = ClubFactory.build(owner=None, member_number=members_per_club)
+                club.owner_id = self.user_ids[member_indexes[0]]
+                clubs.append(club)
+                members.append(member_indexes)
+            with transaction.atomic():
+                Club.objects.bulk_create(clubs, batch_size=self.chunk_size)
+                rows = []
+                for club, member_indexes in zip(clubs, members):
+                    for i in member_indexes:
+                        self.user_clubs[i] = club.pk
+                        rows.append(Membership(club_id=club.pk, user_id=self.user_ids[i]))
+                write_rows(Membership, rows, self.chunk_size)
+            self.add_count("clubs", len(clubs))
+
+    def create_grounds(self):
+        for indexes in self.chunks(self.size.grounds):
+            grounds = []
+            for _ in indexes:
+                ground = SportsGroundFactory.build(owner=None, location=self.random_point())
+                ground.owner_id = self.rng.choice(self.user_ids)
+                grounds.append(ground)
+            with transaction.atomic():
+                SportsGround.objects.bulk_create(grounds, batch_size=self.chunk_size)
+                facilities = [
+                    FacilitiesFactory.build(sports_ground=ground, facility_name=f"Pitch {number}")
+                    for ground in grounds
+                    for number in range(1, FACILITIES_PER_GROUND + 1)
+                ]
+                Facilities.objects.bulk_create(facilities, batch_size=self.chunk_size)
+            self.facilities.extend((facility.pk, facility.sports_ground_id) for facility in facilities)
+            self.add_count("sports_grounds", len(grounds))
+            self.add_count("facilities", len(facilities))
+
+    def create_matches(self):
+        """
+        라운드마다 시설 하나에 매치 하나씩. 첫 라운드가 start보다 rounds/2 라운드 앞에서 시작하므로
+        절반 정도는 이벤트/리뷰가 있는 지난(completed) 매치, 나머지는 예정(scheduled) 매치다.
+        """
+        per_round = min(len(self.facilities), len(self.user_ids) // PLAYERS_PER_MATCH)
+        if not per_round:
+            return
+        rounds = -(-self.size.matches // per_round)
+        remaining = self.size.matches
+        for round_number in range(rounds):
+            count = min(per_round, remaining)
+            start_time = self.start + (round_number - rounds // 2) * MATCH_SPACING
+            self.create_round(start_time, count)
+            remaining -= count
+            self.log(f"matches: {self.size.matches - remaining}/{self.size.matches}")
+
+    def create_round(self, start_time, count):
+        completed = start_time + MATCH_DURATION <= self.start
+        players = self.rng.sample(range(len(self.user_ids)), count * PLAYERS_PER_MATCH)
+        half = PLAYERS_PER_MATCH // 2
+
+        matches, teams, lineups, scorers = [], [], [], []
+        for j in range(count):
+            lineup = players[j * PLAYERS_PER_MATCH:(j + 1) * PLAYERS_PER_MATCH]
+            state = ScoreState()
+            goals = []
+            if completed:
+                for _ in range(EVENTS_PER_MATCH):
+                    scorer = self.rng.randrange(PLAYERS_PER_MATCH)
+                    set_number, points = state.apply('point', 'red' if scorer < half else 'blue')
+                    goals.append((scorer, set_number, points))
+
+            facility_id, ground_id = self.facilities[j]
+            match = MatchFactory.build(
+                facility=None,
+                sports_ground=None,
+                creator=None,
+                start_time=start_time,
+                duration=MATCH_DURATION,
+                status="completed" if completed else "scheduled",
+                total_spots=PLAYERS_PER_MATCH,
+                participant_count=PLAYERS_PER_MATCH,
+                last_event_seq=len(goals),
+                red_score=state.red_score,
+                blue_score=state.blue_score,
+            )
+            match.facility_id, match.sports_ground_id, match.creator_id = facility_id, ground_id, self.user_ids[lineup[0]]
+            matches.append(match)
+            teams.append((TeamFactory.build(name="Red Team", is_red_team=True), TeamFactory.build(name="Blue Team", is_red_team=False)))
+            lineups.append(lineup)
+            scorers.append((goals, state))
+
+        with transaction.atomic():
+            Match.objects.bulk_create(matches, batch_size=self.chunk_size)
+            Team.objects.bulk_create([team for pair in teams for team in pair], batch_size=self.chunk_size)
+            team_players = [
+                TeamPlayer(team=pair[0] if k < half else pair[1], user_id=self.user_ids[i])
+                for pair, lineup in zip(teams, lineups)
+                for k, i in enumerate(lineup)
+            ]
+            TeamPlayer.objects.bulk_create(team_players, batch_size=self.chunk_size)
+
+            rows = {model: [] for model in (Match.participants.through, MatchScheduleSlot, MatchEvent, MatchSetScore, PlayerReview, GroundReview, NewsfeedPost, ProcessedMatchStats)}
+            for j, (match, lineup, (goals, state)) in enumerate(zip(matches, lineups, scorers)):
+                match_players = team_players[j * PLAYERS_PER_MATCH:(j + 1) * PLAYERS_PER_MATCH]
+                for player, i in zip(match_players, lineup):
+                    rows[Match.participants.through].append(Match.participants.through(match_id=match.pk, teamplayer_id=player.pk))
+                    rows[MatchScheduleSlot].append(MatchScheduleSlot(user_id=player.user_id, match_id=match.pk, period=match.period))
+                    rows[NewsfeedPost].append(NewsfeedPost(
+                        newsfeed_id=self.newsfeed_ids[i], post_type="match", post_id=match.pk,
+                        post_content=f"{match.status.capitalize()} match at {match.start_time:%Y-%m-%d %H:%M}.",
+                    ))
+                rows[MatchSetScore].extend(
+                    MatchSetScore(match_id=match.pk, set_number=number, red_points=score['red'], blue_points=score['blue'], winner=score['winner'])
+                    for number, score in state.sets.items()
+                )
+                if not completed:
+                    continue
+
+                for seq, (scorer, set_number, points) in enumerate(goals, start=1):
+                    player = match_players[scorer]
+                    rows[MatchEvent].append(MatchEvent(
+                        match_id=match.pk, seq=seq, event_type='point', added_by_id=player.pk, target_player_id=player.pk,
+                        set_number=set_number, side='red' if scorer < half else 'blue', points=points,
+                    ))
+                for _ in range(PLAYER_REVIEWS_PER_MATCH):
+                    reviewer, player = self.rng.sample(lineup, 2)
+                    rows[PlayerReview].append(PlayerReview(
+                        match_id=match.pk, reviewer_id=self.user_ids[reviewer], player_id=self.user_ids[player],
+                        manner=self.rating(), performance=self.rating(),
+                    ))
+                rows[GroundReview].append(GroundReview(
+                    match_id=match.pk, reviewer_id=match.creator_id, ground_id=match.sports_ground_id,
+                    quality=self.rating(), safety=self.rating(), support=self.rating(),
+                ))
+                self.record_result(lineup, goals, state)
+                # 유저 통계는 record_result로 미리 계산해 넣으므로 통계 파이프라인이 다시 반영하지 않도록 처리 기록을 남긴다
+                rows[ProcessedMatchStats].append(ProcessedMatchStats(match_id=match.pk))
+
+            for model, objs in rows.items():
+                write_rows(model, objs, self.chunk_size)
+                self.add_count(model._meta.model_name, len(objs))
+        self.add_count("matches", len(matches))
+
+    def record_result(self, lineup, goals, state):
+        """유저 통계용 경기 수/승무패/득점 누적"""
+        half = PLAYERS_PER_MATCH // 2
+        red_result = (state.red_score > state.blue_score) - (state.red_score < state.blue_score)
+        for k, i in enumerate(lineup):
+            stats = self.stats.setdefault(i, [0, 0, 0, 0, 0])
+            result = red_result if k < half else -red_result
+            stats[0] += 1
+            stats[1 if result > 0 else 2 if result == 0 else 3] += 1
+        for scorer, _, points in goals:
+            self.stats[lineup[scorer]][4] += points
+
+    def create_statistics(self):
+        for indexes in self.chunks(len(self.user_ids)):
+            rows = []
+            for i in indexes:
+                mp, wins, draws, losses, points_scored = self.stats.get(i, (0, 0, 0, 0, 0))
+                rows.append(UserStatistics(
+                    user_id=self.user_ids[i], mp=mp, wins=wins, draws=draws, losses=losses,
+                    points_scored=points_scored, current_club_id=self.user_clubs.get(i),
+                ))
+            with transaction.atomic():
+                write_rows(UserStatistics, rows, self.chunk_size)
+            self.add_count("user_statistics", len(rows))
@@ -49,6 +49,7 @@ INSTALLED_APPS = [
     "model_utils",
     "django_extensions",
     
+    "core",  # 관리 명령 (create_initial_data)
     "accounts",
     "clubs",
     "sportsgrounds",
@@ -254,4 +255,82 @@ LOGGING = {
 
 GDAL_LIBRARY_PATH = '/usr/local/opt/gdal/lib/libgdal.dylib'
 
-OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', 'your-api-key')
\ No newline at end of file
+OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', 'your-api-key')
+
+# Newsfeed fan-out (팔로워 뉴스피드 포스트 생성 큐)
+
+NEWSFEED_FANOUT_BATCH_SIZE = config("NEWSFEED_FANOUT_BATCH_SIZE", default=1000, cast=int)
+NEWSFEED_FANOUT_MAX_FOLLOWERS = config("NEWSFEED_FANOUT_MAX_FOLLOWERS", default=5000, cast=int)  # 이벤트당 최대 전달 팔로워 수
+NEWSFEED_FANOUT_EAGER = config("NEWSFEED_FANOUT_EAGER", default=False, cast=bool)  # True면 워커 없이 요청 프로세스에서 처리
+NEWSFEED_FANOUT_TASK_TIMEOUT = config("NEWSFEED_FANOUT_TASK_TIMEOUT", default=300, cast=int)  # 초
+NEWSFEED_FANOUT_MAX_ATTEMPTS = config("NEWSFEED_FANOUT_MAX_ATTEMPTS", default=5, cast=int)
+
+# Timeline cache (뉴스피드 타임라인/포스트 캐시)
+# TIMELINE_CACHE_URL이 있으면 Redis(redis 패키지 필요), 없으면 프로세스 로컬 메모리 캐시를 사용
+
+TIMELINE_CACHE_URL = config("TIMELINE_CACHE_URL", default="")
+# 매치 이벤트 스트림의 최신 seq 힌트. 여러 프로세스로 운영할 때는 공유 캐시(Redis)여야 다른 프로세스의 이벤트가 바로 보인다
+# (로컬 메모리 캐시면 matchmaking.stream.SEQ_CACHE_TTL이 지난 뒤 DB에서 다시 읽을 때 보인다)
+MATCH_STREAM_CACHE_URL = config("MATCH_STREAM_CACHE_URL", default=TIMELINE_CACHE_URL)
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "timeline": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": TIMELINE_CACHE_URL,
+            "KEY_PREFIX": "newsfeed",
+        }
+        if TIMELINE_CACHE_URL
+        else {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "timeline",
+            "OPTIONS": {"MAX_ENTRIES": 100000},
+        }
+    ),
+    "stream": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": MATCH_STREAM_CACHE_URL,
+            "KEY_PREFIX": "stream",
+        }
+        if MATCH_STREAM_CACHE_URL
+        else {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "stream",
+        }
+    ),
+}
+
+TIMELINE_CACHE_SIZE = config("TIMELINE_CACHE_SIZE", default=500, cast=int)  # 뉴스피드별 캐시할 최신 포스트 수
+TIMELINE_CACHE_TTL = config("TIMELINE_CACHE_TTL", default=60 * 60 * 24, cast=int)  # 초
+TIMELINE_POST_CACHE_TTL = config("TIMELINE_POST_CACHE_TTL", default=60 * 10, cast=int)  # 초
+
+# League standings cache (리그 순위표 캐시, standings_version이 키에 들어가므로 TTL은 메모리 회수용)
+
+LEAGUE_STANDINGS_CACHE_TTL = config("LEAGUE_STANDINGS_CACHE_TTL", default=60 * 60, cast=int)  # 초
+
+# Newsfeed counters (좋아요/공유 write-behind 버퍼)
+
+NEWSFEED_COUNTER_BUFFER = config("NEWSFEED_COUNTER_BUFFER", default=False, cast=bool)  # True면 증가분을 모았다가 주기적으로 반영
+NEWSFEED_COUNTER_FLUSH_INTERVAL = config("NEWSFEED_COUNTER_FLUSH_INTERVAL", default=5, cast=float)  # 초
+NEWSFEED_COUNTER_MAX_PENDING = config("NEWSFEED_COUNTER_MAX_PENDING", default=1000, cast=int)  # 포스트 수
+
+# LLM (기자회견 질문 생성)
+# 기본은 네트워크 없이 동작하는 StubClient. 실제 질문은 LLM_CLIENT=matchmaking.llm.OpenAIClient (openai>=1.0 패키지 필요)
+
+LLM_CLIENT = config("LLM_CLIENT", default="matchmaking.llm.StubClient")
+LLM_MODEL = config("LLM_MODEL", default="gpt-4o-mini")
+LLM_TIMEOUT = config("LLM_TIMEOUT", default=30, cast=float)  # 초
+LLM_MAX_CONCURRENCY = config("LLM_MAX_CONCURRENCY", default=4, cast=int)  # 프로세스당 동시 호출 수
+LLM_CACHE_TTL = config("LLM_CACHE_TTL", default=60 * 60 * 24, cast=int)  # 같은 프롬프트 결과 캐시 시간 (초)
+LLM_TASK_TIMEOUT = config("LLM_TASK_TIMEOUT", default=120, cast=int)  # 생성 중 상태가 이보다 오래되면 다시 처리 (초)
+LLM_EAGER = config("LLM_EAGER", default=False, cast=bool)  # True면 워커 없이 요청 프로세스의 백그라운드 스레드에서 생성
+
+# 매치 이벤트 실시간 스트림 (SSE / long-poll)
+
+MATCH_STREAM_POLL_INTERVAL = config("MATCH_STREAM_POLL_INTERVAL", default=1, cast=float)  # 새 이벤트 확인 주기 (초)
+MATCH_STREAM_TIMEOUT = config("MATCH_STREAM_TIMEOUT", default=300, cast=float)  # SSE 연결 최대 유지 시간, 이후 클라이언트가 Last-Event-ID로 재연결 (초)
+MATCH_LONG_POLL_TIMEOUT = config("MATCH_LONG_POLL_TIMEOUT", default=25, cast=float)  # long-poll 최대 대기 시간 (초)
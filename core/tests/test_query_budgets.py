@@ -0,0 +1,299 @@
+"""
+API 뷰 쿼리 수 예산 회귀 테스트.
+
+core/urls.py의 GET 라우트마다 factories로 작은/큰 데이터(SIZES)를 만들어 호출하고
+쿼리 수, 응답 시간, 응답 크기를 기록한다.
+- 데이터가 커져도 쿼리 수가 늘지 않아야 한다 (N+1이 생기면 실패)
+- 쿼리 수는 라우트별 예산(budget) 이하여야 한다
+새 GET 라우트를 추가하면 SCENARIOS에 시나리오를 추가하거나, 측정할 수 없는 이유와 함께 EXEMPT에 넣어야 한다.
+QUERY_BUDGET_REPORT 환경 변수에 파일 경로를 주면 측정 결과를 JSON으로 저장한다.
+"""
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+import factory.random
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, get_resolver, reverse
+from rest_framework.test import APIClient
+
+from accounts.tests.factories import AccountFactory, UserStatisticsFactory
+from clubs.tests.factories import ClubFactory
+from leagues.tests.factories import LeagueFactory, LeagueMatchFactory, LeagueStatusFactory
+from matchmaking.models import PressConference, TeamTalk
+from matchmaking.tests.factories import MatchFactory, MatchPostFactory, TeamFactory
+from newsfeed.models import LeaguePost, TournamentPost, TransferPost
+from newsfeed.tests.factories import CommentFactory, NewsfeedFactory, NewsfeedPostFactory
+from sportsgrounds.tests.factories import BookingFactory, FacilitiesFactory, SportsGroundFactory, TimeSlotFactory
+from tournaments.tests.factories import TournamentFactory
+
+SIZES = (2, 10)  # 시나리오마다 이 크기로 데이터를 만들어 쿼리 수를 비교
+
+
+@dataclass
+class Scenario:
+    seed: Callable  # seed(n) -> (요청 유저, URL kwargs, 쿼리 파라미터)
+    budget: int  # 허용하는 최대 쿼리 수
+
+
+def _match_with_events(n):
+    """참가자 n명이 모두 팀에 배정되고 각자 득점 이벤트를 하나씩 가진 매치"""
+    match = MatchFactory(status="ongoing", total_spots=n, players=AccountFactory.create_batch(n))
+    team = TeamFactory(is_red_team=True)
+    match.participants.update(team=team)
+    for player in match.participants.select_related('team'):
+        match.record_event("point", player, player)
+    return match
+
+
+def seed_match_detail(n):
+    match = _match_with_events(n)
+    return match.creator, {"match_id": match.id}, {}
+
+
+def seed_search_match(n):
+    MatchFactory.create_batch(n, status="scheduled", total_spots=10)
+    return AccountFactory(), {}, {"lat": 37.5665, "lng": 126.9780}
+
+
+def seed_free_slots(n):
+    user = AccountFactory()
+    for _ in range(n):
+        MatchFactory(status="scheduled", total_spots=2, players=[user])
+    return user, {}, {}
+
+
+def seed_team_talk(n):
+    user = AccountFactory()
+    match = MatchFactory(total_spots=2, players=[user])
+    player = match.participants.get()
+    team_talk = TeamTalk.objects.create(match=match, team=player)
+    for i in range(n):
+        team_talk.conversation.append(f"message {i}", user=user)
+    return user, {"match_id": match.id, "team_id": player.id}, {}
+
+
+def seed_press_conference(n):
+    match = _match_with_events(n)
+    press_conference = PressConference.objects.create(match=match, questions=["question"] * n)
+    press_conference.participants.set(match.participants.all())
+    for player in match.participants.select_related('user'):
+        press_conference.conversation.append("answer", user=player.user, question="question")
+    return match.creator, {"match_id": match.id}, {}
+
+
+def seed_newsfeed(n):
+    newsfeed = NewsfeedFactory()
+    NewsfeedPostFactory.create_batch(n, newsfeed=newsfeed)
+    return newsfeed.user, {}, {}
+
+
+def seed_comments(n):
+    post = NewsfeedPostFactory()
+    CommentFactory.create_batch(n, post=post)
+    return AccountFactory(), {"post_id": post.id}, {}
+
+
+def seed_match_post(n):
+    posts = MatchPostFactory.create_batch(n)
+    return AccountFactory(), {"post_id": posts[-1].id}, {}
+
+
+def seed_league_post(n):
+    league = LeagueFactory()
+    posts = [
+        LeaguePost.objects.create(league=league, created_by=league.organizer, newsfeed_post=NewsfeedPostFactory(post_type="league"))
+        for _ in range(n)
+    ]
+    return AccountFactory(), {"post_id": posts[-1].id}, {}
+
+
+def seed_tournament_post(n):
+    tournament = TournamentFactory()
+    posts = [
+        TournamentPost.objects.create(
+            tournament=tournament, created_by=tournament.organizer, newsfeed_post=NewsfeedPostFactory(post_type="tournament")
+        )
+        for _ in range(n)
+    ]
+    return AccountFactory(), {"post_id": posts[-1].id}, {}
+
+
+def seed_transfer_post(n):
+    club = ClubFactory()
+    posts = [
+        TransferPost.objects.create(user=AccountFactory(), club=club, transfer_type="join", newsfeed_post=NewsfeedPostFactory(post_type="transfer"))
+        for _ in range(n)
+    ]
+    return AccountFactory(), {"post_id": posts[-1].id}, {}
+
+
+def seed_league_detail(n):
+    league = LeagueFactory()
+    teams = TeamFactory.create_batch(n)
+    league.participants.set(teams)
+    for team in teams:
+        LeagueStatusFactory(league=league, team=team)
+    for home, away in zip(teams, teams[1:] + teams[:1]):
+        LeagueMatchFactory(league=league, home_team=home, away_team=away)
+    return league.organizer, {"league_id": league.id}, {}
+
+
+def seed_league_standings(n):
+    league = LeagueFactory()
+    for team in TeamFactory.create_batch(n):
+        LeagueStatusFactory(league=league, team=team)
+    return league.organizer, {"league_id": league.id}, {}
+
+
+def seed_sportsground_detail(n):
+    facility = FacilitiesFactory()
+    FacilitiesFactory.create_batch(n - 1, sports_ground=facility.sports_ground)
+    return AccountFactory(), {"ground_id": facility.sports_ground_id}, {}
+
+
+def seed_sportsground_matches(n):
+    ground = SportsGroundFactory()
+    facility = FacilitiesFactory(sports_ground=ground)
+    for _ in range(n):
+        MatchFactory(facility=facility, total_spots=2, players=AccountFactory.create_batch(2))
+    return AccountFactory(), {"ground_id": ground.id}, {}
+
+
+def seed_facility_timeslots(n):
+    facility = FacilitiesFactory()
+    TimeSlotFactory.create_batch(n, facility=facility)
+    return AccountFactory(), {"facility_id": facility.id}, {}
+
+
+def seed_bookings(n):
+    BookingFactory.create_batch(n)
+    return AccountFactory(), {}, {}
+
+
+def seed_booking_detail(n):
+    bookings = BookingFactory.create_batch(n)
+    return bookings[-1].user, {"booking_id": bookings[-1].id}, {}
+
+
+def seed_user_profile(n):
+    target = AccountFactory(following=AccountFactory.create_batch(n))
+    return AccountFactory(), {"user_id": target.id}, {}
+
+
+def seed_follow_user(n):
+    target = AccountFactory()
+    for follower in AccountFactory.create_batch(n):
+        follower.following.add(target)
+    return AccountFactory(), {"user_id": target.id}, {}
+
+
+def seed_user_statistics(n):
+    stats = UserStatisticsFactory()
+    stats.previous_clubs.set(ClubFactory.create_batch(n))
+    return stats.user, {"user_id": stats.user_id}, {}
+
+
+SCENARIOS = {
+    'match-detail': Scenario(seed_match_detail, budget=5),
+    'search-match': Scenario(seed_search_match, budget=3),
+    'match-free-slots': Scenario(seed_free_slots, budget=2),
+    'team-talk': Scenario(seed_team_talk, budget=3),
+    'press-conference': Scenario(seed_press_conference, budget=4),
+    'newsfeed': Scenario(seed_newsfeed, budget=4),
+    'comment_post': Scenario(seed_comments, budget=3),
+    'match_post_detail': Scenario(seed_match_post, budget=2),
+    'league_post_detail': Scenario(seed_league_post, budget=2),
+    'tournament_post_detail': Scenario(seed_tournament_post, budget=2),
+    'transfer_post_detail': Scenario(seed_transfer_post, budget=2),
+    'detail_league': Scenario(seed_league_detail, budget=4),
+    'league_standings': Scenario(seed_league_standings, budget=2),
+    'sportsground-detail': Scenario(seed_sportsground_detail, budget=2),
+    'facility-list': Scenario(seed_sportsground_detail, budget=2),
+    'sportsground-matches': Scenario(seed_sportsground_matches, budget=4),
+    'facility-timeslot': Scenario(seed_facility_timeslots, budget=3),
+    'booking-list': Scenario(seed_bookings, budget=2),
+    'booking-detail': Scenario(seed_booking_detail, budget=2),
+    'user-profile': Scenario(seed_user_profile, budget=2),
+    'follow-user': Scenario(seed_follow_user, budget=4),
+    'user-statistics': Scenario(seed_user_statistics, budget=3),
+}
+
+# 쿼리 수를 측정하지 않는 GET 라우트와 그 이유
+EXEMPT = {
+    'match-event-stream': "SSE 스트림은 연결이 끊길 때까지 응답하므로 test_match_stream에서 따로 검증",
+    'match-event-poll': "DRF 밖의 async 뷰라 force_authenticate를 쓸 수 없어 test_match_stream에서 토큰으로 따로 검증",
+    'detail_tournament': "detail_league와 경로가 같아 요청이 항상 리그 상세 뷰로 간다",
+    'user-profile-newsfeed': "NewsfeedPost에 없는 필드(creator, match 등)로 필터링해 아직 동작하지 않는다",
+    'club-profile': "clubs 뷰는 아직 모델/시리얼라이저를 문자열로 참조해 동작하지 않는다",
+}
+
+
+def get_routes(patterns=None):
+    """core.urls의 이름 있는 URL 패턴 (include 포함, admin 제외)"""
+    for pattern in get_resolver().url_patterns if patterns is None else patterns:
+        if isinstance(pattern, URLResolver):
+            if pattern.app_name != 'admin':
+                yield from get_routes(pattern.url_patterns)
+        elif pattern.name:
+            yield pattern
+
+
+def accepts_get(pattern):
+    view_class = getattr(pattern.callback, 'view_class', None)
+    return view_class is None or hasattr(view_class, 'get')
+
+
+class QueryBudgetTestCase(TestCase):
+    results = []
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        report = os.environ.get('QUERY_BUDGET_REPORT')
+        if report:
+            with open(report, 'w') as f:
+                json.dump(cls.results, f, indent=2)
+
+    def setUp(self):
+        cache.clear()
+        factory.random.reseed_random('query-budget')
+
+    def measure(self, name, scenario, size):
+        user, kwargs, params = scenario.seed(size)
+        cache.clear()  # 캐시된 응답이 아니라 DB에서 읽는 경로를 측정
+        client = APIClient()
+        client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = client.get(reverse(name, kwargs=kwargs), params)
+            elapsed = time.perf_counter() - started
+        self.assertEqual(response.status_code, 200, response.content[:500])
+        result = {
+            "route": name,
+            "size": size,
+            "queries": len(queries),
+            "seconds": round(elapsed, 4),
+            "bytes": len(response.content),
+        }
+        self.results.append(result)
+        return result, queries
+
+    def test_query_count_does_not_grow_with_data(self):
+        for name, scenario in SCENARIOS.items():
+            with self.subTest(route=name):
+                (small, _), (large, queries) = [self.measure(name, scenario, size) for size in SIZES]
+                sql = "\n".join(query['sql'] for query in queries.captured_queries)
+                self.assertEqual(small["queries"], large["queries"], f"{name} runs more queries for more rows:\n{sql}")
+                self.assertLessEqual(large["queries"], scenario.budget, f"{name} exceeds its query budget:\n{sql}")
+
+    def test_every_get_route_has_a_budget(self):
+        routes = {pattern.name for pattern in get_routes() if accepts_get(pattern)}
+
+        self.assertEqual(routes - set(SCENARIOS) - set(EXEMPT), set())
+        self.assertEqual((set(SCENARIOS) | set(EXEMPT)) - routes, set())
@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+
+from django.test import TestCase
+
+from accounts.models import User, UserStatistics
+from core.seeding import EVENTS_PER_MATCH, PLAYERS_PER_MATCH, Seeder
+from matchmaking.models import Match, MatchEvent, MatchScheduleSlot
+from newsfeed.models import NewsfeedPost
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class SeederTestCase(TestCase):
+    def seed(self):
+        return Seeder(scale=0.01, seed=7, start=START, chunk_size=30).run()
+
+    def snapshot(self):
+        return (
+            list(User.objects.order_by("email").values_list("email", "username", "first_name")),
+            list(Match.objects.order_by("start_time", "facility__facility_name", "creator__email").values_list(
+                "start_time", "status", "creator__email", "red_score", "blue_score"
+            )),
+        )
+
+    def test_creates_consistent_matches(self):
+        counts = self.seed()
+
+        self.assertEqual(counts["users"], 100)
+        self.assertEqual(counts["matches"], 20)
+        self.assertEqual(UserStatistics.objects.count(), 100)
+        self.assertEqual(MatchScheduleSlot.objects.count(), 20 * PLAYERS_PER_MATCH)
+        self.assertEqual(NewsfeedPost.objects.filter(post_type="match").count(), 20 * PLAYERS_PER_MATCH)
+
+        for match in Match.objects.filter(status="completed"):
+            events = MatchEvent.objects.filter(match=match)
+            self.assertEqual(match.last_event_seq, EVENTS_PER_MATCH)
+            self.assertEqual(match.participant_count, match.participants.count())
+            self.assertEqual(match.red_score, sum(event.points for event in events.filter(side="red")))
+
+    def test_same_seed_gives_same_data(self):
+        self.seed()
+        first = self.snapshot()
+        User.objects.all().delete()
+        self.seed()
+
+        self.assertEqual(self.snapshot(), first)
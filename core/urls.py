@@ -17,11 +17,11 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 
-from matchmaking.views import CreateMatchView, MatchDetailView, MatchUpdateView, ManageMatchView, MatchStartView, MatchCompleteView, SearchMatchView, JoinMatchView, ManageJoinRequestView, MatchEventUpdateView, SubmitReviewView
+from matchmaking.views import CreateMatchView, MatchDetailView, MatchUpdateView, ManageMatchView, MatchStartView, MatchCompleteView, SearchMatchView, JoinMatchView, LeaveMatchView, FreeSlotsView, ManageJoinRequestView, MatchEventUpdateView, MatchEventVoidView, match_event_poll, match_event_stream, SubmitReviewView, PressConferenceView, StartPressConferenceView, TeamTalkView
 from newsfeed.views import NewsfeedView, MatchPostDetailView, LeaguePostDetailView, TournamentPostDetailView, TransferPostDetailView, LikePostView, CommentPostView, SharePostView
 
-from leagues.views import LeagueCreateView, LeagueDetailView, LeagueUpdateView, LeagueDeleteView, JoinLeagueView, LeagueMatchCompleteView
-from tournaments.views import TournamentCreateView, TournamentDetailView, TournamentUpdateView, TournamentDeleteView, JoinTournamentView, MatchCompleteView
+from leagues.views import LeagueCreateView, LeagueDetailView, LeagueStandingsView, LeagueUpdateView, LeagueDeleteView, JoinLeagueView, LeagueMatchCompleteView
+from tournaments.views import TournamentCreateView, TournamentDetailView, TournamentUpdateView, TournamentDeleteView, JoinTournamentView, TournamentMatchCompleteView
 
 from clubs.views import ClubProfileView, FollowClubView, JoinOrQuitClubView, ManageClubMemberView, CreateLineupView, ManageTacticView
 from sportsgrounds import views
@@ -36,14 +36,23 @@ urlpatterns = [
     path('matches/<int:match_id>/start/', MatchStartView.as_view(), name='start-match'),
     path('matches/<int:match_id>/complete/', MatchCompleteView.as_view(), name='complete-match'),
     path('matches/search/', SearchMatchView.as_view(), name='search-match'),  # 매치 검색
+    path('matches/free-slots/', FreeSlotsView.as_view(), name='match-free-slots'),  # 내 빈 시간 조회
     path('matches/<int:match_id>/details/', MatchDetailView.as_view(), name='match-detail'),  # 매치 세부 정보 조회
     path('matches/<int:match_id>/join/', JoinMatchView.as_view(), name='join-match'),  # 매치 참가
+    path('matches/<int:match_id>/leave/', LeaveMatchView.as_view(), name='leave-match'),  # 매치 참가 취소
     path('matches/<int:match_id>/join-request/<int:user_id>/', ManageJoinRequestView.as_view(), name='manage-join-request'),
     path('matches/<int:match_id>/events/', MatchEventUpdateView.as_view(), name='update-match-event'),
+    path('matches/<int:match_id>/events/<int:seq>/void/', MatchEventVoidView.as_view(), name='void-match-event'),  # 이벤트 취소/되돌리기
+    path('matches/<int:match_id>/events/stream/', match_event_stream, name='match-event-stream'),  # 실시간 이벤트 (SSE)
+    path('matches/<int:match_id>/events/poll/', match_event_poll, name='match-event-poll'),  # 실시간 이벤트 (long-poll)
     path('matches/<int:match_id>/review/', SubmitReviewView.as_view(), name='submit-review'),
+    path('matches/<int:match_id>/press-conference/', PressConferenceView.as_view(), name='press-conference'),  # 기자회견 조회(?since=) / 답변
+    path('matches/<int:match_id>/press-conference/start/', StartPressConferenceView.as_view(), name='start-press-conference'),
+    path('matches/<int:match_id>/team-talk/<int:team_id>/', TeamTalkView.as_view(), name='team-talk'),  # 팀 대화 조회(?since=) / 전송
     
     path('create/', LeagueCreateView.as_view(), name='create_league'),
     path('<int:league_id>/', LeagueDetailView.as_view(), name='detail_league'),
+    path('<int:league_id>/standings/', LeagueStandingsView.as_view(), name='league_standings'),
     path('<int:league_id>/update/', LeagueUpdateView.as_view(), name='update_league'),
     path('<int:league_id>/delete/', LeagueDeleteView.as_view(), name='delete_league'),
     path('<int:league_id>/join/', JoinLeagueView.as_view(), name='join_league'),
@@ -54,7 +63,7 @@ urlpatterns = [
     path('<int:tournament_id>/update/', TournamentUpdateView.as_view(), name='update_tournament'),
     path('<int:tournament_id>/delete/', TournamentDeleteView.as_view(), name='delete_tournament'),
     path('<int:tournament_id>/join/', JoinTournamentView.as_view(), name='join_tournament'),
-    path('match/<int:match_id>/complete/', MatchCompleteView.as_view(), name='complete_match'),
+    path('match/<int:match_id>/complete/', TournamentMatchCompleteView.as_view(), name='complete_match'),
     
     path('newsfeed/', NewsfeedView.as_view(), name='newsfeed'),
     path('newsfeed/match/<int:post_id>/', MatchPostDetailView.as_view(), name='match_post_detail'),
@@ -80,7 +89,7 @@ urlpatterns = [
     path('clubs/<int:club_id>/tactics/<int:tactic_id>/', ManageTacticView.as_view(), name='club-delete-tactic'),
     
     # 스포츠 그라운드 관련 URL
-    path('sportsgrounds/', views.SportsGroundDetailView.as_view(), name='sportsground-detail'),  # 특정 스포츠 그라운드 상세 조회
+    path('sportsgrounds/<int:ground_id>/', views.SportsGroundDetailView.as_view(), name='sportsground-detail'),  # 특정 스포츠 그라운드 상세 조회
     path('sportsgrounds/<int:ground_id>/facilities/', views.FacilityListView.as_view(), name='facility-list'),  # 특정 스포츠 그라운드 내 시설 목록 조회
     path('sportsgrounds/<int:ground_id>/matches/', views.SportsGroundMatchListView.as_view(), name='sportsground-matches'),  # 특정 스포츠 그라운드에서 발생한 매치 목록 조회
     path('sportsgrounds/<int:ground_id>/follow/', views.FollowSportsGroundView.as_view(), name='sportsground-follow'),  # 스포츠 그라운드 팔로우
@@ -0,0 +1,30 @@
+"""
+리그 순위표 캐시.
+
+순위표는 매치 완료 때만 바뀌고 바뀔 때마다 League.standings_version이 올라가므로,
+(리그, 버전)을 키로 직렬화된 순위표를 캐시한다. 버전이 올라가면 키가 달라져 따로 지울 필요가 없고,
+같은 버전을 이미 가진 클라이언트에는 ETag로 304를 돌려준다.
+"""
+from django.conf import settings
+from django.core.cache import cache
+
+from leagues.models import LeagueStatus
+from leagues.serializers import LeagueStatusSerializer
+
+
+def _standings_key(league_id, version):
+    return f"league:standings:{league_id}:{version}"
+
+
+def standings_etag(league_id, version):
+    return f'"league-{league_id}-standings-{version}"'
+
+
+def get_standings(league_id, version):
+    """순위 순서대로 직렬화된 순위표. 캐시에 없으면 DB에서 읽어 채운다."""
+    standings = cache.get(_standings_key(league_id, version))
+    if standings is None:
+        rows = LeagueStatus.objects.filter(league_id=league_id).select_related('team').order_by('current_position', 'team__name', 'id')
+        standings = LeagueStatusSerializer(rows, many=True).data
+        cache.set(_standings_key(league_id, version), standings, settings.LEAGUE_STANDINGS_CACHE_TTL)
+    return standings
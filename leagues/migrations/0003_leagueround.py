@@ -0,0 +1,76 @@
+# Generated by Django 4.2.13 on 2026-10-18 20:15
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+import django.db.models.deletion
+from django.utils import timezone
+
+
+def backfill_rounds(apps, schema_editor):
+    """이미 대진이 있는 리그의 라운드별 경기 수/완료 경기 수를 채운다"""
+    LeagueMatch = apps.get_model("leagues", "LeagueMatch")
+    LeagueRound = apps.get_model("leagues", "LeagueRound")
+
+    rows = (
+        LeagueMatch.objects.values("league_id", "round_number")
+        .annotate(total=Count("id"), completed=Count("id", filter=Q(match__status="completed")))
+        .order_by("league_id", "round_number")
+    )
+    now = timezone.now()
+    LeagueRound.objects.bulk_create(
+        [
+            LeagueRound(
+                league_id=row["league_id"],
+                round_number=row["round_number"],
+                total_matches=row["total"],
+                completed_matches=row["completed"],
+                completed_at=now if row["completed"] >= row["total"] else None,
+            )
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("leagues", "0002_initial"),
+        ("matchmaking", "0016_alter_match_facility_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LeagueRound",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("round_number", models.IntegerField()),
+                ("total_matches", models.PositiveIntegerField()),
+                ("completed_matches", models.PositiveIntegerField(default=0)),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "league",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rounds",
+                        to="leagues.league",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="leagueround",
+            constraint=models.UniqueConstraint(
+                fields=("league", "round_number"),
+                name="leagues_leagueround_unique_round",
+            ),
+        ),
+        migrations.RunPython(backfill_rounds, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.13 on 2026-10-18 21:02
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_statuses(apps, schema_editor):
+    """유니크 제약을 걸기 전에 같은 리그/팀의 중복 순위표 행은 가장 먼저 만든 행만 남긴다"""
+    LeagueStatus = apps.get_model("leagues", "LeagueStatus")
+    duplicates = (
+        LeagueStatus.objects.values("league_id", "team_id")
+        .annotate(rows=Count("id"), keep=Min("id"))
+        .filter(rows__gt=1)
+    )
+    for duplicate in duplicates:
+        LeagueStatus.objects.filter(league_id=duplicate["league_id"], team_id=duplicate["team_id"]).exclude(
+            id=duplicate["keep"]
+        ).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("leagues", "0003_leagueround"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="league",
+            name="standings_version",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(remove_duplicate_statuses, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="leaguestatus",
+            constraint=models.UniqueConstraint(
+                fields=("league", "team"), name="leagues_leaguestatus_unique_team"
+            ),
+        ),
+    ]
@@ -1,2 +1,3 @@
 from .league import League, LeagueStatus
-from .league_match import LeagueMatch
\ No newline at end of file
+from .league_match import LeagueMatch
+from .league_round import LeagueRound
@@ -1,9 +1,16 @@
+from collections import Counter
+
 from django.core.exceptions import ValidationError
 from django.utils import timezone
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models import Case, Count, F, When
 
+from leagues.scheduling import round_robin, single_round_count
+from leagues.standings import head_to_head, result_deltas
+from sportsgrounds.scheduling import DEFAULT_REST_GAP
 # User, Match는 문자열로 참조
 from matchmaking.models.team import Team  # Team 모델 임포트
+from newsfeed.cache import invalidate_posts, push_posts
 from newsfeed.models.newsfeed import NewsfeedPost
 from newsfeed.models.league_post import LeaguePost
 
@@ -37,6 +44,7 @@ class League(models.Model):
     # 매치 관련 필드
     match_duration = models.DurationField()  # 매치 경기 시간
     winning_method = models.CharField(max_length=255)  # 승리 조건
+    standings_version = models.PositiveIntegerField(default=0)  # 순위표가 바뀔 때마다 1씩 증가 (순위표 캐시 키/ETag)
 
     def __str__(self):
         return self.league_name
@@ -58,34 +66,83 @@ class League(models.Model):
                 team_1.players.add(participants[i])
                 team_2.players.add(participants[i + 1])
 
-    def generate_schedule(self):
+    def generate_schedule(self, double_round_robin=None):
         """
         리그 매치 생성 메서드. 스케줄링은 시간과 장소 없이 매치만 생성.
+        circle method 라운드 로빈(leagues.scheduling)으로 대진을 짜고, Match와 LeagueMatch를
+        한 트랜잭션에서 각각 INSERT 한 번으로 만든다. 라운드별 LeagueMatch 목록을 반환.
+        double_round_robin을 주지 않으면 total_number_of_rounds가 한 바퀴 라운드 수의 두 배 이상일 때
+        홈/원정을 바꿔 두 번씩 만난다. total_number_of_rounds는 실제 라운드 수로 갱신된다.
         """
-        teams = list(self.participants.all())
-        num_teams = len(teams)
-        if num_teams != self.max_teams:
+        from leagues.models.league_match import LeagueMatch
+        from leagues.models.league_round import LeagueRound
+        from matchmaking.models.match import Match
+
+        teams = list(self.participants.order_by('id'))
+        if len(teams) != self.max_teams or len(teams) < 2:
             return []
-        
-        matches_per_round = []
-        for round_number in range(1, self.total_number_of_rounds + 1):
-            round_matches = []
-            for i in range(0, num_teams - 1, 2):
-                home_team = teams[i]
-                away_team = teams[i + 1]
-                match = models.get_model('matchmaking', 'Match').objects.create(
-                    home_team=home_team,
-                    away_team=away_team,
+        if double_round_robin is None:
+            double_round_robin = self.total_number_of_rounds >= 2 * single_round_count(len(teams))
+        fixtures = [
+            (round_number, home, away)
+            for round_number, round_fixtures in enumerate(round_robin(teams, double=double_round_robin), start=1)
+            for home, away in round_fixtures
+        ]
+
+        with transaction.atomic():
+            # 리그 row를 잠가 동시에 두 번 생성되지 않도록 한다
+            League.objects.select_for_update().values_list('pk', flat=True).get(pk=self.pk)
+            if LeagueMatch.objects.filter(league=self).exists():
+                raise ValidationError("The schedule for this league has already been generated.")
+
+            matches = Match.objects.bulk_create([
+                Match(
+                    league=self,
                     match_type='league',
                     status='scheduled',
+                    creator_id=self.organizer_id,
+                    price=0,
                     duration=self.match_duration,
-                    winning_method=self.winning_method
+                    total_spots=0,
                 )
-                round_matches.append(match)
-            matches_per_round.append(round_matches)
-            teams = [teams[0]] + teams[2:] + teams[1:2]
+                for _ in fixtures
+            ])
+            league_matches = LeagueMatch.objects.bulk_create([
+                LeagueMatch(league=self, match=match, home_team=home, away_team=away, round_number=round_number)
+                for match, (round_number, home, away) in zip(matches, fixtures)
+            ])
+            self.total_number_of_rounds = fixtures[-1][0]
+            self.current_round = 1
+            self.save(update_fields=['total_number_of_rounds', 'current_round'])
+            matches_in_round = Counter(round_number for round_number, _, _ in fixtures)
+            LeagueRound.objects.bulk_create([
+                LeagueRound(league=self, round_number=round_number, total_matches=count)
+                for round_number, count in sorted(matches_in_round.items())
+            ])
+            # 순위표 행 (경기 전에는 모두 공동 1위). 참가 시 이미 만들어진 행은 그대로 둔다
+            LeagueStatus.objects.bulk_create(
+                [LeagueStatus(league=self, team=team, current_position=1) for team in teams], ignore_conflicts=True
+            )
+            # 순위표 행이 생겼으므로 이전 버전으로 캐시된 순위표/ETag를 무효화 (리그 row는 잠겨 있다)
+            League.objects.filter(pk=self.pk).update(standings_version=F('standings_version') + 1)
+            self.standings_version += 1
+
+        matches_per_round = [[] for _ in range(self.total_number_of_rounds)]
+        for league_match in league_matches:
+            matches_per_round[league_match.round_number - 1].append(league_match)
         return matches_per_round
 
+    def auto_schedule(self, rest_gap=DEFAULT_REST_GAP):
+        """
+        시간/장소가 없는 리그 매치를 라운드 순서대로 start_date~deadline 사이 빈 TimeSlot에 배정.
+        팀 경기 사이에는 rest_gap 이상 쉬고, 가까운 구장을 우선한다 (sportsgrounds.auto_schedule).
+        """
+        from leagues.models.league_match import LeagueMatch
+        from sportsgrounds.auto_schedule import schedule_fixtures
+
+        fixtures = LeagueMatch.objects.filter(league=self).order_by('round_number', 'id')
+        return schedule_fixtures(fixtures, self.start_date, self.deadline, rest_gap)
+
     def validate_join(self, user):
         """
         리그 시작일 이후 참가 차단.
@@ -109,6 +166,7 @@ class League(models.Model):
             post_id=self.id,
             post_content=f"League {self.league_name} has been created! Join now!"
         )
+        transaction.on_commit(lambda: push_posts([newsfeed_post]))  # 주최자의 캐시된 타임라인에도 반영
 
         # 리그 포스트 생성
         LeaguePost.objects.create(
@@ -133,18 +191,44 @@ class League(models.Model):
         """
         각 라운드가 완료되었을 때 뉴스피드 포스트 업데이트
         """
-        newsfeed_post = NewsfeedPost.objects.get(post_id=self.id, post_type="league")
-        newsfeed_post.post_content = f"Round {self.current_round} of League {self.league_name} is now complete!"
-        newsfeed_post.save()
+        self.update_league_post(f"Round {self.current_round} of League {self.league_name} is now complete!")
 
 ### 4. 리그 종료 시 최종 포스트 업데이트
     def update_league_post_on_completion(self):
         """
         리그가 완료되었을 때 최종 결과를 뉴스피드 포스트로 업데이트
         """
-        newsfeed_post = NewsfeedPost.objects.get(post_id=self.id, post_type="league")
-        newsfeed_post.post_content = f"League {self.league_name} has been completed! Congratulations to the winners!"
-        newsfeed_post.save()
+        self.update_league_post(f"League {self.league_name} has been completed! Congratulations to the winners!")
+
+    def update_league_post(self, content):
+        # 팔로워에게 fan-out된 포스트와 post_id가 같으므로 주최자 뉴스피드의 포스트만 갱신
+        posts = NewsfeedPost.objects.filter(newsfeed__user=self.organizer_id, post_id=self.id, post_type="league")
+        post_ids = list(posts.values_list('id', flat=True))
+        posts.update(post_content=content)
+        invalidate_posts(post_ids)
+
+    def advance_round(self):
+        """
+        라운드가 끝났을 때 (LeagueRound.record_completion이 True를 반환한 트랜잭션에서 한 번) 호출.
+        끝나지 않은 가장 앞 라운드로 current_round를 옮기고, 모든 라운드가 끝났으면 리그 완료 포스트를 남긴다.
+        반환: 리그가 끝났으면 True
+        """
+        next_round = (
+            self.rounds.filter(completed_at__isnull=True).order_by('round_number').values_list('round_number', flat=True).first()
+        )
+        if next_round is None:
+            LeagueStatus.objects.filter(league=self).update(final_position=F('current_position'))
+            self.update_league_post_on_completion()
+            return True
+        if next_round > self.current_round:
+            self.update_league_post_on_round_completion()
+            League.objects.filter(pk=self.pk, current_round__lt=next_round).update(current_round=next_round)
+            self.current_round = next_round
+        return False
+
+    @property
+    def is_finished(self):
+        return self.rounds.exists() and not self.rounds.filter(completed_at__isnull=True).exists()
 
 
 # League_Status 모델
@@ -161,5 +245,79 @@ class LeagueStatus(models.Model):
     points_conceded = models.IntegerField(default=0)  # 실점
     matches_played = models.IntegerField(default=0)  # 경기 수
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['league', 'team'], name='leagues_leaguestatus_unique_team'),
+        ]
+
     def __str__(self):
-        return f"{self.team.name} in {self.league.league_name} (Position: {self.current_position})"
\ No newline at end of file
+        return f"{self.team.name} in {self.league.league_name} (Position: {self.current_position})"
+
+    @classmethod
+    def apply_result(cls, league_id, home_team_id, away_team_id, home_score, away_score, winning_side=''):
+        """
+        완료된 매치 결과를 두 팀 순위표에 더하고 (UPDATE 한 번) 순위를 다시 매긴다.
+        매치 완료는 조건부 UPDATE로 한 번만 일어나므로 호출자(LeagueMatch.match_completed)도 매치당 한 번만 부른다.
+        """
+        home, away = result_deltas(home_score, away_score, winning_side)
+        cls.objects.filter(league_id=league_id, team_id__in=[home_team_id, away_team_id]).update(**{
+            field: F(field) + Case(When(team_id=home_team_id, then=home[field]), default=away[field])
+            for field in home
+        })
+        cls.update_positions(league_id)
+
+    @classmethod
+    def update_positions(cls, league_id):
+        """
+        승점, 득실차, 득점 순 RANK() 윈도 함수로 순위를 UPDATE 한 번에 다시 매기고,
+        동점 팀이 남으면 승자승으로 가른다 (leagues.standings). 순위표 캐시 무효화를 위해 standings_version을 올린다.
+        """
+        table = connection.ops.quote_name(cls._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                UPDATE {table} AS standing SET current_position = ranked.position
+                FROM (
+                    SELECT id, RANK() OVER (
+                        ORDER BY league_points DESC, points_scored - points_conceded DESC, points_scored DESC
+                    ) AS position
+                    FROM {table} WHERE league_id = %s
+                ) AS ranked
+                WHERE standing.id = ranked.id AND standing.current_position <> ranked.position
+                """,
+                [league_id],
+            )
+
+        tied = list(
+            cls.objects.filter(league_id=league_id).values('current_position').annotate(teams=Count('id'))
+            .filter(teams__gt=1).values_list('current_position', flat=True)
+        )
+        if tied:
+            cls.break_ties(league_id, tied)
+        League.objects.filter(pk=league_id).update(standings_version=F('standings_version') + 1)
+
+    @classmethod
+    def break_ties(cls, league_id, positions):
+        """같은 순위(positions)를 공유하는 팀들을 그 팀들 사이의 완료된 경기 결과로 다시 정렬"""
+        from leagues.models.league_match import LeagueMatch
+
+        standings = list(cls.objects.filter(league_id=league_id, current_position__in=positions).only('id', 'team_id', 'current_position'))
+        team_ids = [standing.team_id for standing in standings]
+        results = list(
+            LeagueMatch.objects.filter(
+                league_id=league_id, match__status='completed', home_team_id__in=team_ids, away_team_id__in=team_ids
+            ).values_list('home_team_id', 'away_team_id', 'match__red_score', 'match__blue_score', 'match__winning_side')
+        )
+
+        by_position = {}
+        for standing in standings:
+            by_position.setdefault(standing.current_position, {})[standing.team_id] = standing
+        changed = []
+        for position, by_team in by_position.items():
+            for group in head_to_head(by_team, results):
+                for team_id in group:
+                    if by_team[team_id].current_position != position:
+                        by_team[team_id].current_position = position
+                        changed.append(by_team[team_id])
+                position += len(group)
+        cls.objects.bulk_update(changed, ['current_position'])
@@ -1,7 +1,7 @@
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.db import models
-from .league import League
+from .league import League, LeagueStatus
 from matchmaking.models.match import Match
 from matchmaking.models.team import Team
 
@@ -29,4 +29,36 @@ class LeagueMatch(models.Model):
             raise ValidationError("Unknown scheduling type.")
     
     def __str__(self):
-        return f"Match {self.match.id} in {self.league.league_name}: {self.home_team} vs {self.away_team}"
\ No newline at end of file
+        return f"Match {self.match.id} in {self.league.league_name}: {self.home_team} vs {self.away_team}"
+
+    def record_score(self, home_score, away_score):
+        """
+        이벤트 없이 결과만 입력하는 대진의 최종 점수 기록 (홈 = 레드, 원정 = 블루).
+        완료 전 매치만 바꾸며, 이벤트로 점수를 기록한 매치는 스코어보드를 그대로 쓴다.
+        """
+        if home_score < 0 or away_score < 0:
+            raise ValidationError("Scores must not be negative.")
+        updated = Match.objects.filter(pk=self.match_id, last_event_seq=0).exclude(status__in=['completed', 'canceled']).update(
+            red_score=home_score, blue_score=away_score, winning_side=''
+        )
+        if not updated:
+            raise ValidationError("The score of this match cannot be changed.")
+        self.match.red_score, self.match.blue_score, self.match.winning_side = home_score, away_score, ''
+
+    @classmethod
+    def match_completed(cls, match_id):
+        """
+        리그 매치 완료 처리 (Match.complete_match가 매치당 한 번 호출).
+        결과를 순위표에 반영하고, 라운드가 끝났으면 리그를 다음 라운드로 진행한다.
+        """
+        from .league_round import LeagueRound
+
+        row = cls.objects.filter(match_id=match_id).values_list(
+            'league_id', 'round_number', 'home_team_id', 'away_team_id', 'match__red_score', 'match__blue_score', 'match__winning_side'
+        ).first()
+        if row is None:
+            return
+        league_id, round_number, home_team_id, away_team_id, home_score, away_score, winning_side = row
+        LeagueStatus.apply_result(league_id, home_team_id, away_team_id, home_score, away_score, winning_side)
+        if LeagueRound.record_completion(league_id, round_number):
+            League.objects.get(pk=league_id).advance_round()
@@ -0,0 +1,39 @@
+from django.db import models
+from django.db.models import F
+from django.utils import timezone
+
+from .league import League
+
+
+class LeagueRound(models.Model):
+    """
+    리그 라운드별 완료 경기 수.
+    매치가 완료될 때마다 완료 수를 F() UPDATE로 1 올리고, 마지막 경기일 때만 completed_at을 조건부 UPDATE로 채워
+    라운드 진행/포스트 갱신이 동시에 완료되는 경기 수와 관계없이 한 번만 실행된다.
+    """
+    league = models.ForeignKey(League, on_delete=models.CASCADE, related_name="rounds")
+    round_number = models.IntegerField()
+    total_matches = models.PositiveIntegerField()
+    completed_matches = models.PositiveIntegerField(default=0)
+    completed_at = models.DateTimeField(null=True, blank=True)  # 라운드의 모든 경기가 끝난 시각
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['league', 'round_number'], name='leagues_leagueround_unique_round'),
+        ]
+
+    def __str__(self):
+        return f"{self.league_id} - Round {self.round_number} ({self.completed_matches}/{self.total_matches})"
+
+    @classmethod
+    def record_completion(cls, league_id, round_number):
+        """
+        라운드 완료 경기 수를 1 올리고, 이번 경기로 라운드가 끝났으면 True (라운드마다 한 번만 True).
+        같은 매치를 두 번 세지 않도록 매치 상태를 조건부 UPDATE로 바꾼 호출자만 불러야 한다.
+        """
+        rounds = cls.objects.filter(league_id=league_id, round_number=round_number)
+        rounds.update(completed_matches=F('completed_matches') + 1)
+        closed = rounds.filter(completed_matches__gte=F('total_matches'), completed_at__isnull=True).update(
+            completed_at=timezone.now()
+        )
+        return bool(closed)
@@ -0,0 +1,50 @@
+"""
+리그 대진표 (circle method 라운드 로빈).
+
+- 팀 수가 홀수면 고정 자리에 가상의 휴식 자리(None)를 두고, 매 라운드 그 자리와 짝지어진 팀이 쉰다.
+- 나머지 자리는 라운드마다 한 칸씩 돌리며 i번째와 (n-1-i)번째 자리를 짝짓는다.
+- 홈/원정은 고정 자리 경기는 라운드마다, 나머지 경기는 짝 번호마다 번갈아 정하므로
+  한 바퀴 동안 각 팀의 홈/원정 경기 수 차이는 1 이하 (팀 수가 홀수면 0)다.
+- 더블 라운드 로빈은 같은 대진을 홈/원정만 바꿔 한 바퀴 더 치른다.
+
+DB 접근이 없는 순수 모듈이다.
+"""
+BYE = None
+
+
+def single_round_count(team_count):
+    """한 바퀴 라운드 수 (팀 수가 홀수면 휴식 때문에 한 라운드 더)"""
+    if team_count < 2:
+        return 0
+    return team_count - 1 if team_count % 2 == 0 else team_count
+
+
+def round_robin(teams, double=False):
+    """
+    라운드별 [(홈, 원정), ...] 목록.
+    모든 팀 쌍이 한 번씩 (double이면 홈/원정을 바꿔 두 번) 만나고, 한 팀은 한 라운드에 최대 한 경기만 치른다.
+    """
+    slots = list(teams)
+    if len(slots) < 2:
+        return []
+    if len(slots) % 2:
+        slots.insert(0, BYE)
+    size = len(slots)
+    fixed, rotating = slots[0], slots[1:]
+
+    rounds = []
+    for round_index in range(size - 1):
+        order = [fixed] + rotating
+        fixtures = []
+        for i in range(size // 2):
+            home, away = order[i], order[size - 1 - i]
+            if (round_index if i == 0 else i) % 2:
+                home, away = away, home
+            if home is not BYE and away is not BYE:
+                fixtures.append((home, away))
+        rounds.append(fixtures)
+        rotating = rotating[-1:] + rotating[:-1]
+
+    if double:
+        rounds += [[(away, home) for home, away in fixtures] for fixtures in rounds]
+    return rounds
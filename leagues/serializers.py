@@ -30,7 +30,8 @@ class LeagueStatusSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = LeagueStatus
-        fields = ['league', 'team', 'current_position', 'league_points', 'wins', 'draws', 'losses', 'matches_played']
+        fields = ['league', 'team', 'current_position', 'final_position', 'league_points', 'wins', 'draws', 'losses',
+                  'matches_played', 'points_scored', 'points_conceded']
 
 class LeagueMatchSerializer(serializers.ModelSerializer):
     home_team = TeamSerializer()
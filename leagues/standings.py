@@ -0,0 +1,71 @@
+"""
+리그 순위표 규칙.
+
+- 승 3점, 무 1점, 패 0점. 매치 결과는 winning_side(세트 승부)가 있으면 그 팀의 승리,
+  없으면 점수가 높은 팀의 승리, 같으면 무승부다 (red = 홈, blue = 원정).
+- 순위는 승점, 득실차, 득점 순으로 정하고 (DB에서 RANK() 윈도 함수로 계산),
+  그래도 같은 팀끼리는 그 팀들 사이의 경기(승자승)만으로 같은 기준을 다시 적용한다.
+  승자승으로도 갈리지 않으면 같은 순위를 공유한다.
+
+매치 완료 시에는 LeagueStatus.apply_result가 result_deltas를 F() UPDATE로 더하고,
+승자승 정렬은 동점 팀이 있을 때만 head_to_head로 메모리에서 계산한다. DB 접근이 없는 순수 모듈이다.
+"""
+from collections import defaultdict
+
+POINTS_FOR_WIN = 3
+POINTS_FOR_DRAW = 1
+POINTS_FOR_LOSS = 0
+
+HOME = 'home'
+AWAY = 'away'
+
+
+def match_result(home_score, away_score, winning_side=''):
+    """승리 팀 (HOME / AWAY), 무승부면 ''"""
+    if winning_side:
+        return HOME if winning_side == 'red' else AWAY
+    if home_score > away_score:
+        return HOME
+    if away_score > home_score:
+        return AWAY
+    return ''
+
+
+def result_deltas(home_score, away_score, winning_side=''):
+    """(홈 팀 증가분, 원정 팀 증가분). 각 증가분은 LeagueStatus 필드 -> 더할 값"""
+    result = match_result(home_score, away_score, winning_side)
+    deltas = []
+    for side, scored, conceded in ((HOME, home_score, away_score), (AWAY, away_score, home_score)):
+        won, drawn = result == side, result == ''
+        deltas.append({
+            'matches_played': 1,
+            'wins': int(won),
+            'draws': int(drawn),
+            'losses': int(not (won or drawn)),
+            'league_points': POINTS_FOR_WIN if won else POINTS_FOR_DRAW if drawn else POINTS_FOR_LOSS,
+            'points_scored': scored,
+            'points_conceded': conceded,
+        })
+    return tuple(deltas)
+
+
+def head_to_head(teams, results):
+    """
+    동점 팀들 사이의 경기만으로 다시 정렬한 순위 그룹 목록 (앞 그룹이 높은 순위, 같은 그룹은 여전히 동점).
+    results: [(홈 팀, 원정 팀, 홈 점수, 원정 점수, winning_side), ...] (다른 팀과의 경기는 무시)
+    """
+    teams = set(teams)
+    table = defaultdict(lambda: [0, 0, 0])  # 팀 -> [승점, 득실차, 득점]
+    for home, away, home_score, away_score, winning_side in results:
+        if home not in teams or away not in teams:
+            continue
+        for team, delta in zip((home, away), result_deltas(home_score, away_score, winning_side)):
+            row = table[team]
+            row[0] += delta['league_points']
+            row[1] += delta['points_scored'] - delta['points_conceded']
+            row[2] += delta['points_scored']
+
+    groups = defaultdict(list)
+    for team in teams:
+        groups[tuple(table[team])].append(team)
+    return [sorted(groups[key]) for key in sorted(groups, reverse=True)]
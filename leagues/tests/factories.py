@@ -1,69 +1,41 @@
+from datetime import date, timedelta
+
 import factory
 import factory.fuzzy
 
-from leagues.models import (
-    League,
-    LeagueMatch,
-    LeaguePosition,
-    LeagueRound,
-    LeagueTablePost,
-)
+from leagues.models import League, LeagueMatch, LeagueStatus
 
 
 class LeagueFactory(factory.django.DjangoModelFactory):
-    name = factory.Faker("name")
-    season = factory.Sequence(lambda n: str(2000 + n))
+    organizer = factory.SubFactory("accounts.tests.factories.AccountFactory")
+    league_name = factory.Faker("company")
+    description = factory.Faker("text")
+    total_number_of_rounds = factory.fuzzy.FuzzyInteger(1, 10)
+    max_teams = factory.fuzzy.FuzzyInteger(4, 20)
+    start_date = factory.LazyFunction(date.today)
+    deadline = factory.LazyAttribute(lambda o: o.start_date + timedelta(days=90))
+    match_duration = timedelta(hours=2)
+    winning_method = "points"
 
     class Meta:
         model = League
 
 
-class LeagueRoundFactory(factory.django.DjangoModelFactory):
+class LeagueStatusFactory(factory.django.DjangoModelFactory):
     league = factory.SubFactory(LeagueFactory)
-    name = factory.Sequence(lambda n: f"Round {n+1}")
+    team = factory.SubFactory("matchmaking.tests.factories.TeamFactory")
+    current_position = factory.Sequence(lambda n: n + 1)
 
     class Meta:
-        model = LeagueRound
+        model = LeagueStatus
 
 
 class LeagueMatchFactory(factory.django.DjangoModelFactory):
-    round = factory.SubFactory(LeagueRoundFactory)
-    match = factory.SubFactory(
-        "matchmaking.tests.factories.MatchFactory", match_type="league"
-    )
-
-    class Meta:
-        model = LeagueMatch
-
-
-class LeaguePositionFactory(factory.django.DjangoModelFactory):
     league = factory.SubFactory(LeagueFactory)
-    club = factory.SubFactory("clubs.tests.factories.ClubFactory")
-    position = factory.fuzzy.FuzzyInteger(0, 20)
-    points = factory.fuzzy.FuzzyInteger(0, 60)
-    played = factory.fuzzy.FuzzyInteger(0, 20)
-    won = factory.fuzzy.FuzzyInteger(0, 20)
-    drawn = factory.fuzzy.FuzzyInteger(0, 20)
-    lost = factory.fuzzy.FuzzyInteger(0, 20)
-    goals_for = factory.fuzzy.FuzzyInteger(0, 60)
-    goals_against = factory.fuzzy.FuzzyInteger(0, 60)
-    goal_difference = factory.fuzzy.FuzzyInteger(-60, 60)
+    match = factory.SubFactory("matchmaking.tests.factories.MatchFactory", match_type="league")
+    home_team = factory.SubFactory("matchmaking.tests.factories.TeamFactory")
+    away_team = factory.SubFactory("matchmaking.tests.factories.TeamFactory")
+    round_number = 1
 
     class Meta:
-        model = LeaguePosition
-
-
-class LeagueTablePostFactory(factory.django.DjangoModelFactory):
-    title = factory.Faker("text")
-    user = factory.SubFactory("accounts.tests.factories.AccountFactory")
-    league = factory.SubFactory(LeagueFactory)
-
-    comments = factory.RelatedFactory(
-        "newsfeed.tests.factories.CommentFactory", "content_object"
-    )
-    likes = factory.RelatedFactory(
-        "newsfeed.tests.factories.LikeFactory", "content_object"
-    )
-
-    class Meta:
-        model = LeagueTablePost
+        model = LeagueMatch
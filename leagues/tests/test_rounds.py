@@ -0,0 +1,40 @@
+from django.test import TestCase
+
+from leagues.models import LeagueMatch, LeagueRound
+from leagues.tests.factories import LeagueFactory
+from matchmaking.tests.factories import TeamFactory
+
+
+class LeagueRoundAdvanceTestCase(TestCase):
+    def setUp(self):
+        self.league = LeagueFactory(max_teams=4, total_number_of_rounds=3)
+        self.league.participants.set(TeamFactory.create_batch(4))
+        self.league.generate_schedule()
+
+    def matches(self, round_number):
+        return [
+            league_match.match
+            for league_match in LeagueMatch.objects.filter(league=self.league, round_number=round_number).select_related("match")
+        ]
+
+    def test_round_advances_once_when_last_match_completes(self):
+        first, second = self.matches(1)
+
+        self.assertTrue(first.complete_match())
+        self.assertFalse(first.complete_match())  # 두 번 완료해도 한 번만 센다
+        self.league.refresh_from_db()
+        self.assertEqual(self.league.current_round, 1)
+
+        self.assertTrue(second.complete_match())
+        self.league.refresh_from_db()
+        self.assertEqual(self.league.current_round, 2)
+        self.assertEqual(LeagueRound.objects.get(league=self.league, round_number=1).completed_matches, 2)
+
+    def test_league_finishes_after_every_round(self):
+        for round_number in (1, 2, 3):
+            for match in self.matches(round_number):
+                match.complete_match()
+
+        self.league.refresh_from_db()
+        self.assertTrue(self.league.is_finished)
+        self.assertEqual(self.league.current_round, 3)
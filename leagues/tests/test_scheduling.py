@@ -0,0 +1,104 @@
+from collections import Counter
+from itertools import combinations
+
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.tests.factories import AccountFactory
+from leagues.models import LeagueMatch
+from leagues.scheduling import round_robin, single_round_count
+from leagues.tests.factories import LeagueFactory
+from matchmaking.models import Match
+from matchmaking.tests.factories import TeamFactory
+
+TEAM_COUNTS = range(2, 49)
+
+
+class RoundRobinTestCase(SimpleTestCase):
+    def test_every_pair_meets_once_per_cycle(self):
+        for count in TEAM_COUNTS:
+            for double in (False, True):
+                with self.subTest(teams=count, double=double):
+                    rounds = round_robin(range(count), double=double)
+                    pairs = Counter(frozenset(fixture) for fixtures in rounds for fixture in fixtures)
+                    cycles = 2 if double else 1
+
+                    self.assertEqual(len(rounds), single_round_count(count) * cycles)
+                    self.assertEqual(set(pairs), {frozenset(pair) for pair in combinations(range(count), 2)})
+                    self.assertEqual(set(pairs.values()), {cycles})
+
+    def test_team_plays_at_most_once_per_round(self):
+        for count in TEAM_COUNTS:
+            with self.subTest(teams=count):
+                for fixtures in round_robin(range(count)):
+                    teams = [team for fixture in fixtures for team in fixture]
+                    self.assertEqual(len(teams), len(set(teams)))
+                    self.assertEqual(len(fixtures), count // 2)  # 홀수면 한 팀만 쉰다
+
+    def test_home_and_away_are_balanced(self):
+        for count in TEAM_COUNTS:
+            with self.subTest(teams=count):
+                home, away = Counter(), Counter()
+                for fixtures in round_robin(range(count)):
+                    for home_team, away_team in fixtures:
+                        home[home_team] += 1
+                        away[away_team] += 1
+
+                self.assertLessEqual(max(abs(home[team] - away[team]) for team in range(count)), 0 if count % 2 else 1)
+
+    def test_second_cycle_swaps_home_and_away(self):
+        rounds = round_robin(range(6), double=True)
+        fixtures = [fixture for round_fixtures in rounds for fixture in round_fixtures]
+
+        self.assertEqual(len(set(fixtures)), len(fixtures))
+
+
+class GenerateScheduleTestCase(TestCase):
+    def setUp(self):
+        self.league = LeagueFactory(max_teams=41, total_number_of_rounds=1)
+        self.league.participants.set(TeamFactory.create_batch(41))
+
+    def test_creates_fixtures_in_constant_queries(self):
+        # 참가 팀 조회, 잠금, 중복 확인, Match/LeagueMatch/LeagueRound/LeagueStatus INSERT, 라운드 수/순위표 버전 저장 + savepoint
+        with self.assertNumQueries(11):
+            rounds = self.league.generate_schedule()
+
+        self.assertEqual(len(rounds), 41)
+        self.assertEqual(LeagueMatch.objects.filter(league=self.league).count(), 41 * 40 // 2)
+        self.assertEqual(Match.objects.filter(league=self.league, match_type="league").count(), 41 * 40 // 2)
+        self.league.refresh_from_db()
+        self.assertEqual(self.league.total_number_of_rounds, 41)
+
+    def test_double_round_robin_when_rounds_allow(self):
+        self.league.total_number_of_rounds = 82
+        rounds = self.league.generate_schedule()
+
+        self.assertEqual(len(rounds), 82)
+        self.assertEqual(LeagueMatch.objects.filter(league=self.league).count(), 41 * 40)
+
+    def test_cannot_generate_twice(self):
+        self.league.generate_schedule()
+
+        with self.assertRaises(ValidationError):
+            self.league.generate_schedule()
+        self.assertEqual(LeagueMatch.objects.filter(league=self.league).count(), 41 * 40 // 2)
+
+    def test_requires_full_league(self):
+        self.league.participants.remove(self.league.participants.first())
+
+        self.assertEqual(self.league.generate_schedule(), [])
+        self.assertFalse(LeagueMatch.objects.exists())
+
+    def test_unscheduled_fixture_rejects_join_and_events(self):
+        match = self.league.generate_schedule()[0][0].match
+        client = APIClient()
+        client.force_authenticate(user=AccountFactory())
+
+        response = client.post(reverse("join-match", kwargs={"match_id": match.id}))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["error"], "This match has not been scheduled yet.")
+
+        response = client.post(reverse("update-match-event", kwargs={"match_id": match.id}), {"event_type": "point"})
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,124 @@
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from leagues.models import LeagueStatus
+from leagues.standings import head_to_head, result_deltas
+from leagues.tests.factories import LeagueFactory, LeagueMatchFactory, LeagueStatusFactory
+from matchmaking.tests.factories import TeamFactory
+
+
+class StandingsRulesTestCase(SimpleTestCase):
+    def test_winning_side_decides_over_score(self):
+        home, away = result_deltas(10, 12, winning_side="red")
+
+        self.assertEqual((home["wins"], home["league_points"], home["points_scored"]), (1, 3, 10))
+        self.assertEqual((away["losses"], away["league_points"], away["points_conceded"]), (1, 0, 10))
+
+    def test_draw(self):
+        home, away = result_deltas(1, 1)
+
+        self.assertEqual((home["draws"], home["league_points"]), (1, 1))
+        self.assertEqual((away["draws"], away["league_points"]), (1, 1))
+
+    def test_head_to_head_ignores_other_opponents(self):
+        results = [("a", "b", 2, 1, ""), ("b", "c", 5, 0, ""), ("a", "c", 0, 3, "")]
+
+        self.assertEqual(head_to_head(["a", "b"], results), [["a"], ["b"]])
+        self.assertEqual(head_to_head(["a", "c"], [("a", "b", 2, 1, "")]), [["a", "c"]])
+
+
+class LeagueStandingsTestCase(TestCase):
+    def setUp(self):
+        self.league = LeagueFactory()
+        self.a, self.b, self.c, self.d = self.teams = TeamFactory.create_batch(4)
+        for team in self.teams:
+            LeagueStatusFactory(league=self.league, team=team, current_position=1)
+
+    def play(self, home, away, home_score, away_score):
+        league_match = LeagueMatchFactory(
+            league=self.league,
+            home_team=home,
+            away_team=away,
+            match__status="scheduled",
+            match__red_score=home_score,
+            match__blue_score=away_score,
+        )
+        self.assertTrue(league_match.match.complete_match())
+
+    def positions(self):
+        return dict(LeagueStatus.objects.filter(league=self.league).values_list("team_id", "current_position"))
+
+    def test_results_are_applied_once_and_ranked(self):
+        self.play(self.a, self.b, 2, 1)
+
+        a = LeagueStatus.objects.get(league=self.league, team=self.a)
+        self.assertEqual((a.matches_played, a.wins, a.league_points, a.points_scored, a.points_conceded), (1, 1, 3, 2, 1))
+        self.assertEqual(self.positions(), {self.a.id: 1, self.c.id: 2, self.d.id: 2, self.b.id: 4})
+
+    def test_head_to_head_breaks_ties(self):
+        self.play(self.a, self.b, 2, 1)
+        self.play(self.b, self.c, 2, 1)
+        self.play(self.d, self.a, 2, 1)
+
+        # a와 b는 승점/득실차/득점이 같지만 맞대결에서 a가 이겼다
+        self.assertEqual(self.positions(), {self.d.id: 1, self.a.id: 2, self.b.id: 3, self.c.id: 4})
+
+    def test_standings_view_uses_etag(self):
+        client = APIClient()
+        client.force_authenticate(user=self.league.organizer)
+        url = reverse("league_standings", kwargs={"league_id": self.league.id})
+
+        response = client.get(url)
+        etag = response["ETag"]
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["standings"]), 4)
+        self.assertEqual(client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.play(self.a, self.b, 2, 1)
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data["standings"][0]["team"]["id"], self.a.id)
+
+
+class CompleteScheduledFixtureTestCase(TestCase):
+    def test_scores_from_complete_view_feed_standings(self):
+        league = LeagueFactory(max_teams=4, total_number_of_rounds=3)
+        league.participants.set(TeamFactory.create_batch(4))
+        first, second = league.generate_schedule()[0]
+        client = APIClient()
+        client.force_authenticate(user=league.organizer)
+
+        def complete(fixture, data):
+            return client.post(reverse("complete_league_match", kwargs={"match_id": fixture.match_id}), data)
+
+        self.assertEqual(complete(first, {}).status_code, 400)  # 이벤트가 없는 대진은 점수가 필요하다
+        self.assertEqual(complete(first, {"home_score": 2, "away_score": 1}).status_code, 200)
+        self.assertEqual(complete(first, {"home_score": 2, "away_score": 1}).status_code, 400)
+        self.assertEqual(complete(second, {"home_score": 1, "away_score": 1}).status_code, 200)
+
+        standings = {
+            team_id: (points, position)
+            for team_id, points, position in LeagueStatus.objects.filter(league=league).values_list("team_id", "league_points", "current_position")
+        }
+        self.assertEqual(standings[first.home_team_id], (3, 1))
+        self.assertEqual(standings[second.home_team_id], (1, 2))
+        self.assertEqual(standings[second.away_team_id], (1, 2))
+        self.assertEqual(standings[first.away_team_id], (0, 4))
+        league.refresh_from_db()
+        self.assertEqual(league.current_round, 2)
+
+    def test_generating_schedule_invalidates_cached_standings(self):
+        league = LeagueFactory(max_teams=4, total_number_of_rounds=3)
+        league.participants.set(TeamFactory.create_batch(4))
+        client = APIClient()
+        client.force_authenticate(user=league.organizer)
+        url = reverse("league_standings", kwargs={"league_id": league.id})
+        etag = client.get(url)["ETag"]
+
+        league.generate_schedule()
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["standings"]), 4)
@@ -2,9 +2,17 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
 from django.utils import timezone
+from django.utils.http import parse_etags
 from rest_framework.exceptions import ValidationError
 
+from leagues.cache import get_standings, standings_etag
+from leagues.models import League, LeagueMatch
+from leagues.serializers import LeagueMatchSerializer, LeagueSerializer
+from newsfeed.fanout import fan_out_to_followers
+
 # 문자열 참조로 수정
 class LeagueCreateView(APIView):
     permission_classes = [IsAuthenticated]
@@ -31,24 +39,42 @@ class LeagueDetailView(APIView):
 
     def get(self, request, league_id, *args, **kwargs):
         try:
-            league = "leagues.models.league.League".objects.get(id=league_id)  # 문자열 참조
-        except "leagues.models.league.League".DoesNotExist:
+            league = League.objects.prefetch_related('participants').get(id=league_id)
+        except League.DoesNotExist:
             return Response({"error": "League not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        league_serializer = "leagues.serializers.LeagueSerializer"(league)  # 문자열 참조
-        league_status = "leagues.models.league.LeagueStatus".objects.filter(league=league)  # 문자열 참조
-        status_serializer = "leagues.serializers.LeagueStatusSerializer"(league_status, many=True)  # 문자열 참조
+        # 순위표는 standings_version별 캐시, 경기 목록은 팀 수와 관계없이 쿼리 1번
+        league_serializer = LeagueSerializer(league)
+        standings = get_standings(league.id, league.standings_version)
 
-        matches = "leagues.models.league_match.LeagueMatch".objects.filter(league=league)  # 문자열 참조
-        matches_serializer = "leagues.serializers.LeagueMatchSerializer"(matches, many=True)  # 문자열 참조
+        matches = LeagueMatch.objects.filter(league=league).select_related('home_team', 'away_team').order_by('round_number', 'id')
+        matches_serializer = LeagueMatchSerializer(matches, many=True)
 
         return Response({
             "league": league_serializer.data,
-            "status": status_serializer.data,
+            "status": standings,
             "matches": matches_serializer.data
         }, status=status.HTTP_200_OK)
 
 
+class LeagueStandingsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, league_id, *args, **kwargs):
+        """
+        순위 순서대로의 순위표. 순위표가 바뀔 때만 올라가는 standings_version으로 ETag를 만들고,
+        클라이언트가 같은 ETag를 보내면 (If-None-Match) 순위표를 읽지 않고 304를 반환한다.
+        """
+        version = League.objects.filter(id=league_id).values_list('standings_version', flat=True).first()
+        if version is None:
+            return Response({"error": "League not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        etag = standings_etag(league_id, version)
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        return Response({"standings": get_standings(league_id, version)}, status=status.HTTP_200_OK, headers={'ETag': etag})
+
+
 class LeagueUpdateView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -109,18 +135,13 @@ class JoinLeagueView(APIView):
         if league.participants.count() == league.total_number_of_teams:
             league.update_league_post_for_full_participation()
 
-        # 유저의 팔로워 목록 가져오기
-        followers = user.followers.all()
-        
         # 팔로워들의 뉴스피드에 해당 리그 포스트 추가
-        for follower_id in followers:
-            follower_newsfeed = "newsfeed.models.newsfeed.Newsfeed".objects.get(user_id=follower_id)  # 문자열 참조
-            "newsfeed.models.newsfeed.NewsfeedPost".objects.create(  # 문자열 참조
-                newsfeed=follower_newsfeed,
-                post_type="league",
-                post_id=league.id,
-                post_content=f"{user.username} joined the league {league.league_name}."
-            )
+        fan_out_to_followers(
+            user,
+            post_type="league",
+            post_id=league.id,
+            post_content=f"{user.username} joined the league {league.league_name}."
+        )
 
         return Response({"message": "Successfully joined the league."}, status=status.HTTP_200_OK)
 
@@ -129,33 +150,33 @@ class LeagueMatchCompleteView(APIView):
 
     def post(self, request, match_id, *args, **kwargs):
         try:
-            match = "matchmaking.models.match.Match".objects.get(id=match_id)  # 문자열 참조
-            league_match = "leagues.models.league_match.LeagueMatch".objects.get(match=match)  # 문자열 참조
-            league = league_match.league
-        except ("matchmaking.models.match.Match".DoesNotExist, "leagues.models.league_match.LeagueMatch".DoesNotExist):
+            league_match = LeagueMatch.objects.select_related('match', 'league').get(match_id=match_id)
+        except LeagueMatch.DoesNotExist:
             return Response({"error": "Match or League not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        # 매치 상태를 완료로 업데이트
-        if match.status == 'completed':
+        # 이벤트로 점수를 기록하지 않은 대진은 최종 점수(home_score, away_score)를 받아 기록한 뒤 완료한다.
+        # 순위표 반영, 라운드 완료 수 갱신과 라운드 진행은 complete_match가 한 번만 처리
+        if league_match.match.status == 'completed':
             return Response({"error": "This match is already completed."}, status=status.HTTP_400_BAD_REQUEST)
-        
-        match.status = 'completed'
-        match.save()
-
-        # 리그의 모든 매치가 완료되었는지 확인
-        all_matches_completed = "leagues.models.league_match.LeagueMatch".objects.filter(league=league, match__status__in=['scheduled', 'ongoing']).count() == 0  # 문자열 참조
-        
-        if all_matches_completed:
-            if league.current_round < league.total_number_of_rounds:
-                league.current_round += 1
-                league.save()
-
-                # 다음 라운드로 전환 시 뉴스피드 포스트 업데이트
-                league.update_league_post_for_new_round()
-
-                return Response({"message": "All matches completed. Proceeding to the next round."}, status=status.HTTP_200_OK)
-            else:
-                # 리그가 완료된 경우 최종 포스트 업데이트
-                league.update_league_post_for_completion()
-                return Response({"message": "All rounds are completed. The league is finished."}, status=status.HTTP_200_OK)
+        league = league_match.league
+        previous_round = league.current_round
+        scores = (request.data.get('home_score'), request.data.get('away_score'))
+        try:
+            with transaction.atomic():
+                if scores != (None, None):
+                    league_match.record_score(*(int(score) for score in scores))
+                elif not league_match.match.last_event_seq:
+                    return Response({"error": "home_score and away_score are required."}, status=status.HTTP_400_BAD_REQUEST)
+                completed = league_match.match.complete_match()
+        except (TypeError, ValueError, DjangoValidationError) as e:
+            message = e.messages[0] if isinstance(e, DjangoValidationError) else "Scores must be integers."
+            return Response({"error": message}, status=status.HTTP_400_BAD_REQUEST)
+        if not completed:
+            return Response({"error": "This match is already completed."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if league.is_finished:
+            return Response({"message": "All rounds are completed. The league is finished."}, status=status.HTTP_200_OK)
+        league.refresh_from_db(fields=['current_round'])
+        if league.current_round != previous_round:
+            return Response({"message": "All matches completed. Proceeding to the next round."}, status=status.HTTP_200_OK)
         return Response({"message": "Match completed. Waiting for other matches in the round to finish."}, status=status.HTTP_200_OK)
\ No newline at end of file
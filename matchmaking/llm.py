@@ -0,0 +1,104 @@
+"""
+LLM 클라이언트.
+
+- LLM_CLIENT 설정으로 백엔드를 고른다 (OpenAIClient는 openai>=1.0 패키지 필요, 기본값은 오프라인/테스트용 StubClient)
+- 같은 프롬프트 결과는 프롬프트 해시 키로 캐시하고 (LLM_CACHE_TTL)
+- 같은 프롬프트가 동시에 요청되면 한 번만 호출해서 결과를 나눠 쓰며 (request coalescing)
+- 프로세스당 동시에 나가는 호출 수는 LLM_MAX_CONCURRENCY로 제한한다.
+"""
+import hashlib
+import threading
+from concurrent.futures import Future
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+
+
+class LLMClient:
+    def complete(self, prompt, n, max_tokens):
+        """프롬프트에 대한 응답 n개를 문자열 목록으로 반환"""
+        raise NotImplementedError
+
+
+class OpenAIClient(LLMClient):
+    def __init__(self):
+        from openai import OpenAI
+
+        self.client = OpenAI(api_key=settings.OPENAI_API_KEY, timeout=settings.LLM_TIMEOUT)
+
+    def complete(self, prompt, n, max_tokens):
+        response = self.client.chat.completions.create(
+            model=settings.LLM_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            n=n,
+            max_tokens=max_tokens,
+            temperature=0.7,
+        )
+        return [choice.message.content.strip() for choice in response.choices]
+
+
+class StubClient(LLMClient):
+    """네트워크 없이 프롬프트에서 결정적으로 응답을 만드는 백엔드 (테스트/로컬 개발용)"""
+
+    def complete(self, prompt, n, max_tokens):
+        subjects = [line.lstrip("- ").split(":")[0] for line in prompt.splitlines() if line.startswith("- ")]
+        subjects = subjects or ["이번 경기"]
+        return [f"{subjects[i % len(subjects)]}, 이번 경기에 대한 각오를 말씀해 주세요. ({i + 1})" for i in range(n)]
+
+
+_client = None
+_client_lock = threading.Lock()
+_limiter = None
+_in_flight = {}  # 프롬프트 해시 -> Future
+_in_flight_lock = threading.Lock()
+
+
+def get_client():
+    global _client
+    with _client_lock:
+        if _client is None or type(_client) is not import_string(settings.LLM_CLIENT):
+            _client = import_string(settings.LLM_CLIENT)()
+        return _client
+
+
+def _get_limiter():
+    global _limiter
+    with _client_lock:
+        if _limiter is None:
+            _limiter = threading.BoundedSemaphore(settings.LLM_MAX_CONCURRENCY)
+        return _limiter
+
+
+def prompt_key(prompt, n, max_tokens):
+    digest = hashlib.sha256(f"{settings.LLM_CLIENT}|{n}|{max_tokens}|{prompt}".encode()).hexdigest()
+    return f"llm:{digest}"
+
+
+def generate(prompt, n=5, max_tokens=150):
+    """캐시 -> 진행 중인 같은 요청 -> 실제 호출 순으로 응답 목록을 얻는다"""
+    key = prompt_key(prompt, n, max_tokens)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        owner = future is None
+        if owner:
+            future = _in_flight[key] = Future()
+    if not owner:
+        return future.result()
+
+    try:
+        with _get_limiter():
+            result = get_client().complete(prompt, n, max_tokens)
+        cache.set(key, result, settings.LLM_CACHE_TTL)
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _in_flight_lock:
+            del _in_flight[key]
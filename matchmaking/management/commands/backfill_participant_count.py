@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from matchmaking.models import Match
+
+
+class Command(BaseCommand):
+    help = "Recompute Match.participant_count from the participants table"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch", type=int, default=5000, help="Matches updated per statement")
+
+    def handle(self, *args, **options):
+        counts = (
+            Match.participants.through.objects.filter(match_id=OuterRef("pk"))
+            .order_by()
+            .values("match_id")
+            .annotate(count=Count("*"))
+            .values("count")
+        )
+
+        # id 구간별로 나눠 UPDATE 해서 한 번에 잡는 row lock 범위를 제한
+        updated = 0
+        last_id = 0
+        while True:
+            ids = list(
+                Match.objects.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:options["batch"]]
+            )
+            if not ids:
+                break
+            updated += Match.objects.filter(id__gte=ids[0], id__lte=ids[-1]).update(
+                participant_count=Coalesce(Subquery(counts), 0)
+            )
+            last_id = ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"Recomputed participant_count for {updated} matches"))
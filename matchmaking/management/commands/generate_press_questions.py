@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from matchmaking.press import claim, process
+
+
+class Command(BaseCommand):
+    help = "Generate press conference questions for pending press conferences"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch", type=int, default=10, help="Press conferences claimed per poll")
+        parser.add_argument("--sleep", type=float, default=1.0, help="Seconds to wait when nothing is pending")
+        parser.add_argument("--once", action="store_true", help="Drain pending press conferences once and exit")
+
+    def handle(self, *args, **options):
+        while True:
+            conferences = claim(options["batch"])
+            if conferences:
+                generated = process(conferences)
+                self.stdout.write(f"Generated questions for {generated}/{len(conferences)} press conferences")
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["sleep"])
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from matchmaking.models import Match, ProcessedMatchStats
+
+
+class Command(BaseCommand):
+    help = "Rebuild player and club statistics from completed matches and their events"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pending", action="store_true", help="Only apply completed matches that were not processed yet")
+        parser.add_argument("--batch", type=int, default=500, help="Matches applied per batch")
+
+    def handle(self, *args, **options):
+        if not options["pending"]:
+            rebuilt = ProcessedMatchStats.rebuild(batch_size=options["batch"])
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt statistics from {rebuilt} completed matches"))
+            return
+
+        # 처리 기록이 없는 완료 매치만 배치마다 한 트랜잭션으로 반영 (이미 반영된 매치는 process가 건너뛴다)
+        pending = Match.objects.filter(status="completed", processed_stats__isnull=True).order_by("id")
+        applied = 0
+        last_id = 0
+        while True:
+            ids = list(pending.filter(id__gt=last_id).values_list("id", flat=True)[:options["batch"]])
+            if not ids:
+                break
+            applied += ProcessedMatchStats.process(ids)
+            last_id = ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"Applied statistics for {applied} completed matches"))
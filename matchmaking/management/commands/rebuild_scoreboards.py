@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from matchmaking.models import Match
+
+
+class Command(BaseCommand):
+    help = "Replay MatchEvents to rebuild match, set and team scoreboards"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--match", type=int, action="append", dest="match_ids", help="Only rebuild these matches")
+        parser.add_argument("--batch", type=int, default=500, help="Matches replayed per batch")
+
+    def handle(self, *args, **options):
+        matches = Match.objects.order_by("id")
+        if options["match_ids"]:
+            matches = matches.filter(id__in=options["match_ids"])
+
+        # 매치 묶음별로 이벤트를 한 번에 읽어 재생 (배치마다 한 트랜잭션)
+        rebuilt = 0
+        last_id = 0
+        while True:
+            ids = list(matches.filter(id__gt=last_id).values_list("id", flat=True)[:options["batch"]])
+            if not ids:
+                break
+            rebuilt += Match.rebuild_scoreboards(ids)
+            last_id = ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt scoreboards for {rebuilt} matches"))
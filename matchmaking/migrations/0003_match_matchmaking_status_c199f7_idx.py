@@ -0,0 +1,18 @@
+# Generated by Django 4.2.13 on 2026-10-18 12:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("matchmaking", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="match",
+            index=models.Index(
+                fields=["status", "start_time"], name="matchmaking_status_c199f7_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.13 on 2026-10-18 12:40
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+import django.db.models.deletion
+
+
+def backfill_participant_count(apps, schema_editor):
+    Match = apps.get_model("matchmaking", "Match")
+    counts = (
+        Match.participants.through.objects.filter(match_id=OuterRef("pk"))
+        .order_by()
+        .values("match_id")
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    Match.objects.update(participant_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("matchmaking", "0003_match_matchmaking_status_c199f7_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="match",
+            name="participant_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name="teamplayer",
+            name="team",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="matchmaking.team",
+            ),
+        ),
+        migrations.RunPython(backfill_participant_count, migrations.RunPython.noop),
+    ]
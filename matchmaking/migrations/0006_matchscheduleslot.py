@@ -0,0 +1,89 @@
+# Generated by Django 4.2.13 on 2026-10-18 13:50
+
+from django.conf import settings
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+import django.db.models.deletion
+
+BATCH_SIZE = 2000
+
+
+def backfill_schedule_slots(apps, schema_editor):
+    """
+    예정/진행 중인 매치의 참가자 일정 구간 생성.
+    기존 데이터에 이미 겹치는 참가가 있으면 배제 제약에 걸리는 행은 건너뛴다 (ON CONFLICT DO NOTHING).
+    """
+    Match = apps.get_model("matchmaking", "Match")
+    MatchScheduleSlot = apps.get_model("matchmaking", "MatchScheduleSlot")
+
+    rows = (
+        Match.participants.through.objects.filter(match__status__in=["pending", "scheduled", "ongoing"])
+        .order_by("match_id", "id")
+        .values_list("match_id", "match__start_time", "match__duration", "teamplayer__user_id")
+    )
+    slots = []
+    for match_id, start_time, duration, user_id in rows.iterator(chunk_size=BATCH_SIZE):
+        slots.append(
+            MatchScheduleSlot(
+                user_id=user_id,
+                match_id=match_id,
+                period=DateTimeTZRange(start_time, start_time + duration, "[)"),
+            )
+        )
+        if len(slots) >= BATCH_SIZE:
+            MatchScheduleSlot.objects.bulk_create(slots, ignore_conflicts=True)
+            slots = []
+    MatchScheduleSlot.objects.bulk_create(slots, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("matchmaking", "0005_matchwaitlist"),
+    ]
+
+    operations = [
+        BtreeGistExtension(),
+        migrations.CreateModel(
+            name="MatchScheduleSlot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("period", django.contrib.postgres.fields.ranges.DateTimeRangeField()),
+                (
+                    "match",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="schedule_slots",
+                        to="matchmaking.match",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="match_schedule",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="matchscheduleslot",
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(
+                expressions=[("user", "="), ("period", "&&")],
+                name="matchmaking_schedule_no_overlap",
+            ),
+        ),
+        migrations.RunPython(backfill_schedule_slots, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.13 on 2026-10-18 14:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("matchmaking", "0006_matchscheduleslot"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="pressconference",
+            name="questions",
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name="pressconference",
+            name="questions_status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("generating", "Generating"),
+                    ("ready", "Ready"),
+                    ("failed", "Failed"),
+                ],
+                default="pending",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="pressconference",
+            name="questions_started_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunSQL(
+            # 이미 질문이 생성된 기자회견은 ready로
+            "UPDATE matchmaking_pressconference SET questions_status = 'ready' "
+            "WHERE questions IS NOT NULL AND questions::text <> '[]'",
+            migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,107 @@
+# Generated by Django 4.2.13 on 2026-10-18 15:06
+
+from django.db import migrations, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+BATCH_SIZE = 500
+
+
+def _created_at(entry):
+    timestamp = entry.get("timestamp") if isinstance(entry, dict) else None
+    return (parse_datetime(timestamp) if timestamp else None) or timezone.now()
+
+
+def _message(entry, participants):
+    """JSON 대화 기록 한 줄 -> (user_id, question, content)"""
+    if not isinstance(entry, dict):
+        return None, "", str(entry)
+    if "answer" in entry:
+        return None, entry.get("question") or "", entry["answer"]
+    return participants.get(entry.get("user")), "", entry.get("message") or ""
+
+
+def move_chat_logs(apps, schema_editor):
+    """
+    TeamTalk / PressConference의 JSON chat_log를 Conversation + ChatMessage로 옮긴다.
+    행을 id 순으로 BATCH_SIZE개씩 읽어 배치마다 한 트랜잭션에서 처리한다.
+    팀 대화 작성자는 기록에 username만 있으므로 같은 경기 참가자 중 username이 일치하는 유저로 연결한다.
+    """
+    Conversation = apps.get_model("matchmaking", "Conversation")
+    ChatMessage = apps.get_model("matchmaking", "ChatMessage")
+    Match = apps.get_model("matchmaking", "Match")
+
+    for model_name in ("TeamTalk", "PressConference"):
+        Model = apps.get_model("matchmaking", model_name)
+        rows = Model.objects.filter(conversation__isnull=True).order_by("id")
+        last_id = 0
+        while True:
+            batch = list(rows.filter(id__gt=last_id).values_list("id", "match_id", "chat_log")[:BATCH_SIZE])
+            if not batch:
+                break
+
+            participants = {}
+            through_rows = Match.participants.through.objects.filter(
+                match_id__in={match_id for _, match_id, _ in batch}
+            ).values_list("match_id", "teamplayer__user__username", "teamplayer__user_id")
+            for match_id, username, user_id in through_rows:
+                participants.setdefault(match_id, {})[username] = user_id
+
+            with transaction.atomic():
+                conversations = Conversation.objects.bulk_create(
+                    [Conversation(last_seq=len(chat_log or [])) for _, _, chat_log in batch]
+                )
+                messages = []
+                for (_, match_id, chat_log), conversation in zip(batch, conversations):
+                    for seq, entry in enumerate(chat_log or [], start=1):
+                        user_id, question, content = _message(entry, participants.get(match_id, {}))
+                        messages.append(
+                            ChatMessage(
+                                conversation=conversation,
+                                seq=seq,
+                                user_id=user_id,
+                                question=question,
+                                content=content,
+                                created_at=_created_at(entry),
+                            )
+                        )
+                ChatMessage.objects.bulk_create(messages, batch_size=1000)
+                Model.objects.bulk_update(
+                    [Model(id=row_id, conversation=conversation) for (row_id, _, _), conversation in zip(batch, conversations)],
+                    ["conversation"],
+                )
+            last_id = batch[-1][0]
+
+
+def restore_chat_logs(apps, schema_editor):
+    ChatMessage = apps.get_model("matchmaking", "ChatMessage")
+    Conversation = apps.get_model("matchmaking", "Conversation")
+
+    for model_name in ("TeamTalk", "PressConference"):
+        Model = apps.get_model("matchmaking", model_name)
+        for row in Model.objects.exclude(conversation__isnull=True).iterator():
+            chat_log = []
+            for message in ChatMessage.objects.filter(conversation_id=row.conversation_id).select_related("user").order_by("seq"):
+                timestamp = message.created_at.isoformat()
+                if message.question:
+                    chat_log.append({"question": message.question, "answer": message.content, "timestamp": timestamp})
+                elif model_name == "TeamTalk":
+                    username = message.user.username if message.user else None
+                    chat_log.append({"user": username, "message": message.content, "timestamp": timestamp})
+                else:
+                    chat_log.append({"message": message.content, "timestamp": timestamp})
+            Model.objects.filter(id=row.id).update(chat_log=chat_log, conversation=None)
+    Conversation.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    # 배치마다 커밋하도록 마이그레이션 전체를 하나의 트랜잭션으로 묶지 않는다
+    atomic = False
+
+    dependencies = [
+        ("matchmaking", "0008_conversation_chatmessage_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(move_chat_logs, restore_chat_logs),
+    ]
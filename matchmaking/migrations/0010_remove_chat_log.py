@@ -0,0 +1,39 @@
+# Generated by Django 4.2.13 on 2026-10-18 15:07
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("matchmaking", "0009_move_chat_logs"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="pressconference",
+            name="conversation",
+            field=models.OneToOneField(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="press_conference",
+                to="matchmaking.conversation",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="teamtalk",
+            name="conversation",
+            field=models.OneToOneField(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="team_talk",
+                to="matchmaking.conversation",
+            ),
+        ),
+        migrations.RemoveField(
+            model_name="pressconference",
+            name="chat_log",
+        ),
+        migrations.RemoveField(
+            model_name="teamtalk",
+            name="chat_log",
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.13 on 2026-10-18 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("matchmaking", "0010_remove_chat_log"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="match",
+            name="last_event_seq",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="red_score",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="blue_score",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="matchevent",
+            name="seq",
+            field=models.PositiveIntegerField(null=True),
+        ),
+    ]
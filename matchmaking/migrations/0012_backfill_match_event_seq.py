@@ -0,0 +1,40 @@
+# Generated by Django 4.2.13 on 2026-10-18 15:41
+
+from django.db import migrations
+
+# 기존 이벤트에 매치별 기록 순서대로 번호를 매기고, 매치의 마지막 번호와 점수를 이벤트에서 다시 계산
+BACKFILL_SQL = """
+UPDATE matchmaking_matchevent AS e
+SET seq = numbered.seq
+FROM (
+    SELECT id, ROW_NUMBER() OVER (PARTITION BY match_id ORDER BY timestamp, id) AS seq
+    FROM matchmaking_matchevent
+) AS numbered
+WHERE e.id = numbered.id;
+
+UPDATE matchmaking_match AS m
+SET last_event_seq = totals.last_event_seq,
+    red_score = totals.red_score,
+    blue_score = totals.blue_score
+FROM (
+    SELECT e.match_id,
+           MAX(e.seq) AS last_event_seq,
+           COUNT(*) FILTER (WHERE e.event_type IN ('point', 'special_point') AND t.is_red_team) AS red_score,
+           COUNT(*) FILTER (WHERE e.event_type IN ('point', 'special_point') AND NOT t.is_red_team) AS blue_score
+    FROM matchmaking_matchevent AS e
+    LEFT JOIN matchmaking_teamplayer AS p ON p.id = e.target_player_id
+    LEFT JOIN matchmaking_team AS t ON t.id = p.team_id
+    GROUP BY e.match_id
+) AS totals
+WHERE m.id = totals.match_id;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("matchmaking", "0011_match_event_seq_and_score"),
+    ]
+
+    operations = [
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+    ]
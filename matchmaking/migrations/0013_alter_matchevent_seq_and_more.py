@@ -0,0 +1,23 @@
+# Generated by Django 4.2.13 on 2026-10-18 15:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("matchmaking", "0012_backfill_match_event_seq"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="matchevent",
+            name="seq",
+            field=models.PositiveIntegerField(),
+        ),
+        migrations.AddConstraint(
+            model_name="matchevent",
+            constraint=models.UniqueConstraint(
+                fields=("match", "seq"), name="matchmaking_matchevent_unique_seq"
+            ),
+        ),
+    ]
@@ -0,0 +1,126 @@
+# Generated by Django 4.2.13 on 2026-10-18 16:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("matchmaking", "0013_alter_matchevent_seq_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="match",
+            name="blue_sets",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="current_set",
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="red_sets",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="match",
+            name="winning_side",
+            field=models.CharField(
+                blank=True,
+                choices=[("red", "Red"), ("blue", "Blue")],
+                default="",
+                max_length=4,
+            ),
+        ),
+        migrations.AddField(
+            model_name="matchevent",
+            name="points",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="matchevent",
+            name="set_number",
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="matchevent",
+            name="side",
+            field=models.CharField(
+                blank=True,
+                choices=[("red", "Red"), ("blue", "Blue")],
+                default="",
+                max_length=4,
+            ),
+        ),
+        migrations.AddField(
+            model_name="matchevent",
+            name="voided",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="matchevent",
+            name="voided_event",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="voids",
+                to="matchmaking.matchevent",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="matchevent",
+            name="event_type",
+            field=models.CharField(
+                choices=[
+                    ("point", "Point"),
+                    ("special_point", "Special Point"),
+                    ("pause", "Pause"),
+                    ("set_end", "Set End"),
+                    ("match_end", "Match End"),
+                    ("void", "Void"),
+                ],
+                max_length=50,
+            ),
+        ),
+        migrations.CreateModel(
+            name="MatchSetScore",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("set_number", models.PositiveSmallIntegerField()),
+                ("red_points", models.PositiveIntegerField(default=0)),
+                ("blue_points", models.PositiveIntegerField(default=0)),
+                (
+                    "winner",
+                    models.CharField(
+                        blank=True,
+                        choices=[("red", "Red"), ("blue", "Blue")],
+                        default="",
+                        max_length=4,
+                    ),
+                ),
+                (
+                    "match",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="set_scores",
+                        to="matchmaking.match",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("match", "set_number")},
+            },
+        ),
+    ]
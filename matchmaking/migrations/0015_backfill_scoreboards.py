@@ -0,0 +1,67 @@
+# Generated by Django 4.2.13 on 2026-10-18 16:21
+
+from django.db import migrations, transaction
+
+from matchmaking.scoreboard import POINT_EVENTS, ScoreState
+
+BATCH_SIZE = 500
+SCORE_FIELDS = ["red_score", "blue_score", "red_sets", "blue_sets", "current_set", "winning_side"]
+
+
+def backfill_scoreboards(apps, schema_editor):
+    """
+    기존 이벤트에 득점 팀(side)을 채우고 매치별로 이벤트를 재생해 세트 점수와 승부를 계산한다.
+    이벤트가 있는 매치를 id 순으로 BATCH_SIZE개씩 처리하고 배치마다 커밋한다.
+    """
+    Match = apps.get_model("matchmaking", "Match")
+    MatchEvent = apps.get_model("matchmaking", "MatchEvent")
+    MatchSetScore = apps.get_model("matchmaking", "MatchSetScore")
+
+    match_ids = MatchEvent.objects.order_by("match_id").values_list("match_id", flat=True).distinct()
+    last_id = 0
+    while True:
+        batch = list(match_ids.filter(match_id__gt=last_id)[:BATCH_SIZE])
+        if not batch:
+            break
+
+        matches = {match.pk: match for match in Match.objects.filter(pk__in=batch).select_related("winning_method")}
+        states = {pk: ScoreState(match.winning_method) for pk, match in matches.items()}
+        events = []
+        for event in (
+            MatchEvent.objects.filter(match_id__in=batch)
+            .select_related("target_player__team")
+            .order_by("match_id", "seq")
+        ):
+            team = event.target_player.team if event.target_player else None
+            if event.event_type in POINT_EVENTS and team is not None:
+                event.side = "red" if team.is_red_team else "blue"
+            event.set_number, event.points = states[event.match_id].apply(event.event_type, event.side)
+            events.append(event)
+
+        with transaction.atomic():
+            MatchEvent.objects.bulk_update(events, ["side", "set_number", "points"], batch_size=1000)
+            MatchSetScore.objects.bulk_create([
+                MatchSetScore(
+                    match_id=pk, set_number=number, red_points=score["red"], blue_points=score["blue"], winner=score["winner"]
+                )
+                for pk, state in states.items()
+                for number, score in state.sets.items()
+            ])
+            for pk, state in states.items():
+                for field in SCORE_FIELDS:
+                    setattr(matches[pk], field, getattr(state, field))
+            Match.objects.bulk_update(matches.values(), SCORE_FIELDS)
+        last_id = batch[-1]
+
+
+class Migration(migrations.Migration):
+    # 배치마다 커밋하도록 마이그레이션 전체를 하나의 트랜잭션으로 묶지 않는다
+    atomic = False
+
+    dependencies = [
+        ("matchmaking", "0014_scoreboard"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_scoreboards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.13 on 2026-10-18 18:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("sportsgrounds", "0001_initial"),
+        ("matchmaking", "0015_backfill_scoreboards"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="match",
+            name="facility",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="sportsgrounds.facilities",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="match",
+            name="sports_ground",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="sportsgrounds.sportsground",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="match",
+            name="start_time",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.13 on 2026-10-18 21:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("matchmaking", "0016_alter_match_facility_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProcessedMatchStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("processed_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "match",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="processed_stats",
+                        to="matchmaking.match",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.13 on 2026-10-18 22:10
+
+from django.db import migrations, models
+from django.db.models import Count, F
+
+
+def merge_duplicate_team_talks(apps, schema_editor):
+    """
+    (match, team)마다 TeamTalk를 하나만 남긴다.
+    가장 먼저 만들어진(id가 가장 작은) 행을 남기고, 나머지 대화의 메시지는 번호를 이어 붙여 그 대화로 옮긴 뒤
+    남는 TeamTalk와 대화를 삭제한다.
+    """
+    TeamTalk = apps.get_model("matchmaking", "TeamTalk")
+    Conversation = apps.get_model("matchmaking", "Conversation")
+    ChatMessage = apps.get_model("matchmaking", "ChatMessage")
+
+    groups = (
+        TeamTalk.objects.values("match_id", "team_id")
+        .annotate(rows=Count("id"))
+        .filter(rows__gt=1)
+        .order_by()
+    )
+    for group in groups:
+        talks = list(
+            TeamTalk.objects.filter(match_id=group["match_id"], team_id=group["team_id"])
+            .order_by("id")
+            .values_list("id", "conversation_id", "conversation__last_seq")
+        )
+        _, keep_conversation_id, last_seq = talks[0]
+        for _, conversation_id, duplicate_last_seq in talks[1:]:
+            ChatMessage.objects.filter(conversation_id=conversation_id).update(
+                conversation_id=keep_conversation_id, seq=F("seq") + last_seq
+            )
+            last_seq += duplicate_last_seq
+        Conversation.objects.filter(id=keep_conversation_id).update(last_seq=last_seq)
+        TeamTalk.objects.filter(id__in=[talk_id for talk_id, _, _ in talks[1:]]).delete()
+        Conversation.objects.filter(id__in=[conversation_id for _, conversation_id, _ in talks[1:]]).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("matchmaking", "0017_processedmatchstats"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_team_talks, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="teamtalk",
+            constraint=models.UniqueConstraint(fields=("match", "team"), name="matchmaking_teamtalk_unique_match_team"),
+        ),
+    ]
@@ -1,2 +1,7 @@
 from .match import Match, WinningMethod, PressConference, TeamTalk, MatchEvent, PlayerReview, GroundReview
-from .team import Team, TeamPlayer
\ No newline at end of file
+from .team import Team, TeamPlayer
+from .waitlist import MatchWaitlist
+from .schedule import MatchScheduleSlot
+from .chat import Conversation, ChatMessage
+from .scoreboard import MatchSetScore
+from .statistics import ProcessedMatchStats
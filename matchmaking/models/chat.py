@@ -0,0 +1,46 @@
+from django.db import models, transaction
+from django.db.models import F
+from django.utils import timezone
+
+
+class Conversation(models.Model):
+    """
+    팀 대화 / 기자회견 대화방.
+    메시지는 ChatMessage에 한 줄씩 추가되고, last_seq는 방 안에서 단조 증가하는 메시지 번호다.
+    """
+    last_seq = models.PositiveIntegerField(default=0)  # 마지막 메시지 번호
+
+    def append(self, content, user=None, question=""):
+        """
+        메시지 추가. last_seq 증가(행 잠금)와 메시지 생성을 한 트랜잭션에서 처리하므로
+        동시에 여러 메시지가 들어와도 번호가 겹치거나 빠지지 않는다.
+        """
+        with transaction.atomic():
+            Conversation.objects.filter(pk=self.pk).update(last_seq=F('last_seq') + 1)
+            self.refresh_from_db(fields=['last_seq'])
+            return self.messages.create(seq=self.last_seq, user=user, question=question, content=content)
+
+    def messages_since(self, seq, limit):
+        """seq 이후 메시지를 번호 순으로 최대 limit개 (클라이언트는 마지막으로 받은 번호부터 이어서 조회)"""
+        return self.messages.filter(seq__gt=seq).select_related('user').order_by('seq')[:limit]
+
+    def __str__(self):
+        return f"Conversation {self.pk}"
+
+
+class ChatMessage(models.Model):
+    conversation = models.ForeignKey(Conversation, on_delete=models.CASCADE, related_name="messages")
+    seq = models.PositiveIntegerField()  # 대화방 안에서의 메시지 번호 (1부터)
+    user = models.ForeignKey('accounts.User', on_delete=models.SET_NULL, null=True, blank=True, related_name="chat_messages")  # 작성자 (작성자를 알 수 없는 기존 기록은 null)
+    question = models.TextField(blank=True, default="")  # 기자회견 답변인 경우 해당 질문
+    content = models.TextField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            # (conversation, seq) 인덱스로 "seq 이후 메시지" 조회도 처리
+            models.UniqueConstraint(fields=['conversation', 'seq'], name='matchmaking_chatmessage_unique_seq'),
+        ]
+
+    def __str__(self):
+        return f"Message {self.seq} in conversation {self.conversation_id}"
@@ -1,9 +1,13 @@
-import openai
+import logging
+
 from django.apps import apps
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.postgres.fields import JSONField
 from django.contrib.gis.db import models
+from django.db import IntegrityError, transaction
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+from django.db.models import F
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.utils.timezone import now
@@ -14,12 +18,23 @@ from rest_framework.exceptions import ValidationError
 # from sportsgrounds.models.facilities import Facilities
 # from leagues.models.league import League
 # from tournaments.models.tournament import Tournament
-from matchmaking.models.team import Team
+from matchmaking.models.chat import Conversation
+from matchmaking.models.team import Team, TeamPlayer
+from matchmaking.models.waitlist import MatchWaitlist
+from matchmaking.models.schedule import MatchScheduleSlot
+from matchmaking.models.scoreboard import SIDE_CHOICES, MatchSetScore
+from matchmaking.models.statistics import ProcessedMatchStats
+from matchmaking.scoreboard import POINT_EVENTS, ScoreState, event_points, match_winner, set_winner
+from matchmaking.teams import balance_teams, player_rating
 from newsfeed.models.newsfeed import NewsfeedPost
 from newsfeed.models.match_post import MatchPost
+from newsfeed.models.fanout import FanoutTask
+from newsfeed.cache import invalidate_posts
 
 from model_utils.models import TimeStampedModel
 
+logger = logging.getLogger(__name__)
+
 # Match 상태를 나타내는 choices (예정됨, 진행 중, 완료됨 등)
 STATUS_CHOICES = [
     ("pending", "Pending"),
@@ -30,12 +45,25 @@ STATUS_CHOICES = [
 ]
 
 
+OVERLAP_ERROR = "You cannot join another match that overlaps with your current match."
+UNSCHEDULED_ERROR = "This match has not been scheduled yet."  # 시간/장소가 정해지지 않은 리그/토너먼트 대진
+
+
+class MatchFull(ValidationError):
+    """정원이 찬 매치에 참가하려 할 때"""
+
+
+def lock_user(user_id):
+    """현재 트랜잭션이 끝날 때까지 유저 row를 잠근다 (같은 유저의 참가 처리를 직렬화)"""
+    apps.get_model('accounts', 'User').objects.select_for_update().values_list('pk', flat=True).get(pk=user_id)
+
+
 class Match(TimeStampedModel):
-    sports_ground = models.ForeignKey('sportsgrounds.SportsGround', on_delete=models.CASCADE)
-    facility = models.ForeignKey('sportsgrounds.Facilities', on_delete=models.CASCADE)
+    sports_ground = models.ForeignKey('sportsgrounds.SportsGround', on_delete=models.CASCADE, null=True, blank=True)  # 리그/토너먼트 대진으로 만든 매치는 장소가 정해지기 전까지 비어 있음
+    facility = models.ForeignKey('sportsgrounds.Facilities', on_delete=models.CASCADE, null=True, blank=True)
     price = models.DecimalField(max_digits=10, decimal_places=2)
     creator = models.ForeignKey('accounts.User', on_delete=models.CASCADE)
-    start_time = models.DateTimeField()
+    start_time = models.DateTimeField(null=True, blank=True)  # 장소와 마찬가지로 일정이 정해지기 전까지 비어 있음
     duration = models.DurationField()
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="scheduled")
     match_type = models.CharField(max_length=50, choices=[("single", "Single"), ("league", "League"), ("tournament", "Tournament")], default="single")
@@ -48,44 +76,331 @@ class Match(TimeStampedModel):
     winning_method = models.ForeignKey('WinningMethod', on_delete=models.CASCADE, null=True, blank=True)
     is_private = models.BooleanField(default=False)  # 공개/비공개 매치 여부
     join_requests = models.ManyToManyField('accounts.User', related_name="join_requests", blank=True)  # 참가 요청 리스트
+    participant_count = models.IntegerField(default=0)  # 참가자 수 (participants 변경 시 함께 갱신)
+    last_event_seq = models.PositiveIntegerField(default=0)  # 마지막 MatchEvent 번호
+    red_score = models.PositiveIntegerField(default=0)  # 이벤트 기록 시 함께 갱신되는 레드팀 점수
+    blue_score = models.PositiveIntegerField(default=0)  # 이벤트 기록 시 함께 갱신되는 블루팀 점수
+    red_sets = models.PositiveSmallIntegerField(default=0)  # 레드팀이 가져간 세트 수
+    blue_sets = models.PositiveSmallIntegerField(default=0)  # 블루팀이 가져간 세트 수
+    current_set = models.PositiveSmallIntegerField(default=1)  # 진행 중인 세트 번호
+    winning_side = models.CharField(max_length=4, choices=SIDE_CHOICES, blank=True, default="")  # 세트 과반을 가져가 승부가 났으면 승리 팀
+
+    class Meta:
+        indexes = [
+            # 주변 매치 검색의 상태/시작 시간 필터용
+            models.Index(fields=['status', 'start_time']),
+        ]
 
     @property
     def available_spots(self):
-        return self.total_spots - self.participants.count()
+        return self.total_spots - self.participant_count
+
+    @property
+    def period(self):
+        """매치 진행 구간 [start_time, start_time + duration). 일정이 정해지지 않은 리그/토너먼트 대진은 None"""
+        if self.start_time is None:
+            return None
+        return DateTimeTZRange(self.start_time, self.start_time + self.duration, '[)')
+
+    def join(self, user, waitlist=False):
+        """
+        참가 신청 처리.
+        같은 유저의 동시 요청은 유저 row lock으로 직렬화해서 겹치는 매치 확인과 참가 추가 사이의 경쟁을 막고,
+        정원은 add_participant의 조건부 UPDATE로 지킨다.
+        정원이 찼을 때 waitlist=True면 대기열에 등록한다.
+        반환: ("joined", TeamPlayer) 또는 ("waitlisted", MatchWaitlist)
+        """
+        if self.start_time is None or self.sports_ground_id is None:
+            raise ValidationError(UNSCHEDULED_ERROR)
+        with transaction.atomic():
+            lock_user(user.pk)
+            if self.participants.filter(user=user).exists():
+                raise ValidationError("You have already joined this match.")
+            self.prevent_overlap(user)
+            try:
+                return "joined", self.add_participant(user)
+            except MatchFull:
+                if not waitlist:
+                    raise
+                entry, _ = MatchWaitlist.objects.get_or_create(match=self, user=user)
+                return "waitlisted", entry
+
+    SCOREBOARD_FIELDS = ['last_event_seq', 'red_score', 'blue_score', 'red_sets', 'blue_sets', 'current_set', 'winning_side']
+
+    def record_event(self, event_type, added_by, target_player=None):
+        """
+        매치 이벤트 기록.
+        이벤트 번호(last_event_seq)와 점수를 한 번의 UPDATE로 올리고(이때 매치 row가 잠김) 같은 트랜잭션에서
+        이벤트와 현재 세트 점수를 갱신하므로, 번호는 빠짐없이 증가하고 스코어보드는 항상 기록된 이벤트와 일치한다.
+        이벤트당 UPDATE 몇 번으로 끝나고, 세트/매치 종료도 현재 세트 점수만 보고 판단한다.
+        커밋 후 스트림 구독자에게 새 번호를 알린다.
+        """
+        from matchmaking import stream
+
+        event = MatchEvent(match=self, event_type=event_type, added_by=added_by, target_player=target_player)
+        event.clean()
+
+        winning_method = self.winning_method
+        points = event_points(event_type, winning_method)
+        updates = {'last_event_seq': F('last_event_seq') + 1}
+        if event_type in POINT_EVENTS:
+            if target_player.team is None:
+                raise ValidationError("Target player has not been assigned to a team.")
+            event.side = 'red' if target_player.team.is_red_team else 'blue'
+            updates[f'{event.side}_score'] = F(f'{event.side}_score') + points
+
+        with transaction.atomic():
+            Match.objects.filter(pk=self.pk).update(**updates)
+            self.refresh_from_db(fields=self.SCOREBOARD_FIELDS)
+            if self.winning_side and event_type in POINT_EVENTS + ('set_end',):
+                raise ValidationError("This match has already been decided.")
+
+            event.seq = self.last_event_seq
+            event.set_number = self.current_set
+            event.points = points
+            event.save()
+
+            if event.side:
+                set_score = self._add_set_points(event.side, points)
+                winner = set_winner(set_score.red_points, set_score.blue_points, winning_method)
+                if winner:
+                    self._close_set(winner, winning_method)
+            elif event_type == 'set_end':
+                set_score = self._add_set_points()
+                self._close_set(set_winner(set_score.red_points, set_score.blue_points, closing=True), winning_method)
+        transaction.on_commit(lambda: stream.publish(self.pk, event.seq))
+        return event
+
+    def void_event(self, event, added_by):
+        """
+        이벤트 취소 (잘못 기록한 득점 정정, 마지막 이벤트 되돌리기).
+        원래 이벤트는 voided로 표시하고 취소 기록을 새 이벤트(void)로 남겨 스트림에도 전달된다.
+        아직 끝나지 않은 현재 세트의 득점이면 점수만 되돌리고(O(1)),
+        이미 끝난 세트의 득점이나 세트 종료를 취소하면 이 매치의 이벤트를 다시 재생해 스코어보드를 재계산한다.
+        """
+        from matchmaking import stream
+
+        with transaction.atomic():
+            Match.objects.filter(pk=self.pk).update(last_event_seq=F('last_event_seq') + 1)
+            self.refresh_from_db(fields=self.SCOREBOARD_FIELDS)
+            try:
+                target = MatchEvent.objects.select_for_update().get(pk=event.pk, match=self)
+            except MatchEvent.DoesNotExist:
+                raise ValidationError("Event not found in this match.")
+            if target.voided or target.event_type == 'void':
+                raise ValidationError("This event cannot be voided.")
+
+            target.voided = True
+            target.save(update_fields=['voided'])
+            void = MatchEvent.objects.create(
+                match=self, seq=self.last_event_seq, event_type='void', added_by=added_by,
+                voided_event=target, set_number=self.current_set,
+            )
+
+            open_set = target.set_number == self.current_set and not self.winning_side
+            if target.points and open_set:
+                Match.objects.filter(pk=self.pk).update(**{f'{target.side}_score': F(f'{target.side}_score') - target.points})
+                self._add_set_points(target.side, -target.points)
+                self.refresh_from_db(fields=self.SCOREBOARD_FIELDS)
+            elif target.points or target.event_type == 'set_end':
+                Match.rebuild_scoreboards([self.pk])
+                self.refresh_from_db(fields=self.SCOREBOARD_FIELDS)
+        transaction.on_commit(lambda: stream.publish(self.pk, void.seq))
+        return void
+
+    def _add_set_points(self, side=None, points=0):
+        """현재 세트 점수에 points를 더하고 갱신된 세트 점수를 반환 (매치 row 잠금 안에서 호출)"""
+        set_score, _ = MatchSetScore.objects.get_or_create(match=self, set_number=self.current_set)
+        if side:
+            MatchSetScore.objects.filter(pk=set_score.pk).update(**{f'{side}_points': F(f'{side}_points') + points})
+            set_score.refresh_from_db(fields=['red_points', 'blue_points'])
+        return set_score
+
+    def _close_set(self, winner, winning_method):
+        """현재 세트를 끝내고 매치 승부가 나지 않았으면 다음 세트로 (매치 row 잠금 안에서 호출)"""
+        MatchSetScore.objects.filter(match=self, set_number=self.current_set).update(winner=winner)
+        if winner:
+            setattr(self, f'{winner}_sets', getattr(self, f'{winner}_sets') + 1)
+        self.winning_side = match_winner(self.red_sets, self.blue_sets, winning_method)
+        if not self.winning_side:
+            self.current_set += 1
+            MatchSetScore.objects.create(match=self, set_number=self.current_set)
+        self.save(update_fields=['red_sets', 'blue_sets', 'current_set', 'winning_side'])
+
+    @classmethod
+    def rebuild_scoreboards(cls, match_ids):
+        """
+        매치들의 스코어보드를 이벤트 재생으로 다시 계산.
+        매치 묶음의 이벤트를 한 번에 읽어 메모리에서 재생하고 bulk_update / bulk_create로 반영한다.
+        """
+        matches = {match.pk: match for match in cls.objects.filter(pk__in=match_ids).select_related('winning_method')}
+        states = {pk: ScoreState(match.winning_method) for pk, match in matches.items()}
+        changed_events = []
+        events = MatchEvent.objects.filter(match_id__in=matches).exclude(event_type='void').order_by('match_id', 'seq')
+        for event in events.only('id', 'match_id', 'seq', 'event_type', 'side', 'set_number', 'points', 'voided'):
+            if event.voided:
+                continue
+            set_number, points = states[event.match_id].apply(event.event_type, event.side)
+            if (event.set_number, event.points) != (set_number, points):
+                event.set_number, event.points = set_number, points
+                changed_events.append(event)
+
+        with transaction.atomic():
+            MatchEvent.objects.bulk_update(changed_events, ['set_number', 'points'], batch_size=1000)
+            MatchSetScore.objects.filter(match_id__in=matches).delete()
+            MatchSetScore.objects.bulk_create([
+                MatchSetScore(match_id=pk, set_number=number, red_points=score['red'], blue_points=score['blue'], winner=score['winner'])
+                for pk, state in states.items()
+                for number, score in state.sets.items()
+            ])
+            for pk, state in states.items():
+                match = matches[pk]
+                for field in ['red_score', 'blue_score', 'red_sets', 'blue_sets', 'current_set', 'winning_side']:
+                    setattr(match, field, getattr(state, field))
+            cls.objects.bulk_update(matches.values(), ['red_score', 'blue_score', 'red_sets', 'blue_sets', 'current_set', 'winning_side'])
+        return len(matches)
+
+    def add_participant(self, user):
+        """
+        참가자 추가 (팀은 나중에 배정).
+        participant_count < total_spots 조건부 UPDATE로 자리를 먼저 잡으므로 동시에 몰려도 정원을 넘지 않는다.
+        정원이 찼으면 MatchFull.
+        """
+        with transaction.atomic():
+            reserved = Match.objects.filter(pk=self.pk, participant_count__lt=F('total_spots')).update(
+                participant_count=F('participant_count') + 1
+            )
+            if not reserved:
+                raise MatchFull("This match is full.")
+            team_player = TeamPlayer.objects.create(user=user, team=None)
+            self.participants.add(team_player)
+            try:
+                # 배제 제약이 동시에 들어온 겹치는 참가까지 막아준다
+                with transaction.atomic():
+                    MatchScheduleSlot.objects.create(user=user, match=self, period=self.period)
+            except IntegrityError:
+                raise ValidationError(OVERLAP_ERROR)
+        self.refresh_from_db(fields=['participant_count'])
+        return team_player
+
+    def remove_participant(self, user):
+        """참가자 제거 후 대기열에서 빈 자리만큼 자동 참가. 제거한 TeamPlayer 수를 반환"""
+        with transaction.atomic():
+            team_players = list(self.participants.filter(user=user))
+            if team_players:
+                self.participants.remove(*team_players)
+                TeamPlayer.objects.filter(pk__in=[player.pk for player in team_players]).delete()
+                MatchScheduleSlot.objects.filter(user=user, match=self).delete()
+                Match.objects.filter(pk=self.pk).update(participant_count=F('participant_count') - len(team_players))
+        if team_players:
+            self.promote_waitlist()
+        self.refresh_from_db(fields=['participant_count'])
+        return len(team_players)
+
+    def promote_waitlist(self):
+        """
+        대기열 앞에서부터 빈 자리만큼 참가시킨다. 자동 참가한 유저 목록을 반환.
+        대기 항목마다 별도 트랜잭션이며, 겹치는 매치가 생긴 유저는 대기열에서 빠진다.
+        """
+        promoted = []
+        while True:
+            with transaction.atomic():
+                entry = (
+                    MatchWaitlist.objects.select_for_update(skip_locked=True)
+                    .filter(match=self)
+                    .select_related('user')
+                    .order_by('created_at', 'id')
+                    .first()
+                )
+                if entry is None:
+                    break
+                lock_user(entry.user_id)
+                try:
+                    self.prevent_overlap(entry.user)
+                    self.add_participant(entry.user)
+                except MatchFull:
+                    break
+                except ValidationError:
+                    pass
+                else:
+                    promoted.append(entry.user)
+                entry.delete()
+        return promoted
 
     def prevent_overlap(self, user):
         """Prevent user from joining multiple matches at the same time"""
-        ongoing_matches = Match.objects.filter(
-            participants__user=user,
-            start_time__lt=self.start_time + self.duration,
-            start_time__gt=self.start_time - self.duration,
-        )
-        if ongoing_matches.exists():
-            raise ValidationError("You cannot join another match that overlaps with your current match.")
+        if self.period is None:
+            raise ValidationError(UNSCHEDULED_ERROR)
+        # (user, period) GiST 인덱스 한 번 탐색
+        overlapping = MatchScheduleSlot.objects.filter(user=user, period__overlap=self.period).exclude(match=self)
+        if overlapping.exists():
+            raise ValidationError(OVERLAP_ERROR)
+
+    def sync_schedule_slots(self):
+        """시작 시간/진행 시간이 바뀌었을 때 참가자 일정 구간 갱신"""
+        if self.period is None:
+            return
+        try:
+            with transaction.atomic():
+                MatchScheduleSlot.objects.filter(match=self).update(period=self.period)
+        except IntegrityError:
+            raise ValidationError("The new time overlaps with another match of a participant.")
+
+    def cancel_match(self):
+        """매치 취소. 참가자 일정에서 빠진다"""
+        with transaction.atomic():
+            self.status = 'canceled'
+            self.save(update_fields=['status'])
+            MatchScheduleSlot.objects.filter(match=self).delete()
 
     def assign_teams(self):
+        """
+        참가자를 두 팀으로 배정.
+        참가자/유저/통계를 한 번에 읽고, 팀 2개는 bulk_create, 배정은 bulk_update 한 번으로 저장한다.
+        - 클럽 매치: 참가자의 현재 클럽이 정확히 두 개면 클럽별로 나눔
+        - 그 외: 경기 성과/매너 점수로 균형을 맞춘 레드/블루 팀
+        """
+        participants = list(
+            self.participants.select_related('user__userstatistics__current_club').order_by('id')
+        )
+        stats = {player.pk: getattr(player.user, 'userstatistics', None) for player in participants}
+
         if self.match_type == 'club':
             # If it's a club match, assign clubs directly
-            club_teams = list(set(participant.user.club for participant in self.participants if participant.user.club))
-            if len(club_teams) == 2:
-                team_1 = Team.objects.create(name=club_teams[0].name, club=club_teams[0], is_red_team=True)
-                team_2 = Team.objects.create(name=club_teams[1].name, club=club_teams[1], is_red_team=False)
-                for player in self.participants.all():
-                    if player.user.club == club_teams[0]:
-                        player.team = team_1
-                    else:
-                        player.team = team_2
-                    player.save()
+            clubs = {}
+            for player in participants:
+                club = stats[player.pk].current_club if stats[player.pk] else None
+                if club:
+                    clubs.setdefault(club.pk, club)
+            if len(clubs) != 2:
+                return None
+            club_1, club_2 = clubs.values()
+            teams = [
+                Team(name=club_1.name, club=club_1, is_red_team=True),
+                Team(name=club_2.name, club=club_2, is_red_team=False),
+            ]
+            red = [
+                player.pk for player in participants
+                if stats[player.pk] and stats[player.pk].current_club_id == club_1.pk
+            ]
         else:
-            # Assign default Red/Blue teams for individual matches
-            red_team = Team.objects.create(name="Red Team", is_red_team=True)
-            blue_team = Team.objects.create(name="Blue Team", is_red_team=False)
-            participants = list(self.participants.all())
-            for idx, player in enumerate(participants):
-                if idx % 2 == 0:
-                    player.team = red_team
-                else: player.team = blue_team
-                player.save()
+            # Assign balanced Red/Blue teams for individual matches
+            teams = [Team(name="Red Team", is_red_team=True), Team(name="Blue Team", is_red_team=False)]
+            red, _ = balance_teams({
+                player.pk: player_rating(
+                    stats[player.pk].performance if stats[player.pk] else None,
+                    stats[player.pk].manner if stats[player.pk] else None,
+                )
+                for player in participants
+            })
+
+        red = set(red)
+        with transaction.atomic():
+            red_team, blue_team = Team.objects.bulk_create(teams)
+            for player in participants:
+                player.team = red_team if player.pk in red else blue_team
+            TeamPlayer.objects.bulk_update(participants, ['team'])
+        return red_team, blue_team
 
     @classmethod
     def create_match(cls, creator, sports_ground, facility, price, start_time, duration, match_type, total_spots, league=None, tournament=None, winning_method=None):
@@ -111,57 +426,61 @@ class Match(TimeStampedModel):
 
     def start_match(self):
         """
-        매치 시작 시 뉴스피드 업데이트 및 팔로워들에게 알림 전송
+        매치 시작 시 뉴스피드 업데이트 및 팔로워들에게 알림 전송.
+        상태만 조건부 UPDATE로 바꾸므로 그 사이 들어온 참가/이벤트(F()로 갱신되는 필드)를 덮어쓰지 않는다
+        (예정된 매치가 아니면 False).
         """
+        started = Match.objects.filter(pk=self.pk, status='scheduled').update(status='ongoing')
+        if not started:
+            return False
         self.status = 'ongoing'
-        self.save()
-
-        participants = self.participants.all()
-        for participant in participants:
-            followers = participant.user.followers.all()
-            for follower in followers:
-                newsfeed_post = NewsfeedPost.objects.create(
-                    newsfeed=follower.newsfeed,
-                    post_type="match",
-                    post_id=self.id,
-                    post_content=f"{participant.user.username}님이 방금 매치를 시작했습니다."
-                )
-                MatchPost.objects.create(
-                    match=self,
-                    created_by=participant.user,
-                    post_content=f"{participant.user.username}님이 방금 매치를 시작했습니다.",
-                    newsfeed_post=newsfeed_post
-                )
+
+        self.enqueue_participant_fanout("{username}님이 방금 매치를 시작했습니다.")
+        return True
 
     def complete_match(self):
         """
-        매치 완료 시 뉴스피드 업데이트 및 팔로워들에게 알림 전송
+        매치 완료 시 뉴스피드 업데이트 및 팔로워들에게 알림 전송.
+        상태는 조건부 UPDATE로 한 번만 바뀌므로 동시에/여러 번 호출돼도 완료 처리는 한 번이다 (이미 완료면 False).
+        같은 트랜잭션에서 선수/클럽 통계를 반영하고 (ProcessedMatchStats), 리그/토너먼트 매치는 (리그는 순위표 반영 후)
+        라운드 완료 수를 올려 라운드의 마지막 경기면 라운드를 진행한다.
         """
-        self.status = 'completed'
-        self.save()
-
-        participants = self.participants.all()
-        for participant in participants:
-            followers = participant.user.followers.all()
-            for follower in followers:
-                newsfeed_post = NewsfeedPost.objects.create(
-                    newsfeed=follower.newsfeed,
-                    post_type="match",
-                    post_id=self.id,
-                    post_content=f"{participant.user.username}님의 매치가 방금 끝났습니다."
-                )
-                MatchPost.objects.create(
-                    match=self,
-                    created_by=participant.user,
-                    post_content=f"{participant.user.username}님의 매치가 방금 끝났습니다.",
-                    newsfeed_post=newsfeed_post
-                )
-
-        # 기존 뉴스피드 포스트 업데이트
-        newsfeed_post = NewsfeedPost.objects.get(post_id=self.id, post_type="match")
-        newsfeed_post.post_content = f"Match completed."
-        newsfeed_post.pinned = False
-        newsfeed_post.save()
+        with transaction.atomic():
+            completed = Match.objects.filter(pk=self.pk).exclude(status__in=['completed', 'canceled']).update(status='completed')
+            if not completed:
+                return False
+            self.status = 'completed'
+            ProcessedMatchStats.process([self.pk])
+            if self.match_type == 'league':
+                apps.get_model('leagues', 'LeagueMatch').match_completed(self.pk)
+            elif self.match_type == 'tournament':
+                apps.get_model('tournaments', 'TournamentRound').match_completed(self.pk)
+
+        self.enqueue_participant_fanout("{username}님의 매치가 방금 끝났습니다.")
+
+        # 기존 뉴스피드 포스트 업데이트 (팔로워에게 fan-out된 포스트와 post_id가 같으므로 생성자 뉴스피드로 한정)
+        posts = NewsfeedPost.objects.filter(newsfeed__user=self.creator_id, post_id=self.id, post_type="match")
+        post_ids = list(posts.values_list('id', flat=True))
+        posts.update(post_content="Match completed.", pinned=False)
+        invalidate_posts(post_ids)
+        return True
+
+    def enqueue_participant_fanout(self, message):
+        """
+        참가자별 팔로워 뉴스피드 포스트 생성을 fan-out 큐에 적재.
+        참가자 조회 1회 + INSERT 1회로 끝나며, 실제 포스트는 워커가 bulk_create로 생성한다.
+        """
+        participants = self.participants.select_related('user')
+        FanoutTask.enqueue([
+            FanoutTask(
+                actor=participant.user,
+                post_type="match",
+                post_id=self.id,
+                post_content=message.format(username=participant.user.username),
+                with_match_post=True,
+            )
+            for participant in participants
+        ])
 
 
 class WinningMethod(models.Model):
@@ -174,63 +493,80 @@ class WinningMethod(models.Model):
     def __str__(self):
         return f"Winning Method: {self.points_needed} points needed, {self.sets} sets"
 
+QUESTIONS_STATUS_CHOICES = [
+    ("pending", "Pending"),
+    ("generating", "Generating"),
+    ("ready", "Ready"),
+    ("failed", "Failed"),
+]
+
+
 class PressConference(models.Model):
     match = models.OneToOneField('matchmaking.Match', related_name="press_conference", on_delete=models.CASCADE)
     participants = models.ManyToManyField('matchmaking.TeamPlayer', related_name="press_conferences")
-    questions = models.JSONField()  # ChatGPT API로 생성된 질문들 저장
-    chat_log = models.JSONField(blank=True, null=True)  # 대화 기록 저장
+    questions = models.JSONField(default=list, blank=True)  # LLM으로 생성된 질문들 저장
+    questions_status = models.CharField(max_length=20, choices=QUESTIONS_STATUS_CHOICES, default="pending")  # 질문 생성 상태
+    questions_started_at = models.DateTimeField(null=True, blank=True)  # 질문 생성 시작 시간 (워커 타임아웃 판단용)
+    conversation = models.OneToOneField('matchmaking.Conversation', related_name="press_conference", on_delete=models.CASCADE)  # 대화 기록
     current_question_index = models.IntegerField(default=0)  # 현재 질문 인덱스
 
-    def generate_questions(self):
+    def save(self, *args, **kwargs):
+        if self.conversation_id is None:
+            self.conversation = Conversation.objects.create()
+        super().save(*args, **kwargs)
+
+    def request_questions(self):
         """
-        ChatGPT API와 연동해 자동으로 질문을 생성하는 메서드.
-        질문 목록을 self.questions에 저장함.
+        질문 생성을 요청하고 바로 반환 (실제 생성은 generate_press_questions 워커가 처리).
+        이미 생성 중이거나 생성된 경우에는 아무것도 하지 않으므로 같은 요청이 몰려도 한 번만 생성된다.
+        LLM_EAGER가 켜져 있으면 워커 없이 커밋 후 백그라운드 스레드에서 생성한다.
         """
-        # OpenAI API 키 설정
-        openai.api_key = settings.OPENAI_API_KEY
-
-        # 프롬프트 작성
-        prompt = f"다음 참가자들이 포함된 축구 경기를 위한 흥미로운 질문 5개를 생성해줘:\n"
-        for player in self.match.participants.all():
-            prompt += f"- {player.user.username}, stats: {player.user.user_statistics}\n"
-        prompt += "질문들은 경기 및 선수들과 관련된 것이어야 합니다."
-
-        # OpenAI API를 통해 질문 생성
-        try:
-            response = openai.Completion.create(
-                engine="text-davinci-003",
-                prompt=prompt,
-                max_tokens=150,
-                n=5,
-                stop=None,
-                temperature=0.7,
-            )
+        requested = PressConference.objects.filter(pk=self.pk, questions_status='failed').update(questions_status='pending')
+        self.refresh_from_db(fields=['questions_status'])
+        if settings.LLM_EAGER and (requested or self.questions_status == 'pending'):
+            from matchmaking.press import submit
 
-            # 생성된 질문을 JSON 형태로 저장
-            generated_questions = [choice['text'].strip() for choice in response['choices']]
-            self.questions = generated_questions
-            self.save()
-        except Exception as e:
-            print(f"질문 생성 중 오류 발생: {e}")
-            return None
+            transaction.on_commit(lambda: submit([self.pk]))
+        return self.questions_status
 
     def create_prompt(self):
         """
-        경기 참가자와 경기 세부 정보를 바탕으로 ChatGPT 프롬프트 생성.
+        경기 참가자와 경기 세부 정보를 바탕으로 질문 생성 프롬프트 작성.
+        참가자, 유저, 통계는 한 번의 쿼리로 읽는다.
         """
         match_info = f"{self.match.sports_ground.name}에서 시작하는 경기 정보."
         player_info = []
 
-        for participant in self.participants.all():
-            UserStatistics = apps.get_model('accounts', 'UserStatistics')  
-            user_stats = UserStatistics.objects.get(user=participant.user)
-            player_info.append(
-                f"플레이어 {participant.user.username}: {user_stats.mp} 경기, {user_stats.wins} 승리, 매너 점수 {user_stats.manner}."
-            )
+        for participant in self.participants.select_related('user__userstatistics').order_by('id'):
+            user_stats = getattr(participant.user, 'userstatistics', None)
+            if user_stats:
+                player_info.append(
+                    f"- {participant.user.username}: {user_stats.mp} 경기, {user_stats.wins} 승리, 매너 점수 {user_stats.manner}."
+                )
+            else:
+                player_info.append(f"- {participant.user.username}: 기록 없음.")
 
-        prompt = f"{match_info}\n참가자들:\n" + "\n".join(player_info)
+        prompt = (
+            f"{match_info}\n참가자들:\n" + "\n".join(player_info)
+            + "\n위 참가자들이 포함된 경기를 위한 흥미로운 기자회견 질문을 만들어줘. 질문들은 경기 및 선수들과 관련된 것이어야 합니다."
+        )
         return prompt
 
+    def generate_questions(self):
+        """
+        LLM으로 질문을 생성해 self.questions에 저장 (워커에서 호출).
+        """
+        from matchmaking.llm import generate
+
+        try:
+            self.questions = generate(self.create_prompt(), n=5, max_tokens=150)
+            self.questions_status = 'ready'
+        except Exception:
+            logger.exception("press conference question generation failed: %s", self.pk)
+            self.questions_status = 'failed'
+        self.save(update_fields=['questions', 'questions_status'])
+        return self.questions_status == 'ready'
+
     def ask_next_question(self):
         """
         Press Conference에서 다음 질문을 던짐.
@@ -238,44 +574,42 @@ class PressConference(models.Model):
         if self.current_question_index == 0:
             intro_message = f"다가오는 경기의 기자회견에 오신 것을 환영합니다: {self.match.sports_ground.name}."
             self.current_question_index += 1
-            self.save()
+            self.save(update_fields=['current_question_index'])
             return intro_message
         elif self.current_question_index <= len(self.questions):
             next_question = self.questions[self.current_question_index - 1]
             self.current_question_index += 1
-            self.save()
+            self.save(update_fields=['current_question_index'])
             return next_question
         else:
             return "기자회견 질문이 끝났습니다. 자유롭게 토론을 이어가십시오."
 
-    def process_answer(self, answer):
+    def process_answer(self, answer, user=None):
         """
-        사용자가 답변을 제출하면, 대화 로그에 저장하고 다음 질문을 던짐.
+        사용자가 답변을 제출하면, 대화 기록에 한 줄 추가하고 다음 질문을 던짐.
         """
-        if not self.chat_log:
-            self.chat_log = []
-
+        question = ""
         if self.current_question_index > 1:
-            current_question = self.questions[self.current_question_index - 2]
-            self.chat_log.append({
-                "question": current_question,
-                "answer": answer,
-                "timestamp": timezone.now().isoformat(),
-            })
-        else:
-            self.chat_log.append({
-                "message": answer,
-                "timestamp": timezone.now().isoformat(),
-            })
-
-        self.save()
+            question = self.questions[self.current_question_index - 2]
+        self.conversation.append(answer, user=user, question=question)
 
         return self.ask_next_question()
 
 class TeamTalk(models.Model):
     match = models.ForeignKey('matchmaking.Match', related_name="team_talks", on_delete=models.CASCADE)
     team = models.ForeignKey('matchmaking.TeamPlayer', related_name="team_talks", on_delete=models.CASCADE)
-    chat_log = models.JSONField()
+    conversation = models.OneToOneField('matchmaking.Conversation', related_name="team_talk", on_delete=models.CASCADE)  # 대화 기록
+
+    class Meta:
+        constraints = [
+            # 동시에 첫 메시지를 보내도 (match, team)마다 대화방은 하나 (get_or_create가 기존 행을 다시 읽는다)
+            models.UniqueConstraint(fields=['match', 'team'], name='matchmaking_teamtalk_unique_match_team'),
+        ]
+
+    def save(self, *args, **kwargs):
+        if self.conversation_id is None:
+            self.conversation = Conversation.objects.create()
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.match} 경기 중 {self.team}의 팀 대화"
@@ -287,9 +621,11 @@ class MatchEvent(TimeStampedModel):
         ('pause', 'Pause'),
         ('set_end', 'Set End'),
         ('match_end', 'Match End'),
+        ('void', 'Void'),
     )
 
     match = models.ForeignKey('matchmaking.Match', related_name="events", on_delete=models.CASCADE)
+    seq = models.PositiveIntegerField()  # 매치 안에서의 이벤트 번호 (1부터, 스트림 재개 기준)
     event_type = models.CharField(max_length=50, choices=EVENT_TYPES)
     timestamp = models.DateTimeField(auto_now_add=True)
     added_by = models.ForeignKey('matchmaking.TeamPlayer', on_delete=models.CASCADE)
@@ -300,13 +636,24 @@ class MatchEvent(TimeStampedModel):
         null=True, 
         blank=True
     )
+    set_number = models.PositiveSmallIntegerField(null=True, blank=True)  # 기록 당시 진행 중이던 세트
+    side = models.CharField(max_length=4, choices=SIDE_CHOICES, blank=True, default="")  # 득점한 팀 (득점 이벤트만)
+    points = models.PositiveIntegerField(default=0)  # 스코어보드에 반영된 점수 (points_per_action 기준)
+    voided = models.BooleanField(default=False)  # 취소된 이벤트 (스코어보드 재계산에서 제외)
+    voided_event = models.ForeignKey('self', related_name="voids", on_delete=models.CASCADE, null=True, blank=True)  # void 이벤트가 취소한 이벤트
+
+    class Meta:
+        constraints = [
+            # (match, seq) 인덱스로 "seq 이후 이벤트" 조회도 처리
+            models.UniqueConstraint(fields=['match', 'seq'], name='matchmaking_matchevent_unique_seq'),
+        ]
 
     def clean(self):
         # point 및 special point 이벤트는 대상이 필요함
         if self.event_type in ['point', 'special_point'] and not self.target_player:
             raise ValidationError("Point or Special Point events must have a target player.")
         # pause, set_end, match_end 이벤트는 대상이 없어야 함
-        elif self.event_type in ['pause', 'set_end', 'match_end'] and self.target_player:
+        elif self.event_type in ['pause', 'set_end', 'match_end', 'void'] and self.target_player:
             raise ValidationError(f"{self.event_type} events should not have a target player.")
 
     def __str__(self):
@@ -0,0 +1,50 @@
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import DateTimeRangeField, RangeOperators
+from django.db import models
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+
+
+class MatchScheduleSlot(models.Model):
+    """
+    유저별 매치 일정 (참가한 매치의 [시작, 종료) 구간).
+    (user, period) GiST 배제 제약으로 한 유저의 구간이 겹치지 않도록 DB가 보장하고,
+    같은 인덱스로 겹침 확인/빈 시간 조회를 한 번의 인덱스 탐색으로 처리한다.
+    """
+    user = models.ForeignKey('accounts.User', on_delete=models.CASCADE, related_name="match_schedule")
+    match = models.ForeignKey('matchmaking.Match', on_delete=models.CASCADE, related_name="schedule_slots")
+    period = DateTimeRangeField()
+
+    class Meta:
+        constraints = [
+            ExclusionConstraint(
+                name="matchmaking_schedule_no_overlap",
+                expressions=[
+                    ("user", RangeOperators.EQUAL),
+                    ("period", RangeOperators.OVERLAPS),
+                ],
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username}: match {self.match_id} ({self.period.lower} - {self.period.upper})"
+
+    @classmethod
+    def free_slots(cls, user, start, end, min_length):
+        """
+        [start, end) 구간에서 유저의 일정(busy)과 min_length 이상인 빈 구간(free)을 반환.
+        일정은 배제 제약 덕분에 서로 겹치지 않으므로 시작 순으로 한 번 훑으면 된다.
+        """
+        busy = list(
+            cls.objects.filter(user=user, period__overlap=DateTimeTZRange(start, end, '[)'))
+            .order_by('period')
+            .values_list('match_id', 'period')
+        )
+        free = []
+        cursor = start
+        for _, period in busy:
+            if period.lower - cursor >= min_length:
+                free.append((cursor, period.lower))
+            cursor = max(cursor, period.upper)
+        if end - cursor >= min_length:
+            free.append((cursor, end))
+        return busy, free
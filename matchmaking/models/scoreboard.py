@@ -0,0 +1,20 @@
+from django.db import models
+
+SIDE_CHOICES = [
+    ("red", "Red"),
+    ("blue", "Blue"),
+]
+
+
+class MatchSetScore(models.Model):
+    match = models.ForeignKey('matchmaking.Match', on_delete=models.CASCADE, related_name="set_scores")
+    set_number = models.PositiveSmallIntegerField()  # 세트 번호 (1부터)
+    red_points = models.PositiveIntegerField(default=0)
+    blue_points = models.PositiveIntegerField(default=0)
+    winner = models.CharField(max_length=4, choices=SIDE_CHOICES, blank=True, default="")  # 세트가 끝나지 않았거나 무승부면 빈 값
+
+    class Meta:
+        unique_together = ('match', 'set_number')
+
+    def __str__(self):
+        return f"{self.match_id} 경기 {self.set_number}세트 {self.red_points}:{self.blue_points}"
@@ -0,0 +1,147 @@
+from django.apps import apps
+from django.db import models, transaction
+from django.db.models import F, Sum
+
+from matchmaking.statistics import STAT_FIELDS, collect_deltas, group_deltas
+
+
+class ProcessedMatchStats(models.Model):
+    """
+    선수/클럽 통계에 반영된 완료 매치 기록 (매치당 한 행).
+    process는 이 행이 없는 매치만 반영하고 같은 트랜잭션에서 행을 만들므로,
+    같은 매치를 다시 처리해도 통계가 두 번 더해지지 않는다.
+    """
+    match = models.OneToOneField('matchmaking.Match', on_delete=models.CASCADE, related_name="processed_stats")
+    processed_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.match_id} 경기 통계 반영"
+
+    @classmethod
+    def process(cls, match_ids):
+        """
+        완료된 매치들의 결과/득점 이벤트를 UserStatistics와 (클럽 팀이면) ClubStatistics에 더한다.
+        리그/토너먼트 경기는 참가자 대신 홈/원정 팀과 그 팀 선수로 쪽을 정한다 (fixture_sides).
+        매치 row를 잠근 뒤 처리 기록을 다시 확인하므로 동시에 호출돼도 매치마다 한 번만 반영된다.
+        증가분은 같은 값끼리 묶어 F() UPDATE 한 번씩으로 반영한다. 반영한 매치 수를 반환.
+        """
+        Match = apps.get_model('matchmaking', 'Match')
+        MatchEvent = apps.get_model('matchmaking', 'MatchEvent')
+
+        with transaction.atomic():
+            locked = {
+                pk: (red_score, blue_score, winning_side)
+                for pk, red_score, blue_score, winning_side in Match.objects.select_for_update()
+                .filter(pk__in=match_ids, status='completed').order_by('pk')
+                .values_list('pk', 'red_score', 'blue_score', 'winning_side')
+            }
+            # 잠금을 얻은 뒤의 새 쿼리라 먼저 커밋된 처리 기록도 보인다
+            processed = set(cls.objects.filter(match_id__in=list(locked)).values_list('match_id', flat=True))
+            matches = {pk: score for pk, score in locked.items() if pk not in processed}
+            if not matches:
+                return 0
+
+            fixtures = cls.fixture_sides(matches)
+            players = [
+                (match_id, user_id, None if is_red_team is None else 'red' if is_red_team else 'blue', club_id)
+                for match_id, user_id, is_red_team, club_id in Match.participants.through.objects
+                .filter(match_id__in=[pk for pk in matches if pk not in fixtures])
+                .values_list('match_id', 'teamplayer__user_id', 'teamplayer__team__is_red_team', 'teamplayer__team__club_id')
+            ]
+            players += cls.fixture_players(fixtures)
+            points = {
+                (row['match_id'], row['target_player__user_id']): row['total']
+                for row in MatchEvent.objects.filter(match_id__in=list(matches), voided=False, points__gt=0, target_player__isnull=False)
+                .values('match_id', 'target_player__user_id').annotate(total=Sum('points')).order_by()
+            }
+            users, clubs = collect_deltas(matches, players, points)
+
+            cls.apply_user_deltas(users)
+            cls.apply_club_deltas(clubs)
+            cls.objects.bulk_create([cls(match_id=pk) for pk in matches])
+        return len(matches)
+
+    @staticmethod
+    def fixture_sides(match_ids):
+        """리그/토너먼트 경기의 매치 id -> ((홈 팀 id, 클럽 id, 'red'), (원정 팀 id, 클럽 id, 'blue'))"""
+        fixtures = {}
+        for model in (apps.get_model('leagues', 'LeagueMatch'), apps.get_model('tournaments', 'TournamentMatch')):
+            for match_id, home_id, home_club_id, away_id, away_club_id in model.objects.filter(match_id__in=list(match_ids)).values_list(
+                'match_id', 'home_team_id', 'home_team__club_id', 'away_team_id', 'away_team__club_id'
+            ):
+                fixtures[match_id] = ((home_id, home_club_id, 'red'), (away_id, away_club_id, 'blue'))
+        return fixtures
+
+    @staticmethod
+    def fixture_players(fixtures):
+        """
+        리그/토너먼트 경기의 (매치 id, 유저 id, side, 클럽 id) 목록. 홈/원정 팀의 선수로 채우고,
+        선수가 없는 팀도 클럽 통계에는 반영되도록 유저 id가 None인 항목을 하나 둔다.
+        """
+        TeamPlayer = apps.get_model('matchmaking', 'TeamPlayer')
+        if not fixtures:
+            return []
+        team_ids = {team_id for sides in fixtures.values() for team_id, _, _ in sides}
+        roster = {}
+        for team_id, user_id in TeamPlayer.objects.filter(team_id__in=list(team_ids)).values_list('team_id', 'user_id'):
+            roster.setdefault(team_id, set()).add(user_id)
+        return [
+            (match_id, user_id, side, club_id)
+            for match_id, sides in fixtures.items()
+            for team_id, club_id, side in sides
+            for user_id in sorted(roster.get(team_id, ())) or [None]
+        ]
+
+    @staticmethod
+    def apply_user_deltas(deltas):
+        UserStatistics = apps.get_model('accounts', 'UserStatistics')
+        if not deltas:
+            return
+        UserStatistics.objects.bulk_create([UserStatistics(user_id=user_id) for user_id in deltas], ignore_conflicts=True)
+        for delta, user_ids in group_deltas(deltas).items():
+            UserStatistics.objects.filter(user_id__in=user_ids).update(**increments(delta))
+
+    @staticmethod
+    def apply_club_deltas(deltas):
+        """클럽 전체 통계(리그/토너먼트가 없는 ClubStatistics 행)에 더한다. 없는 행은 클럽 row를 잠그고 만든다"""
+        Club = apps.get_model('clubs', 'Club')
+        ClubStatistics = apps.get_model('clubs', 'ClubStatistics')
+        if not deltas:
+            return
+        overall = ClubStatistics.objects.filter(league__isnull=True, tournament__isnull=True)
+        list(Club.objects.select_for_update().filter(pk__in=list(deltas)).order_by('pk').values_list('pk', flat=True))
+        existing = set(overall.filter(club_id__in=list(deltas)).values_list('club_id', flat=True))
+        ClubStatistics.objects.bulk_create([ClubStatistics(club_id=club_id) for club_id in deltas if club_id not in existing])
+        for delta, club_ids in group_deltas(deltas).items():
+            overall.filter(club_id__in=club_ids).update(**increments(delta))
+
+    @classmethod
+    def rebuild(cls, batch_size=500):
+        """
+        모든 선수/클럽 누적 통계를 0으로 되돌리고 완료된 매치를 id 순서대로 다시 반영 (백필/정정용).
+        한 트랜잭션에서 처리하므로 중간 상태가 보이지 않고, 같은 이력이면 항상 같은 결과가 나온다. 반영한 매치 수를 반환.
+        """
+        Match = apps.get_model('matchmaking', 'Match')
+        UserStatistics = apps.get_model('accounts', 'UserStatistics')
+        ClubStatistics = apps.get_model('clubs', 'ClubStatistics')
+
+        zeros = dict.fromkeys(STAT_FIELDS, 0)
+        completed = Match.objects.filter(status='completed').order_by('pk')
+        rebuilt = 0
+        with transaction.atomic():
+            UserStatistics.objects.update(**zeros)
+            ClubStatistics.objects.filter(league__isnull=True, tournament__isnull=True).update(**zeros)
+            cls.objects.all().delete()
+            last_id = 0
+            while True:
+                ids = list(completed.filter(pk__gt=last_id).values_list('pk', flat=True)[:batch_size])
+                if not ids:
+                    break
+                rebuilt += cls.process(ids)
+                last_id = ids[-1]
+        return rebuilt
+
+
+def increments(delta):
+    """STAT_FIELDS 순서의 증가분 -> update()에 넘길 F() 식 (0인 필드는 건드리지 않는다)"""
+    return {field: F(field) + value for field, value in zip(STAT_FIELDS, delta) if value}
@@ -15,9 +15,10 @@ class Team(models.Model):
             return "Red Team" if self.is_red_team else "Blue Team"
         
 class TeamPlayer(models.Model):
-    team = models.ForeignKey(Team, on_delete=models.CASCADE)  # 팀과 연결
+    team = models.ForeignKey(Team, on_delete=models.CASCADE, null=True, blank=True)  # 팀과 연결 (참가 후 팀 배정 전에는 없음)
     user = models.ForeignKey('accounts.User', on_delete=models.CASCADE)  # User를 문자열 참조로 변경
     is_starting_player = models.BooleanField(default=True)  # 선발 선수 여부
 
     def __str__(self):
-        return f"{self.user.username} - {self.team.name} ({self.position})"
\ No newline at end of file
+        team = self.team.name if self.team else "미배정"
+        return f"{self.user.username} - {team}"
\ No newline at end of file
@@ -0,0 +1,17 @@
+from django.db import models
+
+
+class MatchWaitlist(models.Model):
+    """정원이 찬 매치의 대기열. 참가자가 빠지면 먼저 등록한 순서대로 자동 참가된다."""
+    match = models.ForeignKey('matchmaking.Match', on_delete=models.CASCADE, related_name="waitlist")
+    user = models.ForeignKey('accounts.User', on_delete=models.CASCADE, related_name="match_waitlists")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('match', 'user')
+        indexes = [
+            models.Index(fields=['match', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} waiting for match {self.match_id}"
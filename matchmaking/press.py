@@ -0,0 +1,71 @@
+"""
+기자회견 질문 생성 작업 처리.
+
+PressConference.questions_status가 pending인 기자회견을 가져가(generating) LLM으로 질문을 만든다.
+generate_press_questions 워커가 주기적으로 처리하고, LLM_EAGER가 켜져 있으면 요청 프로세스의 백그라운드 스레드에서 처리한다.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from matchmaking.models.match import PressConference
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def claim(limit=10, ids=None):
+    """
+    대기 중인(또는 타임아웃된 생성 중) 기자회견을 limit개까지 가져와 generating으로 표시.
+    여러 워커가 같은 기자회견을 가져가지 않도록 SKIP LOCKED를 사용한다.
+    """
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=settings.LLM_TASK_TIMEOUT)
+    with transaction.atomic():
+        conferences = PressConference.objects.select_for_update(skip_locked=True).filter(
+            Q(questions_status='pending') | Q(questions_status='generating', questions_started_at__lt=stale_before)
+        )
+        if ids is not None:
+            conferences = conferences.filter(pk__in=ids)
+        conferences = list(conferences.select_related('match__sports_ground').order_by('id')[:limit])
+        PressConference.objects.filter(pk__in=[conference.pk for conference in conferences]).update(
+            questions_status='generating', questions_started_at=now
+        )
+    return conferences
+
+
+def _generate(conference):
+    try:
+        return conference.generate_questions()
+    finally:
+        connection.close()
+
+
+def process(conferences):
+    """기자회견 질문을 LLM_MAX_CONCURRENCY개씩 동시에 생성. 성공한 개수를 반환"""
+    if not conferences:
+        return 0
+    with ThreadPoolExecutor(max_workers=settings.LLM_MAX_CONCURRENCY) as executor:
+        return sum(executor.map(_generate, conferences))
+
+
+def submit(ids):
+    """커밋 후 백그라운드 스레드에서 해당 기자회견들의 질문 생성 (LLM_EAGER)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="press-questions")
+
+    def run():
+        close_old_connections()
+        try:
+            process(claim(limit=len(ids), ids=ids))
+        finally:
+            connection.close()
+
+    return _executor.submit(run)
@@ -0,0 +1,93 @@
+"""
+스코어보드 규칙.
+
+- 득점 이벤트(point, special_point)의 점수는 WinningMethod.points_per_action[이벤트 종류] (없으면 1점)
+- 한 팀이 현재 세트에서 points_needed에 도달하면 그 팀의 세트 승리로 세트가 끝나고,
+  set_end 이벤트는 현재 세트를 점수가 높은 팀의 승리(동점이면 무승부)로 끝낸다.
+- sets 중 과반(sets // 2 + 1)을 먼저 가져간 팀이 매치 승리. 승부가 난 뒤의 득점/세트 종료는 반영하지 않는다.
+
+이벤트 기록 시에는 Match.record_event가 같은 규칙을 F() UPDATE로 한 이벤트씩 적용하고,
+정정/재계산 시에는 ScoreState로 이벤트를 메모리에서 다시 재생한다. DB 접근이 없는 순수 모듈이다.
+"""
+POINT_EVENTS = ('point', 'special_point')
+DEFAULT_POINTS = 1
+
+
+def event_points(event_type, winning_method=None):
+    """이벤트 하나의 점수 (득점 이벤트가 아니면 0)"""
+    if event_type not in POINT_EVENTS:
+        return 0
+    points_per_action = (winning_method.points_per_action if winning_method else None) or {}
+    return int(points_per_action.get(event_type, DEFAULT_POINTS))
+
+
+def set_winner(red, blue, winning_method=None, closing=False):
+    """
+    세트 승자 ('red' / 'blue') 또는 아직 끝나지 않았으면 None.
+    closing=True(set_end 이벤트)면 점수가 높은 팀, 동점이면 ''(무승부).
+    """
+    if closing:
+        return 'red' if red > blue else 'blue' if blue > red else ''
+    if winning_method is None or winning_method.points_needed <= 0:
+        return None
+    if red >= winning_method.points_needed:
+        return 'red'
+    if blue >= winning_method.points_needed:
+        return 'blue'
+    return None
+
+
+def match_winner(red_sets, blue_sets, winning_method=None):
+    """세트 과반을 가져간 팀 ('red' / 'blue'), 아직이면 ''"""
+    if winning_method is None or winning_method.sets <= 0:
+        return ''
+    sets_to_win = winning_method.sets // 2 + 1
+    if red_sets >= sets_to_win:
+        return 'red'
+    if blue_sets >= sets_to_win:
+        return 'blue'
+    return ''
+
+
+class ScoreState:
+    """이벤트를 seq 순서대로 재생하며 매치/세트 점수를 계산하는 메모리 상태"""
+
+    def __init__(self, winning_method=None):
+        self.winning_method = winning_method
+        self.red_score = 0
+        self.blue_score = 0
+        self.red_sets = 0
+        self.blue_sets = 0
+        self.current_set = 1
+        self.winning_side = ''
+        self.sets = {1: {'red': 0, 'blue': 0, 'winner': ''}}  # 세트 번호 -> 세트 점수
+
+    def apply(self, event_type, side):
+        """이벤트 하나를 반영하고 (세트 번호, 반영한 점수)를 반환"""
+        set_number = self.current_set
+        if self.winning_side:
+            return set_number, 0
+
+        if event_type in POINT_EVENTS and side:
+            points = event_points(event_type, self.winning_method)
+            current = self.sets[set_number]
+            current[side] += points
+            setattr(self, f'{side}_score', getattr(self, f'{side}_score') + points)
+            winner = set_winner(current['red'], current['blue'], self.winning_method)
+            if winner:
+                self.close_set(winner)
+            return set_number, points
+
+        if event_type == 'set_end':
+            current = self.sets[set_number]
+            self.close_set(set_winner(current['red'], current['blue'], closing=True))
+        return set_number, 0
+
+    def close_set(self, winner):
+        self.sets[self.current_set]['winner'] = winner
+        if winner:
+            setattr(self, f'{winner}_sets', getattr(self, f'{winner}_sets') + 1)
+        self.winning_side = match_winner(self.red_sets, self.blue_sets, self.winning_method)
+        if not self.winning_side:
+            self.current_set += 1
+            self.sets[self.current_set] = {'red': 0, 'blue': 0, 'winner': ''}
@@ -0,0 +1,46 @@
+"""
+주변 매치 검색.
+
+SportsGround.location(SRID 4326, GiST 인덱스)에 대해
+1) ST_DWithin(도 단위)으로 인덱스를 타는 넉넉한 사각 범위를 먼저 거르고
+2) 실제 거리(미터)로 반경을 자른 뒤
+3) 거리, id 순으로 정렬한다 (keyset 페이지네이션 키).
+"""
+import math
+
+from django.contrib.gis.db.models.functions import Distance
+from django.contrib.gis.geos import Point
+from django.contrib.gis.measure import D
+from django.db.models import F
+
+from matchmaking.models.match import Match
+
+METERS_PER_DEGREE = 111_320
+
+
+def radius_in_degrees(lat, radius):
+    """반경(미터)을 ST_DWithin용 도 단위로 (경도 방향이 더 넓으므로 위도에 따라 보정)"""
+    return radius / METERS_PER_DEGREE / max(math.cos(math.radians(lat)), 0.01)
+
+
+def search_matches(lat, lng, radius, start_after=None, start_before=None, statuses=None, match_type=None):
+    point = Point(lng, lat, srid=4326)
+    matches = (
+        Match.objects.filter(
+            sports_ground__location__dwithin=(point, radius_in_degrees(lat, radius)),
+            sports_ground__location__distance_lte=(point, D(m=radius)),
+        )
+        .select_related('sports_ground')
+        .annotate(distance=Distance('sports_ground__location', point))
+        .filter(participant_count__lt=F('total_spots'))
+        .order_by('distance', 'id')
+    )
+    if start_after:
+        matches = matches.filter(start_time__gte=start_after)
+    if start_before:
+        matches = matches.filter(start_time__lt=start_before)
+    if statuses:
+        matches = matches.filter(status__in=statuses)
+    if match_type:
+        matches = matches.filter(match_type=match_type)
+    return matches
@@ -1,6 +1,9 @@
+from django.db import transaction
 from rest_framework import serializers
+from .models.chat import ChatMessage
 from .models.match import Match, MatchEvent, PressConference, TeamTalk, PlayerReview, GroundReview
 from .models.team import Team, TeamPlayer
+from newsfeed.cache import push_posts
 from newsfeed.models.newsfeed import NewsfeedPost
 from newsfeed.models.match_post import MatchPost
 
@@ -22,7 +25,7 @@ class TeamPlayerSerializer(serializers.ModelSerializer):
         return {
             "id": obj.user.id,
             "username": obj.user.username,
-            "profile_picture": obj.user.profile.profile_picture.url if obj.user.profile.profile_picture else None
+            "profile_picture": obj.user.profile_photo.url if obj.user.profile_photo else None
         }
 
 
@@ -57,11 +60,38 @@ class MatchSerializer(serializers.ModelSerializer):
         instance.total_spots = validated_data.get('total_spots', instance.total_spots)
         instance.status = validated_data.get('status', instance.status)
         instance.match_type = validated_data.get('match_type', instance.match_type)
-        
-        instance.save()
+
+        with transaction.atomic():
+            # 참가자 수/스코어보드 같은 카운터는 다른 요청이 F()로 갱신하므로 수정 가능한 필드만 저장
+            instance.save(update_fields=['sports_ground', 'facility', 'price', 'start_time', 'duration', 'total_spots', 'status', 'match_type'])
+            # 시간이 바뀌면 참가자 일정 구간도 갱신 (다른 매치와 겹치면 ValidationError로 롤백)
+            if 'start_time' in validated_data or 'duration' in validated_data:
+                instance.sync_schedule_slots()
         return instance
 
 
+class MatchSearchSerializer(serializers.ModelSerializer):
+    """검색 결과용 요약 (참가자 목록은 포함하지 않음)"""
+    sports_ground = serializers.SerializerMethodField()
+    available_spots = serializers.IntegerField(read_only=True)
+    distance = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Match
+        fields = ['id', 'sports_ground', 'start_time', 'duration', 'price', 'match_type', 'status', 'total_spots', 'available_spots', 'distance']
+
+    def get_sports_ground(self, obj):
+        if obj.sports_ground is None:
+            return None
+        return {
+            "id": obj.sports_ground.id,
+            "name": obj.sports_ground.name,
+        }
+
+    def get_distance(self, obj):
+        return round(obj.distance.m)  # 미터
+
+
 class MatchJoinSerializer(serializers.ModelSerializer):
     participants = TeamPlayerSerializer(many=True)
 
@@ -76,24 +106,41 @@ class MatchEventSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = MatchEvent
-        fields = ['event_type', 'timestamp', 'added_by', 'target_player']
+        fields = ['seq', 'event_type', 'timestamp', 'added_by', 'target_player']
 
-    def create(self, validated_data):
-        return MatchEvent.objects.create(**validated_data)
+
+class MatchEventStreamSerializer(serializers.ModelSerializer):
+    """스트림/long-poll용 가벼운 이벤트 표현 (선수는 TeamPlayer id로만)"""
+    voided_seq = serializers.IntegerField(source='voided_event.seq', default=None, read_only=True)  # void 이벤트가 취소한 이벤트 번호
+
+    class Meta:
+        model = MatchEvent
+        fields = ['seq', 'event_type', 'timestamp', 'added_by', 'target_player', 'set_number', 'side', 'points', 'voided_seq']
+
+
+class ChatMessageSerializer(serializers.ModelSerializer):
+    user = serializers.CharField(source='user.username', default=None, read_only=True)
+
+    class Meta:
+        model = ChatMessage
+        fields = ['seq', 'user', 'question', 'content', 'created_at']
 
 
 class PressConferenceSerializer(serializers.ModelSerializer):
     participants = serializers.StringRelatedField(many=True)
+    last_seq = serializers.IntegerField(source='conversation.last_seq', read_only=True)
 
     class Meta:
         model = PressConference
-        fields = ['match', 'participants', 'questions', 'chat_log', 'current_question_index']
+        fields = ['match', 'participants', 'questions', 'questions_status', 'last_seq', 'current_question_index']
 
 
 class TeamTalkSerializer(serializers.ModelSerializer):
+    last_seq = serializers.IntegerField(source='conversation.last_seq', read_only=True)
+
     class Meta:
         model = TeamTalk
-        fields = ['chat_log', 'team', 'match']
+        fields = ['last_seq', 'team', 'match']
 
 
 class PlayerReviewSerializer(serializers.ModelSerializer):
@@ -147,9 +194,10 @@ class MatchPostSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         match_post = MatchPost.objects.create(**validated_data)
         # 뉴스피드 포스트 생성 로직 추가
-        NewsfeedPost.objects.create(
+        newsfeed_post = NewsfeedPost.objects.create(
             newsfeed=match_post.created_by.newsfeed,
             post_type="match",
             post_id=match_post.id
         )
+        transaction.on_commit(lambda: push_posts([newsfeed_post]))
         return match_post
\ No newline at end of file
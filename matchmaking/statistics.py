@@ -0,0 +1,62 @@
+"""
+완료된 매치 결과로 만드는 선수/클럽 통계 증가분.
+
+- 매치 결과는 winning_side(세트 승부)가 있으면 그 팀의 승리, 없으면 점수가 높은 팀의 승리, 같으면 무승부다.
+- 선수: 팀이 배정된 참가자마다 경기 수 1과 승/무/패 1, 득점은 그 선수가 대상(target_player)인 득점 이벤트 점수 합이다.
+- 클럽: 한 매치에서 클럽 팀으로 뛴 쪽(side)마다 한 번 경기 수와 승/무/패를 더하고, 득점은 그쪽 팀 점수다.
+- 리그/토너먼트 경기는 참가자 대신 홈/원정 팀(red = 홈, blue = 원정)과 그 팀 선수로 쪽을 정한다.
+
+ProcessedMatchStats.process가 매치 묶음의 증가분을 collect_deltas로 모으고,
+같은 증가분끼리 묶어(group_deltas) F() UPDATE 한 번씩으로 반영한다. DB 접근이 없는 순수 모듈이다.
+"""
+from collections import defaultdict
+
+STAT_FIELDS = ('mp', 'wins', 'draws', 'losses', 'points_scored')  # UserStatistics / ClubStatistics 공통 누적 필드
+
+
+def side_result(side, red_score, blue_score, winning_side=''):
+    """side('red' / 'blue') 입장의 결과: 'win' / 'draw' / 'loss'"""
+    winner = winning_side or ('red' if red_score > blue_score else 'blue' if blue_score > red_score else '')
+    if not winner:
+        return 'draw'
+    return 'win' if winner == side else 'loss'
+
+
+def stat_delta(result, points):
+    """STAT_FIELDS 순서의 증가분"""
+    return (1, int(result == 'win'), int(result == 'draw'), int(result == 'loss'), points)
+
+
+def collect_deltas(matches, players, points):
+    """
+    matches: 매치 id -> (red 점수, blue 점수, winning_side)
+    players: [(매치 id, 유저 id, side, 클럽 id 또는 None), ...] (팀이 배정되지 않은 참가자는 side가 None,
+             선수가 없는 클럽 팀은 유저 id가 None)
+    points: (매치 id, 유저 id) -> 득점
+    반환: (유저 id -> 증가분, 클럽 id -> 증가분). 증가분은 STAT_FIELDS 순서의 튜플
+    """
+    users, clubs = defaultdict(lambda: (0,) * len(STAT_FIELDS)), defaultdict(lambda: (0,) * len(STAT_FIELDS))
+    club_sides = set()
+    for match_id, user_id, side, club_id in players:
+        if side is None:
+            continue
+        red_score, blue_score, winning_side = matches[match_id]
+        result = side_result(side, red_score, blue_score, winning_side)
+        if user_id is not None:
+            users[user_id] = _add(users[user_id], stat_delta(result, points.get((match_id, user_id), 0)))
+        if club_id is not None and (match_id, club_id, side) not in club_sides:
+            club_sides.add((match_id, club_id, side))
+            clubs[club_id] = _add(clubs[club_id], stat_delta(result, red_score if side == 'red' else blue_score))
+    return dict(users), dict(clubs)
+
+
+def group_deltas(deltas):
+    """증가분 -> 그 증가분을 더할 id 목록 (같은 증가분은 UPDATE 한 번으로 반영)"""
+    groups = defaultdict(list)
+    for key, delta in deltas.items():
+        groups[delta].append(key)
+    return {delta: sorted(keys) for delta, keys in groups.items()}
+
+
+def _add(total, delta):
+    return tuple(a + b for a, b in zip(total, delta))
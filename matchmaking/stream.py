@@ -0,0 +1,140 @@
+"""
+매치 이벤트 실시간 스트림.
+
+- 이벤트는 매치 안에서 단조 증가하는 seq를 가지므로 클라이언트는 마지막으로 받은 seq부터 이어서 받는다
+  (SSE는 Last-Event-ID, long-poll은 ?since=).
+- 최신 seq는 CACHES["stream"]에 짧게 보관한다. 같은 매치를 보는 연결들은 캐시만 확인하고,
+  새 이벤트가 있을 때만 DB에서 (match, seq) 인덱스로 차이분을 읽는다.
+  운영에서는 Redis(MATCH_STREAM_CACHE_URL)라 다른 프로세스에서 기록된 이벤트도 publish 직후 보이고,
+  로컬 메모리 캐시일 때는 SEQ_CACHE_TTL이 지나 DB에서 다시 읽을 때 보인다.
+- 점수는 Match와 MatchSetScore에 미리 계산되어 있어 매번 이벤트를 다시 집계하지 않는다.
+"""
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+
+from matchmaking.models.match import Match, MatchEvent
+from matchmaking.models.scoreboard import MatchSetScore
+
+MAX_EVENTS = 100
+SEQ_CACHE_TTL = 1  # 다른 프로세스에서 기록된 이벤트도 이 시간 안에 보인다 (초)
+HEARTBEAT_INTERVAL = 15  # 프록시가 유휴 연결을 끊지 않도록 보내는 주석 간격 (초)
+RETRY_MS = 3000  # 연결이 끊겼을 때 EventSource 재연결 대기 시간
+STREAM_CACHE_ALIAS = "stream"
+
+
+def stream_cache():
+    return caches[STREAM_CACHE_ALIAS]
+
+
+def seq_key(match_id):
+    return f"match:{match_id}:last_event_seq"
+
+
+def publish(match_id, seq):
+    """이벤트 기록 커밋 후 호출. 캐시를 공유하는 구독자는 다음 확인 때 바로 새 이벤트를 받는다"""
+    stream_cache().set(seq_key(match_id), seq, SEQ_CACHE_TTL)
+
+
+def _load_seq(match_id):
+    seq = Match.objects.filter(pk=match_id).values_list('last_event_seq', flat=True).first()
+    if seq is not None:
+        stream_cache().set(seq_key(match_id), seq, SEQ_CACHE_TTL)
+    return seq
+
+
+def latest_seq(match_id):
+    """최신 이벤트 번호 (없는 매치면 None)"""
+    seq = stream_cache().get(seq_key(match_id))
+    return _load_seq(match_id) if seq is None else seq
+
+
+async def alatest_seq(match_id):
+    seq = await stream_cache().aget(seq_key(match_id))
+    return await sync_to_async(_load_seq)(match_id) if seq is None else seq
+
+
+def scoreboard(match_id):
+    """미리 계산된 매치/세트 점수 (매치 row 1건 + 세트 row 몇 건)"""
+    match = Match.objects.filter(pk=match_id).values(
+        'status', 'last_event_seq', 'red_score', 'blue_score', 'red_sets', 'blue_sets', 'current_set', 'winning_side'
+    ).first()
+    sets = MatchSetScore.objects.filter(match_id=match_id).order_by('set_number').values_list(
+        'set_number', 'red_points', 'blue_points', 'winner'
+    )
+    return {
+        "seq": match['last_event_seq'],
+        "status": match['status'],
+        "red": match['red_score'],
+        "blue": match['blue_score'],
+        "red_sets": match['red_sets'],
+        "blue_sets": match['blue_sets'],
+        "current_set": match['current_set'],
+        "winner": match['winning_side'],
+        "sets": [
+            {"set": number, "red": red, "blue": blue, "winner": winner}
+            for number, red, blue, winner in sets
+        ],
+    }
+
+
+def events_since(match_id, since, limit=MAX_EVENTS):
+    """
+    since 이후 이벤트 (최대 limit개)와 현재 스코어보드.
+    스코어보드의 seq가 마지막 이벤트 seq보다 크면 아직 받지 않은 이벤트가 더 있다는 뜻이다.
+    """
+    from matchmaking.serializers import MatchEventStreamSerializer
+
+    events = list(
+        MatchEvent.objects.filter(match_id=match_id, seq__gt=since).select_related('voided_event').order_by('seq')[:limit + 1]
+    )
+    has_more = len(events) > limit
+    events = events[:limit]
+    return {
+        "events": MatchEventStreamSerializer(events, many=True).data,
+        "last_seq": events[-1].seq if events else since,
+        "has_more": has_more,
+        "score": scoreboard(match_id),
+    }
+
+
+def format_sse(data, event, event_id=None):
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def sse_events(match_id, since):
+    """
+    SSE 본문. 새 이벤트는 id가 seq인 match_event로, 이어서 현재 점수를 score로 보낸다.
+    MATCH_STREAM_TIMEOUT이 지나면 연결을 닫고 클라이언트는 Last-Event-ID로 이어서 재연결한다.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.MATCH_STREAM_TIMEOUT
+    last_write = loop.time()
+    yield f"retry: {RETRY_MS}\n\n"
+
+    while loop.time() < deadline:
+        latest = await alatest_seq(match_id)
+        if latest is None:
+            return
+        if latest > since:
+            delta = await sync_to_async(events_since)(match_id, since)
+            for event in delta["events"]:
+                yield format_sse(event, "match_event", event_id=event["seq"])
+            yield format_sse(delta["score"], "score")
+            since = delta["last_seq"]
+            last_write = loop.time()
+            if delta["has_more"]:
+                continue
+        elif loop.time() - last_write >= HEARTBEAT_INTERVAL:
+            yield ": keepalive\n\n"
+            last_write = loop.time()
+        await asyncio.sleep(settings.MATCH_STREAM_POLL_INTERVAL)
@@ -0,0 +1,60 @@
+"""
+레드/블루 팀 배정 엔진.
+
+선수별 점수(경기 성과, 매너)를 기준으로 두 팀의 인원 차이는 1명 이하, 점수 합 차이는 최소가 되도록 나눈다.
+1) 점수 내림차순으로 정렬해 현재 합이 작은 팀에 넣고 (정원이 찬 팀은 건너뜀)
+2) 두 팀 사이 1:1 교환으로 점수 합 차이가 줄어드는 동안 개선한다.
+DB 접근이 없는 순수 함수라 30명 풋살 로테이션도 메모리에서 바로 계산된다.
+"""
+from decimal import Decimal
+
+PERFORMANCE_WEIGHT = Decimal("0.7")
+MANNER_WEIGHT = Decimal("0.3")
+DEFAULT_RATING = Decimal("2.50")  # 통계가 없는 신규 유저 (0.00~5.00의 중간값)
+
+
+def player_rating(performance=None, manner=None):
+    """경기 성과와 매너 점수를 가중 평균한 선수 점수"""
+    performance = DEFAULT_RATING if performance is None else performance
+    manner = DEFAULT_RATING if manner is None else manner
+    return performance * PERFORMANCE_WEIGHT + manner * MANNER_WEIGHT
+
+
+def balance_teams(ratings):
+    """
+    ratings: {선수 키: 점수}
+    반환: (red 키 목록, blue 키 목록)
+    """
+    players = sorted(ratings, key=lambda key: ratings[key], reverse=True)
+    capacity = (len(players) + 1) // 2
+    red, blue = [], []
+    red_total = blue_total = Decimal(0)
+
+    for player in players:
+        if len(blue) >= capacity or (len(red) < capacity and red_total <= blue_total):
+            red.append(player)
+            red_total += ratings[player]
+        else:
+            blue.append(player)
+            blue_total += ratings[player]
+
+    # 1:1 교환으로 점수 합 차이 개선 (교환해도 인원수는 그대로)
+    improved = True
+    while improved:
+        improved = False
+        diff = red_total - blue_total
+        best = None
+        for i, red_player in enumerate(red):
+            for j, blue_player in enumerate(blue):
+                delta = ratings[red_player] - ratings[blue_player]
+                new_diff = abs(diff - 2 * delta)
+                if new_diff < abs(diff) and (best is None or new_diff < best[0]):
+                    best = (new_diff, i, j, delta)
+        if best is not None:
+            _, i, j, delta = best
+            red[i], blue[j] = blue[j], red[i]
+            red_total -= delta
+            blue_total += delta
+            improved = True
+
+    return red, blue
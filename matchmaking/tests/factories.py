@@ -1,101 +1,67 @@
+from datetime import timedelta
+
 import factory
 import factory.fuzzy
+from django.utils import timezone
 
-from matchmaking.choices import MATCH_TYPES, STATUS_CHOICES
-from matchmaking.models import Goal, Match, MatchParticipant, MatchPost, MatchScore
-from sports.choices import SPORT_CHOICES
+from matchmaking.models import Match, Team, TeamPlayer, WinningMethod
+from matchmaking.models.match import STATUS_CHOICES
+from newsfeed.models import MatchPost
 
 
-class MatchParticipantFactory(factory.django.DjangoModelFactory):
-    player = factory.SubFactory("accounts.tests.factories.AccountFactory")
-    club = factory.Maybe(
-        "should_have_club",
-        yes_declaration=factory.SubFactory("clubs.tests.factories.ClubFactory"),
-        no_declaration=None,
-    )
-    position = factory.Maybe(
-        "should_have_position",
-        yes_declaration=factory.SubFactory(
-            "sports.tests.factories.SportPositionFactory"
-        ),
-        no_declaration=None,
-    )
-    is_home_team = factory.Faker("boolean")
+class TeamFactory(factory.django.DjangoModelFactory):
+    name = factory.Faker("word")
+    is_red_team = factory.Faker("boolean")
 
     class Meta:
-        model = MatchParticipant
+        model = Team
 
-    class Params:
-        should_have_club = factory.Faker("boolean")
-        should_have_position = factory.Faker("boolean")
 
-
-class MatchFactory(factory.django.DjangoModelFactory):
-    sports_ground = factory.SubFactory(
-        "sportsgrounds.tests.factories.SportGroundFactory"
-    )
-    sport = factory.fuzzy.FuzzyChoice([x[0] for x in SPORT_CHOICES])
-    creator = factory.SubFactory("accounts.tests.factories.AccountFactory")
-    start_time = factory.Faker("date_time")
-    duration = factory.Faker("time_delta")
-    is_public = factory.Faker("boolean")
-    is_club = factory.Faker("boolean")
-    total_spots = factory.fuzzy.FuzzyInteger(0, 22)
-    average_level = factory.fuzzy.FuzzyInteger(1, 10)
-    home = factory.Maybe(
-        "is_club",
-        yes_declaration=factory.SubFactory("clubs.tests.factories.ClubFactory"),
-        no_declaration=None,
-    )
-    away = factory.Maybe(
-        "is_club",
-        yes_declaration=factory.SubFactory("clubs.tests.factories.ClubFactory"),
-        no_declaration=None,
-    )
-    status = factory.fuzzy.FuzzyChoice([x[0] for x in STATUS_CHOICES])
-    match_type = factory.fuzzy.FuzzyChoice([x[0] for x in MATCH_TYPES])
+class TeamPlayerFactory(factory.django.DjangoModelFactory):
+    team = factory.SubFactory(TeamFactory)
+    user = factory.SubFactory("accounts.tests.factories.AccountFactory")
 
     class Meta:
-        model = Match
+        model = TeamPlayer
 
-    @classmethod
-    def _create(cls, model_class, *args, **kwargs):
-        instance = model_class(*args, **kwargs)
-        instance.full_clean()
-        instance.save()
-        return instance
 
-
-class MatchScoreFactory(factory.django.DjangoModelFactory):
-    match = factory.SubFactory(MatchFactory)
-    home_score = factory.fuzzy.FuzzyInteger(0, 100)
-    away_score = factory.fuzzy.FuzzyInteger(0, 300)
+class WinningMethodFactory(factory.django.DjangoModelFactory):
+    points_needed = factory.fuzzy.FuzzyInteger(5, 25)
+    time_per_set = timedelta(minutes=20)
+    sets = factory.fuzzy.FuzzyChoice([1, 3, 5])
+    points_per_action = factory.LazyFunction(lambda: {"point": 1, "special_point": 2})
 
     class Meta:
-        model = MatchScore
+        model = WinningMethod
 
 
-class GoalFactory(factory.django.DjangoModelFactory):
-    match = factory.SubFactory(MatchFactory)
-    scorer = factory.SubFactory("accounts.tests.factories.AccountFactory")
-    time_scored = factory.Faker("date_time")
-    is_penalty = factory.Faker("boolean")
-    is_own_goal = factory.Faker("boolean")
+class MatchFactory(factory.django.DjangoModelFactory):
+    facility = factory.SubFactory("sportsgrounds.tests.factories.FacilitiesFactory")
+    sports_ground = factory.SelfAttribute("facility.sports_ground")
+    price = factory.fuzzy.FuzzyDecimal(0, 30000)
+    creator = factory.SubFactory("accounts.tests.factories.AccountFactory")
+    start_time = factory.Sequence(lambda n: timezone.now() + timedelta(days=1, hours=3 * n))  # 같은 유저가 여러 매치에 참가해도 겹치지 않음
+    duration = timedelta(hours=2)
+    status = factory.fuzzy.FuzzyChoice([x[0] for x in STATUS_CHOICES])
+    total_spots = factory.fuzzy.FuzzyInteger(2, 22)
 
     class Meta:
-        model = Goal
+        model = Match
+
+    @factory.post_generation
+    def players(self, create, extracted, **kwargs):
+        # MatchFactory(players=[user, ...]) 로 참가자 추가 (participant_count도 함께 갱신)
+        if create and extracted:
+            for user in extracted:
+                self.add_participant(user)
 
 
 class MatchPostFactory(factory.django.DjangoModelFactory):
-    title = factory.Faker("text")
-    user = factory.SubFactory("accounts.tests.factories.AccountFactory")
     match = factory.SubFactory(MatchFactory)
-
-    comments = factory.RelatedFactory(
-        "newsfeed.tests.factories.CommentFactory", "content_object"
-    )
-    likes = factory.RelatedFactory(
-        "newsfeed.tests.factories.LikeFactory", "content_object"
+    created_by = factory.SubFactory("accounts.tests.factories.AccountFactory")
+    post_content = factory.Faker("text")
+    newsfeed_post = factory.SubFactory(
+        "newsfeed.tests.factories.NewsfeedPostFactory", post_type="match", post_id=factory.SelfAttribute("..match.id")
     )
 
     class Meta:
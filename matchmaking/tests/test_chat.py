@@ -0,0 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import IntegrityError, connection
+from django.test import TestCase, TransactionTestCase
+
+from accounts.tests.factories import AccountFactory
+from matchmaking.models import ChatMessage, Conversation, TeamTalk
+from matchmaking.tests.factories import MatchFactory
+
+WRITERS = 16
+MESSAGES = 100
+
+
+class ConversationTestCase(TransactionTestCase):
+    def setUp(self):
+        self.user = AccountFactory()
+        self.conversation = Conversation.objects.create()
+
+    def test_concurrent_appends_get_gapless_unique_seq(self):
+        def append(i):
+            try:
+                return Conversation.objects.get(pk=self.conversation.pk).append(f"message {i}", user=self.user).seq
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=WRITERS) as executor:
+            seqs = list(executor.map(append, range(MESSAGES)))
+
+        self.conversation.refresh_from_db()
+        self.assertEqual(sorted(seqs), list(range(1, MESSAGES + 1)))
+        self.assertEqual(self.conversation.last_seq, MESSAGES)
+        self.assertEqual(ChatMessage.objects.filter(conversation=self.conversation).count(), MESSAGES)
+
+    def test_messages_since_returns_only_new_messages(self):
+        for i in range(5):
+            self.conversation.append(f"message {i}", user=self.user)
+
+        delta = list(self.conversation.messages_since(3, limit=10))
+
+        self.assertEqual([message.seq for message in delta], [4, 5])
+        self.assertEqual(delta[0].content, "message 3")
+
+
+class TeamTalkTestCase(TestCase):
+    def test_one_team_talk_per_match_and_team(self):
+        match = MatchFactory(status="scheduled", total_spots=2, players=[AccountFactory()])
+        team = match.participants.get()
+        team_talk, _ = TeamTalk.objects.get_or_create(match=match, team=team)
+
+        self.assertEqual(TeamTalk.objects.get_or_create(match=match, team=team), (team_talk, False))
+        with self.assertRaises(IntegrityError):
+            TeamTalk.objects.create(match=match, team=team)
@@ -0,0 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection
+from django.test import TransactionTestCase
+from rest_framework.exceptions import ValidationError
+
+from accounts.tests.factories import AccountFactory
+from matchmaking.models import Match, MatchWaitlist
+from matchmaking.tests.factories import MatchFactory
+
+JOINERS = 200
+SPOTS = 20
+WORKERS = 32
+
+
+class JoinAdmissionTestCase(TransactionTestCase):
+    """동시에 몰리는 참가 요청에서 정원 초과/중복 참가가 없는지 확인하는 테스트"""
+
+    def setUp(self):
+        self.users = AccountFactory.create_batch(JOINERS)
+        self.match = MatchFactory(creator=self.users[0], status="scheduled", total_spots=SPOTS)
+
+    def join_in_parallel(self, users, waitlist=False):
+        def join(user):
+            try:
+                return Match.objects.get(pk=self.match.pk).join(user, waitlist=waitlist)[0]
+            except ValidationError:
+                return "rejected"
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+            return list(executor.map(join, users))
+
+    def test_parallel_joins_never_overbook(self):
+        results = self.join_in_parallel(self.users)
+
+        self.match.refresh_from_db()
+        self.assertEqual(results.count("joined"), SPOTS)
+        self.assertEqual(self.match.participant_count, SPOTS)
+        self.assertEqual(self.match.participants.count(), SPOTS)
+
+    def test_parallel_joins_by_the_same_user_admit_once(self):
+        results = self.join_in_parallel([self.users[1]] * WORKERS)
+
+        self.assertEqual(results.count("joined"), 1)
+        self.assertEqual(self.match.participants.filter(user=self.users[1]).count(), 1)
+
+    def test_waitlist_is_promoted_in_order_when_someone_leaves(self):
+        self.join_in_parallel(self.users[:SPOTS])
+        for user in self.users[SPOTS:SPOTS + 3]:
+            self.match.join(user, waitlist=True)
+
+        self.match.remove_participant(self.users[0])
+
+        self.assertEqual(self.match.participant_count, SPOTS)
+        self.assertTrue(self.match.participants.filter(user=self.users[SPOTS]).exists())
+        self.assertEqual(MatchWaitlist.objects.filter(match=self.match).count(), 2)
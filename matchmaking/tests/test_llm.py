@@ -0,0 +1,133 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.tests.factories import AccountFactory
+from matchmaking import llm
+from matchmaking.models import PressConference
+from matchmaking.press import claim, process
+from matchmaking.tests.factories import MatchFactory
+
+
+class CountingClient(llm.LLMClient):
+    """호출 횟수와 최대 동시 호출 수를 기록하는 느린 테스트용 백엔드"""
+    calls = 0
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def complete(self, prompt, n, max_tokens):
+        cls = type(self)
+        with cls.lock:
+            cls.calls += 1
+            cls.running += 1
+            cls.max_running = max(cls.max_running, cls.running)
+        time.sleep(0.05)
+        with cls.lock:
+            cls.running -= 1
+        return [f"{prompt} #{i}" for i in range(n)]
+
+
+class FailingClient(llm.LLMClient):
+    def complete(self, prompt, n, max_tokens):
+        raise RuntimeError("LLM unavailable")
+
+
+@override_settings(
+    LLM_CLIENT="matchmaking.tests.test_llm.CountingClient",
+    LLM_CACHE_TTL=60,
+    LLM_MAX_CONCURRENCY=2,
+)
+class GenerateTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        llm._limiter = None
+        CountingClient.calls = CountingClient.running = CountingClient.max_running = 0
+
+    def test_same_prompt_is_served_from_cache(self):
+        first = llm.generate("prompt", n=3)
+        second = llm.generate("prompt", n=3)
+
+        self.assertEqual(first, second)
+        self.assertEqual(CountingClient.calls, 1)
+
+    def test_concurrent_identical_prompts_are_coalesced(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: llm.generate("same prompt"), range(8)))
+
+        self.assertEqual(CountingClient.calls, 1)
+        self.assertTrue(all(result == results[0] for result in results))
+
+    def test_distinct_prompts_respect_concurrency_limit(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda i: llm.generate(f"prompt {i}"), range(8)))
+
+        self.assertEqual(CountingClient.calls, 8)
+        self.assertLessEqual(CountingClient.max_running, 2)
+
+
+@override_settings(LLM_CLIENT="matchmaking.llm.StubClient", LLM_EAGER=False)
+class PressQuestionsTestCase(TransactionTestCase):
+    """질문 생성 요청 -> 워커의 claim/process -> 상태 조회 흐름 (워커 스레드가 커밋된 row를 읽으므로 TransactionTestCase)"""
+
+    def setUp(self):
+        cache.clear()
+        self.host, self.guest = AccountFactory.create_batch(2)
+        self.match = MatchFactory(creator=self.host, status="scheduled", total_spots=2, players=[self.host, self.guest])
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.host)
+
+    def url(self, name):
+        return reverse(name, kwargs={"match_id": self.match.id})
+
+    def test_views_accept_request_and_serve_questions_once_generated(self):
+        response = self.client.post(self.url("start-press-conference"))
+        self.assertEqual((response.status_code, response.data["questions_status"]), (202, "pending"))
+
+        response = self.client.post(self.url("press-conference"), {"answer": "ready"})
+        self.assertEqual((response.status_code, response.data["questions_status"]), (202, "pending"))  # 아직 생성 전
+        self.assertEqual(self.client.get(self.url("press-conference")).data["questions_status"], "pending")
+
+        conferences = claim()
+        self.assertEqual(len(conferences), 1)
+        self.assertEqual(claim(), [])  # 생성 중인 기자회견은 다시 가져가지 않는다
+        self.assertEqual(self.client.get(self.url("press-conference")).data["questions_status"], "generating")
+        self.assertEqual(process(conferences), 1)
+
+        data = self.client.get(self.url("press-conference")).data
+        self.assertEqual(data["questions_status"], "ready")
+        self.assertEqual(len(data["questions"]), 5)
+        response = self.client.post(self.url("press-conference"), {"answer": "ready"})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("next_question", response.data)
+
+    def test_failed_generation_can_be_requested_again(self):
+        conference = PressConference.objects.create(match=self.match)
+        conference.participants.set(self.match.participants.all())
+
+        with override_settings(LLM_CLIENT="matchmaking.tests.test_llm.FailingClient"):
+            self.assertEqual(process(claim()), 0)
+        conference.refresh_from_db()
+        self.assertEqual(conference.questions_status, "failed")
+
+        self.assertEqual(conference.request_questions(), "pending")
+        self.assertEqual(process(claim()), 1)
+        conference.refresh_from_db()
+        self.assertEqual(conference.request_questions(), "ready")  # 생성된 질문은 다시 만들지 않는다
+
+    @override_settings(LLM_TASK_TIMEOUT=60)
+    def test_stale_generation_is_claimed_again(self):
+        conference = PressConference.objects.create(match=self.match)
+        [claimed] = claim()
+        self.assertEqual(claim(), [])
+
+        PressConference.objects.filter(pk=conference.pk).update(questions_started_at=timezone.now() - timedelta(minutes=5))
+
+        self.assertEqual([conference.pk for conference in claim()], [claimed.pk])
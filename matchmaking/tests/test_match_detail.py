@@ -0,0 +1,53 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.tests.factories import AccountFactory
+from matchmaking.tests.factories import MatchFactory, TeamFactory
+from matchmaking.views import MatchDetailView
+from sportsgrounds.tests.factories import FacilitiesFactory
+
+QUERY_BUDGET = 5
+
+
+class MatchDetailViewTestCase(TestCase):
+    def setUp(self):
+        self.user = AccountFactory()
+        self.facility = FacilitiesFactory()
+        self.team = TeamFactory(is_red_team=True)
+
+    def create_match(self, players):
+        match = MatchFactory(facility=self.facility, creator=self.user, status="scheduled", total_spots=players)
+        for user in AccountFactory.create_batch(players):
+            player = match.add_participant(user)
+            player.team = self.team
+            player.save()
+            match.record_event("point", player, player)
+        return match
+
+    def get(self, match, **params):
+        request = APIRequestFactory().get(f"/matches/{match.id}/details/", params)
+        force_authenticate(request, user=self.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = MatchDetailView.as_view()(request, match_id=match.id)
+        return response, len(queries)
+
+    def test_query_count_is_fixed_for_any_match_size(self):
+        small, small_queries = self.get(self.create_match(2))
+        large, large_queries = self.get(self.create_match(20))
+
+        self.assertEqual(large.status_code, 200)
+        self.assertEqual(len(large.data["players"]), 20)
+        self.assertEqual(len(large.data["events"]), 20)
+        self.assertEqual(small_queries, large_queries)
+        self.assertLessEqual(large_queries, QUERY_BUDGET)
+
+    def test_sparse_fields_skip_events_and_players(self):
+        match = self.create_match(5)
+
+        response, queries = self.get(match, fields="match")
+
+        self.assertEqual(set(response.data), {"match"})
+        self.assertEqual(queries, 2)
+        self.assertEqual(self.get(match, fields="match,unknown")[0].status_code, 400)
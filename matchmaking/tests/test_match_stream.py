@@ -0,0 +1,93 @@
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncClient, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from oauth2_provider.models import AccessToken
+
+from accounts.tests.factories import AccountFactory
+from matchmaking import stream
+from matchmaking.tests.factories import MatchFactory, TeamFactory
+
+
+class MatchStreamTestCase(TestCase):
+    def setUp(self):
+        stream.stream_cache().clear()
+        self.creator, guest = AccountFactory.create_batch(2)
+        self.match = MatchFactory(creator=self.creator, status="scheduled", total_spots=2)
+        self.red = self.match.add_participant(self.creator)
+        self.red.team = TeamFactory(is_red_team=True)
+        self.red.save()
+        self.blue = self.match.add_participant(guest)
+        self.blue.team = TeamFactory(is_red_team=False)
+        self.blue.save()
+        AccessToken.objects.create(
+            user=self.creator, token="poll-token", expires=timezone.now() + timedelta(hours=1), scope="read"
+        )
+
+    def test_events_get_sequential_numbers_and_running_score(self):
+        self.match.record_event('point', self.red, self.red)
+        self.match.record_event('special_point', self.blue, self.blue)
+        self.match.record_event('point', self.red, self.red)
+        self.match.record_event('pause', self.red)
+
+        delta = stream.events_since(self.match.id, 1)
+
+        self.assertEqual([event["seq"] for event in delta["events"]], [2, 3, 4])
+        self.assertEqual(delta["last_seq"], 4)
+        self.assertEqual(delta["score"]["seq"], 4)
+        self.assertEqual((delta["score"]["red"], delta["score"]["blue"]), (2, 1))
+
+    @override_settings(MATCH_STREAM_POLL_INTERVAL=0.01, MATCH_STREAM_TIMEOUT=0.05)
+    def test_sse_resumes_after_last_event_id(self):
+        for _ in range(3):
+            self.match.record_event('point', self.red, self.red)
+
+        async def collect():
+            return [chunk async for chunk in stream.sse_events(self.match.id, 1)]
+
+        body = "".join(async_to_sync(collect)())
+
+        self.assertNotIn("id: 1\n", body)
+        self.assertIn("id: 2\nevent: match_event", body)
+        self.assertIn("id: 3\nevent: match_event", body)
+        self.assertIn('event: score\ndata: {"seq": 3, "status": "scheduled", "red": 3, "blue": 0', body)
+
+    def poll(self, since):
+        client = AsyncClient(headers={"authorization": "Bearer poll-token"})
+        url = reverse("match-event-poll", kwargs={"match_id": self.match.id})
+        return async_to_sync(client.get)(url, {"since": since})
+
+    @override_settings(MATCH_STREAM_POLL_INTERVAL=0.01, MATCH_LONG_POLL_TIMEOUT=0.05)
+    def test_long_poll_returns_new_events(self):
+        self.match.record_event('point', self.red, self.red)
+
+        response = self.poll(0)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([event["seq"] for event in response.json()["events"]], [1])
+
+    @override_settings(MATCH_STREAM_POLL_INTERVAL=0.01, MATCH_LONG_POLL_TIMEOUT=0.05)
+    def test_long_poll_times_out_with_no_new_events(self):
+        response = self.poll(0)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["events"], [])
+        self.assertEqual(self.poll("x").status_code, 400)
+
+    @override_settings(MATCH_STREAM_POLL_INTERVAL=0.01, MATCH_LONG_POLL_TIMEOUT=0.05)
+    def test_long_poll_query_count_does_not_grow_with_events(self):
+        counts = []
+        for events in (1, 20):
+            for _ in range(events):
+                self.match.record_event('point', self.red, self.red)
+            stream.stream_cache().clear()
+            with CaptureQueriesContext(connection) as queries:
+                response = self.poll(self.match.last_event_seq - events)
+            self.assertEqual(len(response.json()["events"]), events)
+            counts.append(len(queries))
+
+        self.assertEqual(counts[0], counts[1])
@@ -0,0 +1,34 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from accounts.tests.factories import AccountFactory
+from matchmaking.models import Match
+from matchmaking.tests.factories import MatchFactory
+
+
+class ParticipantCountTestCase(TestCase):
+    def setUp(self):
+        self.users = AccountFactory.create_batch(3)
+        self.match = MatchFactory(creator=self.users[0], status="scheduled", total_spots=10)
+
+    def test_join_and_leave_keep_count_in_sync(self):
+        for user in self.users:
+            self.match.add_participant(user)
+        self.match.remove_participant(self.users[0])
+
+        self.assertEqual(self.match.participant_count, 2)
+        self.assertEqual(self.match.participants.count(), 2)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.match.available_spots, 8)
+
+    def test_backfill_command_recomputes_drifted_count(self):
+        for user in self.users:
+            self.match.add_participant(user)
+        Match.objects.filter(pk=self.match.pk).update(participant_count=0)
+
+        call_command("backfill_participant_count", stdout=StringIO())
+
+        self.match.refresh_from_db()
+        self.assertEqual(self.match.participant_count, 3)
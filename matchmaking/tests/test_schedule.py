@@ -0,0 +1,49 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from accounts.tests.factories import AccountFactory
+from matchmaking.models import MatchScheduleSlot
+from matchmaking.tests.factories import MatchFactory
+from sportsgrounds.tests.factories import FacilitiesFactory
+
+
+class MatchScheduleTestCase(TestCase):
+    def setUp(self):
+        self.user = AccountFactory()
+        self.facility = FacilitiesFactory()
+        self.day = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+    def create_match(self, start_hour, hours=2):
+        return MatchFactory(
+            facility=self.facility,
+            status="scheduled",
+            start_time=self.day + timedelta(hours=start_hour),
+            duration=timedelta(hours=hours),
+            total_spots=10,
+        )
+
+    def test_overlapping_join_is_rejected_using_each_matchs_duration(self):
+        self.create_match(10, hours=3).join(self.user)
+
+        with self.assertRaises(ValidationError):
+            self.create_match(12).join(self.user)
+        self.create_match(13).join(self.user)
+
+        self.assertEqual(MatchScheduleSlot.objects.filter(user=self.user).count(), 2)
+
+    def test_free_slots_are_the_gaps_between_joined_matches(self):
+        self.create_match(10).join(self.user)
+        self.create_match(14).join(self.user)
+
+        busy, free = MatchScheduleSlot.free_slots(
+            self.user, self.day + timedelta(hours=9), self.day + timedelta(hours=18), timedelta(hours=1)
+        )
+
+        self.assertEqual(len(busy), 2)
+        self.assertEqual(
+            [(start.hour, end.hour) for start, end in free],
+            [(9, 10), (12, 14), (16, 18)],
+        )
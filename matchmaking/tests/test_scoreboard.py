@@ -0,0 +1,87 @@
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase, TestCase
+
+from accounts.tests.factories import AccountFactory
+from matchmaking.models import Match, MatchSetScore
+from matchmaking.scoreboard import ScoreState
+from matchmaking.tests.factories import MatchFactory, TeamFactory, WinningMethodFactory
+
+
+class ScoreStateTestCase(SimpleTestCase):
+    def test_sets_end_at_points_needed_and_match_ends_at_majority(self):
+        winning_method = SimpleNamespace(points_needed=3, sets=3, points_per_action={"special_point": 2})
+        state = ScoreState(winning_method)
+
+        for event_type, side in [
+            ("special_point", "red"), ("point", "red"),  # 1세트 레드 3점
+            ("point", "blue"), ("set_end", ""),  # 2세트 블루 1:0으로 종료
+            ("point", "red"), ("special_point", "red"),  # 3세트 레드 3점 -> 레드 승
+            ("point", "blue"),  # 승부가 난 뒤라 반영하지 않음
+        ]:
+            state.apply(event_type, side)
+
+        self.assertEqual(state.winning_side, "red")
+        self.assertEqual((state.red_sets, state.blue_sets), (2, 1))
+        self.assertEqual((state.red_score, state.blue_score), (6, 1))
+        self.assertEqual([score["winner"] for score in state.sets.values()], ["red", "blue", "red"])
+
+
+class RecordEventTestCase(TestCase):
+    def setUp(self):
+        creator, guest = AccountFactory.create_batch(2)
+        winning_method = WinningMethodFactory(points_needed=3, sets=3, points_per_action={"point": 1})
+        self.match = MatchFactory(creator=creator, status="scheduled", total_spots=2, winning_method=winning_method)
+        self.red = self.match.add_participant(creator)
+        self.red.team = TeamFactory(is_red_team=True)
+        self.red.save()
+        self.blue = self.match.add_participant(guest)
+        self.blue.team = TeamFactory(is_red_team=False)
+        self.blue.save()
+
+    def scoreboard(self):
+        self.match.refresh_from_db()
+        sets = list(self.match.set_scores.order_by("set_number").values_list("red_points", "blue_points", "winner"))
+        return (
+            self.match.red_score, self.match.blue_score, self.match.red_sets, self.match.blue_sets,
+            self.match.current_set, self.match.winning_side, sets,
+        )
+
+    def test_set_end_is_detected_incrementally(self):
+        for player in [self.red, self.blue, self.red, self.red]:
+            self.match.record_event("point", player, player)
+
+        self.assertEqual(self.scoreboard(), (3, 1, 1, 0, 2, "", [(3, 1, "red"), (0, 0, "")]))
+
+    def test_void_in_current_set_matches_full_rebuild(self):
+        self.match.record_event("point", self.red, self.red)
+        mistake = self.match.record_event("point", self.blue, self.red)
+        self.match.record_event("point", self.blue, self.blue)
+
+        self.match.void_event(mistake, self.blue)
+        incremental = self.scoreboard()
+        Match.rebuild_scoreboards([self.match.pk])
+
+        self.assertEqual(incremental, (1, 1, 0, 0, 1, "", [(1, 1, "")]))
+        self.assertEqual(self.scoreboard(), incremental)
+
+    def test_void_in_finished_set_replays_events(self):
+        self.match.record_event("point", self.red, self.red)
+        self.match.record_event("point", self.red, self.red)
+        mistake = self.match.record_event("point", self.red, self.red)  # 1세트 종료
+        self.match.record_event("point", self.blue, self.blue)  # 2세트
+
+        self.match.void_event(mistake, self.blue)
+
+        self.assertEqual(self.scoreboard(), (2, 1, 0, 0, 1, "", [(2, 1, "")]))
+        self.assertEqual(MatchSetScore.objects.filter(match=self.match).count(), 1)
+
+    def test_start_match_keeps_concurrent_scoreboard_updates(self):
+        stale = Match.objects.get(pk=self.match.pk)
+        self.match.record_event("point", self.red, self.red)
+
+        self.assertTrue(stale.start_match())
+        self.assertFalse(stale.start_match())
+
+        self.assertEqual(self.scoreboard()[:2], (1, 0))
+        self.assertEqual(self.match.status, "ongoing")
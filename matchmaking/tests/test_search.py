@@ -0,0 +1,55 @@
+from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
+
+from django.contrib.gis.geos import Point
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.tests.factories import AccountFactory
+from matchmaking.tests.factories import MatchFactory
+from matchmaking.views import SearchMatchView
+
+# 서울 시청 기준
+LAT, LNG = 37.5665, 126.9780
+
+
+class SearchMatchViewTestCase(TestCase):
+    def setUp(self):
+        self.user = AccountFactory()
+        start_time = timezone.now() + timedelta(days=1)
+        # 약 1km, 3km, 30km 떨어진 구장
+        self.near, self.mid, self.far = [
+            MatchFactory(
+                facility__sports_ground__location=Point(LNG, LAT + offset, srid=4326), status="scheduled", start_time=start_time
+            )
+            for offset in [0.009, 0.027, 0.27]
+        ]
+
+    def search(self, **params):
+        request = APIRequestFactory().get("/matchmaking/search/", {"lat": LAT, "lng": LNG, **params})
+        force_authenticate(request, user=self.user)
+        return SearchMatchView.as_view()(request)
+
+    def test_results_are_ranked_by_distance_within_radius(self):
+        response = self.search(radius=10000)
+
+        self.assertEqual([match["id"] for match in response.data["results"]], [self.near.id, self.mid.id])
+        self.assertNotIn("participants", response.data["results"][0])
+
+    def test_keyset_pagination_continues_by_distance(self):
+        first = self.search(radius=10000, page_size=1)
+        cursor = parse_qs(urlparse(first.data["next"]).query)["cursor"][0]
+        second = self.search(radius=10000, page_size=1, cursor=cursor)
+
+        self.assertEqual([match["id"] for match in first.data["results"]], [self.near.id])
+        self.assertEqual([match["id"] for match in second.data["results"]], [self.mid.id])
+        self.assertIsNone(second.data["next"])
+
+    def test_missing_location_is_rejected(self):
+        request = APIRequestFactory().get("/matchmaking/search/")
+        force_authenticate(request, user=self.user)
+
+        response = SearchMatchView.as_view()(request)
+
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,100 @@
+from datetime import datetime, timezone
+
+from django.test import SimpleTestCase, TestCase
+
+from accounts.models import UserStatistics
+from accounts.tests.factories import AccountFactory
+from clubs.models import ClubStatistics
+from clubs.tests.factories import ClubFactory
+from core.seeding import Seeder
+from leagues.tests.factories import LeagueFactory
+from matchmaking.models import ProcessedMatchStats
+from matchmaking.statistics import collect_deltas, group_deltas
+from matchmaking.tests.factories import MatchFactory, TeamFactory, TeamPlayerFactory
+
+
+class CollectDeltasTestCase(SimpleTestCase):
+    def test_players_and_clubs(self):
+        matches = {1: (3, 1, ""), 2: (2, 2, "blue")}
+        players = [
+            (1, "a", "red", "club"), (1, "b", "red", "club"), (1, "c", "blue", None), (1, "d", None, None),
+            (2, "a", "red", None), (2, "c", "blue", "club"),
+        ]
+
+        users, clubs = collect_deltas(matches, players, {(1, "a"): 3, (2, "c"): 2})
+
+        self.assertEqual(users["a"], (2, 1, 0, 1, 3))
+        self.assertEqual(users["b"], (1, 1, 0, 0, 0))
+        self.assertEqual(users["c"], (2, 1, 0, 1, 2))
+        self.assertNotIn("d", users)  # 팀이 배정되지 않은 참가자
+        self.assertEqual(clubs["club"], (2, 2, 0, 0, 5))  # 한 매치에서 같은 쪽 선수가 여럿이어도 클럽은 한 번
+        self.assertEqual(group_deltas(users)[(2, 1, 0, 1, 3)], ["a"])
+
+    def test_club_team_without_players(self):
+        users, clubs = collect_deltas({1: (0, 2, "")}, [(1, None, "blue", "club")], {})
+
+        self.assertEqual(users, {})
+        self.assertEqual(clubs["club"], (1, 1, 0, 0, 2))
+
+
+class ProcessMatchStatsTestCase(TestCase):
+    def setUp(self):
+        self.club = ClubFactory()
+        self.red_user, self.blue_user = AccountFactory.create_batch(2)
+        self.match = MatchFactory(status="scheduled", total_spots=2, players=[self.red_user, self.blue_user])
+        self.red, self.blue = self.match.participants.order_by("id")
+        self.red.team = TeamFactory(is_red_team=True, club=self.club)
+        self.red.save()
+        self.blue.team = TeamFactory(is_red_team=False)
+        self.blue.save()
+        for scorer in (self.red, self.red, self.blue):
+            self.match.record_event("point", scorer, scorer)
+
+    def stats(self, user):
+        return UserStatistics.objects.values_list("mp", "wins", "draws", "losses", "points_scored").get(user=user)
+
+    def test_completed_match_is_applied_once(self):
+        self.assertTrue(self.match.complete_match())
+        self.assertEqual(ProcessedMatchStats.process([self.match.pk]), 0)  # 다시 처리해도 두 번 더하지 않는다
+
+        self.assertEqual(self.stats(self.red_user), (1, 1, 0, 0, 2))
+        self.assertEqual(self.stats(self.blue_user), (1, 0, 0, 1, 1))
+        club_stats = ClubStatistics.objects.get(club=self.club)
+        self.assertEqual((club_stats.mp, club_stats.wins, club_stats.points_scored), (1, 1, 2))
+
+    def test_rebuild_replays_history(self):
+        self.match.complete_match()
+        UserStatistics.objects.filter(user=self.red_user).update(wins=10)
+
+        self.assertEqual(ProcessedMatchStats.rebuild(), 1)
+        self.assertEqual(self.stats(self.red_user), (1, 1, 0, 0, 2))
+        self.assertEqual(ClubStatistics.objects.get(club=self.club).mp, 1)
+
+
+class ProcessFixtureStatsTestCase(TestCase):
+    def test_league_fixture_uses_home_and_away_teams(self):
+        home_club, away_club = ClubFactory.create_batch(2)
+        league = LeagueFactory(max_teams=2, total_number_of_rounds=1)
+        league.participants.set([TeamFactory(club=home_club), TeamFactory(club=away_club)])
+        [[fixture]] = league.generate_schedule()
+        home_player = TeamPlayerFactory(team=fixture.home_team)
+
+        fixture.record_score(1, 3)
+        fixture.match.complete_match()
+
+        self.assertEqual(
+            UserStatistics.objects.values_list("mp", "wins", "losses").get(user=home_player.user), (1, 0, 1)
+        )
+        stats = dict(ClubStatistics.objects.values_list("club_id", "points_scored"))
+        self.assertEqual(stats, {fixture.home_team.club_id: 1, fixture.away_team.club_id: 3})
+
+
+class RebuildSeededStatsTestCase(TestCase):
+    def test_rebuild_matches_seeded_statistics(self):
+        Seeder(scale=0.01, seed=3, start=datetime(2026, 1, 1, tzinfo=timezone.utc), chunk_size=30).run()
+        fields = ("user_id", "mp", "wins", "draws", "losses", "points_scored")
+        seeded = list(UserStatistics.objects.order_by("user_id").values_list(*fields))
+
+        ProcessedMatchStats.rebuild(batch_size=7)
+
+        self.assertEqual(list(UserStatistics.objects.order_by("user_id").values_list(*fields)), seeded)
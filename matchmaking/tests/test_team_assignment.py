@@ -0,0 +1,45 @@
+import random
+from decimal import Decimal
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from accounts.tests.factories import UserStatisticsFactory
+from matchmaking.teams import balance_teams
+from matchmaking.tests.factories import MatchFactory
+
+
+class BalanceTeamsTestCase(SimpleTestCase):
+    def test_teams_are_even_in_size_and_close_in_rating(self):
+        rng = random.Random(42)
+        for size in range(2, 31):
+            ratings = {i: Decimal(rng.randint(0, 500)) / 100 for i in range(size)}
+
+            red, blue = balance_teams(ratings)
+
+            self.assertEqual(sorted(red + blue), list(range(size)))
+            self.assertLessEqual(abs(len(red) - len(blue)), 1)
+            gap = abs(sum(ratings[p] for p in red) - sum(ratings[p] for p in blue))
+            self.assertLessEqual(gap, max(ratings.values()))
+
+
+class AssignTeamsTestCase(TestCase):
+    def create_match_with_players(self, count):
+        players = [
+            UserStatisticsFactory(performance=Decimal(i % 5), manner=Decimal("4.00")).user for i in range(count)
+        ]
+        return MatchFactory(status="scheduled", total_spots=count, players=players)
+
+    def assign_and_count_queries(self, match):
+        with CaptureQueriesContext(connection) as queries:
+            red_team, blue_team = match.assign_teams()
+        return len(queries), red_team, blue_team
+
+    def test_query_count_does_not_grow_with_players(self):
+        small, *_ = self.assign_and_count_queries(self.create_match_with_players(6))
+        large, red_team, blue_team = self.assign_and_count_queries(self.create_match_with_players(30))
+
+        self.assertEqual(small, large)
+        self.assertEqual(red_team.teamplayer_set.count(), 15)
+        self.assertEqual(blue_team.teamplayer_set.count(), 15)
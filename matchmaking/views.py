@@ -1,11 +1,57 @@
+import asyncio
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import Prefetch
+from django.http import JsonResponse, StreamingHttpResponse
 from django.utils import timezone
-from django.forms import ValidationError
+from django.utils.dateparse import parse_datetime
 from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
-from .serializers import MatchSerializer, MatchEventSerializer, TeamPlayerSerializer, PlayerReviewSerializer, GroundReviewSerializer, PressConferenceSerializer
-from newsfeed.models.newsfeed import Newsfeed, NewsfeedPost
+from . import stream
+from .models.match import Match, MatchEvent, PressConference, TeamTalk, STATUS_CHOICES
+from .models.schedule import MatchScheduleSlot
+from .models.team import TeamPlayer
+from .pagination import DistanceCursorPagination
+from .search import search_matches
+from .serializers import ChatMessageSerializer, MatchSearchSerializer, MatchSerializer, MatchEventSerializer, MatchEventStreamSerializer, TeamPlayerSerializer, PlayerReviewSerializer, GroundReviewSerializer, PressConferenceSerializer
+from accounts.models import User
+from newsfeed.fanout import fan_out_to_followers
+
+DEFAULT_SEARCH_RADIUS = 10000  # 미터
+MAX_SEARCH_RADIUS = 50000
+MAX_FREE_SLOTS_WINDOW = timedelta(days=31)
+MAX_CHAT_MESSAGES = 100
+MATCH_DETAIL_FIELDS = ('match', 'events', 'players')
+
+
+def chat_messages_since(conversation, since):
+    """
+    since 번호 이후 메시지 (최대 MAX_CHAT_MESSAGES개).
+    클라이언트는 응답의 last_seq를 다음 요청의 since로 넘겨 새 메시지만 받아간다.
+    """
+    messages = list(conversation.messages_since(since, MAX_CHAT_MESSAGES + 1))
+    has_more = len(messages) > MAX_CHAT_MESSAGES
+    messages = messages[:MAX_CHAT_MESSAGES]
+    return {
+        "messages": ChatMessageSerializer(messages, many=True).data,
+        "last_seq": messages[-1].seq if messages else since,
+        "has_more": has_more,
+    }
+
+
+def parse_since(request):
+    since = request.query_params.get('since', '0')
+    if not since.isdigit():
+        return None
+    return int(since)
+
 
 class CreateMatchView(APIView):
     permission_classes = [IsAuthenticated]
@@ -28,24 +74,38 @@ class MatchDetailView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, match_id, *args, **kwargs):
+        """
+        매치 세부 정보. 매치(+리그/토너먼트), 참가자(+유저), 이벤트(+선수/유저)를 각각 한 번의 쿼리로 읽으므로
+        참가자/이벤트 수와 관계없이 쿼리 수가 일정하다.
+        ?fields=match,events,players 로 필요한 항목만 요청할 수 있고, 요청하지 않은 항목은 조회하지 않는다.
+        """
+        fields = set(filter(None, request.query_params.get('fields', ','.join(MATCH_DETAIL_FIELDS)).split(',')))
+        if not fields or not fields <= set(MATCH_DETAIL_FIELDS):
+            return Response({"error": f"fields must be a comma-separated subset of {', '.join(MATCH_DETAIL_FIELDS)}."}, status=status.HTTP_400_BAD_REQUEST)
+
+        matches = Match.objects.select_related('league', 'tournament')
+        if fields & {'match', 'players'}:
+            matches = matches.prefetch_related(
+                Prefetch('participants', queryset=TeamPlayer.objects.select_related('user').order_by('id'))
+            )
+        if 'events' in fields:
+            matches = matches.prefetch_related(
+                Prefetch('events', queryset=MatchEvent.objects.select_related('added_by__user', 'target_player__user').order_by('seq'))
+            )
         try:
-            match = "match.Match".objects.get(id=match_id)
-        except "match.Match".DoesNotExist:
+            match = matches.get(id=match_id)
+        except Match.DoesNotExist:
             return Response({"error": "Match not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        match_serializer = MatchSerializer(match)
-        events = "match.MatchEvent".objects.filter(match=match)
-        event_serializer = MatchEventSerializer(events, many=True)
-
+        data = {}
+        if 'match' in fields:
+            data["match"] = MatchSerializer(match).data
+        if 'events' in fields:
+            data["events"] = MatchEventSerializer(match.events.all(), many=True).data
         # 선수 정보도 함께 반환
-        team_players = "match.TeamPlayer".objects.filter(team__match=match)
-        player_serializer = TeamPlayerSerializer(team_players, many=True)
-
-        return Response({
-            "match": match_serializer.data,
-            "events": event_serializer.data,
-            "players": player_serializer.data
-        }, status=status.HTTP_200_OK)
+        if 'players' in fields:
+            data["players"] = TeamPlayerSerializer(match.participants.all(), many=True).data
+        return Response(data, status=status.HTTP_200_OK)
 
 class MatchUpdateView(APIView):
     permission_classes = [IsAuthenticated]
@@ -124,79 +184,155 @@ class MatchCompleteView(APIView):
             return Response({"error": "Cannot complete a match that is not ongoing."}, status=status.HTTP_400_BAD_REQUEST)
 
 class SearchMatchView(APIView):
+    """
+    주변 매치 검색 (거리순, keyset 페이지네이션).
+    필수: lat, lng / 선택: radius(미터, 기본 10km, 최대 50km), start_after, start_before,
+    status(쉼표 구분, 기본 pending,scheduled), match_type
+    """
     permission_classes = [IsAuthenticated]
 
     def get(self, request, *args, **kwargs):
-        location = request.query_params.get('location')  # Get user location
-        if not location:
-            return Response({"error": "Location parameter is required."}, status=status.HTTP_400_BAD_REQUEST)
-        
-        # Use GIS to find nearby matches
-        matches = "match.Match".objects.filter(sports_ground__location__distance_lte=(location, 10000))  # 10km range
-        serializer = MatchSerializer(matches, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        params = request.query_params
+        try:
+            lat = float(params['lat'])
+            lng = float(params['lng'])
+            radius = float(params.get('radius', DEFAULT_SEARCH_RADIUS))
+        except KeyError:
+            return Response({"error": "lat and lng parameters are required."}, status=status.HTTP_400_BAD_REQUEST)
+        except ValueError:
+            return Response({"error": "lat, lng and radius must be numbers."}, status=status.HTTP_400_BAD_REQUEST)
+        if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+            return Response({"error": "lat/lng out of range."}, status=status.HTTP_400_BAD_REQUEST)
+        if not 0 < radius <= MAX_SEARCH_RADIUS:
+            return Response({"error": f"radius must be between 0 and {MAX_SEARCH_RADIUS} meters."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            start_after = parse_datetime(params['start_after']) if 'start_after' in params else timezone.now()
+            start_before = parse_datetime(params['start_before']) if 'start_before' in params else None
+        except ValueError:
+            start_after = None
+        if start_after is None or ('start_before' in params and start_before is None):
+            return Response({"error": "start_after/start_before must be ISO 8601 datetimes."}, status=status.HTTP_400_BAD_REQUEST)
+
+        statuses = params.get('status', 'pending,scheduled').split(',')
+        if not set(statuses) <= {value for value, _ in STATUS_CHOICES}:
+            return Response({"error": "Invalid status filter."}, status=status.HTTP_400_BAD_REQUEST)
+
+        matches = search_matches(
+            lat, lng, radius,
+            start_after=start_after,
+            start_before=start_before,
+            statuses=statuses,
+            match_type=params.get('match_type'),
+        )
+        paginator = DistanceCursorPagination()
+        page = paginator.paginate_queryset(matches, request, view=self)
+        serializer = MatchSearchSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 class JoinMatchView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, match_id, *args, **kwargs):
         try:
-            match = "match.Match".objects.get(id=match_id)
-        except "match.Match".DoesNotExist:
+            match = Match.objects.get(id=match_id)
+        except Match.DoesNotExist:
             return Response({"error": "Match not found."}, status=status.HTTP_404_NOT_FOUND)
 
         user = request.user
-        # Check for overlapping matches
-        try:
-            match.prevent_overlap(user)
-        except ValidationError as e:
-            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
-
         if match.is_private:
             # Private match, send request to join
             match.join_requests.add(user)
             return Response({"message": "Request to join sent to the match owner."}, status=status.HTTP_200_OK)
-        else:
-            # Public match, join immediately
-            team_player = "match.TeamPlayer".objects.create(user=user, team=None)  # Assign teams later
-            match.participants.add(team_player)
-            match.save()
-
-            # 유저의 팔로워 목록 가져오기
-            followers = user.followers.all()
-
-            # 팔로워들의 뉴스피드에 해당 매치 포스트 추가
-            for follower_id in followers:
-                follower_newsfeed = Newsfeed.objects.get(user_id=follower_id)
-                NewsfeedPost.objects.create(
-                    newsfeed=follower_newsfeed,
-                    post_type="match",
-                    post_id=match.id,
-                    post_content=f"{user.username} joined a match at {match.sports_ground.name}."
-                )
 
-            return Response({"message": "Successfully joined the match."}, status=status.HTTP_200_OK)
+        # Public match, join immediately (정원/겹치는 매치 확인과 참가를 한 트랜잭션에서)
+        try:
+            result, _ = match.join(user, waitlist=request.data.get('waitlist') in (True, 'true', '1'))
+        except ValidationError as e:
+            return Response({"error": e.detail[0]}, status=status.HTTP_400_BAD_REQUEST)
+
+        if result == "waitlisted":
+            return Response({"message": "The match is full. You have been added to the waitlist."}, status=status.HTTP_202_ACCEPTED)
+
+        # 팔로워들의 뉴스피드에 해당 매치 포스트 추가
+        fan_out_to_followers(
+            user,
+            post_type="match",
+            post_id=match.id,
+            post_content=f"{user.username} joined a match at {match.sports_ground.name}."
+        )
+
+        return Response({"message": "Successfully joined the match."}, status=status.HTTP_200_OK)
+
+class LeaveMatchView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, match_id, *args, **kwargs):
+        try:
+            match = Match.objects.get(id=match_id)
+        except Match.DoesNotExist:
+            return Response({"error": "Match not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        if match.status not in ('pending', 'scheduled'):
+            return Response({"error": "Cannot leave a match that has already started."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not match.remove_participant(request.user):
+            if match.waitlist.filter(user=request.user).delete()[0]:
+                return Response({"message": "Removed from the waitlist."}, status=status.HTTP_200_OK)
+            return Response({"error": "You are not participating in this match."}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({"message": "Successfully left the match.", "available_spots": match.available_spots}, status=status.HTTP_200_OK)
+
+class FreeSlotsView(APIView):
+    """
+    내 빈 시간 조회.
+    start/end(ISO 8601, 기본: 지금부터 7일, 최대 31일) 구간에서 참가한 매치 일정을 뺀 빈 구간을 반환
+    min_minutes(기본 60)보다 짧은 빈 구간은 제외
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        params = request.query_params
+        try:
+            start = parse_datetime(params['start']) if 'start' in params else timezone.now()
+            end = parse_datetime(params['end']) if 'end' in params else start + timedelta(days=7)
+            min_length = timedelta(minutes=int(params.get('min_minutes', 60)))
+        except (TypeError, ValueError):
+            start = end = None
+        if start is None or end is None:
+            return Response({"error": "start/end must be ISO 8601 datetimes and min_minutes an integer."}, status=status.HTTP_400_BAD_REQUEST)
+        start, end = [timezone.make_aware(value) if timezone.is_naive(value) else value for value in (start, end)]
+        if not start < end <= start + MAX_FREE_SLOTS_WINDOW:
+            return Response({"error": "end must be after start and within 31 days."}, status=status.HTTP_400_BAD_REQUEST)
+
+        busy, free = MatchScheduleSlot.free_slots(request.user, start, end, min_length)
+        return Response({
+            "busy": [{"match": match_id, "start": period.lower, "end": period.upper} for match_id, period in busy],
+            "free": [{"start": free_start, "end": free_end} for free_start, free_end in free],
+        }, status=status.HTTP_200_OK)
 
 class ManageJoinRequestView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, match_id, user_id, *args, **kwargs):
         try:
-            match = "match.Match".objects.get(id=match_id, creator=request.user)
-        except "match.Match".DoesNotExist:
+            match = Match.objects.get(id=match_id, creator=request.user)
+        except Match.DoesNotExist:
             return Response({"error": "Match not found or you don't have permission to manage this match."}, status=status.HTTP_404_NOT_FOUND)
 
         try:
-            requested_user = "accounts.User".objects.get(id=user_id)
-        except "accounts.User".DoesNotExist:
+            requested_user = User.objects.get(id=user_id)
+        except User.DoesNotExist:
             return Response({"error": "Requested user not found."}, status=status.HTTP_404_NOT_FOUND)
 
         action = request.data.get('action')  # 'accept' or 'deny'
         if action == 'accept':
             if requested_user in match.join_requests.all():
+                try:
+                    match.join(requested_user)
+                except ValidationError as e:
+                    return Response({"error": e.detail[0]}, status=status.HTTP_400_BAD_REQUEST)
                 match.join_requests.remove(requested_user)
-                team_player = "match.TeamPlayer".objects.create(user=requested_user, team=None)
-                match.participants.add(team_player)
                 return Response({"message": f"{requested_user.username} has been added to the match."}, status=status.HTTP_200_OK)
             else:
                 return Response({"error": "User did not request to join this match."}, status=status.HTTP_400_BAD_REQUEST)
@@ -214,19 +350,124 @@ class MatchEventUpdateView(APIView):
 
     def post(self, request, match_id, *args, **kwargs):
         try:
-            match = "match.Match".objects.get(id=match_id)
-        except "match.Match".DoesNotExist:
+            match = Match.objects.get(id=match_id)
+        except Match.DoesNotExist:
             return Response({"error": "Match not found."}, status=status.HTTP_404_NOT_FOUND)
-        
-        serializer = MatchEventSerializer(data=request.data)
-        if serializer.is_valid():
-            match_event = serializer.save(match=match, added_by=request.user)
-            return Response({
-                "message": "Match event added successfully.",
-                "event": MatchEventSerializer(match_event).data
-            }, status=status.HTTP_201_CREATED)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-    
+
+        added_by = match.participants.filter(user=request.user).first()
+        if added_by is None:
+            return Response({"error": "Only participants can add match events."}, status=status.HTTP_403_FORBIDDEN)
+
+        event_type = request.data.get('event_type')
+        if event_type not in dict(MatchEvent.EVENT_TYPES) or event_type == 'void':
+            return Response({"error": "Invalid event type."}, status=status.HTTP_400_BAD_REQUEST)
+
+        target_player = None
+        target_player_id = request.data.get('target_player')
+        if target_player_id is not None:
+            target_player = match.participants.select_related('team').filter(id=target_player_id).first()
+            if target_player is None:
+                return Response({"error": "Target player is not participating in this match."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            match_event = match.record_event(event_type, added_by, target_player)
+        except ValidationError as e:
+            return Response({"error": e.detail[0]}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            "message": "Match event added successfully.",
+            "event": MatchEventStreamSerializer(match_event).data,
+            "score": stream.scoreboard(match.id),
+        }, status=status.HTTP_201_CREATED)
+
+
+class MatchEventVoidView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, match_id, seq, *args, **kwargs):
+        """
+        잘못 기록한 이벤트 취소 (마지막 이벤트 되돌리기 포함). 스코어보드도 함께 정정된다.
+        """
+        try:
+            match = Match.objects.get(id=match_id)
+            event = match.events.get(seq=seq)
+        except (Match.DoesNotExist, MatchEvent.DoesNotExist):
+            return Response({"error": "Match event not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        added_by = match.participants.filter(user=request.user).first()
+        if added_by is None:
+            return Response({"error": "Only participants can void match events."}, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            void = match.void_event(event, added_by)
+        except ValidationError as e:
+            return Response({"error": e.detail[0]}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({
+            "message": "Match event voided.",
+            "event": MatchEventStreamSerializer(void).data,
+            "score": stream.scoreboard(match.id),
+        }, status=status.HTTP_201_CREATED)
+
+
+def authenticate(request):
+    """DRF 인증 클래스로 일반 Django 요청의 유저를 확인 (async 뷰에서 사용)"""
+    return Request(request, authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES]).user
+
+
+async def is_authenticated(request):
+    try:
+        user = await sync_to_async(authenticate)(request)
+    except APIException:
+        return False
+    return user is not None and user.is_authenticated
+
+
+async def match_event_stream(request, match_id):
+    """
+    매치 이벤트 SSE 스트림 (ASGI에서 연결당 스레드를 잡지 않음).
+    Last-Event-ID 헤더 또는 ?since=<seq> 이후 이벤트부터 보낸다.
+    """
+    if not await is_authenticated(request):
+        return JsonResponse({"error": "Authentication credentials were not provided."}, status=status.HTTP_401_UNAUTHORIZED)
+
+    since = request.headers.get('Last-Event-ID') or request.GET.get('since', '0')
+    if not since.isdigit():
+        return JsonResponse({"error": "since must be a non-negative integer."}, status=status.HTTP_400_BAD_REQUEST)
+    if await stream.alatest_seq(match_id) is None:
+        return JsonResponse({"error": "Match not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    response = StreamingHttpResponse(stream.sse_events(match_id, int(since)), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx 버퍼링 끄기
+    return response
+
+
+async def match_event_poll(request, match_id):
+    """
+    매치 이벤트 long-poll (SSE를 쓸 수 없는 클라이언트용, ASGI에서 기다리는 동안 스레드를 잡지 않음).
+    ?since=<seq> 이후 이벤트가 생기거나 MATCH_LONG_POLL_TIMEOUT이 지날 때까지 기다렸다가 차이분과 현재 점수를 반환.
+    """
+    if not await is_authenticated(request):
+        return JsonResponse({"error": "Authentication credentials were not provided."}, status=status.HTTP_401_UNAUTHORIZED)
+
+    since = request.GET.get('since', '0')
+    if not since.isdigit():
+        return JsonResponse({"error": "since must be a non-negative integer."}, status=status.HTTP_400_BAD_REQUEST)
+    since = int(since)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.MATCH_LONG_POLL_TIMEOUT
+    while True:
+        latest = await stream.alatest_seq(match_id)
+        if latest is None:
+            return JsonResponse({"error": "Match not found."}, status=status.HTTP_404_NOT_FOUND)
+        if latest > since or loop.time() >= deadline:
+            break
+        await asyncio.sleep(settings.MATCH_STREAM_POLL_INTERVAL)
+
+    return JsonResponse(await sync_to_async(stream.events_since)(match_id, since), status=status.HTTP_200_OK)
+
 class PlayerUpdateView(APIView):
     permission_classes = [IsAuthenticated]  # 로그인된 사용자만 접근 가능
 
@@ -270,33 +511,40 @@ class PressConferenceView(APIView):
         """
         Press Conference 정보를 불러오는 뷰
         """
+        since = parse_since(request)
+        if since is None:
+            return Response({"error": "since must be a non-negative integer."}, status=status.HTTP_400_BAD_REQUEST)
+
         try:
-            press_conference = "match.PressConference".objects.get(match_id=match_id)
-        except "match.PressConference".DoesNotExist:
+            press_conference = PressConference.objects.select_related('conversation').prefetch_related(
+                Prefetch('participants', queryset=TeamPlayer.objects.select_related('user', 'team'))
+            ).get(match_id=match_id)
+        except PressConference.DoesNotExist:
             return Response({"error": "Press Conference not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        # Press Conference 정보 반환 (참가자, 질문 등)
-        serializer = PressConferenceSerializer(press_conference)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # Press Conference 정보 반환 (참가자, 질문 등) + since 이후 대화 기록
+        data = PressConferenceSerializer(press_conference).data
+        data["chat"] = chat_messages_since(press_conference.conversation, since)
+        return Response(data, status=status.HTTP_200_OK)
 
     def post(self, request, match_id, *args, **kwargs):
         """
         질문 생성 및 답변 처리. 처음 호출 시 질문을 생성하고, 그 후로는 답변을 받아 처리.
         """
         try:
-            press_conference = "match.PressConference".objects.get(match_id=match_id)
-        except "match.PressConference".DoesNotExist:
+            press_conference = PressConference.objects.get(match_id=match_id)
+        except PressConference.DoesNotExist:
             return Response({"error": "Press Conference not found."}, status=status.HTTP_404_NOT_FOUND)
 
-        # 질문 생성이 필요하면
-        if not press_conference.questions:
-            press_conference.generate_questions()
-            return Response({"message": "Questions generated successfully."}, status=status.HTTP_201_CREATED)
+        # 질문이 아직 준비되지 않았으면 생성을 요청하고 바로 반환 (GET으로 questions_status를 확인)
+        if press_conference.questions_status != 'ready':
+            questions_status = press_conference.request_questions()
+            return Response({"message": "Questions are being generated.", "questions_status": questions_status}, status=status.HTTP_202_ACCEPTED)
 
         # 질문이 이미 생성된 경우, 답변을 처리하고 다음 질문을 반환
         answer = request.data.get("answer", "")
         if answer:
-            next_question = press_conference.process_answer(answer)
+            next_question = press_conference.process_answer(answer, user=request.user)
             return Response({"next_question": next_question}, status=status.HTTP_200_OK)
         else:
             return Response({"error": "Answer not provided."}, status=status.HTTP_400_BAD_REQUEST)
@@ -306,14 +554,14 @@ class PressConferenceView(APIView):
         대화를 추가로 이어갈 때 사용할 수 있는 뷰.
         """
         try:
-            press_conference = "match.PressConference".objects.get(match_id=match_id)
-        except "match.PressConference".DoesNotExist:
+            press_conference = PressConference.objects.get(match_id=match_id)
+        except PressConference.DoesNotExist:
             return Response({"error": "Press Conference not found."}, status=status.HTTP_404_NOT_FOUND)
 
         # 추가 대화 저장
         chat_message = request.data.get("message", "")
         if chat_message:
-            press_conference.process_answer(chat_message)
+            press_conference.process_answer(chat_message, user=request.user)
             return Response({"message": "Chat message saved."}, status=status.HTTP_200_OK)
         else:
             return Response({"error": "Message not provided."}, status=status.HTTP_400_BAD_REQUEST)
@@ -323,32 +571,46 @@ class StartPressConferenceView(APIView):
 
     def post(self, request, match_id, *args, **kwargs):
         """
-        Press Conference 시작 뷰. 처음 실행 시 사용자를 참가자로 추가하고, 첫 질문 생성.
+        Press Conference 시작 뷰. 처음 실행 시 사용자를 참가자로 추가하고, 질문 생성을 요청.
         """
         try:
-            match = "match.Match".objects.get(id=match_id)
-        except "match.Match".DoesNotExist:
+            match = Match.objects.get(id=match_id)
+        except Match.DoesNotExist:
             return Response({"error": "Match not found."}, status=status.HTTP_404_NOT_FOUND)
 
         # 이미 Press Conference가 있으면
-        if "match.PressConference".objects.filter(match=match).exists():
+        if PressConference.objects.filter(match=match).exists():
             return Response({"error": "Press Conference already exists for this match."}, status=status.HTTP_400_BAD_REQUEST)
 
         # Press Conference 생성
-        press_conference = "match.PressConference".objects.create(match=match)
+        press_conference = PressConference.objects.create(match=match)
         press_conference.participants.set(match.participants.all())  # 참가자 설정
-        press_conference.generate_questions()  # 질문 생성
+        questions_status = press_conference.request_questions()  # 질문 생성 요청 (백그라운드)
 
-        return Response({"message": "Press Conference started and questions generated."}, status=status.HTTP_201_CREATED)
+        return Response({"message": "Press Conference started. Questions are being generated.", "questions_status": questions_status}, status=status.HTTP_202_ACCEPTED)
 
 class TeamTalkView(APIView):
     permission_classes = [IsAuthenticated]
 
+    def get(self, request, match_id, team_id):
+        """
+        팀 대화 조회. ?since=<seq> 이후 메시지만 반환하므로 클라이언트는 새 메시지만 폴링한다.
+        """
+        since = parse_since(request)
+        if since is None:
+            return Response({"error": "since must be a non-negative integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+        team_talk = TeamTalk.objects.filter(match_id=match_id, team_id=team_id).select_related('conversation').first()
+        if team_talk is None:
+            return Response({"messages": [], "last_seq": since, "has_more": False}, status=status.HTTP_200_OK)
+
+        return Response(chat_messages_since(team_talk.conversation, since), status=status.HTTP_200_OK)
+
     def post(self, request, match_id, team_id):
         try:
-            match = "match.Match".objects.get(id=match_id)
-            team = "match.TeamPlayer".objects.get(id=team_id, match=match)
-        except ("match.Match".DoesNotExist, "match.TeamPlayer".DoesNotExist):
+            match = Match.objects.get(id=match_id)
+            team = match.participants.get(id=team_id)
+        except (Match.DoesNotExist, TeamPlayer.DoesNotExist):
             return Response({"error": "Match or team not found."}, status=status.HTTP_404_NOT_FOUND)
 
         # 채팅 메시지 가져오기
@@ -356,16 +618,11 @@ class TeamTalkView(APIView):
         if not message:
             return Response({"error": "Message content is required."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # 채팅 로그에 저장
-        team_talk, created = "match.TeamTalk".objects.get_or_create(match=match, team=team)
-        team_talk.chat_log.append({
-            "user": request.user.username,
-            "message": message,
-            "timestamp": timezone.now().isoformat(),
-        })
-        team_talk.save()
+        # 대화 기록에 한 줄 추가 (전체 기록을 다시 쓰지 않음)
+        team_talk, created = TeamTalk.objects.get_or_create(match=match, team=team)
+        chat_message = team_talk.conversation.append(message, user=request.user)
 
-        return Response({"message": "Message sent.", "chat_log": team_talk.chat_log}, status=status.HTTP_200_OK)
+        return Response({"message": "Message sent.", "chat_message": ChatMessageSerializer(chat_message).data}, status=status.HTTP_200_OK)
 
 class SubmitReviewView(APIView):
     permission_classes = [IsAuthenticated]
@@ -0,0 +1,113 @@
+"""
+뉴스피드 타임라인 캐시.
+
+- 타임라인: 뉴스피드별 최신 포스트 ID 목록 (최대 TIMELINE_CACHE_SIZE개)
+- 포스트: 직렬화된 포스트 본문 (포스트별 2차 캐시)
+
+CACHES["timeline"] 백엔드를 사용하므로 운영에서는 Redis, 테스트/단일 서버에서는 로컬 메모리 캐시로 동작한다.
+fan-out 경로는 새 포스트 ID를 이미 캐시된 타임라인 앞에 붙이고, 캐시되지 않은 타임라인은 다음 조회 때 DB에서 채운다.
+"""
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import caches
+
+from newsfeed.models.newsfeed import Newsfeed, NewsfeedPost
+
+TIMELINE_CACHE_ALIAS = "timeline"
+
+
+def timeline_cache():
+    return caches[TIMELINE_CACHE_ALIAS]
+
+
+def _newsfeed_key(user_id):
+    return f"newsfeed:user:{user_id}"
+
+
+def _timeline_key(newsfeed_id):
+    return f"timeline:{newsfeed_id}"
+
+
+def _post_key(post_id):
+    return f"timeline:post:{post_id}"
+
+
+def get_newsfeed_id(user_id):
+    """유저의 (첫 번째) 뉴스피드 ID. 없으면 None"""
+    cache = timeline_cache()
+    newsfeed_id = cache.get(_newsfeed_key(user_id))
+    if newsfeed_id is None:
+        newsfeed_id = Newsfeed.objects.filter(user=user_id).order_by('id').values_list('id', flat=True).first()
+        if newsfeed_id is not None:
+            cache.set(_newsfeed_key(user_id), newsfeed_id, settings.TIMELINE_CACHE_TTL)
+    return newsfeed_id
+
+
+def get_timeline_ids(newsfeed_id):
+    """뉴스피드의 최신 포스트 ID 목록 (최신순). 캐시에 없으면 DB에서 읽어 채운다."""
+    cache = timeline_cache()
+    post_ids = cache.get(_timeline_key(newsfeed_id))
+    if post_ids is None:
+        post_ids = list(
+            NewsfeedPost.objects.filter(newsfeed_id=newsfeed_id)
+            .order_by('-created_at', '-id')
+            .values_list('id', flat=True)[:settings.TIMELINE_CACHE_SIZE]
+        )
+        cache.set(_timeline_key(newsfeed_id), post_ids, settings.TIMELINE_CACHE_TTL)
+    return post_ids
+
+
+def push_posts(posts):
+    """
+    새로 생성된 포스트를 캐시된 타임라인 앞에 붙인다 (get_many 1회 + set_many 1회).
+    캐시에 없는 타임라인은 건드리지 않는다.
+    """
+    new_ids = defaultdict(list)
+    for post in sorted(posts, key=lambda post: (post.created_at, post.id), reverse=True):
+        new_ids[_timeline_key(post.newsfeed_id)].append(post.id)
+    if not new_ids:
+        return
+
+    cache = timeline_cache()
+    cached = cache.get_many(list(new_ids))
+    cache.set_many(
+        {
+            key: (new_ids[key] + post_ids)[:settings.TIMELINE_CACHE_SIZE]
+            for key, post_ids in cached.items()
+        },
+        settings.TIMELINE_CACHE_TTL,
+    )
+
+
+def invalidate_timeline(newsfeed_id):
+    timeline_cache().delete(_timeline_key(newsfeed_id))
+
+
+def invalidate_posts(post_ids):
+    """좋아요/댓글/공유/수정 등으로 바뀐 포스트의 본문 캐시 삭제"""
+    timeline_cache().delete_many([_post_key(post_id) for post_id in post_ids])
+
+
+def get_posts(post_ids, serializer_class):
+    """
+    포스트 ID 목록을 직렬화된 포스트 목록으로 (순서 유지).
+    캐시에 없는 포스트만 in_bulk로 한 번에 읽어 캐시에 채우고, 삭제된 포스트는 건너뛴다.
+    """
+    cache = timeline_cache()
+    cached = cache.get_many([_post_key(post_id) for post_id in post_ids])
+    data = {int(key.rsplit(':', 1)[1]): value for key, value in cached.items()}
+
+    missing = [post_id for post_id in post_ids if post_id not in data]
+    if missing:
+        fetched = {
+            post.id: serializer_class(post).data
+            for post in NewsfeedPost.objects.in_bulk(missing).values()
+        }
+        cache.set_many(
+            {_post_key(post_id): post for post_id, post in fetched.items()},
+            settings.TIMELINE_POST_CACHE_TTL,
+        )
+        data.update(fetched)
+
+    return [data[post_id] for post_id in post_ids if post_id in data]
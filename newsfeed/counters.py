@@ -0,0 +1,104 @@
+"""
+뉴스피드 포스트 카운터(좋아요/공유) write-behind 버퍼.
+
+NEWSFEED_COUNTER_BUFFER가 켜져 있으면 증가분을 프로세스 메모리에 모았다가 백그라운드 flush 스레드가
+NEWSFEED_COUNTER_FLUSH_INTERVAL초마다 (NEWSFEED_COUNTER_MAX_PENDING개 포스트가 쌓이면 바로) 한꺼번에 반영한다.
+좋아요/공유 요청 스레드는 메모리에 더하기만 하고 DB에 쓰지 않는다.
+반영은 F() 증가로 하므로 여러 프로세스가 각자 flush 해도 유실되지 않으며,
+증가분이 같은 포스트끼리는 UPDATE 한 번으로 묶는다.
+프로세스가 비정상 종료되면 아직 반영되지 않은 증가분은 잃을 수 있다 (정상 종료 시에는 close로 flush).
+"""
+import atexit
+import logging
+import threading
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import F
+
+from newsfeed.models.newsfeed import NewsfeedPost
+
+logger = logging.getLogger(__name__)
+
+
+class CounterBuffer:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = defaultdict(Counter)  # post_id -> {field: 증가분}
+        self._wake = threading.Event()  # 쌓인 포스트가 많으면 flush 스레드를 바로 깨운다
+        self._stop = threading.Event()
+        self._flusher = None
+
+    def add(self, post_id, field, amount=1):
+        with self._lock:
+            self._pending[post_id][field] += amount
+            full = len(self._pending) >= settings.NEWSFEED_COUNTER_MAX_PENDING
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._run, name="newsfeed-counter-flush", daemon=True)
+                self._flusher.start()
+        if full:
+            self._wake.set()
+
+    def _run(self):
+        """flush 스레드: FLUSH_INTERVAL초마다 (또는 깨우면 바로) 반영. 실패한 증가분은 다음 주기에 다시 반영한다"""
+        while not self._stop.is_set():
+            self._wake.wait(settings.NEWSFEED_COUNTER_FLUSH_INTERVAL)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush newsfeed counters")
+            finally:
+                connection.close()  # 이 스레드의 DB 연결을 주기 사이에 들고 있지 않는다
+
+    def close(self):
+        """
+        flush 스레드를 멈추고(join) 남은 증가분을 반영. 반영한 포스트 수를 반환.
+        닫은 뒤에 add를 부르면 flush 스레드를 새로 시작한다.
+        """
+        with self._lock:
+            flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            self._stop.set()
+            self._wake.set()
+            flusher.join()
+            self._stop.clear()
+            self._wake.clear()
+        return self.flush()
+
+    def flush(self):
+        """모인 증가분을 DB에 반영하고 반영한 포스트 수를 반환"""
+        from newsfeed.cache import invalidate_posts
+
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(Counter)
+        if not pending:
+            return 0
+
+        # 증가분이 같은 포스트끼리 묶어서 UPDATE
+        groups = defaultdict(list)
+        for post_id, deltas in pending.items():
+            groups[tuple(sorted(deltas.items()))].append(post_id)
+
+        try:
+            while groups:
+                deltas, post_ids = next(iter(groups.items()))
+                NewsfeedPost.objects.filter(pk__in=post_ids).update(
+                    **{field: F(field) + amount for field, amount in deltas}
+                )
+                del groups[deltas]
+        except Exception:
+            # 반영하지 못한 증가분은 다음 flush 때 다시 반영하도록 되돌려 놓는다
+            with self._lock:
+                for deltas, post_ids in groups.items():
+                    for post_id in post_ids:
+                        self._pending[post_id].update(dict(deltas))
+            raise
+
+        invalidate_posts(list(pending))
+        return len(pending)
+
+
+counter_buffer = CounterBuffer()
+atexit.register(counter_buffer.close)
@@ -0,0 +1,176 @@
+"""
+팔로워 뉴스피드 fan-out 처리.
+
+- fan_out_to_followers: 참가(join) 이벤트처럼 가벼운 이벤트를 요청 안에서 바로 처리
+- FanoutTask 큐 + process_task: 매치 시작/종료처럼 참가자가 많은 이벤트를 워커에서 처리
+
+어느 쪽이든 팔로워 뉴스피드는 한 번의 쿼리로 조회하고 포스트는 bulk_create로 생성하며,
+이벤트당 NEWSFEED_FANOUT_MAX_FOLLOWERS명까지만 전달한다.
+생성된 포스트는 커밋 후 캐시된 타임라인 앞에 붙인다 (newsfeed.cache).
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from newsfeed.cache import push_posts
+from newsfeed.models.fanout import FanoutTask
+from newsfeed.models.match_post import MatchPost
+from newsfeed.models.newsfeed import Newsfeed, NewsfeedPost
+
+logger = logging.getLogger(__name__)
+
+
+def follower_newsfeeds(user_id):
+    """
+    user_id를 팔로우하는 유저들의 뉴스피드를 (newsfeed_id, user_id)로 반환하는 쿼리셋.
+    유저당 하나의 뉴스피드만 고르고 user_id 순으로 정렬해 커서 기반으로 이어서 읽을 수 있다.
+    """
+    return (
+        Newsfeed.objects.filter(user__following=user_id)
+        .order_by('user_id', 'id')
+        .distinct('user_id')
+        .values_list('id', 'user_id')
+    )
+
+
+def build_posts(newsfeed_ids, post_type, post_id, post_content):
+    return [
+        NewsfeedPost(
+            newsfeed_id=newsfeed_id,
+            post_type=post_type,
+            post_id=post_id,
+            post_content=post_content,
+        )
+        for newsfeed_id in newsfeed_ids
+    ]
+
+
+def fan_out_to_followers(user, post_type, post_id, post_content):
+    """
+    user의 팔로워 뉴스피드에 포스트를 바로 생성 (뉴스피드 조회 1회 + bulk_create 1회).
+    """
+    followers = follower_newsfeeds(user.id)[:settings.NEWSFEED_FANOUT_MAX_FOLLOWERS]
+    posts = build_posts([newsfeed_id for newsfeed_id, _ in followers], post_type, post_id, post_content)
+    posts = NewsfeedPost.objects.bulk_create(posts, batch_size=settings.NEWSFEED_FANOUT_BATCH_SIZE)
+    transaction.on_commit(lambda: push_posts(posts))
+    return posts
+
+
+def claim_tasks(limit, ids=None):
+    """
+    대기 중인 작업(또는 타임아웃된 실행 중 작업)을 limit개까지 가져와 running으로 표시.
+    여러 워커가 동시에 돌아도 같은 작업을 가져가지 않도록 SKIP LOCKED를 사용한다.
+    ids를 주면 그 작업들 중에서만 가져온다 (이미 다른 워커가 가져간 작업은 빠진다).
+    반환하는 작업의 status/started_at/attempts는 DB에 기록한 값과 같다 (재시도 상한 판단에 사용).
+    """
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=settings.NEWSFEED_FANOUT_TASK_TIMEOUT)
+    queryset = FanoutTask.objects.select_for_update(skip_locked=True)
+    if ids is not None:
+        queryset = queryset.filter(pk__in=list(ids))
+    with transaction.atomic():
+        tasks = list(queryset.filter(status='pending').order_by('created_at')[:limit])
+        if len(tasks) < limit:
+            tasks += list(
+                queryset.filter(status='running', started_at__lt=stale_before)
+                .order_by('created_at')[:limit - len(tasks)]
+            )
+        FanoutTask.objects.filter(pk__in=[task.pk for task in tasks]).update(
+            status='running', started_at=now, attempts=F('attempts') + 1
+        )
+    for task in tasks:
+        task.status, task.started_at, task.attempts = 'running', now, task.attempts + 1
+    return tasks
+
+
+def process_task(task):
+    """
+    작업 하나를 처리. 팔로워 뉴스피드를 NEWSFEED_FANOUT_BATCH_SIZE 단위로 읽어
+    배치마다 한 트랜잭션에서 bulk_create 하고 커서를 저장한다.
+    커서 저장은 이 워커가 가져간 그대로일 때만(started_at이 같을 때) 반영되고 started_at을 갱신(heartbeat)하므로,
+    처리 중인 작업은 타임아웃으로 다시 가져가지지 않고, 이미 다른 워커가 가져간 작업이면 포스트를 만들지 않고 멈춘다.
+    """
+    batch_size = settings.NEWSFEED_FANOUT_BATCH_SIZE
+    remaining = settings.NEWSFEED_FANOUT_MAX_FOLLOWERS - task.posts_created
+    cursor = task.cursor
+    created = 0
+
+    while remaining > 0:
+        batch = list(follower_newsfeeds(task.actor_id).filter(user_id__gt=cursor)[:min(batch_size, remaining)])
+        if not batch:
+            break
+
+        with transaction.atomic():
+            # 조건부 UPDATE가 작업 row를 잠그므로 이 배치가 커밋될 때까지 다른 워커가 가져갈 수 없다
+            heartbeat = timezone.now()
+            owned = FanoutTask.objects.filter(pk=task.pk, status='running', started_at=task.started_at).update(
+                cursor=batch[-1][1], posts_created=F('posts_created') + len(batch), started_at=heartbeat
+            )
+            if not owned:
+                logger.warning("newsfeed.fanout.claim_lost task=%s", task.pk)
+                return created
+            task.started_at = heartbeat
+            posts = NewsfeedPost.objects.bulk_create(build_posts(
+                [newsfeed_id for newsfeed_id, _ in batch], task.post_type, task.post_id, task.post_content
+            ))
+            if task.with_match_post:
+                MatchPost.objects.bulk_create([
+                    MatchPost(
+                        match_id=task.post_id,
+                        created_by_id=task.actor_id,
+                        post_content=task.post_content,
+                        newsfeed_post=post,
+                    )
+                    for post in posts
+                ])
+            transaction.on_commit(lambda posts=posts: push_posts(posts))
+            cursor = batch[-1][1]
+        created += len(posts)
+        remaining -= len(posts)
+
+    finished_at = timezone.now()
+    if not FanoutTask.objects.filter(pk=task.pk, status='running', started_at=task.started_at).update(
+        status='done', finished_at=finished_at
+    ):
+        logger.warning("newsfeed.fanout.claim_lost task=%s", task.pk)
+        return created
+    task.status = 'done'
+    task.cursor = cursor
+    task.finished_at = finished_at
+
+    # fan-out 지연 시간 메트릭 (적재 ~ 완료)
+    logger.info(
+        "newsfeed.fanout.lag_ms=%d task=%s post_type=%s post_id=%s posts=%d",
+        task.lag.total_seconds() * 1000, task.pk, task.post_type, task.post_id, created,
+    )
+    return created
+
+
+def process_tasks(tasks):
+    """작업 목록을 처리. 실패한 작업은 최대 시도 횟수까지 다시 pending으로 돌린다."""
+    processed = 0
+    for task in tasks:
+        try:
+            process_task(task)
+            processed += 1
+        except Exception as e:
+            logger.exception("newsfeed.fanout.failed task=%s", task.pk)
+            status = 'failed' if task.attempts >= settings.NEWSFEED_FANOUT_MAX_ATTEMPTS else 'pending'
+            # 그 사이 다른 워커가 가져간 작업이면 그 워커의 상태를 덮어쓰지 않는다
+            FanoutTask.objects.filter(pk=task.pk, started_at=task.started_at).update(status=status, last_error=str(e))
+    return processed
+
+
+def pending_lag():
+    """가장 오래 대기 중인 작업의 대기 시간 (대기 작업이 없으면 0)"""
+    oldest = (
+        FanoutTask.objects.filter(status__in=['pending', 'running'])
+        .order_by('created_at')
+        .values_list('created_at', flat=True)
+        .first()
+    )
+    return timezone.now() - oldest if oldest else timedelta(0)
@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from newsfeed.fanout import claim_tasks, pending_lag, process_tasks
+
+
+class Command(BaseCommand):
+    help = "Process queued newsfeed fan-out tasks"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch", type=int, default=10, help="Tasks claimed per poll")
+        parser.add_argument("--sleep", type=float, default=1.0, help="Seconds to wait when the queue is empty")
+        parser.add_argument("--once", action="store_true", help="Drain the queue once and exit")
+        parser.add_argument("--stats", action="store_true", help="Print the current fan-out lag and exit")
+
+    def handle(self, *args, **options):
+        if options["stats"]:
+            self.stdout.write(f"fan-out lag: {pending_lag().total_seconds():.3f}s")
+            return
+
+        while True:
+            tasks = claim_tasks(options["batch"])
+            if tasks:
+                processed = process_tasks(tasks)
+                self.stdout.write(f"Processed {processed}/{len(tasks)} fan-out tasks")
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS("Fan-out queue drained"))
@@ -0,0 +1,85 @@
+# Generated by Django 4.2.13 on 2026-10-18 09:12
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("newsfeed", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newsfeedpost",
+            name="post_content",
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name="FanoutTask",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "post_type",
+                    models.CharField(
+                        choices=[
+                            ("match", "Match Post"),
+                            ("league", "League Post"),
+                            ("tournament", "Tournament Post"),
+                            ("transfer", "Transfer Post"),
+                        ],
+                        max_length=50,
+                    ),
+                ),
+                ("post_id", models.IntegerField()),
+                ("post_content", models.TextField(blank=True, null=True)),
+                ("with_match_post", models.BooleanField(default=False)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("attempts", models.IntegerField(default=0)),
+                ("cursor", models.BigIntegerField(default=0)),
+                ("posts_created", models.IntegerField(default=0)),
+                ("last_error", models.TextField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "actor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="fanout_tasks",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["status", "created_at"],
+                        name="newsfeed_fa_status_b1f197_idx",
+                    )
+                ],
+            },
+        ),
+    ]
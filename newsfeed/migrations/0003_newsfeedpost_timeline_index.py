@@ -0,0 +1,19 @@
+# Generated by Django 4.2.13 on 2026-10-18 10:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("newsfeed", "0002_newsfeedpost_post_content_fanouttask"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="newsfeedpost",
+            index=models.Index(
+                fields=["newsfeed", "-created_at", "-id"],
+                name="newsfeed_ne_newsfee_5f38b0_idx",
+            ),
+        ),
+    ]
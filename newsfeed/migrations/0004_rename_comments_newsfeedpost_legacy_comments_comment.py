@@ -0,0 +1,67 @@
+# Generated by Django 4.2.13 on 2026-10-18 11:20
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("newsfeed", "0003_newsfeedpost_timeline_index"),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name="newsfeedpost",
+            old_name="comments",
+            new_name="legacy_comments",
+        ),
+        migrations.AddField(
+            model_name="newsfeedpost",
+            name="comment_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name="Comment",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("content", models.TextField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="comments",
+                        to="newsfeed.newsfeedpost",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="newsfeed_comments",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["post", "created_at"],
+                        name="newsfeed_co_post_id_b22a1c_idx",
+                    )
+                ],
+            },
+        ),
+    ]
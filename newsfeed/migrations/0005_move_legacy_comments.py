@@ -0,0 +1,70 @@
+# Generated by Django 4.2.13 on 2026-10-18 11:21
+
+import json
+
+from django.db import migrations, transaction
+
+BATCH_SIZE = 500
+
+
+def _content(comment):
+    return comment if isinstance(comment, str) else json.dumps(comment, ensure_ascii=False)
+
+
+def move_comments(apps, schema_editor):
+    """
+    JSON 댓글을 Comment 테이블로 옮긴다.
+    포스트를 id 순으로 BATCH_SIZE개씩 읽어 배치마다 한 트랜잭션에서 bulk_create 하므로
+    전체 댓글을 메모리에 올리지 않고, 중간에 실패해도 처리한 배치는 남는다.
+    """
+    NewsfeedPost = apps.get_model("newsfeed", "NewsfeedPost")
+    Comment = apps.get_model("newsfeed", "Comment")
+
+    posts = NewsfeedPost.objects.exclude(legacy_comments=[]).order_by("id")
+    last_id = 0
+    while True:
+        batch = list(posts.filter(id__gt=last_id).values_list("id", "legacy_comments")[:BATCH_SIZE])
+        if not batch:
+            break
+
+        with transaction.atomic():
+            Comment.objects.bulk_create(
+                [
+                    Comment(post_id=post_id, content=_content(comment))
+                    for post_id, comments in batch
+                    for comment in comments or []
+                ],
+                batch_size=1000,
+            )
+            NewsfeedPost.objects.bulk_update(
+                [
+                    NewsfeedPost(id=post_id, comment_count=len(comments or []), legacy_comments=[])
+                    for post_id, comments in batch
+                ],
+                ["comment_count", "legacy_comments"],
+            )
+        last_id = batch[-1][0]
+
+
+def restore_comments(apps, schema_editor):
+    NewsfeedPost = apps.get_model("newsfeed", "NewsfeedPost")
+    Comment = apps.get_model("newsfeed", "Comment")
+
+    post_ids = Comment.objects.order_by("post_id").values_list("post_id", flat=True).distinct()
+    for post_id in post_ids.iterator():
+        contents = list(Comment.objects.filter(post_id=post_id).order_by("created_at", "id").values_list("content", flat=True))
+        NewsfeedPost.objects.filter(id=post_id).update(legacy_comments=contents, comment_count=0)
+    Comment.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    # 배치마다 커밋하도록 마이그레이션 전체를 하나의 트랜잭션으로 묶지 않는다
+    atomic = False
+
+    dependencies = [
+        ("newsfeed", "0004_rename_comments_newsfeedpost_legacy_comments_comment"),
+    ]
+
+    operations = [
+        migrations.RunPython(move_comments, restore_comments),
+    ]
@@ -0,0 +1,16 @@
+# Generated by Django 4.2.13 on 2026-10-18 11:22
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("newsfeed", "0005_move_legacy_comments"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="newsfeedpost",
+            name="legacy_comments",
+        ),
+    ]
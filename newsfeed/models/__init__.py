@@ -2,4 +2,6 @@ from .newsfeed import Newsfeed, NewsfeedPost
 from .match_post import MatchPost
 from .league_post import LeaguePost
 from .tournament_post import TournamentPost
-from .transfer_post import TransferPost
\ No newline at end of file
+from .transfer_post import TransferPost
+from .fanout import FanoutTask
+from .comment import Comment
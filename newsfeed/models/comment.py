@@ -0,0 +1,18 @@
+from django.db import models
+from newsfeed.models.newsfeed import NewsfeedPost
+
+
+class Comment(models.Model):
+    post = models.ForeignKey(NewsfeedPost, on_delete=models.CASCADE, related_name="comments")  # 댓글이 달린 뉴스피드 포스트
+    user = models.ForeignKey('accounts.User', on_delete=models.SET_NULL, null=True, blank=True, related_name="newsfeed_comments")  # 작성자 (기존 JSON 댓글은 작성자 정보 없음)
+    content = models.TextField()  # 댓글 내용
+    created_at = models.DateTimeField(auto_now_add=True)  # 작성 시간
+
+    class Meta:
+        indexes = [
+            # 포스트별 댓글 커서 페이지네이션용 인덱스
+            models.Index(fields=['post', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"Comment on post {self.post_id}"
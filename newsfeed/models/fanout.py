@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+
+from newsfeed.models.newsfeed import NewsfeedPost
+
+
+class FanoutTask(models.Model):
+    """
+    팔로워 뉴스피드에 포스트를 뿌리는(fan-out) 작업 큐.
+    요청 스레드에서는 작업만 적재하고, 실제 포스트 생성은 워커(process_fanout_tasks)가 처리한다.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+
+    actor = models.ForeignKey('accounts.User', on_delete=models.CASCADE, related_name="fanout_tasks")  # 이 유저의 팔로워들에게 전달
+    post_type = models.CharField(max_length=50, choices=NewsfeedPost.NEWSFEED_POST_TYPES)
+    post_id = models.IntegerField()  # 연결된 포스트의 ID (Match, League, Tournament 등)
+    post_content = models.TextField(blank=True, null=True)
+    with_match_post = models.BooleanField(default=False)  # 팔로워마다 MatchPost도 함께 생성할지 여부
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.IntegerField(default=0)
+    cursor = models.BigIntegerField(default=0)  # 마지막으로 처리한 팔로워 user_id (재시도 시 이어서 처리)
+    posts_created = models.IntegerField(default=0)
+    last_error = models.TextField(blank=True, null=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)  # 적재 시간
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"Fan-out of {self.post_type} {self.post_id} for {self.actor_id} ({self.status})"
+
+    @property
+    def lag(self):
+        """적재부터 완료(또는 현재)까지 걸린 시간"""
+        return (self.finished_at or timezone.now()) - self.created_at
+
+    @classmethod
+    def enqueue(cls, tasks):
+        """
+        fan-out 작업을 한 번의 INSERT로 적재.
+        NEWSFEED_FANOUT_EAGER가 켜져 있으면 커밋 직후 현재 프로세스에서 바로 처리한다.
+        이때도 claim_tasks로 running 표시를 먼저 하고, 그 사이 워커가 가져간 작업은 처리하지 않는다.
+        """
+        tasks = cls.objects.bulk_create(tasks)
+        if tasks and settings.NEWSFEED_FANOUT_EAGER:
+            from newsfeed.fanout import claim_tasks, process_tasks
+
+            ids = [task.pk for task in tasks]
+            transaction.on_commit(lambda: process_tasks(claim_tasks(len(ids), ids=ids)))
+        return tasks
@@ -1,4 +1,6 @@
-from django.db import models
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import F
 
 # User 모델에 문자열 참조 방식 사용
 class Newsfeed(models.Model):
@@ -20,30 +22,56 @@ class NewsfeedPost(models.Model):
     newsfeed = models.ForeignKey(Newsfeed, on_delete=models.CASCADE, related_name="posts")
     post_type = models.CharField(max_length=50, choices=NEWSFEED_POST_TYPES)
     post_id = models.IntegerField()  # 연결된 포스트의 ID (Match, League, Tournament, Transfer 등)
+    post_content = models.TextField(blank=True, null=True)  # 뉴스피드에 표시될 문구
     created_at = models.DateTimeField(auto_now_add=True)
     pinned = models.BooleanField(default=False)
     likes = models.IntegerField(default=0)
-    comments = models.JSONField(default=list)
+    comment_count = models.IntegerField(default=0)  # 댓글 수 (Comment 테이블 비정규화)
     shares = models.IntegerField(default=0)
     edited_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # 타임라인 조회용 인덱스 (뉴스피드별 최신순 커서 페이지네이션)
+            models.Index(fields=['newsfeed', '-created_at', '-id']),
+        ]
+
     def __str__(self):
         return f"{self.post_type.capitalize()} Post in {self.newsfeed.user.username}'s newsfeed"
 
     def add_like(self):
         """좋아요 추가"""
-        self.likes += 1
-        self.save()
+        self.increment('likes')
 
-    def add_comment(self, comment):
-        """댓글 추가"""
-        self.comments.append(comment)
-        self.save()
+    def add_comment(self, user, content):
+        """댓글 추가 (Comment 생성과 댓글 수 증가를 한 트랜잭션에서)"""
+        with transaction.atomic():
+            comment = self.comments.create(user=user, content=content)
+            self.comment_count = F('comment_count') + 1
+            self.save(update_fields=['comment_count'])
+        self.refresh_from_db(fields=['comment_count'])
+        return comment
 
     def add_share(self):
         """공유 수 증가"""
-        self.shares += 1
-        self.save()
+        self.increment('shares')
+
+    def increment(self, field, amount=1):
+        """
+        카운터를 F()로 원자적으로 증가 (동시 요청에도 유실되지 않음).
+        NEWSFEED_COUNTER_BUFFER가 켜져 있으면 write-behind 버퍼에 모았다가 주기적으로 반영하고,
+        이 인스턴스의 값은 읽어온 값 + amount로만 갱신한다.
+        """
+        if settings.NEWSFEED_COUNTER_BUFFER:
+            from newsfeed.counters import counter_buffer
+
+            counter_buffer.add(self.pk, field, amount)
+            setattr(self, field, getattr(self, field) + amount)
+            return
+
+        setattr(self, field, F(field) + amount)
+        self.save(update_fields=[field])
+        self.refresh_from_db(fields=[field])
 
     def edit_post(self, new_content):
         """포스트 수정 (여기서는 내용 수정 대신 수정 시간만 기록)"""
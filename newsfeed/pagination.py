@@ -0,0 +1,39 @@
+from rest_framework.pagination import CursorPagination
+
+
+class TimelinePagination(CursorPagination):
+    """
+    뉴스피드 타임라인 커서 페이지네이션.
+    (newsfeed, -created_at, -id) 인덱스를 그대로 타므로 몇 번째 페이지든 인덱스 범위 스캔으로 조회된다.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def paginate_cached(self, rows, request):
+        """
+        캐시에서 읽은 첫 페이지(직렬화된 포스트, 최대 page_size + 1개)를 paginate_queryset과 같은 상태로 설정.
+        다음 페이지 커서는 DB 조회와 동일하게 만들어지므로 두 번째 페이지부터는 DB에서 이어서 읽는다.
+        """
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.cursor = None
+        self.has_previous = False
+        self.has_next = len(rows) > self.page_size
+        if self.has_next:
+            self.next_position = self._get_position_from_instance(rows[self.page_size], self.ordering)
+        self.page = list(rows[:self.page_size])
+        return self.page
+
+
+class CommentPagination(CursorPagination):
+    """
+    포스트 댓글 커서 페이지네이션 (오래된 순).
+    (post, created_at) 인덱스를 타므로 댓글이 많은 포스트도 페이지마다 일정한 비용으로 조회된다.
+    """
+    ordering = ('created_at', 'id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from newsfeed.models.newsfeed import NewsfeedPost
+from newsfeed.models.comment import Comment
 from newsfeed.models.match_post import MatchPost
 from newsfeed.models.league_post import LeaguePost
 from newsfeed.models.tournament_post import TournamentPost
@@ -8,7 +9,12 @@ from newsfeed.models.transfer_post import TransferPost
 class NewsfeedPostSerializer(serializers.ModelSerializer):
     class Meta:
         model = NewsfeedPost
-        fields = ['id', 'newsfeed', 'post_type', 'post_id', 'created_at', 'likes', 'comments', 'shares']
+        fields = ['id', 'newsfeed', 'post_type', 'post_id', 'post_content', 'created_at', 'likes', 'comment_count', 'shares']
+
+class CommentSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Comment
+        fields = ['id', 'post', 'user', 'content', 'created_at']
 
 class MatchPostSerializer(serializers.ModelSerializer):
     newsfeed_post = NewsfeedPostSerializer()
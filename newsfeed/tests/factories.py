@@ -1,62 +1,29 @@
 import factory
-import factory.fuzzy
 
-from newsfeed.models import (
-    Comment,
-    CustomPost,
-    ImageAttachment,
-    Like,
-    TextAttachment,
-    VideoAttachment,
-)
+from newsfeed.models import Comment, Newsfeed, NewsfeedPost
 
 
-class CustomPostFactory(factory.django.DjangoModelFactory):
-    title = factory.Faker("sentence")
+class NewsfeedFactory(factory.django.DjangoModelFactory):
     user = factory.SubFactory("accounts.tests.factories.AccountFactory")
 
-    comments = factory.RelatedFactory(
-        "newsfeed.tests.factories.CommentFactory", "content_object"
-    )
-    likes = factory.RelatedFactory(
-        "newsfeed.tests.factories.LikeFactory", "content_object"
-    )
-
     class Meta:
-        model = CustomPost
+        model = Newsfeed
 
 
-class LikeFactory(factory.django.DjangoModelFactory):
-    user = factory.SubFactory("accounts.tests.factories.AccountFactory")
+class NewsfeedPostFactory(factory.django.DjangoModelFactory):
+    newsfeed = factory.SubFactory(NewsfeedFactory)
+    post_type = "match"
+    post_id = factory.Sequence(lambda n: n + 1)
+    post_content = factory.Faker("sentence")
 
     class Meta:
-        model = Like
+        model = NewsfeedPost
 
 
 class CommentFactory(factory.django.DjangoModelFactory):
+    post = factory.SubFactory(NewsfeedPostFactory)
     user = factory.SubFactory("accounts.tests.factories.AccountFactory")
     content = factory.Faker("text")
 
     class Meta:
         model = Comment
-
-
-class ImageAttachmentFactory(factory.django.DjangoModelFactory):
-    image = factory.django.ImageField()
-
-    class Meta:
-        model = ImageAttachment
-
-
-class VideoAttachmentFactory(factory.django.DjangoModelFactory):
-    video = factory.django.FileField()
-
-    class Meta:
-        model = VideoAttachment
-
-
-class TextAttachmentFactory(factory.django.DjangoModelFactory):
-    text = factory.Faker("text")
-
-    class Meta:
-        model = TextAttachment
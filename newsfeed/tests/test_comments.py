@@ -0,0 +1,40 @@
+from urllib.parse import parse_qs, urlparse
+
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from accounts.tests.factories import AccountFactory
+from newsfeed.tests.factories import NewsfeedPostFactory
+from newsfeed.views import CommentPostView
+
+
+class CommentPostViewTestCase(TestCase):
+    def setUp(self):
+        self.user = AccountFactory()
+        self.post = NewsfeedPostFactory(newsfeed__user=self.user)
+
+    def request(self, method, data=None):
+        request = getattr(APIRequestFactory(), method)(f"/newsfeed/posts/{self.post.id}/comments/", data)
+        force_authenticate(request, user=self.user)
+        return CommentPostView.as_view()(request, post_id=self.post.id)
+
+    def test_post_creates_comment_and_bumps_count(self):
+        self.post.add_comment(self.user, "first")
+
+        response = self.request("post", {"comment": "nice match"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["comments"], ["first", "nice match"])
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 2)
+
+    def test_get_pages_comments_oldest_first(self):
+        for i in range(3):
+            self.post.add_comment(self.user, f"comment {i}")
+
+        first = self.request("get", {"page_size": 2})
+        cursor = parse_qs(urlparse(first.data["next"]).query)["cursor"][0]
+        second = self.request("get", {"page_size": 2, "cursor": cursor})
+
+        self.assertEqual([c["content"] for c in first.data["results"]], ["comment 0", "comment 1"])
+        self.assertEqual([c["content"] for c in second.data["results"]], ["comment 2"])
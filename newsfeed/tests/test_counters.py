@@ -0,0 +1,96 @@
+import threading
+import time
+
+from django.db import connection
+from django.test import TransactionTestCase, override_settings
+
+from newsfeed.counters import CounterBuffer, counter_buffer
+from newsfeed.models import NewsfeedPost
+from newsfeed.tests.factories import NewsfeedPostFactory
+
+THREADS = 8
+PER_THREAD = 10
+
+
+class CounterTestCase(TransactionTestCase):
+    def setUp(self):
+        self.post = NewsfeedPostFactory()
+        self.user = self.post.newsfeed.user
+
+    def tearDown(self):
+        # flush 스레드가 다음 테스트까지 살아남아 다른 테스트의 DB에 반영하지 않도록 멈춘다
+        counter_buffer.close()
+
+    def run_in_parallel(self, action):
+        barrier = threading.Barrier(THREADS)
+
+        def worker(i):
+            try:
+                # 스레드마다 각자 읽어온 인스턴스로 동시에 갱신
+                post = NewsfeedPost.objects.get(pk=self.post.pk)
+                barrier.wait()
+                for j in range(PER_THREAD):
+                    action(post, i, j)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_parallel_likes_and_shares_are_not_lost(self):
+        self.run_in_parallel(lambda post, i, j: (post.add_like(), post.add_share()))
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes, THREADS * PER_THREAD)
+        self.assertEqual(self.post.shares, THREADS * PER_THREAD)
+
+    def test_parallel_comments_are_not_lost(self):
+        self.run_in_parallel(lambda post, i, j: post.add_comment(self.user, f"{i}-{j}"))
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, THREADS * PER_THREAD)
+        self.assertEqual(self.post.comments.count(), THREADS * PER_THREAD)
+
+    @override_settings(
+        NEWSFEED_COUNTER_BUFFER=True, NEWSFEED_COUNTER_FLUSH_INTERVAL=3600, NEWSFEED_COUNTER_MAX_PENDING=1000
+    )
+    def test_buffered_likes_are_coalesced_then_flushed(self):
+        counter_buffer.flush()
+        self.run_in_parallel(lambda post, i, j: post.add_like())
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes, 0)
+
+        with self.assertNumQueries(1):
+            counter_buffer.flush()
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes, THREADS * PER_THREAD)
+
+    @override_settings(NEWSFEED_COUNTER_BUFFER=True, NEWSFEED_COUNTER_FLUSH_INTERVAL=0.05, NEWSFEED_COUNTER_MAX_PENDING=1000)
+    def test_background_thread_flushes_without_further_requests(self):
+        buffer = CounterBuffer()
+        self.addCleanup(buffer.close)
+        buffer.add(self.post.pk, "likes")
+
+        for _ in range(100):  # 최대 5초
+            self.post.refresh_from_db()
+            if self.post.likes:
+                break
+            time.sleep(0.05)
+        self.assertEqual(self.post.likes, 1)
+
+    @override_settings(NEWSFEED_COUNTER_BUFFER=True, NEWSFEED_COUNTER_FLUSH_INTERVAL=3600, NEWSFEED_COUNTER_MAX_PENDING=1000)
+    def test_close_stops_the_thread_and_flushes(self):
+        buffer = CounterBuffer()
+        buffer.add(self.post.pk, "likes")
+        flusher = buffer._flusher
+
+        self.assertEqual(buffer.close(), 1)
+
+        self.assertFalse(flusher.is_alive())
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes, 1)
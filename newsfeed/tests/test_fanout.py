@@ -0,0 +1,25 @@
+from django.test import TestCase, override_settings
+
+from accounts.tests.factories import AccountFactory
+from newsfeed.fanout import fan_out_to_followers
+from newsfeed.models import NewsfeedPost
+from newsfeed.tests.factories import NewsfeedFactory
+
+
+class FanoutTestCase(TestCase):
+    def setUp(self):
+        self.author = AccountFactory()
+        NewsfeedFactory.create_batch(5, user__following=[self.author])
+
+    def test_fan_out_to_followers_with_one_read_and_one_write(self):
+        with self.assertNumQueries(2):
+            posts = fan_out_to_followers(self.author, "league", 1, "author joined the league.")
+
+        self.assertEqual(len(posts), 5)
+        self.assertEqual(NewsfeedPost.objects.filter(post_type="league", post_id=1).count(), 5)
+
+    @override_settings(NEWSFEED_FANOUT_MAX_FOLLOWERS=3)
+    def test_fan_out_to_followers_respects_cap(self):
+        posts = fan_out_to_followers(self.author, "league", 1, "author joined the league.")
+
+        self.assertEqual(len(posts), 3)
@@ -0,0 +1,123 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from accounts.tests.factories import AccountFactory
+from newsfeed.fanout import claim_tasks, process_task, process_tasks
+from newsfeed.models import FanoutTask, NewsfeedPost
+from newsfeed.tests.factories import NewsfeedFactory
+
+
+class FanoutQueueTestCase(TestCase):
+    def setUp(self):
+        self.author = AccountFactory()
+        for follower in AccountFactory.create_batch(5, following=[self.author]):
+            NewsfeedFactory(user=follower)
+
+    def task(self, **kwargs):
+        return FanoutTask(actor=self.author, post_type="tournament", post_id=7, post_content="author joined.", **kwargs)
+
+    def posts(self):
+        return NewsfeedPost.objects.filter(post_type="tournament", post_id=7).count()
+
+    @override_settings(NEWSFEED_FANOUT_EAGER=False)
+    def test_enqueue_only_stores_pending_tasks(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            [task] = FanoutTask.enqueue([self.task()])
+
+        task.refresh_from_db()
+        self.assertEqual((task.status, task.attempts), ("pending", 0))
+        self.assertEqual(self.posts(), 0)
+
+    def test_claim_marks_tasks_running_oldest_first(self):
+        first, second, done = FanoutTask.enqueue([self.task(), self.task(), self.task()])
+        FanoutTask.objects.filter(pk=first.pk).update(created_at=timezone.now() - timedelta(minutes=1))
+        FanoutTask.objects.filter(pk=done.pk).update(status="done")
+
+        [claimed] = claim_tasks(1)
+
+        self.assertEqual((claimed.pk, claimed.status, claimed.attempts), (first.pk, "running", 1))
+        self.assertEqual([task.pk for task in claim_tasks(10)], [second.pk])
+        self.assertEqual(claim_tasks(10), [])  # 실행 중이거나 끝난 작업은 가져가지 않는다
+
+    @override_settings(NEWSFEED_FANOUT_BATCH_SIZE=2)
+    def test_queued_task_is_processed_in_batches_then_done(self):
+        FanoutTask.enqueue([self.task()])
+
+        process_tasks(claim_tasks(10))
+
+        task = FanoutTask.objects.get()
+        self.assertEqual((task.status, task.attempts, task.posts_created), ("done", 1, 5))
+        self.assertEqual(self.posts(), 5)
+
+    def test_reprocessing_a_task_does_not_duplicate_posts(self):
+        [task] = FanoutTask.enqueue([self.task()])
+        process_tasks(claim_tasks(10))
+
+        FanoutTask.objects.filter(pk=task.pk).update(status="pending")
+        process_tasks(claim_tasks(10))
+
+        self.assertEqual(self.posts(), 5)
+
+    @override_settings(NEWSFEED_FANOUT_MAX_ATTEMPTS=2)
+    def test_failed_task_is_retried_up_to_max_attempts(self):
+        [task] = FanoutTask.enqueue([self.task()])
+
+        with mock.patch("newsfeed.fanout.process_task", side_effect=RuntimeError("boom")):
+            process_tasks(claim_tasks(10))
+            task.refresh_from_db()
+            self.assertEqual((task.status, task.attempts, task.last_error), ("pending", 1, "boom"))
+
+            process_tasks(claim_tasks(10))
+            task.refresh_from_db()
+            self.assertEqual((task.status, task.attempts), ("failed", 2))
+
+    def test_stale_running_task_is_claimed_again(self):
+        [task] = FanoutTask.enqueue([self.task()])
+        claim_tasks(10)
+        self.assertEqual(claim_tasks(10), [])  # 아직 타임아웃 전
+
+        FanoutTask.objects.filter(pk=task.pk).update(started_at=timezone.now() - timedelta(hours=1))
+        [reclaimed] = claim_tasks(10)
+
+        self.assertEqual((reclaimed.pk, reclaimed.attempts), (task.pk, 2))
+
+    @override_settings(NEWSFEED_FANOUT_BATCH_SIZE=2)
+    def test_worker_stops_when_its_claim_was_taken_over(self):
+        FanoutTask.enqueue([self.task()])
+        [slow] = claim_tasks(10)
+        FanoutTask.objects.filter(pk=slow.pk).update(started_at=timezone.now() - timedelta(hours=1))
+        [reclaimed] = claim_tasks(10)
+
+        self.assertEqual(process_task(slow), 0)
+        self.assertEqual(process_task(reclaimed), 5)
+
+        task = FanoutTask.objects.get()
+        self.assertEqual((task.status, task.posts_created), ("done", 5))
+        self.assertEqual(self.posts(), 5)
+
+    @override_settings(NEWSFEED_FANOUT_EAGER=True)
+    def test_eager_enqueue_processes_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            [task] = FanoutTask.enqueue([self.task()])
+
+        task.refresh_from_db()
+        self.assertEqual((task.status, task.attempts), ("done", 1))
+        self.assertEqual(self.posts(), 5)
+
+    @override_settings(NEWSFEED_FANOUT_EAGER=True)
+    def test_eager_enqueue_skips_tasks_claimed_by_a_worker(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            [task] = FanoutTask.enqueue([self.task()])
+        worker_tasks = claim_tasks(10)
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.posts(), 0)
+
+        process_tasks(worker_tasks)
+        task.refresh_from_db()
+        self.assertEqual(task.attempts, 1)
+        self.assertEqual(self.posts(), 5)
@@ -0,0 +1,51 @@
+from urllib.parse import parse_qs, urlparse
+
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from newsfeed.cache import get_timeline_ids, push_posts, timeline_cache
+from newsfeed.tests.factories import NewsfeedFactory, NewsfeedPostFactory
+from newsfeed.views import NewsfeedView
+
+
+class TimelineCacheTestCase(TestCase):
+    def setUp(self):
+        timeline_cache().clear()
+        self.newsfeed = NewsfeedFactory()
+        self.user = self.newsfeed.user
+        self.posts = [NewsfeedPostFactory(newsfeed=self.newsfeed, post_type="league", post_id=i) for i in range(5)]
+
+    def get_feed(self, **params):
+        request = APIRequestFactory().get("/newsfeed/", params)
+        force_authenticate(request, user=self.user)
+        return NewsfeedView.as_view()(request)
+
+    def test_warm_first_page_does_not_touch_the_database(self):
+        self.get_feed()
+
+        with self.assertNumQueries(0):
+            response = self.get_feed()
+
+        self.assertEqual(
+            [post["id"] for post in response.data["results"]],
+            [post.id for post in reversed(self.posts)],
+        )
+
+    def test_next_page_continues_from_the_cached_first_page(self):
+        first = self.get_feed(page_size=2)
+        cursor = parse_qs(urlparse(first.data["next"]).query)["cursor"][0]
+
+        second = self.get_feed(page_size=2, cursor=cursor)
+
+        self.assertEqual(
+            [post["id"] for post in second.data["results"]],
+            [self.posts[2].id, self.posts[1].id],
+        )
+
+    def test_push_posts_prepends_to_cached_timeline(self):
+        get_timeline_ids(self.newsfeed.id)
+        post = NewsfeedPostFactory(newsfeed=self.newsfeed, post_type="match", post_id=9)
+
+        push_posts([post])
+
+        self.assertEqual(get_timeline_ids(self.newsfeed.id)[0], post.id)
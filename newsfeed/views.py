@@ -1,73 +1,42 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 from django.shortcuts import get_object_or_404
-from django.db import models
-from django.contrib.gis.db.models.functions import Distance  # GeoDjango distance function for location-based queries
 
-from newsfeed.serializers import NewsfeedPostSerializer, MatchPostSerializer, LeaguePostSerializer, TournamentPostSerializer, TransferPostSerializer
+from newsfeed.cache import get_newsfeed_id, get_posts, get_timeline_ids, invalidate_posts, invalidate_timeline
+from newsfeed.models import LeaguePost, MatchPost, NewsfeedPost, TournamentPost, TransferPost
+from newsfeed.pagination import CommentPagination, TimelinePagination
+from newsfeed.serializers import CommentSerializer, NewsfeedPostSerializer, MatchPostSerializer, LeaguePostSerializer, TournamentPostSerializer, TransferPostSerializer
 
 
 class NewsfeedView(APIView):
     """
-    유저의 뉴스피드를 조회하는 뷰
+    유저의 뉴스피드를 조회하는 뷰.
+    팔로우한 유저/클럽/구장의 포스트는 작성 시점에 뉴스피드로 fan-out 되므로
+    읽을 때는 내 뉴스피드의 포스트만 최신순 커서 페이지네이션으로 가져온다.
+    첫 페이지는 타임라인 캐시에서 읽고, 커서가 있는 다음 페이지부터 DB에서 읽는다.
     """
+    permission_classes = [IsAuthenticated]
+
     def get(self, request):
-        user = request.user
-        try:
-            # 유저의 뉴스피드 가져오기
-            newsfeed = "newsfeed.Newsfeed".objects.get(user=user)
-        except "newsfeed.Newsfeed".DoesNotExist:
+        # 유저의 뉴스피드 가져오기
+        newsfeed_id = get_newsfeed_id(request.user.id)
+        if newsfeed_id is None:
             return Response({"error": "No newsfeed found for this user"}, status=status.HTTP_404_NOT_FOUND)
 
-        # 팔로우한 유저, 클럽, 그리고 스포츠 그라운드 가져오기
-        followed_users = user.following.all()
-        followed_clubs = user.followed_clubs.all()  # 팔로우한 클럽이 있다고 가정
-        followed_grounds = user.followed_grounds.all()  # 팔로우한 스포츠 그라운드 목록
-
-        # 위치 기반 필터링을 위한 위치 정보
-        user_location = user.location  # 유저의 위치 정보
-
-        # 관련된 뉴스피드 포스트 필터링
-        posts = "newsfeed.NewsfeedPost".objects.filter(
-            models.Q(creator=user) |  # 유저가 생성한 포스트
-            models.Q(creator__in=followed_users) |  # 유저가 팔로우한 사람이 생성한 포스트
-            models.Q(match__participants__user=user) |  # 유저가 참가한 매치 포스트
-            models.Q(match__participants__user__in=followed_users) |  # 팔로우한 사람이 참가한 매치 포스트
-            models.Q(league__participants__user=user) |  # 유저가 참가한 리그 포스트
-            models.Q(league__participants__user__in=followed_users) |  # 팔로우한 사람이 참가한 리그 포스트
-            models.Q(tournament__participants__user=user) |  # 유저가 참가한 토너먼트 포스트
-            models.Q(tournament__participants__user__in=followed_users) |  # 팔로우한 사람이 참가한 토너먼트 포스트
-            models.Q(match__participants__club__in=followed_clubs) |  # 팔로우한 클럽의 매치 포스트
-            models.Q(league__participants__club__in=followed_clubs) |  # 팔로우한 클럽의 리그 포스트
-            models.Q(tournament__participants__club__in=followed_clubs) |  # 팔로우한 클럽의 토너먼트 포스트
-            models.Q(match__sports_ground__in=followed_grounds)  # 팔로우한 스포츠 그라운드에서 일어나는 매치 포스트
-        ).distinct()
-
-        # 가까운 지역의 매치, 리그, 토너먼트 포스트 필터링
-        nearby_matches = "matchmaking.Match".objects.annotate(
-            distance=Distance('location', user_location)
-        ).filter(distance__lte=5000)  # 5km 이내의 매치
-        nearby_leagues = "leagues.League".objects.annotate(
-            distance=Distance('location', user_location)
-        ).filter(distance__lte=5000)  # 5km 이내의 리그
-        nearby_tournaments = "tournaments.Tournament".objects.annotate(
-            distance=Distance('location', user_location)
-        ).filter(distance__lte=5000)  # 5km 이내의 토너먼트
-
-        # 위치 기반의 포스트도 필터링된 posts에 포함
-        nearby_posts = "newsfeed.NewsfeedPost".objects.filter(
-            models.Q(match__in=nearby_matches) |
-            models.Q(league__in=nearby_leagues) |
-            models.Q(tournament__in=nearby_tournaments)
-        ).distinct()
-
-        # 최종 포스트 리스트: 필터링된 포스트 + 위치 기반 포스트
-        all_posts = posts.union(nearby_posts)
+        paginator = TimelinePagination()
+        if paginator.cursor_query_param not in request.query_params:
+            post_ids = get_timeline_ids(newsfeed_id)[:paginator.get_page_size(request) + 1]
+            page = paginator.paginate_cached(get_posts(post_ids, NewsfeedPostSerializer), request)
+            return paginator.get_paginated_response(page)
+
+        posts = NewsfeedPost.objects.filter(newsfeed_id=newsfeed_id)
+        page = paginator.paginate_queryset(posts, request, view=self)
 
         # 직렬화하여 응답 반환
-        serializer = NewsfeedPostSerializer(all_posts, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        serializer = NewsfeedPostSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
 
 
 class LikePostView(APIView):
@@ -75,23 +44,36 @@ class LikePostView(APIView):
     뉴스피드 포스트에 좋아요를 추가하는 뷰
     """
     def post(self, request, post_id):
-        post = get_object_or_404("newsfeed.NewsfeedPost", id=post_id)
+        post = get_object_or_404(NewsfeedPost, id=post_id)
         post.add_like()
+        invalidate_posts([post.id])
         return Response({"message": "Like added successfully", "likes": post.likes}, status=status.HTTP_200_OK)
 
 
 class CommentPostView(APIView):
     """
-    뉴스피드 포스트에 댓글을 추가하는 뷰
+    뉴스피드 포스트의 댓글을 조회(커서 페이지네이션)하거나 추가하는 뷰
     """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, post_id):
+        post = get_object_or_404(NewsfeedPost, id=post_id)
+        paginator = CommentPagination()
+        page = paginator.paginate_queryset(post.comments.all(), request, view=self)
+        serializer = CommentSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
     def post(self, request, post_id):
-        post = get_object_or_404("newsfeed.NewsfeedPost", id=post_id)
+        post = get_object_or_404(NewsfeedPost, id=post_id)
         comment = request.data.get('comment')
         if not comment:
             return Response({"error": "Comment content is required"}, status=status.HTTP_400_BAD_REQUEST)
         
-        post.add_comment(comment)
-        return Response({"message": "Comment added successfully", "comments": post.comments}, status=status.HTTP_200_OK)
+        post.add_comment(request.user, comment)
+        invalidate_posts([post.id])
+        # 기존 클라이언트와의 응답 형식 유지 (전체 댓글 내용 목록). 새 클라이언트는 GET으로 페이지 단위 조회
+        comments = list(post.comments.order_by('created_at', 'id').values_list('content', flat=True))
+        return Response({"message": "Comment added successfully", "comments": comments}, status=status.HTTP_200_OK)
 
 
 class SharePostView(APIView):
@@ -99,8 +81,9 @@ class SharePostView(APIView):
     뉴스피드 포스트를 공유하는 뷰
     """
     def post(self, request, post_id):
-        post = get_object_or_404("newsfeed.NewsfeedPost", id=post_id)
+        post = get_object_or_404(NewsfeedPost, id=post_id)
         post.add_share()
+        invalidate_posts([post.id])
         return Response({"message": "Post shared successfully", "shares": post.shares}, status=status.HTTP_200_OK)
 
 
@@ -109,18 +92,18 @@ class ViewPostDetailView(APIView):
     특정 포스트의 전체 화면 조회 (매치, 리그, 토너먼트, 트랜스퍼) 뷰
     """
     def get(self, request, post_id):
-        post = get_object_or_404("newsfeed.NewsfeedPost", id=post_id)
+        post = get_object_or_404(NewsfeedPost, id=post_id)
         if post.post_type == 'match':
-            match_post = get_object_or_404("newsfeed.MatchPost", newsfeed_post=post)
+            match_post = get_object_or_404(MatchPost, newsfeed_post=post)
             serializer = MatchPostSerializer(match_post)
         elif post.post_type == 'league':
-            league_post = get_object_or_404("newsfeed.LeaguePost", newsfeed_post=post)
+            league_post = get_object_or_404(LeaguePost, newsfeed_post=post)
             serializer = LeaguePostSerializer(league_post)
         elif post.post_type == 'tournament':
-            tournament_post = get_object_or_404("newsfeed.TournamentPost", newsfeed_post=post)
+            tournament_post = get_object_or_404(TournamentPost, newsfeed_post=post)
             serializer = TournamentPostSerializer(tournament_post)
         elif post.post_type == 'transfer':
-            transfer_post = get_object_or_404("newsfeed.TransferPost", newsfeed_post=post)
+            transfer_post = get_object_or_404(TransferPost, newsfeed_post=post)
             serializer = TransferPostSerializer(transfer_post)
         else:
             return Response({"error": "Invalid post type"}, status=status.HTTP_400_BAD_REQUEST)
@@ -133,7 +116,7 @@ class EditPostView(APIView):
     뉴스피드 포스트를 수정하는 뷰 (권한이 있는 경우)
     """
     def put(self, request, post_id):
-        post = get_object_or_404("newsfeed.NewsfeedPost", id=post_id)
+        post = get_object_or_404(NewsfeedPost, id=post_id)
         if post.newsfeed.user != request.user:
             return Response({"error": "You do not have permission to edit this post"}, status=status.HTTP_403_FORBIDDEN)
 
@@ -142,6 +125,7 @@ class EditPostView(APIView):
             return Response({"error": "Content is required"}, status=status.HTTP_400_BAD_REQUEST)
         
         post.edit_post(new_content)
+        invalidate_posts([post.id])
         return Response({"message": "Post edited successfully"}, status=status.HTTP_200_OK)
 
 
@@ -150,11 +134,13 @@ class DeletePostView(APIView):
     뉴스피드 포스트를 삭제하는 뷰 (권한이 있는 경우)
     """
     def delete(self, request, post_id):
-        post = get_object_or_404("newsfeed.NewsfeedPost", id=post_id)
+        post = get_object_or_404(NewsfeedPost, id=post_id)
         if post.newsfeed.user != request.user:
             return Response({"error": "You do not have permission to delete this post"}, status=status.HTTP_403_FORBIDDEN)
 
         post.delete()
+        invalidate_timeline(post.newsfeed_id)
+        invalidate_posts([post_id])
         return Response({"message": "Post deleted successfully"}, status=status.HTTP_200_OK)
 
 
@@ -163,18 +149,19 @@ class HidePostView(APIView):
     뉴스피드 포스트를 숨기는 뷰
     """
     def post(self, request, post_id):
-        post = get_object_or_404("newsfeed.NewsfeedPost", id=post_id)
+        post = get_object_or_404(NewsfeedPost, id=post_id)
         # 포스트를 숨기는 로직을 여기에 구현
         post.hidden = True
         post.save()
+        invalidate_posts([post.id])
         return Response({"message": "Post hidden successfully"}, status=status.HTTP_200_OK)
     
 # Match Post 상세 정보 조회
 class MatchPostDetailView(APIView):
     def get(self, request, post_id):
         try:
-            match_post = "newsfeed.MatchPost".objects.get(id=post_id)
-        except "newsfeed.MatchPost".DoesNotExist:
+            match_post = MatchPost.objects.select_related('newsfeed_post').get(id=post_id)
+        except MatchPost.DoesNotExist:
             return Response({"error": "Match post not found"}, status=status.HTTP_404_NOT_FOUND)
         
         serializer = MatchPostSerializer(match_post)
@@ -184,8 +171,8 @@ class MatchPostDetailView(APIView):
 class LeaguePostDetailView(APIView):
     def get(self, request, post_id):
         try:
-            league_post = "newsfeed.LeaguePost".objects.get(id=post_id)
-        except "newsfeed.LeaguePost".DoesNotExist:
+            league_post = LeaguePost.objects.select_related('newsfeed_post').get(id=post_id)
+        except LeaguePost.DoesNotExist:
             return Response({"error": "League post not found"}, status=status.HTTP_404_NOT_FOUND)
         
         serializer = LeaguePostSerializer(league_post)
@@ -195,8 +182,8 @@ class LeaguePostDetailView(APIView):
 class TournamentPostDetailView(APIView):
     def get(self, request, post_id):
         try:
-            tournament_post = "newsfeed.TournamentPost".objects.get(id=post_id)
-        except "newsfeed.TournamentPost".DoesNotExist:
+            tournament_post = TournamentPost.objects.select_related('newsfeed_post').get(id=post_id)
+        except TournamentPost.DoesNotExist:
             return Response({"error": "Tournament post not found"}, status=status.HTTP_404_NOT_FOUND)
         
         serializer = TournamentPostSerializer(tournament_post)
@@ -206,8 +193,8 @@ class TournamentPostDetailView(APIView):
 class TransferPostDetailView(APIView):
     def get(self, request, post_id):
         try:
-            transfer_post = "newsfeed.TransferPost".objects.get(id=post_id)
-        except "newsfeed.TransferPost".DoesNotExist:
+            transfer_post = TransferPost.objects.select_related('newsfeed_post').get(id=post_id)
+        except TransferPost.DoesNotExist:
             return Response({"error": "Transfer post not found"}, status=status.HTTP_404_NOT_FOUND)
         
         serializer = TransferPostSerializer(transfer_post)
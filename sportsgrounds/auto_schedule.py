@@ -0,0 +1,172 @@
+"""
+리그/토너먼트 대진을 빈 TimeSlot에 자동 배정 (sportsgrounds.scheduling을 모델과 연결).
+
+- 읽기: 배정할 대진, 팀 위치(선수 위치 평균), 팀/시설의 기존 일정, 빈 슬롯을 각각 쿼리 한 번으로 읽는다.
+- 쓰기: 고른 TimeSlot을 잠근 뒤 그사이 예약되지 않은 것만 예약하고, 두 팀 선수들의 MatchScheduleSlot을 만들고,
+  Match(구장/시설/시작 시각)와 대진(날짜/시간)을 bulk_update로 한 트랜잭션에 저장한다.
+"""
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.backends.postgresql.psycopg_any import DateTimeTZRange
+from django.db.models import Q
+from django.utils import timezone
+
+from matchmaking.models import Match, MatchScheduleSlot, TeamPlayer
+from sportsgrounds.models import TimeSlot
+from sportsgrounds.scheduling import DEFAULT_REST_GAP, Fixture, Schedule, Scheduler, Slot
+
+
+def day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def team_locations(teams):
+    """팀 -> 위치가 있는 선수들의 평균 (경도, 위도)"""
+    points = defaultdict(list)
+    rows = TeamPlayer.objects.filter(team_id__in=teams, user__location__isnull=False).values_list('team_id', 'user__location')
+    for team_id, location in rows:
+        points[team_id].append((location.x, location.y))
+    return {
+        team_id: (sum(x for x, _ in coords) / len(coords), sum(y for _, y in coords) / len(coords))
+        for team_id, coords in points.items()
+    }
+
+
+def team_busy_periods(teams, start, end):
+    """팀 -> [start, end)와 겹치는 기존 일정 (선수들의 매치 일정 + 이미 시간이 정해진 리그/토너먼트 대진)"""
+    from leagues.models import LeagueMatch
+    from tournaments.models import TournamentMatch
+
+    busy = defaultdict(list)
+    rows = MatchScheduleSlot.objects.filter(
+        user__teamplayer__team_id__in=teams, period__overlap=DateTimeTZRange(start, end, '[)')
+    ).values_list('user__teamplayer__team_id', 'period')
+    for team_id, period in rows:
+        busy[team_id].append((period.lower, period.upper))
+
+    for model in (LeagueMatch, TournamentMatch):
+        rows = model.objects.filter(
+            Q(home_team_id__in=teams) | Q(away_team_id__in=teams),
+            match__start_time__lt=end,
+            match__start_time__gte=start - timedelta(days=1),
+        ).values_list('home_team_id', 'away_team_id', 'match__start_time', 'match__duration')
+        for home, away, start_time, duration in rows:
+            busy[home].append((start_time, start_time + duration))
+            busy[away].append((start_time, start_time + duration))
+    return busy
+
+
+def free_slots(start, end):
+    """[start, end)에 시작하는 예약되지 않은 TimeSlot과, 그 시설에 이미 잡힌 매치 일정"""
+    rows = TimeSlot.objects.filter(is_reserved=False, start_time__gte=start, start_time__lt=end).values_list(
+        'id', 'facility_id', 'facility__sports_ground_id', 'start_time', 'end_time', 'facility__sports_ground__location'
+    )
+    slots = [
+        Slot(key=pk, facility=facility_id, venue=ground_id, start=start_time, end=end_time,
+             location=(location.x, location.y) if location else None)
+        for pk, facility_id, ground_id, start_time, end_time, location in rows
+    ]
+
+    facility_busy = defaultdict(list)
+    rows = Match.objects.filter(
+        facility_id__in={slot.facility for slot in slots},
+        start_time__lt=end,
+        start_time__gte=start - timedelta(days=1),
+    ).exclude(status='canceled').values_list('facility_id', 'start_time', 'duration')
+    for facility_id, start_time, duration in rows:
+        facility_busy[facility_id].append((start_time, start_time + duration))
+    return slots, facility_busy
+
+
+def schedule_fixtures(fixtures, start_date, deadline, rest_gap=DEFAULT_REST_GAP):
+    """
+    fixtures(LeagueMatch/TournamentMatch 쿼리셋, 배정 순서대로 정렬) 중 시간이 없는 대진을
+    start_date부터 deadline 당일까지의 빈 TimeSlot에 배정하고 Schedule을 반환.
+    """
+    pending = list(fixtures.filter(match__start_time__isnull=True).select_related('match'))
+    if not pending:
+        return Schedule()
+
+    not_before = max(timezone.now(), day_start(start_date))
+    until = day_start(deadline + timedelta(days=1))
+    teams = {team for fixture in pending for team in (fixture.home_team_id, fixture.away_team_id)}
+    slots, facility_busy = free_slots(not_before, until)
+    scheduler = Scheduler(
+        slots,
+        team_locations=team_locations(teams),
+        busy=team_busy_periods(teams, not_before - rest_gap, until + rest_gap),
+        facility_busy=facility_busy,
+        rest_gap=rest_gap,
+        not_before=not_before,
+        deadline=until,
+    )
+    schedule = scheduler.schedule([
+        Fixture(key=fixture.pk, home=fixture.home_team_id, away=fixture.away_team_id, duration=fixture.match.duration, order=order)
+        for order, fixture in enumerate(pending)
+    ])
+    save_schedule(pending, schedule)
+    return schedule
+
+
+def team_rosters(teams):
+    """팀 -> 선수 user id 집합"""
+    rosters = defaultdict(set)
+    for team_id, user_id in TeamPlayer.objects.filter(team_id__in=teams).values_list('team_id', 'user_id'):
+        rosters[team_id].add(user_id)
+    return rosters
+
+
+def reserve_players(fixture, slot, rosters):
+    """
+    두 팀 선수들의 일정(MatchScheduleSlot)을 만든다. 그사이 다른 매치에 참가해 겹치는 선수가 있으면
+    (배제 제약 위반) 이 대진의 일정만 되돌리고 False.
+    """
+    period = DateTimeTZRange(slot.start, slot.start + fixture.match.duration, '[)')
+    users = rosters[fixture.home_team_id] | rosters[fixture.away_team_id]
+    try:
+        with transaction.atomic():
+            MatchScheduleSlot.objects.bulk_create([
+                MatchScheduleSlot(user_id=user_id, match_id=fixture.match_id, period=period) for user_id in sorted(users)
+            ])
+    except IntegrityError:
+        return False
+    return True
+
+
+def save_schedule(fixtures, schedule):
+    """
+    배정 결과 저장. 배정하는 사이 다른 요청이 예약한 슬롯이나, 그사이 선수 일정이 겹치게 된 대진은 unscheduled로 돌린다.
+    """
+    if not schedule.assignments:
+        return
+    with transaction.atomic():
+        slot_ids = [slot.key for slot in schedule.assignments.values()]
+        available = set(
+            TimeSlot.objects.select_for_update().filter(pk__in=slot_ids, is_reserved=False).values_list('id', flat=True)
+        )
+        rosters = team_rosters({team for fixture in fixtures for team in (fixture.home_team_id, fixture.away_team_id)})
+
+        assigned = []
+        for fixture in fixtures:
+            slot = schedule.assignments.get(fixture.pk)
+            if slot is None:
+                continue
+            if slot.key not in available or not reserve_players(fixture, slot, rosters):
+                del schedule.assignments[fixture.pk]
+                schedule.unscheduled.append(
+                    Fixture(key=fixture.pk, home=fixture.home_team_id, away=fixture.away_team_id, duration=fixture.match.duration)
+                )
+                continue
+            local = timezone.localtime(slot.start)
+            fixture.match.sports_ground_id = slot.venue
+            fixture.match.facility_id = slot.facility
+            fixture.match.start_time = slot.start
+            fixture.match_date = local.date()
+            fixture.match_time = local.time()
+            assigned.append(fixture)
+
+        TimeSlot.objects.filter(pk__in=[schedule.assignments[fixture.pk].key for fixture in assigned]).update(is_reserved=True)
+        Match.objects.bulk_update([fixture.match for fixture in assigned], ['sports_ground', 'facility', 'start_time'])
+        type(fixtures[0]).objects.bulk_update(assigned, ['match_date', 'match_time'])
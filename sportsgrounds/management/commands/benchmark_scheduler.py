@@ -0,0 +1,78 @@
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from django.core.management.base import BaseCommand
+
+from leagues.scheduling import round_robin
+from sportsgrounds.scheduling import DEFAULT_REST_GAP, Fixture, Scheduler, Slot, distance_km
+
+CENTER = (126.9780, 37.5665)  # 서울
+SPREAD = 0.2  # 팀/구장 위치가 중심에서 흩어지는 정도 (도)
+SLOT_HOURS = (10, 12, 14, 16, 18, 20)  # 하루 슬롯 시작 시각
+
+
+class Command(BaseCommand):
+    help = "Benchmark the fixture auto-scheduler on a synthetic season (no database access)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--teams", type=int, default=40)
+        parser.add_argument("--venues", type=int, default=20)
+        parser.add_argument("--facilities", type=int, default=2, help="Facilities per venue")
+        parser.add_argument("--days", type=int, default=180, help="Season length")
+        parser.add_argument("--single", action="store_true", help="Single round robin instead of double")
+        parser.add_argument("--rest-hours", type=int, default=DEFAULT_REST_GAP.total_seconds() // 3600)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        start = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        duration = timedelta(hours=2)
+
+        def location():
+            return (CENTER[0] + rng.uniform(-SPREAD, SPREAD), CENTER[1] + rng.uniform(-SPREAD, SPREAD))
+
+        teams = list(range(options["teams"]))
+        team_locations = {team: location() for team in teams}
+        slots = []
+        for venue in range(options["venues"]):
+            venue_location = location()
+            for facility in range(options["facilities"]):
+                for day in range(options["days"]):
+                    for hour in SLOT_HOURS:
+                        slot_start = start + timedelta(days=day, hours=hour)
+                        slots.append(Slot(
+                            key=len(slots), facility=(venue, facility), venue=venue,
+                            start=slot_start, end=slot_start + duration, location=venue_location,
+                        ))
+        fixtures = [
+            Fixture(key=(round_number, home, away), home=home, away=away, duration=duration, order=round_number)
+            for round_number, round_fixtures in enumerate(round_robin(teams, double=not options["single"]))
+            for home, away in round_fixtures
+        ]
+
+        started = time.perf_counter()
+        scheduler = Scheduler(
+            slots,
+            team_locations=team_locations,
+            rest_gap=timedelta(hours=options["rest_hours"]),
+            not_before=start,
+            deadline=start + timedelta(days=options["days"]),
+        )
+        schedule = scheduler.schedule(fixtures)
+        elapsed = time.perf_counter() - started
+
+        travel = [
+            sum(distance_km(team_locations[team], slot.location) for team in (home, away))
+            for (_, home, away), slot in schedule.assignments.items()
+        ]
+        last = max((slot.start for slot in schedule.assignments.values()), default=start)
+        self.stdout.write(
+            f"{len(fixtures)} fixtures, {len(slots)} slots: "
+            f"{len(schedule.assignments)} scheduled ({schedule.repaired} by repair), {len(schedule.unscheduled)} unscheduled"
+        )
+        self.stdout.write(
+            f"season ends day {(last - start).days + 1}, "
+            f"mean travel {sum(travel) / max(len(travel), 1):.1f} km per fixture"
+        )
+        self.stdout.write(self.style.SUCCESS(f"Scheduled in {elapsed:.3f}s"))
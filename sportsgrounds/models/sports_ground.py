@@ -1,7 +1,9 @@
 from django.contrib.gis.db import models
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
 # User, Match, GroundReview는 문자열 참조로 처리
+from newsfeed.cache import push_posts
 from newsfeed.models.newsfeed import NewsfeedPost
 
 STATUS_CHOICES = [
@@ -68,13 +70,16 @@ class SportsGround(models.Model):
 
     def update_newsfeed_for_followers(self, user):
         matches = self.get_matches()
-        for match in matches:
-            NewsfeedPost.objects.create(
+        posts = NewsfeedPost.objects.bulk_create([
+            NewsfeedPost(
                 newsfeed=user.newsfeed,
                 post_type="match",
                 post_id=match.id,
                 post_content=f"New match scheduled at {self.name}."
             )
+            for match in matches
+        ])
+        transaction.on_commit(lambda: push_posts(posts))  # 팔로워의 캐시된 타임라인에도 반영
 
 
 class Booking(models.Model):
@@ -0,0 +1,247 @@
+"""
+리그/토너먼트 대진 자동 배정 (greedy + repair).
+
+- 대진은 순서(order, 리그는 라운드)대로 배정한다. 각 팀은 직전 경기 종료 + rest_gap 이후에만 다음 경기를 치르므로
+  라운드 순서가 유지된다.
+- 한 팀의 경기는 서로, 그리고 이미 잡힌 일정(busy)과 겹치거나 rest_gap보다 가깝게 붙지 않는다.
+  한 시설의 경기도 서로, 그리고 시설에 이미 잡힌 매치(facility_busy)와 겹치지 않는다.
+- 후보는 경기 시간이 들어가고 deadline 전에 끝나는 빈 슬롯이다. 그중 가장 이른 날짜를 고르고,
+  그날 슬롯 중에서는 두 팀 위치에서 구장까지 거리 합이 가장 작은 슬롯을 고른다.
+- greedy로 못 넣은 대진은 repair 단계에서 (1) 라운드 순서를 무시하고 아무 빈 슬롯에,
+  (2) 그래도 없으면 이미 배정된 대진 하나를 다른 빈 슬롯으로 옮기고 그 자리에 넣는다.
+  그래도 안 되면 unscheduled로 남긴다.
+
+DB 접근이 없는 순수 모듈이다. 모델과의 연결은 sportsgrounds.auto_schedule에서 한다.
+"""
+import math
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from operator import attrgetter
+
+DEFAULT_REST_GAP = timedelta(hours=24)  # 한 팀의 경기 사이 최소 휴식 시간
+MAX_REPAIR_MOVES = 200  # 대진 하나를 넣기 위해 옮겨 볼 기존 배정 수
+EARTH_RADIUS_KM = 6371.0
+
+
+@dataclass(frozen=True)
+class Fixture:
+    key: object  # LeagueMatch/TournamentMatch pk
+    home: object
+    away: object
+    duration: timedelta
+    order: int = 0  # 작을수록 먼저 배정
+
+    @property
+    def teams(self):
+        return (self.home, self.away)
+
+
+@dataclass(frozen=True)
+class Slot:
+    key: object  # TimeSlot pk
+    facility: object
+    start: datetime
+    end: datetime
+    venue: object = None  # SportsGround pk
+    location: tuple = None  # 구장 (경도, 위도)
+
+
+@dataclass
+class Schedule:
+    assignments: dict = field(default_factory=dict)  # Fixture.key -> Slot
+    unscheduled: list = field(default_factory=list)  # 배정하지 못한 Fixture
+    repaired: int = 0  # repair 단계에서 배정한 대진 수
+
+
+def distance_km(a, b):
+    """두 (경도, 위도) 사이 거리 (haversine)"""
+    lng1, lat1, lng2, lat2 = map(math.radians, (*a, *b))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(h))
+
+
+def merge_periods(periods):
+    """겹치는 (시작, 끝) 구간을 합친 정렬된 목록"""
+    merged = []
+    for start, end in sorted(periods):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class Scheduler:
+    """
+    slots: 배정할 수 있는 빈 Slot 목록
+    team_locations: 팀 -> (경도, 위도). 없는 팀은 거리 계산에서 빠진다
+    busy / facility_busy: 팀 / 시설 -> 이미 잡힌 (시작, 끝) 목록
+    not_before / deadline: 경기는 not_before 이후 시작해 deadline 전에 끝나야 한다
+    """
+
+    def __init__(self, slots, team_locations=None, busy=None, facility_busy=None,
+                 rest_gap=DEFAULT_REST_GAP, not_before=None, deadline=None, max_repair_moves=MAX_REPAIR_MOVES):
+        self.slots = sorted(slots, key=attrgetter('start'))
+        self.starts = [slot.start for slot in self.slots]
+        self.free = list(range(len(self.slots)))  # 빈 슬롯 인덱스 (시작 시각 순)
+        self.team_locations = team_locations or {}
+        self.rest_gap = rest_gap
+        self.not_before = not_before
+        self.deadline = deadline
+        self.max_repair_moves = max_repair_moves
+
+        self.occupant = {}  # 슬롯 인덱스 -> Fixture
+        self.placed = {}  # Fixture.key -> 슬롯 인덱스
+        self.ready = {}  # 팀 -> greedy 단계에서 다음 경기를 시작할 수 있는 가장 이른 시각
+        self.intervals = {}  # ('team' | 'facility', id) -> ([시작], [끝]) 시작 순
+        for team, periods in (busy or {}).items():
+            for start, end in merge_periods(periods):
+                self._add_interval(('team', team), start, end)
+        for facility, periods in (facility_busy or {}).items():
+            for start, end in merge_periods(periods):
+                self._add_interval(('facility', facility), start, end)
+
+    def schedule(self, fixtures):
+        pending = []
+        for fixture in sorted(fixtures, key=attrgetter('order')):
+            earliest = max(
+                [time for time in [self.not_before, *(self.ready.get(team) for team in fixture.teams)] if time],
+                default=None,
+            )
+            index = self._best(fixture, earliest)
+            if index is None:
+                pending.append(fixture)
+                continue
+            self._assign(fixture, index)
+            for team in fixture.teams:
+                self.ready[team] = self.slots[index].start + fixture.duration + self.rest_gap
+
+        schedule = Schedule()
+        for fixture in pending:
+            if self._repair(fixture):
+                schedule.repaired += 1
+            else:
+                schedule.unscheduled.append(fixture)
+        schedule.assignments = {key: self.slots[index] for key, index in self.placed.items()}
+        return schedule
+
+    def _best(self, fixture, earliest=None):
+        """earliest 이후 fixture를 넣을 수 있는 가장 이른 날의 빈 슬롯 중 이동 거리가 가장 짧은 슬롯 인덱스"""
+        day, candidates = None, []
+        position = bisect_left(self.free, bisect_left(self.starts, earliest)) if earliest else 0
+        while position < len(self.free):
+            index = self.free[position]
+            slot = self.slots[index]
+            if day is not None and slot.start.date() != day:
+                break
+            if self.deadline and slot.start + fixture.duration > self.deadline:
+                break  # 시작 시각 순이므로 이후 슬롯도 모두 늦다
+            position += 1
+            if not self._slot_fits(fixture, slot):
+                continue
+            blocked_until = self._team_blocked_until(fixture, slot)
+            if blocked_until is not None:
+                # 팀 일정이 끝날 때까지의 슬롯은 건너뛴다
+                if day is None:
+                    position = max(position, bisect_left(self.free, bisect_left(self.starts, blocked_until)))
+                continue
+            if self._is_free(('facility', slot.facility), slot.start, slot.start + fixture.duration, timedelta(0)):
+                day = slot.start.date()
+                candidates.append(index)
+        return min(candidates, key=lambda index: (self._travel(fixture, self.slots[index]), index), default=None)
+
+    def _repair(self, fixture):
+        index = self._best(fixture, self.not_before)
+        if index is not None:
+            self._assign(fixture, index)
+            return True
+
+        moves = 0
+        for index in sorted(self.occupant):
+            if moves >= self.max_repair_moves:
+                break
+            slot, other = self.slots[index], self.occupant[index]
+            if not self._slot_fits(fixture, slot):
+                continue
+            self._unassign(other)
+            if self._fits(fixture, slot):
+                moves += 1
+                self._assign(fixture, index)
+                alternative = self._best(other, self.not_before)
+                if alternative is not None:
+                    self._assign(other, alternative)
+                    return True
+                self._unassign(fixture)
+            self._assign(other, index)
+        return False
+
+    def _slot_fits(self, fixture, slot):
+        if slot.end - slot.start < fixture.duration:
+            return False
+        if self.not_before and slot.start < self.not_before:
+            return False
+        return not (self.deadline and slot.start + fixture.duration > self.deadline)
+
+    def _team_blocked_until(self, fixture, slot):
+        """slot에 두 팀 중 한 팀이라도 경기할 수 없으면 그 팀이 다시 경기할 수 있는 가장 이른 시각, 둘 다 가능하면 None"""
+        end = slot.start + fixture.duration
+        blocked = [self._blocked_until(('team', team), slot.start, end, self.rest_gap) for team in fixture.teams]
+        return max((time for time in blocked if time is not None), default=None)
+
+    def _fits(self, fixture, slot):
+        return (
+            self._slot_fits(fixture, slot)
+            and self._team_blocked_until(fixture, slot) is None
+            and self._is_free(('facility', slot.facility), slot.start, slot.start + fixture.duration, timedelta(0))
+        )
+
+    def _travel(self, fixture, slot):
+        if slot.location is None:
+            return 0
+        return sum(
+            distance_km(self.team_locations[team], slot.location) for team in fixture.teams if team in self.team_locations
+        )
+
+    def _blocked_until(self, resource, start, end, gap):
+        """[start, end)가 resource의 일정과 gap 안으로 붙으면 겹치는 일정의 끝 + gap, 아니면 None"""
+        starts, ends = self.intervals.get(resource, ((), ()))
+        # 구간은 서로 겹치지 않으므로 end + gap 전에 시작하는 마지막 구간만 확인하면 된다
+        index = bisect_left(starts, end + gap)
+        if index == 0 or ends[index - 1] + gap <= start:
+            return None
+        return ends[index - 1] + gap
+
+    def _is_free(self, resource, start, end, gap):
+        return self._blocked_until(resource, start, end, gap) is None
+
+    def _resources(self, fixture, index):
+        slot = self.slots[index]
+        end = slot.start + fixture.duration
+        for team in fixture.teams:
+            yield ('team', team), slot.start, end
+        yield ('facility', slot.facility), slot.start, end
+
+    def _assign(self, fixture, index):
+        del self.free[bisect_left(self.free, index)]
+        self.occupant[index] = fixture
+        self.placed[fixture.key] = index
+        for resource, start, end in self._resources(fixture, index):
+            self._add_interval(resource, start, end)
+
+    def _unassign(self, fixture):
+        index = self.placed.pop(fixture.key)
+        del self.occupant[index]
+        insort(self.free, index)
+        for resource, start, end in self._resources(fixture, index):
+            starts, ends = self.intervals[resource]
+            position = bisect_left(starts, start)
+            while ends[position] != end:
+                position += 1
+            del starts[position], ends[position]
+
+    def _add_interval(self, resource, start, end):
+        starts, ends = self.intervals.setdefault(resource, ([], []))
+        position = bisect_right(starts, start)
+        starts.insert(position, start)
+        ends.insert(position, end)
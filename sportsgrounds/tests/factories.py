@@ -0,0 +1,47 @@
+from datetime import timedelta
+
+import factory
+import factory.fuzzy
+from django.contrib.gis.geos import Point
+from django.utils import timezone
+
+from sportsgrounds.models import Booking, Facilities, SportsGround, TimeSlot
+
+
+class SportsGroundFactory(factory.django.DjangoModelFactory):
+    name = factory.Faker("company")
+    location = factory.LazyFunction(lambda: Point(126.9780, 37.5665, srid=4326))
+    description = factory.Faker("text")
+    owner = factory.SubFactory("accounts.tests.factories.AccountFactory")
+
+    class Meta:
+        model = SportsGround
+
+
+class FacilitiesFactory(factory.django.DjangoModelFactory):
+    sports_ground = factory.SubFactory(SportsGroundFactory)
+    facility_name = factory.Sequence(lambda n: f"Pitch {n}")
+    facility_description = factory.Faker("text")
+    facility_price = factory.fuzzy.FuzzyDecimal(0, 100000)
+
+    class Meta:
+        model = Facilities
+
+
+class TimeSlotFactory(factory.django.DjangoModelFactory):
+    facility = factory.SubFactory(FacilitiesFactory)
+    start_time = factory.Sequence(lambda n: timezone.now() + timedelta(hours=n + 1))
+    end_time = factory.LazyAttribute(lambda o: o.start_time + timedelta(hours=1))
+
+    class Meta:
+        model = TimeSlot
+
+
+class BookingFactory(factory.django.DjangoModelFactory):
+    time_slot = factory.SubFactory(TimeSlotFactory)
+    facility = factory.SelfAttribute("time_slot.facility")
+    sports_ground = factory.SelfAttribute("facility.sports_ground")
+    user = factory.SubFactory("accounts.tests.factories.AccountFactory")
+
+    class Meta:
+        model = Booking
@@ -0,0 +1,153 @@
+from datetime import date, datetime, timedelta, timezone
+
+from django.contrib.gis.geos import Point
+from django.test import SimpleTestCase, TestCase
+
+from leagues.models import LeagueMatch
+from leagues.scheduling import round_robin
+from leagues.tests.factories import LeagueFactory
+from matchmaking.models import MatchScheduleSlot
+from matchmaking.tests.factories import MatchFactory, TeamFactory, TeamPlayerFactory
+from sportsgrounds.auto_schedule import save_schedule
+from sportsgrounds.scheduling import Fixture, Schedule, Scheduler, Slot
+from sportsgrounds.tests.factories import FacilitiesFactory, SportsGroundFactory, TimeSlotFactory
+
+START = datetime(2026, 3, 1, tzinfo=timezone.utc)
+HOUR = timedelta(hours=1)
+
+
+def slot(key, hours, length=2, facility="A", location=None):
+    return Slot(key=key, facility=facility, start=START + hours * HOUR, end=START + (hours + length) * HOUR, location=location)
+
+
+def fixture(key, home, away, order=0, length=2):
+    return Fixture(key=key, home=home, away=away, duration=length * HOUR, order=order)
+
+
+class SchedulerTestCase(SimpleTestCase):
+    def test_keeps_rest_gap_and_round_order(self):
+        slots = [slot(day * 24 + hour, day * 24 + hour, facility=hour) for day in range(10) for hour in (10, 14, 18)]
+        fixtures = [
+            fixture((order, home, away), home, away, order=order)
+            for order, round_fixtures in enumerate(round_robin(range(4)))
+            for home, away in round_fixtures
+        ]
+
+        schedule = Scheduler(slots, rest_gap=timedelta(hours=24)).schedule(fixtures)
+
+        self.assertEqual(schedule.unscheduled, [])
+        by_team = {}
+        for (order, home, away), assigned in sorted(schedule.assignments.items()):
+            for team in (home, away):
+                if team in by_team:
+                    self.assertGreaterEqual(assigned.start - by_team[team], timedelta(hours=26))
+                by_team[team] = assigned.start
+        self.assertEqual(len({assigned.key for assigned in schedule.assignments.values()}), len(fixtures))
+
+    def test_prefers_nearest_venue_on_earliest_day(self):
+        slots = [
+            slot("far", 10, location=(127.5, 37.5)),
+            slot("near", 12, facility="B", location=(126.98, 37.57)),
+            slot("tomorrow", 34, facility="C", location=(126.97, 37.56)),
+        ]
+        locations = {"home": (126.97, 37.56), "away": (126.99, 37.57)}
+
+        schedule = Scheduler(slots, team_locations=locations).schedule([fixture(1, "home", "away")])
+
+        self.assertEqual(schedule.assignments[1].key, "near")
+
+    def test_respects_deadline_and_existing_commitments(self):
+        slots = [slot("busy", 10), slot("facility-taken", 14, facility="B"), slot("late", 48)]
+        scheduler = Scheduler(
+            slots,
+            busy={"home": [(START + 9 * HOUR, START + 12 * HOUR)]},
+            facility_busy={"B": [(START + 13 * HOUR, START + 15 * HOUR)]},
+            rest_gap=timedelta(0),
+            deadline=START + 24 * HOUR,
+        )
+
+        schedule = scheduler.schedule([fixture(1, "home", "away")])
+
+        self.assertEqual(schedule.assignments, {})
+        self.assertEqual([unscheduled.key for unscheduled in schedule.unscheduled], [1])
+
+    def test_repair_moves_an_assigned_fixture(self):
+        # 먼저 배정된 1시간 경기가 유일한 2시간 슬롯을 차지하면 repair가 짧은 슬롯으로 옮긴다
+        slots = [slot("long", 10, length=2), slot("short", 12, length=1, facility="B")]
+        fixtures = [fixture(1, "a", "b", order=0, length=1), fixture(2, "c", "d", order=1, length=2)]
+
+        schedule = Scheduler(slots).schedule(fixtures)
+
+        self.assertEqual(schedule.unscheduled, [])
+        self.assertEqual(schedule.repaired, 1)
+        self.assertEqual(schedule.assignments[1].key, "short")
+        self.assertEqual(schedule.assignments[2].key, "long")
+
+
+class LeagueAutoScheduleTestCase(TestCase):
+    def test_assigns_time_slots_and_updates_fixtures(self):
+        start = date.today() + timedelta(days=1)
+        league = LeagueFactory(max_teams=4, total_number_of_rounds=3, start_date=start, deadline=start + timedelta(days=6))
+        league.participants.set(TeamFactory.create_batch(4))
+        league.generate_schedule()
+        ground = SportsGroundFactory(location=Point(126.9780, 37.5665, srid=4326))
+        facility = FacilitiesFactory(sports_ground=ground)
+        for day in range(7):
+            for hour in (10, 14, 18):
+                slot_start = datetime.combine(start + timedelta(days=day), datetime.min.time(), timezone.utc) + hour * HOUR
+                TimeSlotFactory(facility=facility, start_time=slot_start, end_time=slot_start + league.match_duration)
+
+        schedule = league.auto_schedule()
+
+        self.assertEqual(schedule.unscheduled, [])
+        self.assertEqual(len(schedule.assignments), 6)
+        for league_match in LeagueMatch.objects.filter(league=league).select_related("match"):
+            self.assertEqual(league_match.match.facility_id, facility.id)
+            self.assertEqual(league_match.match.sports_ground_id, ground.id)
+            self.assertEqual(league_match.match_date, league_match.match.start_time.date())
+        self.assertEqual(facility.time_slots.filter(is_reserved=True).count(), 6)
+        self.assertEqual(league.auto_schedule().assignments, {})  # 이미 배정된 대진은 다시 배정하지 않는다
+
+    def test_creates_player_schedule_slots_for_assigned_fixtures(self):
+        start = date.today() + timedelta(days=1)
+        league = LeagueFactory(max_teams=2, total_number_of_rounds=1, start_date=start, deadline=start + timedelta(days=2))
+        teams = TeamFactory.create_batch(2)
+        players = [TeamPlayerFactory(team=team).user for team in teams for _ in range(2)]
+        league.participants.set(teams)
+        league.generate_schedule()
+        facility = FacilitiesFactory(sports_ground=SportsGroundFactory(location=Point(126.9780, 37.5665, srid=4326)))
+        slot_start = datetime.combine(start, datetime.min.time(), timezone.utc) + 10 * HOUR
+        TimeSlotFactory(facility=facility, start_time=slot_start, end_time=slot_start + league.match_duration)
+
+        schedule = league.auto_schedule()
+
+        self.assertEqual(len(schedule.assignments), 1)
+        match = LeagueMatch.objects.get(league=league).match
+        slots = MatchScheduleSlot.objects.filter(match=match)
+        self.assertCountEqual(slots.values_list("user_id", flat=True), [player.id for player in players])
+        for schedule_slot in slots:
+            self.assertEqual(schedule_slot.period.lower, match.start_time)
+            self.assertEqual(schedule_slot.period.upper, match.start_time + match.duration)
+
+    def test_leaves_fixture_unscheduled_when_player_schedule_overlaps(self):
+        start = date.today() + timedelta(days=1)
+        league = LeagueFactory(max_teams=2, total_number_of_rounds=1, start_date=start, deadline=start + timedelta(days=2))
+        teams = TeamFactory.create_batch(2)
+        player = TeamPlayerFactory(team=teams[0]).user
+        league.participants.set(teams)
+        league.generate_schedule()
+        facility = FacilitiesFactory(sports_ground=SportsGroundFactory(location=Point(126.9780, 37.5665, srid=4326)))
+        slot_start = datetime.combine(start, datetime.min.time(), timezone.utc) + 10 * HOUR
+        time_slot = TimeSlotFactory(facility=facility, start_time=slot_start, end_time=slot_start + league.match_duration)
+        league_match = LeagueMatch.objects.select_related("match").get(league=league)
+        # 배정을 계산한 뒤 저장하기 전에 선수가 같은 시간의 다른 매치에 참가한 경우
+        MatchScheduleSlot.objects.create(user=player, match=MatchFactory(), period=(slot_start, slot_start + HOUR))
+        assigned = Slot(key=time_slot.pk, facility=facility.pk, start=slot_start, end=time_slot.end_time, venue=facility.sports_ground_id)
+        schedule = Schedule(assignments={league_match.pk: assigned})
+
+        save_schedule([league_match], schedule)
+
+        self.assertEqual(schedule.assignments, {})
+        self.assertEqual(len(schedule.unscheduled), 1)
+        time_slot.refresh_from_db()
+        self.assertFalse(time_slot.is_reserved)
@@ -4,17 +4,23 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 from django.shortcuts import get_object_or_404
 from django.core.exceptions import ValidationError
+from django.db.models import Prefetch
 
+from matchmaking.models import Match, TeamPlayer
 from matchmaking.serializers import MatchSerializer
+from sportsgrounds.models import Booking, Facilities, SportsGround, TimeSlot
 from sportsgrounds.serializers import SportsGroundSerializer, BookingSerializer, TimeSlotSerializer, FacilitiesSerializer
 
+# BookingSerializer가 표시하는 관계 (타임슬롯의 시설 이름 포함)
+BOOKING_RELATED = ('sports_ground', 'facility', 'user', 'time_slot__facility')
+
 
 # 1. 스포츠 그라운드 조회
 class SportsGroundDetailView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, ground_id):
-        sports_ground = get_object_or_404("sportsgrounds.SportsGround", id=ground_id)
+        sports_ground = get_object_or_404(SportsGround.objects.select_related('owner'), id=ground_id)
         serializer = SportsGroundSerializer(sports_ground)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -27,8 +33,8 @@ class FacilityTimeSlotView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, facility_id):
-        facility = get_object_or_404("sportsgrounds.Facilities", id=facility_id)
-        time_slots = "sportsgrounds.TimeSlot".objects.filter(facility=facility)
+        facility = get_object_or_404(Facilities, id=facility_id)
+        time_slots = TimeSlot.objects.filter(facility=facility).select_related('facility').order_by('start_time')
         serializer = TimeSlotSerializer(time_slots, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -42,13 +48,13 @@ class CreateBookingView(APIView):
         facility_id = request.data.get('facility_id')
         time_slot_id = request.data.get('time_slot_id')
 
-        facility = get_object_or_404("sportsgrounds.Facilities", id=facility_id)
-        time_slot = get_object_or_404("sportsgrounds.TimeSlot", id=time_slot_id)
+        facility = get_object_or_404(Facilities, id=facility_id)
+        time_slot = get_object_or_404(TimeSlot, id=time_slot_id)
 
         if time_slot.is_reserved:
             return Response({"error": "This time slot is already reserved."}, status=status.HTTP_400_BAD_REQUEST)
 
-        booking = "sportsgrounds.Booking".objects.create(
+        booking = Booking.objects.create(
             sports_ground=facility.sports_ground,
             facility=facility,
             user=user,
@@ -64,7 +70,7 @@ class ManageBookingView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, booking_id, action):
-        booking = get_object_or_404("sportsgrounds.Booking", id=booking_id)
+        booking = get_object_or_404(Booking, id=booking_id)
         sports_ground = booking.sports_ground
 
         if not sports_ground.is_owner(request.user):
@@ -88,7 +94,7 @@ class CancelBookingView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, booking_id):
-        booking = get_object_or_404("sportsgrounds.Booking", id=booking_id)
+        booking = get_object_or_404(Booking, id=booking_id)
 
         if booking.user != request.user:
             return Response({"error": "You do not have permission to cancel this booking."}, status=status.HTTP_403_FORBIDDEN)
@@ -102,7 +108,7 @@ class FollowSportsGroundView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, ground_id):
-        sports_ground = get_object_or_404("sportsgrounds.SportsGround", id=ground_id)
+        sports_ground = get_object_or_404(SportsGround, id=ground_id)
         user = request.user
 
         if user in sports_ground.followers.all():
@@ -116,7 +122,7 @@ class UnfollowSportsGroundView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, ground_id):
-        sports_ground = get_object_or_404("sportsgrounds.SportsGround", id=ground_id)
+        sports_ground = get_object_or_404(SportsGround, id=ground_id)
         user = request.user
 
         if user in sports_ground.followers.all():
@@ -128,8 +134,8 @@ class UnfollowSportsGroundView(APIView):
 class FacilityListView(APIView):
     def get(self, request, ground_id):
         try:
-            sportsground = "sportsgrounds.SportsGround".objects.get(id=ground_id)
-        except "sportsgrounds.SportsGround".DoesNotExist:
+            sportsground = SportsGround.objects.get(id=ground_id)
+        except SportsGround.DoesNotExist:
             return Response({"error": "Sports ground not found"}, status=status.HTTP_404_NOT_FOUND)
         
         facilities = sportsground.facilities.all()
@@ -139,26 +145,29 @@ class FacilityListView(APIView):
 class SportsGroundMatchListView(APIView):
     def get(self, request, ground_id):
         try:
-            sportsground = "sportsgrounds.SportsGround".objects.get(id=ground_id)
-        except "sportsgrounds.SportsGround".DoesNotExist:
+            sportsground = SportsGround.objects.get(id=ground_id)
+        except SportsGround.DoesNotExist:
             return Response({"error": "Sports ground not found"}, status=status.HTTP_404_NOT_FOUND)
         
-        matches = "matchmaking.Match".objects.filter(sports_ground=sportsground)
+        # 참가자(유저 포함)는 매치 수와 관계없이 한 번에 가져온다
+        matches = Match.objects.filter(sports_ground=sportsground).select_related('league', 'tournament').prefetch_related(
+            Prefetch('participants', queryset=TeamPlayer.objects.select_related('user').order_by('id'))
+        ).order_by('start_time')
         serializer = MatchSerializer(matches, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
     
 #booking related views
 class BookingListView(APIView):
     def get(self, request):
-        bookings = "sportsgrounds.Booking".objects.all()
+        bookings = Booking.objects.select_related(*BOOKING_RELATED)
         serializer = BookingSerializer(bookings, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 class BookingDetailView(APIView):
     def get(self, request, booking_id):
         try:
-            booking = "sportsgrounds.Booking".objects.get(id=booking_id)
-        except "sportsgrounds.Booking".DoesNotExist:
+            booking = Booking.objects.select_related(*BOOKING_RELATED).get(id=booking_id)
+        except Booking.DoesNotExist:
             return Response({"error": "Booking not found"}, status=status.HTTP_404_NOT_FOUND)
         
         serializer = BookingSerializer(booking)
@@ -167,26 +176,26 @@ class BookingDetailView(APIView):
 class ConfirmBookingView(APIView):
     def post(self, request, booking_id):
         try:
-            booking = "sportsgrounds.Booking".objects.get(id=booking_id)
+            booking = Booking.objects.get(id=booking_id)
             booking.confirm_booking(request.user)
             return Response({"message": "Booking confirmed"}, status=status.HTTP_200_OK)
-        except "sportsgrounds.Booking".DoesNotExist:
+        except Booking.DoesNotExist:
             return Response({"error": "Booking not found"}, status=status.HTTP_404_NOT_FOUND)
 
 class DeclineBookingView(APIView):
     def post(self, request, booking_id):
         try:
-            booking = "sportsgrounds.Booking".objects.get(id=booking_id)
+            booking = Booking.objects.get(id=booking_id)
             booking.decline_booking(request.user)
             return Response({"message": "Booking declined"}, status=status.HTTP_200_OK)
-        except "sportsgrounds.Booking".DoesNotExist:
+        except Booking.DoesNotExist:
             return Response({"error": "Booking not found"}, status=status.HTTP_404_NOT_FOUND)
 
 class CancelBookingView(APIView):
     def post(self, request, booking_id):
         try:
-            booking = "sportsgrounds.Booking".objects.get(id=booking_id)
+            booking = Booking.objects.get(id=booking_id)
             booking.cancel_booking()
             return Response({"message": "Booking canceled"}, status=status.HTTP_200_OK)
-        except "sportsgrounds.Booking".DoesNotExist:
+        except Booking.DoesNotExist:
             return Response({"error": "Booking not found"}, status=status.HTTP_404_NOT_FOUND)
\ No newline at end of file
@@ -0,0 +1,186 @@
+"""
+토너먼트 대진표 (싱글/더블 엘리미네이션).
+
+- 대진표 크기는 팀 수 이상인 가장 작은 2의 거듭제곱이다. 1번 시드와 2번 시드가 결승에서 만나도록
+  표준 시드 배치를 쓰고, 팀 수를 넘는 시드 자리는 부전승(BYE)이 되어 상위 시드가 부전승을 받는다.
+- 각 경기(노드)는 (bracket, round, position)으로 식별하고, 두 자리는 시드 / 이전 경기의 승자 / 패자에서 온다.
+- 더블 엘리미네이션은 승자조 경기의 패자가 패자조로 내려가고, 승자조 우승자와 패자조 우승자가 그랜드 파이널을 치른다
+  (그랜드 파이널 한 경기로 끝나며 리셋 경기는 없다).
+- resolve는 결과가 나온 경기로부터 모든 노드의 상태를 계산한다. 부전승 노드는 경기 없이 바로 진출시키므로
+  실제 경기(TournamentMatch)는 두 자리에 모두 팀이 정해진 노드(READY)만 만들면 된다.
+
+DB 접근이 없는 순수 모듈이다.
+"""
+from dataclasses import dataclass
+
+BYE = None
+
+WINNERS = 'winners'
+LOSERS = 'losers'
+GRAND_FINAL = 'grand_final'
+
+# 노드 상태
+PENDING = 'pending'  # 앞 경기 결과를 기다리는 중
+READY = 'ready'  # 두 팀이 정해져 경기를 치러야 함
+DONE = 'done'  # 경기 결과가 나옴
+WALKOVER = 'walkover'  # 한쪽 이상이 부전승이라 경기 없이 끝남
+
+
+@dataclass(frozen=True)
+class Source:
+    kind: str  # 'seed' | 'winner' | 'loser'
+    ref: object  # 시드 번호(1부터) 또는 노드 키
+
+
+@dataclass(frozen=True)
+class NodeState:
+    status: str
+    home: object = BYE
+    away: object = BYE
+    winner: object = BYE
+    loser: object = BYE
+
+
+def bracket_size(team_count):
+    size = 1
+    while size < team_count:
+        size *= 2
+    return size
+
+
+def seed_positions(size):
+    """대진표 자리 순서대로의 시드 번호 (예: 8 -> [1, 8, 4, 5, 2, 7, 3, 6])"""
+    order = [1]
+    while len(order) < size:
+        count = len(order) * 2
+        order = [seed for top in order for seed in (top, count + 1 - top)]
+    return order
+
+
+def round_name(bracket, round_number, size):
+    """TournamentMatch.round_number에 저장하는 라운드 이름"""
+    if bracket == GRAND_FINAL:
+        return '그랜드 파이널'
+    if bracket == LOSERS:
+        return f'패자조 {round_number}라운드'
+    remaining = size >> (round_number - 1)
+    return '결승' if remaining == 2 else f'{remaining}강'
+
+
+def build(team_count, double=False):
+    """노드 키 -> (home Source, away Source). 앞 라운드 노드가 먼저 온다"""
+    size = bracket_size(team_count)
+    if size < 2:
+        return {}
+    winner_rounds = size.bit_length() - 1
+    nodes = {}
+
+    seeds = seed_positions(size)
+    for position in range(size // 2):
+        nodes[(WINNERS, 1, position)] = (Source('seed', seeds[2 * position]), Source('seed', seeds[2 * position + 1]))
+    for round_number in range(2, winner_rounds + 1):
+        for position in range(size >> round_number):
+            nodes[(WINNERS, round_number, position)] = (
+                Source('winner', (WINNERS, round_number - 1, 2 * position)),
+                Source('winner', (WINNERS, round_number - 1, 2 * position + 1)),
+            )
+    if not double:
+        return nodes
+
+    final = Source('winner', (WINNERS, winner_rounds, 0))
+    if winner_rounds == 1:
+        nodes[(GRAND_FINAL, 1, 0)] = (final, Source('loser', (WINNERS, 1, 0)))
+        return nodes
+
+    for position in range(size // 4):
+        nodes[(LOSERS, 1, position)] = (
+            Source('loser', (WINNERS, 1, 2 * position)),
+            Source('loser', (WINNERS, 1, 2 * position + 1)),
+        )
+    for dropped in range(2, winner_rounds + 1):
+        # 승자조 dropped 라운드의 패자가 내려오는 라운드. 바로 재대결하지 않도록 번갈아 순서를 뒤집는다
+        round_number = 2 * (dropped - 1)
+        count = size >> dropped
+        for position in range(count):
+            loser_position = count - 1 - position if dropped % 2 == 0 else position
+            nodes[(LOSERS, round_number, position)] = (
+                Source('winner', (LOSERS, round_number - 1, position)),
+                Source('loser', (WINNERS, dropped, loser_position)),
+            )
+        if dropped < winner_rounds:
+            for position in range(count // 2):
+                nodes[(LOSERS, round_number + 1, position)] = (
+                    Source('winner', (LOSERS, round_number, 2 * position)),
+                    Source('winner', (LOSERS, round_number, 2 * position + 1)),
+                )
+    nodes[(GRAND_FINAL, 1, 0)] = (final, Source('winner', (LOSERS, 2 * (winner_rounds - 1), 0)))
+    return nodes
+
+
+def round_count(nodes):
+    """가장 긴 경기 순서의 길이 (앞 경기가 모두 끝나야 치를 수 있는 라운드 수)"""
+    return max(node_depths(nodes).values(), default=0)
+
+
+def playable(nodes, team_count):
+    """
+    실제로 경기를 치르는 노드 키 목록.
+    부전승 여부는 경기 결과와 관계없이 팀 수로만 정해진다
+    (부전승 노드의 승자는 팀, 패자는 BYE이고 양쪽 모두 BYE인 노드는 승자도 BYE).
+    """
+    byes = {}  # 노드 키 -> (승자가 BYE인지, 패자가 BYE인지)
+
+    def is_bye(source):
+        if source.kind == 'seed':
+            return source.ref > team_count
+        winner_bye, loser_bye = byes[source.ref]
+        return winner_bye if source.kind == 'winner' else loser_bye
+
+    keys = []
+    for key, (home_source, away_source) in nodes.items():
+        home_bye, away_bye = is_bye(home_source), is_bye(away_source)
+        byes[key] = (home_bye and away_bye, home_bye or away_bye)
+        if not (home_bye or away_bye):
+            keys.append(key)
+    return keys
+
+
+def node_depths(nodes):
+    """노드 키 -> 앞 경기를 따라간 깊이 (첫 라운드가 1)"""
+    depth = {}
+    for key, sources in nodes.items():
+        depth[key] = 1 + max((depth[source.ref] for source in sources if source.kind != 'seed'), default=0)
+    return depth
+
+
+def resolve(nodes, seeds, results):
+    """
+    seeds: 시드 순서대로의 팀 목록 (seeds[0]이 1번 시드)
+    results: 노드 키 -> 승리 팀 (결과가 나온 경기)
+    반환: 노드 키 -> NodeState
+    """
+    states = {}
+
+    def team_from(source):
+        """(자리가 정해졌는지, 팀 또는 BYE)"""
+        if source.kind == 'seed':
+            return True, seeds[source.ref - 1] if source.ref <= len(seeds) else BYE
+        state = states[source.ref]
+        if state.status not in (DONE, WALKOVER):
+            return False, BYE
+        return True, state.winner if source.kind == 'winner' else state.loser
+
+    for key, (home_source, away_source) in nodes.items():
+        home_known, home = team_from(home_source)
+        away_known, away = team_from(away_source)
+
+        if not (home_known and away_known):
+            states[key] = NodeState(PENDING, home, away)
+        elif home is BYE or away is BYE:
+            states[key] = NodeState(WALKOVER, home, away, winner=home if away is BYE else away)
+        elif key in results:
+            winner = results[key]
+            states[key] = NodeState(DONE, home, away, winner=winner, loser=away if winner == home else home)
+        else:
+            states[key] = NodeState(READY, home, away)
+    return states
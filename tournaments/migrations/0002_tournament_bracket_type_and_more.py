@@ -0,0 +1,72 @@
+# Generated by Django 4.2.13 on 2026-10-18 19:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("matchmaking", "0016_alter_match_facility_and_more"),
+        ("tournaments", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tournament",
+            name="bracket_type",
+            field=models.CharField(
+                choices=[
+                    ("single_elimination", "Single Elimination"),
+                    ("double_elimination", "Double Elimination"),
+                ],
+                default="single_elimination",
+                max_length=50,
+            ),
+        ),
+        migrations.AddField(
+            model_name="tournamentmatch",
+            name="bracket",
+            field=models.CharField(
+                choices=[
+                    ("winners", "Winners"),
+                    ("losers", "Losers"),
+                    ("grand_final", "Grand Final"),
+                ],
+                default="winners",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="tournamentmatch",
+            name="bracket_position",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="tournamentmatch",
+            name="bracket_round",
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name="tournamentmatch",
+            name="winner",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="won_tournament_matches",
+                to="matchmaking.team",
+            ),
+        ),
+        migrations.AddField(
+            model_name="tournamentstatus",
+            name="seed",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name="tournamentmatch",
+            constraint=models.UniqueConstraint(
+                fields=("tournament", "bracket", "bracket_round", "bracket_position"),
+                name="tournaments_unique_bracket_node",
+            ),
+        ),
+    ]
@@ -0,0 +1,100 @@
+# Generated by Django 4.2.13 on 2026-10-18 20:16
+
+from collections import Counter
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+import django.db.models.deletion
+from django.utils import timezone
+
+from tournaments.bracket import bracket_size, build, node_depths, playable, round_name
+
+
+def backfill_rounds(apps, schema_editor):
+    """
+    대진표가 생성된 토너먼트(시드가 있는 팀)의 라운드별 실제 경기 수를 대진표로 계산하고,
+    이미 끝난 경기 수를 채운다.
+    """
+    Tournament = apps.get_model("tournaments", "Tournament")
+    TournamentStatus = apps.get_model("tournaments", "TournamentStatus")
+    TournamentMatch = apps.get_model("tournaments", "TournamentMatch")
+    TournamentRound = apps.get_model("tournaments", "TournamentRound")
+
+    team_counts = dict(
+        TournamentStatus.objects.filter(seed__isnull=False).values("tournament_id").annotate(teams=Count("id"))
+        .values_list("tournament_id", "teams")
+    )
+    completed = {
+        (row["tournament_id"], row["bracket"], row["bracket_round"]): row["completed"]
+        for row in TournamentMatch.objects.filter(bracket_position__isnull=False)
+        .values("tournament_id", "bracket", "bracket_round")
+        .annotate(completed=Count("id", filter=Q(match__status="completed")))
+    }
+    now = timezone.now()
+    rounds = []
+    for tournament in Tournament.objects.filter(pk__in=team_counts).only("pk", "bracket_type"):
+        team_count = team_counts[tournament.pk]
+        nodes = build(team_count, double=tournament.bracket_type == "double_elimination")
+        depths, size = node_depths(nodes), bracket_size(team_count)
+        keys = playable(nodes, team_count)
+        totals = Counter(key[:2] for key in keys)
+        stages = {key[:2]: depths[key] for key in keys}
+        for (bracket, round_number), total in totals.items():
+            done = completed.get((tournament.pk, bracket, round_number), 0)
+            rounds.append(TournamentRound(
+                tournament_id=tournament.pk,
+                bracket=bracket,
+                bracket_round=round_number,
+                name=round_name(bracket, round_number, size),
+                stage=stages[(bracket, round_number)],
+                total_matches=total,
+                completed_matches=done,
+                completed_at=now if done >= total else None,
+            ))
+    TournamentRound.objects.bulk_create(rounds, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tournaments", "0002_tournament_bracket_type_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TournamentRound",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("bracket", models.CharField(default="winners", max_length=20)),
+                ("bracket_round", models.PositiveSmallIntegerField()),
+                ("name", models.CharField(max_length=50)),
+                ("stage", models.PositiveSmallIntegerField()),
+                ("total_matches", models.PositiveIntegerField()),
+                ("completed_matches", models.PositiveIntegerField(default=0)),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "tournament",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rounds",
+                        to="tournaments.tournament",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="tournamentround",
+            constraint=models.UniqueConstraint(
+                fields=("tournament", "bracket", "bracket_round"),
+                name="tournaments_tournamentround_unique_round",
+            ),
+        ),
+        migrations.RunPython(backfill_rounds, migrations.RunPython.noop),
+    ]
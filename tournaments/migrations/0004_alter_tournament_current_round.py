@@ -0,0 +1,17 @@
+# Generated by Django 4.2.13 on 2026-10-18 22:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tournaments", "0003_tournamentround"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="tournament",
+            name="current_round",
+            field=models.CharField(default="16강", max_length=50),
+        ),
+    ]
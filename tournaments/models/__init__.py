@@ -1,2 +1,3 @@
 from .tournament import Tournament, TournamentStatus
-from .tournament_match import TournamentMatch
\ No newline at end of file
+from .tournament_match import TournamentMatch
+from .tournament_round import TournamentRound
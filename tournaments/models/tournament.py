@@ -1,9 +1,14 @@
 from django.core.exceptions import ValidationError
 from django.utils import timezone
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Avg
 
 # User, Match는 문자열로 참조
-from matchmaking.models.team import Team
+from matchmaking.models.team import Team, TeamPlayer
+from matchmaking.teams import player_rating
+from sportsgrounds.scheduling import DEFAULT_REST_GAP
+from tournaments.bracket import READY, bracket_size, build, node_depths, playable, resolve, round_count, round_name
+from newsfeed.cache import invalidate_posts, push_posts
 from newsfeed.models.newsfeed import NewsfeedPost
 from newsfeed.models.tournament_post import TournamentPost
 
@@ -18,11 +23,9 @@ class Tournament(models.Model):
         ('deadline_based', 'Deadline Based'),
     ]
     
-    ROUND_CHOICES = [
-        ('16강', 'Round of 16'),
-        ('8강', 'Quarterfinals'),
-        ('4강', 'Semifinals'),
-        ('결승', 'Final'),
+    BRACKET_TYPES = [
+        ('single_elimination', 'Single Elimination'),
+        ('double_elimination', 'Double Elimination'),
     ]
     
     organizer = models.ForeignKey('accounts.User', on_delete=models.CASCADE)  # 문자열 참조
@@ -35,53 +38,179 @@ class Tournament(models.Model):
     max_teams = models.IntegerField()  # 참가 팀 수
     start_date = models.DateField()  # 시작일
     deadline = models.DateField()  # 마감일
-    current_round = models.CharField(max_length=50, choices=ROUND_CHOICES, default='16강')  # 현재 라운드
+    # 현재 라운드 (tournaments.bracket.round_name: '32강', '패자조 N라운드', '그랜드 파이널' 등 대진표 크기에 따라 정해지므로 choices 없음)
+    current_round = models.CharField(max_length=50, default='16강')
     scheduling_type = models.CharField(max_length=50, choices=SCHEDULING_TYPES, default='organizer_based')
+    bracket_type = models.CharField(max_length=50, choices=BRACKET_TYPES, default='single_elimination')
     match_duration = models.DurationField()  # 경기 시간
     winning_method = models.ForeignKey('matchmaking.WinningMethod', on_delete=models.SET_NULL, null=True, blank=True)  # 문자열 참조
 
     def __str__(self):
         return self.tournament_name
 
+    def seed_teams(self, teams):
+        """
+        시드 순서대로 정렬한 팀 목록.
+        클럽 팀은 ClubStatistics, 개인 팀은 선수들의 UserStatistics 성과/매너 평균으로 점수를 매기고
+        (통계가 없으면 기본 점수), 같은 점수는 팀 id 순이다.
+        """
+        from clubs.models.club_statistics import ClubStatistics
+
+        club_ratings = {
+            row['club_id']: player_rating(row['performance'], row['manner'])
+            for row in ClubStatistics.objects.filter(club_id__in={team.club_id for team in teams if team.club_id})
+            .values('club_id').annotate(performance=Avg('performance'), manner=Avg('manner'))
+        }
+        team_ratings = {
+            row['team_id']: player_rating(row['performance'], row['manner'])
+            for row in TeamPlayer.objects.filter(team__in=teams)
+            .values('team_id').annotate(performance=Avg('user__userstatistics__performance'), manner=Avg('user__userstatistics__manner'))
+        }
+
+        def rating(team):
+            if team.club_id in club_ratings:
+                return club_ratings[team.club_id]
+            return team_ratings.get(team.id, player_rating())
+
+        return sorted(teams, key=lambda team: (-rating(team), team.id))
+
     def generate_bracket(self):
         """
-        토너먼트 대진표를 생성. 첫 라운드에서 팀들을 섞어 매치업을 구성.
+        토너먼트 대진표 생성 (tournaments.bracket).
+        참가 팀을 시드 순으로 배치하고 팀 수가 2의 거듭제곱이 아니면 상위 시드가 부전승을 받는다.
+        지금 치를 수 있는 경기만 만들고, 다음 라운드 경기는 앞 경기 결과가 나올 때 advance_bracket이 만든다.
         """
+        from tournaments.models.tournament_match import TournamentMatch
+        from tournaments.models.tournament_round import TournamentRound
+
         teams = list(self.participants.all())
-        if len(teams) != self.max_teams:
+        if len(teams) != self.max_teams or len(teams) < 2:
             raise ValidationError("참가 팀 수가 충분하지 않습니다.")
-        
-        num_teams = len(teams)
-        bracket = []
-        
-        while len(teams) > 1:
-            round_matches = []
-            for i in range(0, num_teams - 1, 2):
-                home_team = teams[i]
-                away_team = teams[i + 1]
-                match = models.get_model('matchmaking', 'Match').objects.create(  # Match를 문자열 참조
-                    home_team=home_team,
-                    away_team=away_team,
+        seeded = self.seed_teams(teams)
+
+        with transaction.atomic():
+            Tournament.objects.select_for_update().values_list('pk', flat=True).get(pk=self.pk)
+            if TournamentMatch.objects.filter(tournament=self).exists():
+                raise ValidationError("대진표가 이미 생성되었습니다.")
+
+            statuses = {status.team_id: status for status in TournamentStatus.objects.filter(tournament=self)}
+            for seed, team in enumerate(seeded, start=1):
+                statuses.setdefault(team.id, TournamentStatus(tournament=self, team=team)).seed = seed
+            TournamentStatus.objects.bulk_update([status for status in statuses.values() if status.pk], ['seed'])
+            TournamentStatus.objects.bulk_create([status for status in statuses.values() if not status.pk])
+
+            # 라운드별 실제 경기 수 (부전승 제외)는 팀 수만으로 정해지므로 라운드 완료 카운터를 미리 만든다
+            nodes = build(len(seeded), double=self.is_double_elimination)
+            depths, size = node_depths(nodes), bracket_size(len(seeded))
+            rounds = {}
+            for bracket, round_number, position in playable(nodes, len(seeded)):
+                rounds.setdefault((bracket, round_number), TournamentRound(
+                    tournament=self,
+                    bracket=bracket,
+                    bracket_round=round_number,
+                    name=round_name(bracket, round_number, size),
+                    stage=depths[(bracket, round_number, position)],
+                    total_matches=0,
+                )).total_matches += 1
+            ordered = sorted(rounds.values(), key=lambda round_: round_.stage)
+            TournamentRound.objects.bulk_create(ordered)
+
+            self.total_number_of_rounds = round_count(nodes)
+            self.current_round = ordered[0].name
+            self.save(update_fields=['total_number_of_rounds', 'current_round'])
+            return self.advance_bracket()
+
+    @property
+    def is_double_elimination(self):
+        return self.bracket_type == 'double_elimination'
+
+    def advance_bracket(self):
+        """
+        결과가 나온 경기로 대진표를 다시 계산해, 두 팀이 정해졌는데 아직 경기가 없는 자리의
+        Match/TournamentMatch를 만든다 (각각 INSERT 한 번). 새로 만든 TournamentMatch 목록을 반환.
+        """
+        from matchmaking.models.match import Match
+        from tournaments.models.tournament_match import TournamentMatch
+
+        with transaction.atomic():
+            # 동시에 결과가 들어와도 같은 자리의 경기를 두 번 만들지 않도록 토너먼트 row를 잠근다
+            Tournament.objects.select_for_update().values_list('pk', flat=True).get(pk=self.pk)
+            seeds = list(
+                TournamentStatus.objects.filter(tournament=self, seed__isnull=False).order_by('seed').values_list('team_id', flat=True)
+            )
+            existing = {
+                (bracket, round_number, position): winner_id
+                for bracket, round_number, position, winner_id in TournamentMatch.objects.filter(
+                    tournament=self, bracket_position__isnull=False
+                ).values_list('bracket', 'bracket_round', 'bracket_position', 'winner_id')
+            }
+            states = resolve(
+                build(len(seeds), double=self.is_double_elimination),
+                seeds,
+                {key: winner_id for key, winner_id in existing.items() if winner_id is not None},
+            )
+            ready = [key for key, state in states.items() if state.status == READY and key not in existing]
+            if not ready:
+                return []
+
+            matches = Match.objects.bulk_create([
+                Match(
+                    tournament=self,
                     match_type='tournament',
                     status='scheduled',
+                    creator_id=self.organizer_id,
+                    price=0,
                     duration=self.match_duration,
-                    winning_method=self.winning_method
+                    total_spots=0,
+                    winning_method=self.winning_method,
                 )
-                round_matches.append(match)
-            bracket.append(round_matches)
-            teams = teams[:num_teams // 2]  # 다음 라운드를 위해 팀을 절반으로 줄임
+                for _ in ready
+            ])
+            size = bracket_size(len(seeds))
+            return TournamentMatch.objects.bulk_create([
+                TournamentMatch(
+                    tournament=self,
+                    match=match,
+                    home_team_id=states[key].home,
+                    away_team_id=states[key].away,
+                    round_number=round_name(key[0], key[1], size),
+                    bracket=key[0],
+                    bracket_round=key[1],
+                    bracket_position=key[2],
+                )
+                for match, key in zip(matches, ready)
+            ])
+
+    def auto_schedule(self, rest_gap=DEFAULT_REST_GAP):
+        """
+        시간/장소가 없는 토너먼트 매치를 생성 순서대로 start_date~deadline 사이 빈 TimeSlot에 배정.
+        팀 경기 사이에는 rest_gap 이상 쉬고, 가까운 구장을 우선한다 (sportsgrounds.auto_schedule).
+        """
+        from tournaments.models.tournament_match import TournamentMatch
+        from sportsgrounds.auto_schedule import schedule_fixtures
 
-        return bracket
+        fixtures = TournamentMatch.objects.filter(tournament=self).order_by('id')
+        return schedule_fixtures(fixtures, self.start_date, self.deadline, rest_gap)
 
     def advance_round(self):
         """
-        현재 라운드를 마친 후 다음 라운드를 진행.
+        라운드가 끝났을 때 (TournamentRound.record_completion이 True를 반환한 트랜잭션에서 한 번) 호출.
+        끝나지 않은 가장 앞 라운드로 current_round를 옮기고, 모든 라운드가 끝났으면 토너먼트 완료 포스트를 남긴다.
+        반환: 토너먼트가 끝났으면 True
         """
-        if self.current_round < self.total_number_of_rounds:
-            self.current_round += 1
-        else:
-            raise ValidationError("토너먼트가 이미 종료되었습니다.")
-        self.save()
+        next_round = self.rounds.filter(completed_at__isnull=True).order_by('stage', 'id').values_list('name', flat=True).first()
+        if next_round is None:
+            self.update_tournament_post_on_completion()
+            return True
+        if next_round != self.current_round:
+            self.update_tournament_post_on_round_completion()
+            Tournament.objects.filter(pk=self.pk).update(current_round=next_round)
+            self.current_round = next_round
+        return False
+
+    @property
+    def is_finished(self):
+        return self.rounds.exists() and not self.rounds.filter(completed_at__isnull=True).exists()
 
     def validate_join(self, user):
         """
@@ -107,6 +236,7 @@ class Tournament(models.Model):
             post_id=self.id,
             post_content=f"Tournament {self.tournament_name} has been created! Join now!"
         )
+        transaction.on_commit(lambda: push_posts([newsfeed_post]))  # 주최자의 캐시된 타임라인에도 반영
 
         # 토너먼트 포스트 생성
         TournamentPost.objects.create(
@@ -129,17 +259,20 @@ class Tournament(models.Model):
         """
         각 라운드가 완료되었을 때 뉴스피드 포스트 업데이트
         """
-        newsfeed_post = NewsfeedPost.objects.get(post_id=self.id, post_type="tournament")
-        newsfeed_post.post_content = f"Round {self.current_round} of Tournament {self.tournament_name} is now complete!"
-        newsfeed_post.save()
+        self.update_tournament_post(f"Round {self.current_round} of Tournament {self.tournament_name} is now complete!")
 
     def update_tournament_post_on_completion(self):
         """
         토너먼트가 완료되었을 때 최종 결과를 뉴스피드 포스트로 업데이트
         """
-        newsfeed_post = NewsfeedPost.objects.get(post_id=self.id, post_type="tournament")
-        newsfeed_post.post_content = f"Tournament {self.tournament_name} has been completed! Congratulations to the winners!"
-        newsfeed_post.save()
+        self.update_tournament_post(f"Tournament {self.tournament_name} has been completed! Congratulations to the winners!")
+
+    def update_tournament_post(self, content):
+        # 팔로워에게 fan-out된 포스트와 post_id가 같으므로 주최자 뉴스피드의 포스트만 갱신
+        posts = NewsfeedPost.objects.filter(newsfeed__user=self.organizer_id, post_id=self.id, post_type="tournament")
+        post_ids = list(posts.values_list('id', flat=True))
+        posts.update(post_content=content)
+        invalidate_posts(post_ids)
 
 # TournamentStatus 모델
 class TournamentStatus(models.Model):
@@ -153,6 +286,7 @@ class TournamentStatus(models.Model):
     tournament = models.ForeignKey(Tournament, on_delete=models.CASCADE)
     team = models.ForeignKey(Team, on_delete=models.CASCADE)
     current_round = models.CharField(max_length=50, choices=ROUND_CHOICES, default='16강')  # 선택 가능한 라운드
+    seed = models.PositiveIntegerField(null=True, blank=True)  # 대진표 시드 (1이 최상위, generate_bracket에서 정함)
     advancement_status = models.CharField(max_length=50, choices=[
         ('in_progress', 'In Progress'),
         ('eliminated', 'Eliminated'),
@@ -1,12 +1,18 @@
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
-from django.db import models
+from django.db import models, transaction
 from .tournament import Tournament
 from matchmaking.models.match import Match
 from matchmaking.models.team import Team
 
 class TournamentMatch(models.Model):
+    BRACKET_CHOICES = [
+        ('winners', 'Winners'),
+        ('losers', 'Losers'),
+        ('grand_final', 'Grand Final'),
+    ]
+
     tournament = models.ForeignKey(Tournament, on_delete=models.CASCADE)
     match = models.ForeignKey(Match, on_delete=models.CASCADE)
     home_team = models.ForeignKey(Team, related_name="home_tournament_matches", on_delete=models.CASCADE)
@@ -15,9 +21,36 @@ class TournamentMatch(models.Model):
     match_date = models.DateField(null=True, blank=True)
     match_time = models.TimeField(null=True, blank=True)
     is_knockout_stage = models.BooleanField(default=True)  # 토너먼트는 기본적으로 녹아웃 스테이지
+
+    # 대진표 자리 (tournaments.bracket의 노드 키). 다음 라운드 경기는 앞 경기 결과가 나오면 이 자리로 만들어진다
+    bracket = models.CharField(max_length=20, choices=BRACKET_CHOICES, default='winners')
+    bracket_round = models.PositiveSmallIntegerField(default=1)
+    bracket_position = models.PositiveIntegerField(null=True, blank=True)
+    winner = models.ForeignKey(Team, related_name="won_tournament_matches", on_delete=models.SET_NULL, null=True, blank=True)
     
     class Meta:
         unique_together = ('tournament', 'match')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['tournament', 'bracket', 'bracket_round', 'bracket_position'], name='tournaments_unique_bracket_node'
+            ),
+        ]
+
+    def record_result(self, winner):
+        """
+        승리 팀을 기록하고 대진표를 진행 (advance_bracket). 새로 만들어진 다음 경기 목록을 반환.
+        기록과 진행은 한 트랜잭션에서 처리한다. 결과는 한 번만 기록되며, 같은 결과를 다시 기록하면
+        대진표 진행만 다시 시도한다 (advance_bracket은 이미 만든 경기를 다시 만들지 않는다).
+        """
+        if winner.pk not in (self.home_team_id, self.away_team_id):
+            raise ValidationError("승리 팀은 이 경기에 참가한 팀이어야 합니다.")
+
+        with transaction.atomic():
+            recorded = TournamentMatch.objects.filter(pk=self.pk, winner__isnull=True).update(winner=winner)
+            if not recorded and TournamentMatch.objects.filter(pk=self.pk).values_list('winner_id', flat=True).get() != winner.pk:
+                raise ValidationError("이미 다른 결과가 기록된 경기입니다.")
+            self.winner = winner
+            return self.tournament.advance_bracket()
 
     def schedule_match(self):
         """
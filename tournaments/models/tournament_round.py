@@ -0,0 +1,52 @@
+from django.db import models
+from django.db.models import F
+from django.utils import timezone
+
+from .tournament import Tournament
+
+
+class TournamentRound(models.Model):
+    """
+    토너먼트 라운드(대진표의 bracket, bracket_round)별 완료 경기 수.
+    다음 라운드 경기는 늦게 만들어지므로 total_matches는 대진표 생성 시 부전승을 뺀 실제 경기 수로 미리 정한다.
+    완료 수는 F() UPDATE로 올리고 마지막 경기일 때만 completed_at을 조건부 UPDATE로 채워
+    라운드 진행/포스트 갱신이 한 번만 실행된다.
+    """
+    tournament = models.ForeignKey(Tournament, on_delete=models.CASCADE, related_name="rounds")
+    bracket = models.CharField(max_length=20, default='winners')
+    bracket_round = models.PositiveSmallIntegerField()
+    name = models.CharField(max_length=50)  # TournamentMatch.round_number와 같은 라운드 이름
+    stage = models.PositiveSmallIntegerField()  # 진행 순서 (앞 라운드가 작다)
+    total_matches = models.PositiveIntegerField()
+    completed_matches = models.PositiveIntegerField(default=0)
+    completed_at = models.DateTimeField(null=True, blank=True)  # 라운드의 모든 경기가 끝난 시각
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['tournament', 'bracket', 'bracket_round'], name='tournaments_tournamentround_unique_round'),
+        ]
+
+    def __str__(self):
+        return f"{self.tournament_id} - {self.name} ({self.completed_matches}/{self.total_matches})"
+
+    @classmethod
+    def record_completion(cls, tournament_id, bracket, bracket_round):
+        """
+        라운드 완료 경기 수를 1 올리고, 이번 경기로 라운드가 끝났으면 True (라운드마다 한 번만 True).
+        같은 매치를 두 번 세지 않도록 매치 상태를 조건부 UPDATE로 바꾼 호출자만 불러야 한다.
+        """
+        rounds = cls.objects.filter(tournament_id=tournament_id, bracket=bracket, bracket_round=bracket_round)
+        rounds.update(completed_matches=F('completed_matches') + 1)
+        closed = rounds.filter(completed_matches__gte=F('total_matches'), completed_at__isnull=True).update(
+            completed_at=timezone.now()
+        )
+        return bool(closed)
+
+    @classmethod
+    def match_completed(cls, match_id):
+        """토너먼트 매치 완료 처리. 라운드가 끝났으면 토너먼트를 다음 라운드로 진행"""
+        from .tournament_match import TournamentMatch
+
+        row = TournamentMatch.objects.filter(match_id=match_id).values_list('tournament_id', 'bracket', 'bracket_round').first()
+        if row and cls.record_completion(*row):
+            Tournament.objects.get(pk=row[0]).advance_round()
@@ -11,7 +11,7 @@ class TournamentSerializer(serializers.ModelSerializer):
         model = Tournament
         fields = ['id', 'tournament_name', 'description', 'tournament_type', 'participants', 
                   'total_number_of_rounds', 'current_round', 'start_date', 'deadline', 
-                  'max_teams', 'match_duration', 'winning_method']
+                  'max_teams', 'match_duration', 'winning_method', 'bracket_type']
     
     def create(self, validated_data):
         """
@@ -27,7 +27,7 @@ class TournamentStatusSerializer(serializers.ModelSerializer):
     class Meta:
         model = TournamentStatus
         fields = ['tournament', 'team', 'current_round', 'advancement_status', 
-                  'wins', 'losses', 'matches_played', 'final_position']
+                  'wins', 'losses', 'matches_played', 'final_position', 'seed']
 
 class TournamentMatchSerializer(serializers.ModelSerializer):
     home_team = TeamSerializer()
@@ -35,7 +35,8 @@ class TournamentMatchSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = TournamentMatch
-        fields = ['tournament', 'match', 'home_team', 'away_team', 'round_number', 'is_knockout_stage']
+        fields = ['tournament', 'match', 'home_team', 'away_team', 'round_number', 'is_knockout_stage',
+                  'bracket', 'bracket_round', 'bracket_position', 'winner']
 
     def update(self, instance, validated_data):
         """
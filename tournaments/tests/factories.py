@@ -1,29 +1,39 @@
+from datetime import date, timedelta
+
 import factory
 import factory.fuzzy
 
-from tournaments.choices import TOURNAMENT_STAGE_TYPES
-from tournaments.models import Stage, Tournament, TournamentMatch
+from tournaments.models import Tournament, TournamentMatch, TournamentStatus
 
 
 class TournamentFactory(factory.django.DjangoModelFactory):
-    name = factory.Faker("word")
+    organizer = factory.SubFactory("accounts.tests.factories.AccountFactory")
+    tournament_name = factory.Faker("company")
+    description = factory.Faker("text")
+    total_number_of_rounds = 4
+    max_teams = 16
+    start_date = factory.LazyFunction(date.today)
+    deadline = factory.LazyAttribute(lambda o: o.start_date + timedelta(days=30))
+    match_duration = timedelta(hours=2)
 
     class Meta:
         model = Tournament
 
 
-class StageFactory(factory.django.DjangoModelFactory):
+class TournamentStatusFactory(factory.django.DjangoModelFactory):
     tournament = factory.SubFactory(TournamentFactory)
-    name = factory.Faker("word")
-    type = factory.fuzzy.FuzzyChoice([x[0] for x in TOURNAMENT_STAGE_TYPES])
+    team = factory.SubFactory("matchmaking.tests.factories.TeamFactory")
 
     class Meta:
-        model = Stage
+        model = TournamentStatus
 
 
 class TournamentMatchFactory(factory.django.DjangoModelFactory):
-    stage = factory.SubFactory(StageFactory)
-    match = factory.SubFactory("matchmaking.tests.factories.MatchFactory")
+    tournament = factory.SubFactory(TournamentFactory)
+    match = factory.SubFactory("matchmaking.tests.factories.MatchFactory", match_type="tournament")
+    home_team = factory.SubFactory("matchmaking.tests.factories.TeamFactory")
+    away_team = factory.SubFactory("matchmaking.tests.factories.TeamFactory")
+    round_number = "16강"
 
     class Meta:
         model = TournamentMatch
@@ -0,0 +1,162 @@
+import random
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, TestCase
+
+from clubs.models.club_statistics import ClubStatistics
+from clubs.tests.factories import ClubFactory
+from matchmaking.tests.factories import TeamFactory
+from tournaments.bracket import DONE, READY, WALKOVER, build, resolve, seed_positions
+from tournaments.models import Tournament, TournamentMatch, TournamentStatus
+from tournaments.tests.factories import TournamentFactory
+
+
+def play_out(team_count, double=False, seed=0):
+    """모든 경기를 무작위 결과로 끝까지 진행하고 (최종 상태, 치른 경기 수, 팀별 패배 수)를 반환"""
+    rng = random.Random(seed)
+    nodes, teams, results = build(team_count, double), list(range(team_count)), {}
+    losses = dict.fromkeys(teams, 0)
+    while True:
+        states = resolve(nodes, teams, results)
+        ready = [key for key, state in states.items() if state.status == READY]
+        if not ready:
+            return states, len(results), losses
+        for key in ready:
+            state = states[key]
+            results[key] = rng.choice([state.home, state.away])
+            losses[state.away if results[key] == state.home else state.home] += 1
+
+
+class BracketTestCase(SimpleTestCase):
+    def test_standard_seeding(self):
+        self.assertEqual(seed_positions(8), [1, 8, 4, 5, 2, 7, 3, 6])
+
+    def test_top_seeds_get_byes(self):
+        states = resolve(build(6), ["s1", "s2", "s3", "s4", "s5", "s6"], {})
+        first_round = [state for key, state in states.items() if key[1] == 1]
+
+        self.assertEqual([state.status for state in first_round], [WALKOVER, READY, WALKOVER, READY])
+        self.assertEqual({state.winner for state in first_round if state.status == WALKOVER}, {"s1", "s2"})
+
+    def test_single_elimination_needs_one_match_per_eliminated_team(self):
+        for team_count in range(2, 40):
+            with self.subTest(teams=team_count):
+                states, played, losses = play_out(team_count, seed=team_count)
+
+                self.assertTrue(all(state.status in (DONE, WALKOVER) for state in states.values()))
+                self.assertEqual(played, team_count - 1)
+                self.assertEqual(sorted(losses.values()), [0] + [1] * (team_count - 1))
+
+    def test_double_elimination_eliminates_after_two_losses(self):
+        for team_count in range(2, 40):
+            with self.subTest(teams=team_count):
+                states, _, losses = play_out(team_count, double=True, seed=team_count)
+                grand_final = states[list(states)[-1]]
+
+                self.assertTrue(all(state.status in (DONE, WALKOVER) for state in states.values()))
+                for team, lost in losses.items():
+                    if team == grand_final.winner:
+                        self.assertLessEqual(lost, 1)
+                    elif team == grand_final.home == grand_final.loser:
+                        self.assertEqual(lost, 1)  # 승자조 우승자는 그랜드 파이널에서 처음 진다
+                    else:
+                        self.assertEqual(lost, 2)
+
+
+class GenerateBracketTestCase(TestCase):
+    def setUp(self):
+        self.tournament = TournamentFactory(max_teams=6)
+        self.teams = []
+        for rank in range(6):
+            club = ClubFactory()
+            ClubStatistics.objects.create(club=club, performance=Decimal("4.50") - rank)
+            self.teams.append(TeamFactory(club=club))
+        self.tournament.participants.set(self.teams)
+
+    def test_seeds_from_club_statistics_and_creates_only_playable_matches(self):
+        created = self.tournament.generate_bracket()
+
+        seeds = dict(TournamentStatus.objects.filter(tournament=self.tournament).values_list("team_id", "seed"))
+        self.assertEqual([seeds[team.id] for team in self.teams], [1, 2, 3, 4, 5, 6])
+        # 1, 2번 시드는 부전승이라 첫 라운드 경기는 4 vs 5, 3 vs 6 두 경기뿐
+        self.assertEqual(
+            {(match.home_team_id, match.away_team_id) for match in created},
+            {(self.teams[3].id, self.teams[4].id), (self.teams[2].id, self.teams[5].id)},
+        )
+        self.assertEqual(self.tournament.total_number_of_rounds, 3)
+
+        with self.assertRaises(ValidationError):
+            self.tournament.generate_bracket()
+
+    def test_next_match_is_created_when_both_feeders_finish(self):
+        first, second = sorted(self.tournament.generate_bracket(), key=lambda match: match.bracket_position)
+
+        # 1번 시드는 부전승으로 기다리고 있으므로 4 vs 5 경기가 끝나면 바로 4강 경기가 생긴다
+        [semifinal] = first.record_result(first.home_team)
+        self.assertEqual((semifinal.home_team_id, semifinal.away_team_id), (self.teams[0].id, self.teams[3].id))
+        self.assertEqual(semifinal.round_number, "4강")
+        self.assertEqual(first.record_result(first.home_team), [])  # 같은 결과를 다시 기록해도 그대로
+        with self.assertRaises(ValidationError):
+            first.record_result(first.away_team)
+
+        [other_semifinal] = second.record_result(second.away_team)
+        self.assertEqual(semifinal.record_result(semifinal.home_team), [])  # 결승은 4강 두 경기가 모두 끝나야 생긴다
+        [final] = other_semifinal.record_result(other_semifinal.away_team)
+
+        self.assertEqual((final.home_team_id, final.away_team_id, final.round_number), (self.teams[0].id, self.teams[5].id, "결승"))
+        self.assertEqual(TournamentMatch.objects.filter(tournament=self.tournament).count(), 5)
+
+    def test_retrying_a_recorded_result_advances_the_bracket(self):
+        first, _ = sorted(self.tournament.generate_bracket(), key=lambda match: match.bracket_position)
+        # 승자는 기록됐지만 대진표 진행 전에 중단된 상태
+        TournamentMatch.objects.filter(pk=first.pk).update(winner=first.home_team)
+
+        [semifinal] = first.record_result(first.home_team)
+
+        self.assertEqual((semifinal.home_team_id, semifinal.away_team_id), (self.teams[0].id, self.teams[3].id))
+        self.assertEqual(first.record_result(first.home_team), [])
+
+
+class TournamentRoundAdvanceTestCase(TestCase):
+    def setUp(self):
+        self.tournament = TournamentFactory(max_teams=4)
+        self.tournament.participants.set(TeamFactory.create_batch(4))
+
+    def test_round_counters_skip_byes(self):
+        self.tournament.max_teams = 6
+        self.tournament.participants.add(*TeamFactory.create_batch(2))
+        self.tournament.generate_bracket()
+
+        self.assertEqual(
+            list(self.tournament.rounds.order_by("stage").values_list("name", "total_matches")),
+            [("8강", 2), ("4강", 2), ("결승", 1)],
+        )
+
+    def test_generated_round_names_pass_field_validation(self):
+        self.tournament.max_teams = 17
+        self.tournament.participants.add(*TeamFactory.create_batch(13))
+        self.tournament.generate_bracket()
+        self.assertEqual(self.tournament.current_round, "32강")
+
+        field = Tournament._meta.get_field("current_round")
+        for name in (self.tournament.current_round, "패자조 3라운드", "그랜드 파이널"):
+            field.clean(name, self.tournament)
+
+    def test_completing_round_moves_to_next_round(self):
+        first, second = self.tournament.generate_bracket()
+        self.assertEqual(self.tournament.current_round, "4강")
+
+        first.record_result(first.home_team)
+        first.match.complete_match()
+        self.tournament.refresh_from_db()
+        self.assertEqual(self.tournament.current_round, "4강")
+
+        [final] = second.record_result(second.home_team)
+        second.match.complete_match()
+        self.tournament.refresh_from_db()
+        self.assertEqual(self.tournament.current_round, "결승")
+
+        final.record_result(final.home_team)
+        final.match.complete_match()
+        self.assertTrue(self.tournament.is_finished)
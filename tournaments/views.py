@@ -2,9 +2,13 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
+from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.utils import timezone
-from newsfeed.models.newsfeed import Newsfeed, NewsfeedPost
+from matchmaking.models import Team
+from newsfeed.fanout import fan_out_to_followers
 
+from tournaments.models import Tournament, TournamentMatch, TournamentStatus
 from tournaments.serializers import TournamentSerializer, TournamentStatusSerializer, TournamentMatchSerializer
 
 
@@ -37,15 +41,16 @@ class TournamentDetailView(APIView):
 
     def get(self, request, tournament_id, *args, **kwargs):
         try:
-            tournament = "tournaments.Tournament".objects.get(id=tournament_id)
-        except "tournaments.Tournament".DoesNotExist:
+            tournament = Tournament.objects.prefetch_related('participants').get(id=tournament_id)
+        except Tournament.DoesNotExist:
             return Response({"error": "Tournament not found."}, status=status.HTTP_404_NOT_FOUND)
 
+        # 진출 현황/경기 목록은 팀 수와 관계없이 각각 쿼리 1번
         tournament_serializer = TournamentSerializer(tournament)
-        tournament_status = "tournaments.TournamentStatus".objects.filter(tournament=tournament)
+        tournament_status = TournamentStatus.objects.filter(tournament=tournament).select_related('team').order_by('id')
         status_serializer = TournamentStatusSerializer(tournament_status, many=True)
 
-        matches = "tournaments.TournamentMatch".objects.filter(tournament=tournament)
+        matches = TournamentMatch.objects.filter(tournament=tournament).select_related('home_team', 'away_team').order_by('id')
         matches_serializer = TournamentMatchSerializer(matches, many=True)
 
         return Response({
@@ -115,45 +120,52 @@ class JoinTournamentView(APIView):
         if tournament.participants.count() == tournament.max_teams:
             tournament.update_tournament_post_on_full_participation()
 
-        # 유저의 팔로워 목록 가져오기
-        followers = user.followers.all()
-
         # 팔로워들의 뉴스피드에 해당 토너먼트 포스트 추가
-        for follower_id in followers:
-            follower_newsfeed = Newsfeed.objects.get(user_id=follower_id)
-            NewsfeedPost.objects.create(
-                newsfeed=follower_newsfeed,
-                post_type="tournament",
-                post_id=tournament.id,
-                post_content=f"{user.username} joined the tournament {tournament.tournament_name}."
-            )
+        fan_out_to_followers(
+            user,
+            post_type="tournament",
+            post_id=tournament.id,
+            post_content=f"{user.username} joined the tournament {tournament.tournament_name}."
+        )
 
         return Response({"message": "Successfully joined the tournament."}, status=status.HTTP_200_OK)
 
 
-class MatchCompleteView(APIView):
+class TournamentMatchCompleteView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request, match_id):
+        """
+        토너먼트 경기 완료. 승리 팀(winner, 팀 id)을 주지 않으면 스코어보드의 승리 쪽(레드=홈, 블루=원정)으로 정한다.
+        승자 기록으로 대진표를 진행하고, 라운드 완료 수 갱신과 라운드 진행은 complete_match가 한 번만 처리한다.
+        """
         try:
-            match = "matchmaking.Match".objects.get(id=match_id)
-            match.complete()  # 경기 완료 처리
-            tournament = match.tournament
-
-            # 해당 라운드의 모든 경기가 끝났는지 확인
-            remaining_matches = "tournaments.TournamentMatch".objects.filter(
-                tournament=tournament, round_number=tournament.current_round, match__status='scheduled'
-            )
-            if not remaining_matches.exists():
-                tournament.advance_round()  # 다음 라운드로 진행
-                tournament.save()
-
-                # 포스트 업데이트
-                tournament.update_tournament_post_on_round_completion()
-
-                return Response({"message": "Tournament advanced to the next round."}, status=status.HTTP_200_OK)
-            
-            return Response({"message": "Match completed successfully."}, status=status.HTTP_200_OK)
-
-        except "matchmaking.Match".DoesNotExist:
-            return Response({"error": "Match not found."}, status=status.HTTP_404_NOT_FOUND)
\ No newline at end of file
+            tournament_match = TournamentMatch.objects.select_related('match', 'tournament').get(match_id=match_id)
+        except TournamentMatch.DoesNotExist:
+            return Response({"error": "Match not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        match = tournament_match.match
+        winner_id = request.data.get('winner') or {
+            'red': tournament_match.home_team_id,
+            'blue': tournament_match.away_team_id,
+        }.get(match.winning_side)
+        if not winner_id:
+            return Response({"error": "The winner of this match is not decided."}, status=status.HTTP_400_BAD_REQUEST)
+
+        tournament = tournament_match.tournament
+        previous_round = tournament.current_round
+        try:
+            with transaction.atomic():
+                tournament_match.record_result(Team(pk=int(winner_id)))
+                completed = match.complete_match()
+        except (ValueError, ValidationError) as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if not completed:
+            return Response({"error": "This match is already completed."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if tournament.is_finished:
+            return Response({"message": "The tournament is finished."}, status=status.HTTP_200_OK)
+        tournament.refresh_from_db(fields=['current_round'])
+        if tournament.current_round != previous_round:
+            return Response({"message": "Tournament advanced to the next round."}, status=status.HTTP_200_OK)
+        return Response({"message": "Match completed successfully."}, status=status.HTTP_200_OK)